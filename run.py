@@ -1,68 +1,467 @@
 #!/usr/bin/env python3
 """
 GenieFactory BP 14 Mois - Orchestrateur Principal
-Exécute séquentiellement tous les scripts de génération du Business Plan
+Exécute tous les scripts de génération du Business Plan
+
+Les étapes indépendantes (ex: BP Excel 14M, BP Excel 50M, graphiques,
+template → injection) tournent en parallèle sur un pool dimensionné au
+nombre de coeurs; une étape démarre dès que celles dont elle dépend sont
+terminées. Chaque étape a son propre log (logs/run_YYYYMMDD_HHMMSS/) et
+un échec n'arrête que les étapes qui en dépendent.
+
+Mode --in-process : les étapes tournent dans ce process (séquentiellement),
+chaque module étant importé une seule fois (openpyxl, pandas, matplotlib...
+chargés une fois au lieu d'une fois par étape). assumptions.yaml et les
+projections passent d'une étape à l'autre via un contexte partagé
+(scripts/pipeline_context.py) au lieu d'être relus sur disque. Un module de
+scripts/ modifié depuis son import est rechargé avant l'étape, avec les
+modules qui l'importent (dépendances d'abord); un module importé par run.py
+lui-même ne peut pas l'être : l'étape tourne alors dans un sous-process.
+
+Chaque étape déclare ses fichiers d'entrée et de sortie. Comme make, une
+étape n'est relancée que si le contenu (hash SHA-256) d'une entrée a changé
+depuis sa dernière exécution réussie, ou si une sortie manque. Modifier un
+montant de levée dans assumptions.yaml relance projections → Excel → Word →
+validation, pas l'extraction. État: .cache/run_state.json
+
+Cache d'artefacts (scripts/artifact_store.py) : les sorties de chaque
+exécution réussie sont copiées dans un cache adressé par contenu, indexé
+par l'empreinte de l'étape (script + entrées). Sur une autre branche, un
+autre poste ou un job CI partageant le dossier (--artifact-cache ou
+BP_ARTIFACT_CACHE, ex: montage NFS), une étape déjà calculée est restaurée
+au lieu d'être relancée. Taille bornée (éviction LRU); --cache-stats.
+
+Mode portefeuille (--manifest plans.yaml) : un pipeline par dossier de plan
+(data/structured/assumptions.yaml propre, data/raw partagé par défaut),
+répartis sur un pool de process; chaque worker garde ses modules importés
+d'un plan à l'autre et les plans partagent le cache d'artefacts. Sorties
+dans chaque dossier de plan + un tableau de synthèse consolidé.
+
+Mode --watch : reste actif (en process) et relance les étapes concernées à
+chaque enregistrement d'un fichier source (assumptions.yaml,
+funding_captable.yaml, scripts...). Modules importés et fichiers parsés
+restent en mémoire d'un build à l'autre; extraction et génération
+d'assumptions sont ignorées (elles écraseraient les éditions manuelles).
+Notifications du système de fichiers via watchdog s'il est installé,
+sinon scrutation des dates de modification.
+
+Télémétrie : chaque run écrit dans son dossier de logs telemetry.json et
+telemetry.csv (temps, CPU, pic mémoire, cellules écrites) par étape et par
+sous-étape instrumentée (scripts/telemetry.py). --profile ajoute un profil
+cProfile par étape (<étape>.prof, lisible avec pstats ou snakeviz).
 
 Usage:
-    python run.py                    # Exécution complète
+    python run.py                    # Exécution (étapes à jour ignorées)
+    python run.py --force            # Tout relancer (ignorer le cache)
     python run.py --skip-extract     # Skip extraction (si déjà fait)
     python run.py --validate-only    # Seulement validation
+    python run.py --jobs 1           # Exécution séquentielle
+    python run.py --in-process       # Sans sous-process (imports et parsing partagés)
+    python run.py --force --profile  # Profil cProfile de chaque étape
+    python run.py --watch            # Rebuild à chaque modification des hypothèses
+    python run.py --cache-stats      # Contenu du cache d'artefacts
+    python run.py --manifest plans.yaml -j 8   # Portefeuille de plans
 """
 
+import os
 import sys
-import subprocess
+import json
+import time
+import hashlib
+import logging
 import argparse
+import importlib
+import importlib.util
+import traceback
+import threading
+import subprocess
+import contextlib
+from concurrent.futures import (Future, ThreadPoolExecutor, ProcessPoolExecutor,
+                                FIRST_COMPLETED, as_completed, wait)
 from pathlib import Path
 from datetime import datetime
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.panel import Panel
-from rich import print as rprint
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # Optionnel: scrutation des fichiers à la place
+    Observer = None
+    FileSystemEventHandler = object
+
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from pipeline_context import PipelineContext, PLAN_ENV_VAR, activate, deactivate  # noqa: E402
+import telemetry  # noqa: E402
+from artifact_store import ArtifactStore, DEFAULT_MAX_MB  # noqa: E402
+
+class _LazyConsole:
+    """Console rich créée au premier affichage (`--help` n'importe pas rich)"""
+
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
 
 # Setup console
-console = Console()
+console = _LazyConsole()
+
+BASE_PATH = Path(__file__).parent
+SCRIPTS_DIR = BASE_PATH / "scripts"
+CACHE_PATH = BASE_PATH / ".cache" / "run_state.json"
+ARTIFACT_CACHE_PATH = Path(os.environ.get('BP_ARTIFACT_CACHE', BASE_PATH / ".cache" / "artifacts"))
 
-# Scripts à exécuter (ordre important)
+# Mode --watch: intervalle de scrutation et délai de regroupement des écritures
+POLL_INTERVAL = 0.2
+DEBOUNCE_S = 0.1
+
+# Fichiers sources (data/raw)
+RAW_FILES = [
+    "data/raw/BP FABRIQ_PRODUCT-OCT2025.xlsx",
+    "data/raw/Business Plan GenieFactory-SEPT2025.docx",
+    "data/raw/GENIE FACTORY PACTE AATL-v3 [1].docx"
+]
+
+# Scripts à exécuter: entrées / sorties (chemins relatifs à la racine)
+# Le script et les modules de scripts/ qu'il importe (transitivement, voir
+# code_dependencies) font partie des entrées sans être listés. Une entrée
+# absente est hashée comme "absente" (ex: .jsonl ou .json selon le format).
+# "after": dépendances d'ordre sans échange de fichier (point de jonction).
 SCRIPTS = [
     {
         "name": "1. Extraction",
         "script": "scripts/1_extract.py",
         "description": "Parse BP Excel, BM Word, Pacte",
-        "skip_flag": "--skip-extract"
+        "skip_flag": "--skip-extract",
+        "inputs": RAW_FILES,
+        "outputs": [
+            "data/structured/bp_extracted.json",
+            "data/structured/bm_extracted.json",
+            "data/structured/pacte_extracted.json"
+        ]
     },
     {
         "name": "2. Assumptions",
         "script": "scripts/2_generate_assumptions.py",
         "description": "Génère assumptions.yaml (validation manuelle requise)",
-        "skip_flag": "--skip-assumptions"
+        "skip_flag": "--skip-assumptions",
+        "inputs": [
+            "data/structured/bp_extracted.json",
+            "data/structured/bm_extracted.json",
+            "data/structured/pacte_extracted.json",
+            "assumptions_template.yaml"
+        ],
+        "outputs": ["data/structured/assumptions.yaml"]
     },
     {
         "name": "3. Projections",
         "script": "scripts/3_calculate_projections.py",
         "description": "Calcule ARR, CA, charges M1-M14",
-        "skip_flag": None  # Jamais skip
+        "skip_flag": None,  # Jamais skip
+        "inputs": [
+            "data/structured/assumptions.yaml"
+        ],
+        "outputs": [
+            "data/structured/projections_50m.jsonl",
+            "data/structured/projections.jsonl"
+        ]
     },
     {
         "name": "4. BP Excel",
         "script": "scripts/4_generate_bp_excel.py",
         "description": "Génère BP_14M_Nov2025-Dec2026.xlsx",
-        "skip_flag": None
+        "skip_flag": None,
+        "inputs": [
+            "data/structured/projections.jsonl",
+            "data/structured/projections.json",
+            "data/structured/assumptions.yaml"
+        ],
+        "outputs": ["data/outputs/BP_14M_Nov2025-Dec2026.xlsx"]
+    },
+    {
+        "name": "4b. BP Excel 50M",
+        "script": "scripts/4b_generate_bp_excel_50m.py",
+        "description": "Génère BP_50M_Nov2025-Dec2029.xlsx",
+        "skip_flag": None,
+        "inputs": [
+            "data/structured/projections_50m.jsonl",
+            "data/structured/projections_50m.json",
+            "data/structured/assumptions.yaml"
+        ],
+        "outputs": ["data/outputs/BP_50M_Nov2025-Dec2029.xlsx"]
+    },
+    {
+        "name": "4c. Graphiques",
+        "script": "scripts/generate_charts.py",
+        "description": "Génère les graphiques PNG (ARR, CA, cash...)",
+        "skip_flag": None,
+        "inputs": [
+            "data/structured/projections.jsonl",
+            "data/structured/projections.json"
+        ],
+        "outputs": [
+            "data/outputs/charts/arr_evolution.png",
+            "data/outputs/charts/ca_mensuel.png",
+            "data/outputs/charts/revenue_mix.png",
+            "data/outputs/charts/ebitda.png",
+            "data/outputs/charts/cash_position.png",
+            "data/outputs/charts/team_evolution.png"
+        ]
+    },
+    {
+        "name": "4d. Template 50M",
+        "script": "scripts/6a_create_template.py",
+        "description": "Crée BP_50M_TEMPLATE.xlsx depuis le RAW",
+        "skip_flag": None,
+        "inputs": [
+            "data/raw/BP FABRIQ_PRODUCT-OCT2025.xlsx",
+            "data/structured/assumptions.yaml",
+            "data/structured/funding_captable.yaml",
+            "data/structured/sensitivity.json"
+        ],
+        "outputs": ["data/outputs/BP_50M_TEMPLATE.xlsx"]
+    },
+    {
+        "name": "4e. Injection 50M",
+        "script": "scripts/6b_inject_data.py",
+        "description": "Injecte les projections dans le template 50M",
+        "skip_flag": None,
+        "inputs": [
+            "data/outputs/BP_50M_TEMPLATE.xlsx",
+            "data/structured/projections_50m.jsonl",
+            "data/structured/projections_50m.json"
+        ],
+        "outputs": ["data/outputs/BP_50M_FINAL_Nov2025-Dec2029.xlsx"]
     },
     {
         "name": "5. BM Word",
         "script": "scripts/5_update_bm_word.py",
         "description": "Update BM_Updated_14M.docx",
-        "skip_flag": None
+        "skip_flag": None,
+        "inputs": [
+            "data/raw/Business Plan GenieFactory-SEPT2025.docx",
+            "data/structured/projections.jsonl",
+            "data/structured/projections.json",
+            "data/structured/assumptions.yaml",
+            "data/outputs/charts/arr_evolution.png",
+            "data/outputs/charts/revenue_mix.png",
+            "data/outputs/charts/ca_mensuel.png",
+            "data/outputs/charts/cash_position.png"
+        ],
+        "outputs": ["data/outputs/BM_Updated_14M.docx"]
     },
     {
         "name": "6. Validation",
         "script": "scripts/6_validate.py",
         "description": "Checks cohérence et targets",
-        "skip_flag": None
+        "skip_flag": None,
+        "inputs": [
+            "data/structured/projections.jsonl",
+            "data/structured/projections.json",
+            "data/structured/assumptions.yaml",
+            "data/outputs/BP_14M_Nov2025-Dec2026.xlsx",
+            "data/outputs/BM_Updated_14M.docx"
+        ],
+        "outputs": [],  # Rapport horodaté dans logs/: relancé si une entrée change
+        "after": [  # Jonction: valider une fois tous les livrables produits
+            "scripts/4b_generate_bp_excel_50m.py",
+            "scripts/6b_inject_data.py"
+        ]
     }
 ]
 
 
+def resolve_path(relative_path: str, root: Path = BASE_PATH) -> Path:
+    """Chemin absolu: données (data/...) sous la racine du plan, code sous le dépôt"""
+    if relative_path.startswith('data/'):
+        return root / relative_path
+    return BASE_PATH / relative_path
+
+
+_import_cache = {}  # module -> (mtime, modules de scripts/ importés)
+
+
+def module_imports(name: str):
+    """Modules de scripts/ importés par scripts/<name>.py (relevé AST, sans l'exécuter)
+
+    import x, from x import y et importlib.import_module('x'), au niveau du
+    module comme dans les fonctions (imports différés).
+    """
+    path = SCRIPTS_DIR / f"{name}.py"
+    try:
+        stamp = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    cached = _import_cache.get(name)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    import ast
+
+    try:
+        tree = ast.parse(path.read_bytes(), str(path))
+    except SyntaxError:
+        return []  # Script en cours d'édition: son échec sera rapporté par l'étape
+    imported = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        elif (isinstance(node, ast.Call) and node.args and isinstance(node.args[0], ast.Constant)
+              and isinstance(node.args[0].value, str)
+              and getattr(node.func, 'attr', getattr(node.func, 'id', None)) == 'import_module'):
+            names = [node.args[0].value]
+        else:
+            continue
+        for module in names:
+            module = module.split('.')[0]
+            if module != name and module not in imported and (SCRIPTS_DIR / f"{module}.py").exists():
+                imported.append(module)
+    _import_cache[name] = (stamp, imported)
+    return imported
+
+
+def code_dependencies(name: str):
+    """Modules de scripts/ dont dépend un module (imports transitifs), dépendances d'abord
+
+    Le module lui-même est le dernier de la liste.
+    """
+    ordered, seen = [], set()
+
+    def visit(module):
+        seen.add(module)
+        for imported in module_imports(module):
+            if imported not in seen:
+                visit(imported)
+        ordered.append(module)
+
+    visit(name)
+    return ordered
+
+
+def stage_code(stage):
+    """Fichiers de code d'une étape: modules importés puis le script lui-même"""
+    return [f"scripts/{module}.py" for module in code_dependencies(Path(stage['script']).stem)]
+
+
+def stage_dependencies(stages):
+    """Dépendances de chaque étape: producteurs de ses entrées + "after"
+
+    Les dépendances vers des étapes absentes de `stages` sont ignorées
+    (ex: --validate-only).
+    """
+    producers = {}
+    for stage in stages:
+        for output in stage['outputs']:
+            producers[output] = stage['script']
+    scripts = {stage['script'] for stage in stages}
+
+    depends = {}
+    for stage in stages:
+        required = {producers[path] for path in stage['inputs'] if path in producers}
+        required |= {script for script in stage.get('after', []) if script in scripts}
+        required.discard(stage['script'])
+        depends[stage['script']] = required
+    return depends
+
+
+def stage_order(stages):
+    """Ordre topologique des étapes (une étape après celles qui produisent ses entrées)
+
+    À dépendances égales, l'ordre de déclaration est conservé.
+    """
+    depends = stage_dependencies(stages)
+    ordered, done = [], set()
+    while len(ordered) < len(stages):
+        ready = [stage for stage in stages
+                 if stage['script'] not in done and depends[stage['script']] <= done]
+        if not ready:
+            cycle = [stage['name'] for stage in stages if stage['script'] not in done]
+            raise ValueError(f"Dépendances circulaires entre: {', '.join(cycle)}")
+        ordered.append(ready[0])
+        done.add(ready[0]['script'])
+    return ordered
+
+
+class StageCache:
+    """État des étapes: hash du contenu des entrées à la dernière exécution réussie
+
+    Le hash d'un fichier est mémorisé avec (taille, mtime): un fichier non
+    modifié n'est pas relu (fichiers raw volumineux). `root` : racine des
+    données (dossier du plan en mode portefeuille).
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, root: Path = BASE_PATH):
+        self.path = path
+        self.root = root
+        self.files = {}
+        self.stages = {}
+        self.up_to_date = []  # Étapes ignorées pendant ce run
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                self.files = state.get('files', {})
+                self.stages = state.get('stages', {})
+            except (json.JSONDecodeError, OSError):
+                pass  # État illisible: tout sera relancé
+
+    def file_hash(self, relative_path: str) -> str:
+        """SHA-256 du contenu ('absent' si le fichier n'existe pas)"""
+        path = resolve_path(relative_path, self.root)
+        if not path.exists():
+            return 'absent'
+
+        stat = path.stat()
+        cached = self.files.get(relative_path)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+        self.files[relative_path] = {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256
+        }
+        return sha256
+
+    def inputs_digest(self, stage) -> str:
+        """Empreinte de l'étape: code (script + modules importés) + contenu de toutes ses entrées"""
+        digest = hashlib.sha256()
+        for relative_path in stage_code(stage) + stage['inputs']:
+            digest.update(f"{relative_path}={self.file_hash(relative_path)}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_up_to_date(self, stage) -> bool:
+        """Entrées inchangées et sorties présentes"""
+        recorded = self.stages.get(stage['script'])
+        if not recorded or recorded['inputs'] != self.inputs_digest(stage):
+            return False
+        return all(resolve_path(output, self.root).exists() for output in stage['outputs'])
+
+    def record(self, stage, inputs: str = None):
+        """Mémoriser une exécution réussie
+
+        `inputs` : empreinte relevée au lancement de l'étape (une entrée
+        modifiée pendant l'exécution la fera relancer au run suivant).
+        """
+        self.stages[stage['script']] = {
+            'inputs': inputs or self.inputs_digest(stage),
+            'outputs': {output: self.file_hash(output) for output in stage['outputs']},
+            'finished': datetime.now().isoformat(timespec='seconds')
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.files, 'stages': self.stages}, f, indent=2)
+
+
 def check_dependencies():
     """Vérifier que toutes les dépendances sont installées"""
     console.print("\n[bold cyan]🔍 Vérification des dépendances...[/]")
@@ -70,11 +469,11 @@ def check_dependencies():
     required = ['openpyxl', 'docx', 'yaml', 'pandas', 'rich']
     missing = []
     
+    # find_spec: présence vérifiée sans importer (les étapes importent ce qu'elles utilisent)
     for module in required:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             console.print(f"  ✓ {module}")
-        except ImportError:
+        else:
             missing.append(module)
             console.print(f"  ✗ {module} [red](manquant)[/]")
     
@@ -91,15 +490,9 @@ def check_source_files():
     """Vérifier présence des fichiers sources"""
     console.print("\n[bold cyan]📂 Vérification des fichiers sources...[/]")
     
-    required_files = [
-        "data/raw/BP_FABRIQ_PRODUCT-OCT2025.xlsx",
-        "data/raw/Business_Plan_GenieFactory-SEPT2025.docx",
-        "data/raw/GENIE_FACTORY_PACTE_AATL-v3.docx"
-    ]
-    
     missing = []
-    for filepath in required_files:
-        path = Path(filepath)
+    for filepath in RAW_FILES:
+        path = BASE_PATH / filepath
         if path.exists():
             console.print(f"  ✓ {filepath}")
         else:
@@ -115,43 +508,634 @@ def check_source_files():
     return True
 
 
-def run_script(script_info, args):
-    """Exécuter un script Python"""
-    script_path = Path(script_info['script'])
-    
-    # Check si skip demandé
-    skip_flag = script_info.get('skip_flag')
-    if skip_flag and getattr(args, skip_flag.replace('--skip-', ''), False):
-        console.print(f"[yellow]⏭️  Skipping {script_info['name']}[/]")
-        return True
-    
-    console.print(f"\n[bold cyan]▶️  {script_info['name']}[/]")
-    console.print(f"[dim]{script_info['description']}[/]")
-    
+def run_script(script_info, log_path: Path, profile_path: Path = None):
+    """Exécuter un script Python; stdout/stderr dans son propre fichier log
+
+    Retourne (succès, mesures) avec mesures = {wall_s, cpu_s, peak_rss_mb}
+    (CPU et mémoire du sous-process via wait4, None si indisponible).
+    """
+    script_path = BASE_PATH / script_info['script']
     if not script_path.exists():
-        console.print(f"[red]❌ Script non trouvé : {script_path}[/]")
+        log_path.write_text(f"Script non trouvé : {script_path}\n", encoding='utf-8')
+        return False, {'wall_s': 0.0, 'cpu_s': None, 'peak_rss_mb': None}
+
+    command = [sys.executable, str(script_path)]
+    if profile_path is not None:
+        command = [sys.executable, '-m', 'cProfile', '-o', str(profile_path), str(script_path)]
+
+    usage = {'cpu_s': None, 'peak_rss_mb': None}
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        if hasattr(os, 'wait4'):
+            _, wait_status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(wait_status)
+            usage['cpu_s'] = round(rusage.ru_utime + rusage.ru_stime, 6)
+            # Linux: Ko, macOS: octets
+            divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+            usage['peak_rss_mb'] = rusage.ru_maxrss / divisor
+        else:
+            process.wait()
+    usage['wall_s'] = round(time.perf_counter() - start, 6)
+    return process.returncode == 0, usage
+
+
+# Modules importés par run.py (en tête de fichier): jamais rechargés, run.py
+# garderait l'ancien contexte / la télémétrie de l'ancien module
+RUNNER_MODULES = ('pipeline_context', 'telemetry', 'artifact_store')
+
+
+def _module_mtime(name: str):
+    try:
+        return (SCRIPTS_DIR / f"{name}.py").stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# Modules de scripts/ importés en process: (mtime à l'import, n° de rechargement)
+_module_stamps = {name: (_module_mtime(name), 0) for name in RUNNER_MODULES}
+_reloads = 0
+
+
+def reload_modules(names, stamps):
+    """Recharger les modules déjà importés dont le code a changé, dans l'ordre de `names`
+
+    `names` : dépendances d'abord (code_dependencies). Un module est aussi
+    rechargé si un module qu'il importe l'a été depuis son propre chargement
+    (ses `from x import y` pointent encore sur l'ancien code).
+    """
+    global _reloads
+    for name in names:
+        module = sys.modules.get(name)
+        if module is None or name not in _module_stamps:
+            continue
+        mtime, loaded = _module_stamps[name]
+        if mtime != stamps[name] or any(_module_stamps.get(imported, (None, 0))[1] > loaded
+                                        for imported in module_imports(name)):
+            importlib.reload(module)
+            _reloads += 1
+            _module_stamps[name] = (stamps[name], _reloads)
+
+
+def record_modules(names, stamps):
+    """Mémoriser les modules importés par l'étape (mtime relevé avant l'import)"""
+    for name in names:
+        if name in sys.modules and name not in _module_stamps:
+            _module_stamps[name] = (stamps[name], _reloads)
+
+
+def run_in_process(script_info, log_path: Path, profile_path: Path = None):
+    """Exécuter main() du script dans ce process (module importé une seule fois)
+
+    stdout/stderr et le logging racine sont redirigés vers le log de l'étape
+    le temps de l'exécution. Retourne (succès, mesures) comme run_script;
+    le pic mémoire est celui du process (cumulé sur les étapes précédentes).
+    """
+    script_path = BASE_PATH / script_info['script']
+    if not script_path.exists():
+        log_path.write_text(f"Script non trouvé : {script_path}\n", encoding='utf-8')
+        return False, {'wall_s': 0.0, 'cpu_s': None, 'peak_rss_mb': None}
+
+    scripts_dir = str(script_path.parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+
+    modules = code_dependencies(script_path.stem)
+    stamps = {name: _module_mtime(name) for name in modules}
+    stale = [name for name in modules
+             if name in RUNNER_MODULES and stamps[name] != _module_stamps[name][0]]
+    if stale:
+        console.print(f"[yellow]⚠️  {', '.join(stale)}.py modifié (importé par run.py) : "
+                      f"{script_info['name']} exécuté en sous-process[/]")
+        return run_script(script_info, log_path, profile_path)
+
+    root = logging.getLogger()
+    saved_handlers, saved_level, saved_argv = root.handlers[:], root.level, sys.argv
+
+    profiler = None
+    if profile_path is not None:
+        import cProfile
+        profiler = cProfile.Profile()
+    start, cpu_start = time.perf_counter(), time.process_time()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        handler = logging.StreamHandler(log)
+        handler.setFormatter(logging.Formatter(
+            '[%(asctime)s] %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        # Handler déjà en place: le basicConfig du module (1er import) est sans effet
+        root.handlers = [handler]
+        root.setLevel(logging.INFO)
+        sys.argv = [str(script_path)]
+        try:
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                try:
+                    reload_modules(modules, stamps)  # Script ou module modifié (mode --watch)
+                    module = importlib.import_module(script_path.stem)
+                    if profiler is not None:
+                        code = profiler.runcall(module.main)
+                    else:
+                        code = module.main()
+                except SystemExit as e:
+                    code = e.code
+                except Exception:
+                    traceback.print_exc()
+                    code = 1
+        finally:
+            record_modules(modules, stamps)
+            root.handlers, sys.argv = saved_handlers, saved_argv
+            root.setLevel(saved_level)
+    usage = {
+        'wall_s': round(time.perf_counter() - start, 6),
+        'cpu_s': round(time.process_time() - cpu_start, 6),
+        'peak_rss_mb': telemetry.peak_rss_mb(),
+    }
+    if profiler is not None:
+        profiler.dump_stats(str(profile_path))
+    return code in (0, None), usage
+
+
+class InlineExecutor:
+    """Exécuteur synchrone (mode en process: une étape à la fois)"""
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
         return False
-    
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def log_tail(log_path: Path, lines: int = 15) -> str:
+    """Dernières lignes d'un log d'étape (rapport d'échec)"""
+    if not log_path.exists():
+        return ""
+    return "\n".join(log_path.read_text(encoding='utf-8', errors='replace').splitlines()[-lines:])
+
+
+def write_telemetry(log_dir: Path):
+    """Consolider telemetry.jsonl du run en telemetry.json et telemetry.csv
+
+    Retourne les enregistrements (étapes et sous-étapes).
+    """
+    import csv
+
+    source = log_dir / "telemetry.jsonl"
+    if not source.exists():
+        return []
+    with open(source, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    with open(log_dir / "telemetry.json", 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+
+    columns = ['stage', 'step', 'wall_s', 'cpu_s', 'peak_rss_mb', 'cells', 'ok']
+    columns += sorted({key for record in records for key in record} - set(columns))
+    with open(log_dir / "telemetry.csv", 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(records)
+    return records
+
+
+def print_telemetry(records):
+    """Résumé: mesures par étape et sous-étapes les plus longues"""
+    stages = [record for record in records if record['step'] == 'stage']
+    if not stages:
+        return
+    console.print("\n[bold cyan]⏱️  Télémétrie par étape :[/]")
+    for record in sorted(stages, key=lambda record: record['wall_s'], reverse=True):
+        cpu = f"{record['cpu_s']:.1f}s CPU" if record.get('cpu_s') is not None else "CPU n/d"
+        rss = f"{record['peak_rss_mb']:.0f} Mo" if record.get('peak_rss_mb') is not None else "mém. n/d"
+        console.print(f"  {record['stage']}: {record['wall_s']:.1f}s, {cpu}, {rss}")
+
+    steps = sorted((record for record in records if record['step'] != 'stage'),
+                   key=lambda record: record['wall_s'], reverse=True)
+    for record in steps[:5]:
+        console.print(
+            f"[dim]    {record['stage']}.{record['step']}: {record['wall_s']:.2f}s, "
+            f"{record['cells']} cellules[/]"
+        )
+
+
+def store_outputs(store: ArtifactStore, cache: StageCache, stage):
+    """Copier les sorties d'une exécution réussie dans le cache d'artefacts"""
+    recorded = cache.stages[stage['script']]
+    outputs = recorded['outputs']
+    if not outputs or 'absent' in outputs.values():
+        return  # Pas de sortie déclarée, ou sortie non produite
     try:
-        # Exécuter le script
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            check=True,
-            capture_output=True,
-            text=True
+        store.store(recorded['inputs'], stage['name'], cache.root, outputs)
+    except OSError as e:  # Cache partagé indisponible: le run continue
+        console.print(f"[yellow]⚠️  Cache d'artefacts non alimenté ({stage['name']}) : {e}[/]")
+
+
+def print_cache_stats(store: ArtifactStore):
+    """Rapport --cache-stats: taille, entrées et hits par étape"""
+    from rich.table import Table
+
+    stats = store.stats()
+    console.print(f"\n[bold cyan]📦 Cache d'artefacts : {stats['root']}[/]")
+    console.print(
+        f"  {stats['objects']} objet(s), {stats['bytes'] / 1024 / 1024:.1f} Mo "
+        f"/ {stats['max_bytes'] / 1024 / 1024:.0f} Mo max"
+    )
+    if not stats['stages']:
+        console.print("[dim]  Cache vide[/]")
+        return
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Étape")
+    table.add_column("Entrées", justify="right")
+    table.add_column("Restaurations", justify="right")
+    table.add_column("Taille (Mo)", justify="right")
+    table.add_column("Dernier usage")
+    stage_names = [stage['name'] for stage in SCRIPTS]
+    for name, stage in sorted(stats['stages'].items(),
+                              key=lambda item: stage_names.index(item[0])
+                              if item[0] in stage_names else len(stage_names)):
+        table.add_row(name, str(stage['entries']), str(stage['hits']),
+                      f"{stage['bytes'] / 1024 / 1024:.1f}", stage['last_used'])
+    console.print(table)
+
+
+def run_stages(stages, args, cache, log_dir: Path, jobs: int, in_process: bool = False,
+               store: ArtifactStore = None):
+    """Exécuter les étapes en parallèle dès que leurs dépendances sont prêtes
+
+    Le cache est consulté et mis à jour dans le thread principal; les
+    workers ne font que lancer les scripts. En mode en process, les étapes
+    s'exécutent une à une dans le thread principal. Une étape dont les
+    sorties sont dans le cache d'artefacts (`store`) est restaurée. Retourne
+    {script: statut} avec statut parmi 'ok', 'cached', 'restored', 'skipped',
+    'failed', 'blocked'.
+    """
+    runner = run_in_process if in_process else run_script
+    executor = InlineExecutor if in_process else ThreadPoolExecutor
+    depends = stage_dependencies(stages)
+    pending = stage_order(stages)
+    status = {}
+    running = {}
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with executor(max_workers=jobs) as pool:
+        while pending or running:
+            for stage in list(pending):
+                required = depends[stage['script']]
+                if any(status.get(script) in ('failed', 'blocked') for script in required):
+                    status[stage['script']] = 'blocked'
+                    pending.remove(stage)
+                    console.print(f"[yellow]⛔ {stage['name']} non exécuté (dépendance en échec)[/]")
+                    continue
+                if not all(script in status for script in required):
+                    continue
+
+                pending.remove(stage)
+                skip_flag = stage.get('skip_flag')
+                if skip_flag and getattr(args, skip_flag.lstrip('-').replace('-', '_'), False):
+                    console.print(f"[yellow]⏭️  Skipping {stage['name']}[/]")
+                    status[stage['script']] = 'skipped'
+                elif cache is not None and not args.force and cache.is_up_to_date(stage):
+                    console.print(f"[dim]⏭️  {stage['name']} à jour (entrées inchangées)[/]")
+                    cache.up_to_date.append(stage['name'])
+                    status[stage['script']] = 'cached'
+                elif (store is not None and cache is not None and not args.force and stage['outputs']
+                      and store.restore(cache.inputs_digest(stage), cache.root)):
+                    console.print(f"[dim]📦 {stage['name']} restauré depuis le cache d'artefacts[/]")
+                    cache.record(stage)
+                    cache.save()
+                    status[stage['script']] = 'restored'
+                else:
+                    console.print(f"[bold cyan]▶️  {stage['name']}[/] [dim]{stage['description']}[/]")
+                    log_path = log_dir / f"{Path(stage['script']).stem}.log"
+                    profile_path = log_path.with_suffix('.prof') if args.profile else None
+                    inputs = cache.inputs_digest(stage) if cache is not None else None
+                    running[pool.submit(runner, stage, log_path, profile_path)] = (stage, log_path, inputs)
+
+            if not running:
+                continue  # Nouvelles étapes prêtes (cache / skip)
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, log_path, inputs = running.pop(future)
+                success, usage = future.result()
+                elapsed = usage['wall_s']
+                telemetry.emit({
+                    'stage': Path(stage['script']).stem, 'step': 'stage', **usage, 'ok': success
+                })
+                if success:
+                    status[stage['script']] = 'ok'
+                    console.print(f"[green]✅ {stage['name']} terminé ({elapsed:.1f}s)[/]")
+                    if args.verbose:
+                        console.print(log_path.read_text(encoding='utf-8', errors='replace'))
+                    if cache is not None:
+                        cache.record(stage, inputs)
+                        cache.save()
+                        if store is not None:
+                            store_outputs(store, cache, stage)
+                else:
+                    status[stage['script']] = 'failed'
+                    console.print(f"[red]❌ Erreur dans {stage['name']} (log: {log_path})[/]")
+                    console.print(f"[red]{log_tail(log_path)}[/]")
+    return status
+
+
+def watched_files(stages):
+    """Fichiers sources à surveiller: code des étapes et entrées non produites par une étape"""
+    produced = {output for stage in stages for output in stage['outputs']}
+    files = set()
+    for stage in stages:
+        files.update(stage_code(stage))
+        files.update(path for path in stage['inputs'] if path not in produced)
+    return sorted(files)
+
+
+def file_stamps(paths):
+    """(mtime, taille) de chaque fichier (None s'il est absent)"""
+    stamps = {}
+    for relative_path in paths:
+        try:
+            stat = (BASE_PATH / relative_path).stat()
+            stamps[relative_path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamps[relative_path] = None
+    return stamps
+
+
+class _WakeHandler(FileSystemEventHandler):
+    """Réveiller la boucle de surveillance à chaque événement fichier"""
+
+    def __init__(self, wake: threading.Event):
+        self.wake = wake
+
+    def on_any_event(self, event):
+        self.wake.set()
+
+
+class ChangeWatcher:
+    """Attendre la modification d'un fichier surveillé
+
+    Les événements watchdog ne font que réveiller la boucle: les fichiers
+    modifiés sont déterminés en comparant (mtime, taille), ce qui ignore
+    les sorties écrites dans les mêmes dossiers.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.stamps = file_stamps(paths)
+        self.wake = threading.Event()
+        self.observer = None
+        if Observer is not None:
+            handler = _WakeHandler(self.wake)
+            self.observer = Observer()
+            for directory in sorted({(BASE_PATH / path).parent for path in paths}):
+                if directory.exists():
+                    self.observer.schedule(handler, str(directory), recursive=False)
+            self.observer.start()
+
+    def wait(self):
+        """Bloquer jusqu'à une modification; retourne les fichiers modifiés"""
+        while True:
+            self.wake.wait(timeout=1.0 if self.observer else POLL_INTERVAL)
+            self.wake.clear()
+            if file_stamps(self.paths) == self.stamps:
+                continue
+            time.sleep(DEBOUNCE_S)  # Enregistrement en plusieurs écritures
+            self.wake.clear()
+            stamps = file_stamps(self.paths)
+            changed = [path for path in self.paths if stamps[path] != self.stamps[path]]
+            self.stamps = stamps
+            if changed:
+                return changed
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+
+def watch(args, store: ArtifactStore = None):
+    """Mode --watch: build initial puis rebuild des étapes concernées à chaque modification"""
+    args.in_process = True
+    stages = [stage for stage in SCRIPTS if stage['skip_flag'] is None]
+    cache = StageCache()
+    context = PipelineContext()
+    activate(context)
+
+    watcher = ChangeWatcher(watched_files(stages))
+    mode = "notifications watchdog" if watcher.observer else f"scrutation {POLL_INTERVAL}s"
+    console.print(f"\n[bold cyan]👀 Mode watch : {len(watcher.paths)} fichiers surveillés ({mode})[/]")
+
+    changed = None
+    try:
+        while True:
+            start_time = datetime.now()
+            log_dir = BASE_PATH / "logs" / f"run_{start_time.strftime('%Y%m%d_%H%M%S_%f')}"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            os.environ[telemetry.ENV_VAR] = str(log_dir / "telemetry.jsonl")
+            if changed:
+                console.print(f"\n[bold cyan]🔄 Modifié : {', '.join(changed)}[/]")
+
+            cache.up_to_date = []
+            status = run_stages(stages, args, cache, log_dir, 1, in_process=True, store=store)
+            write_telemetry(log_dir)
+
+            elapsed = (datetime.now() - start_time).total_seconds()
+            executed = sum(1 for state in status.values() if state == 'ok')
+            failed = [stage['name'] for stage in stages if status.get(stage['script']) == 'failed']
+            if failed:
+                console.print(f"[red]❌ Build en échec ({', '.join(failed)}) - {elapsed:.1f}s[/]")
+            else:
+                console.print(f"[green]✅ Build à jour : {executed} étape(s) relancée(s) en {elapsed:.1f}s[/]")
+            console.print("[dim]En attente de modifications (Ctrl+C pour quitter)...[/]")
+            args.force = False  # --force: seulement pour le build initial
+            changed = watcher.wait()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]👋 Mode watch arrêté[/]")
+    finally:
+        watcher.stop()
+        deactivate()
+    return 0
+
+
+def load_manifest(manifest_path: Path):
+    """Plans du manifeste: [{'name', 'path'}] (chemins relatifs au manifeste)
+
+    plans:
+      - name: acme
+        path: plans/acme
+      - plans/globex          # nom = nom du dossier
+    """
+    import yaml
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = yaml.safe_load(f) or {}
+    entries = manifest.get('plans', []) if isinstance(manifest, dict) else manifest
+
+    plans = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'path': entry}
+        path = (manifest_path.parent / entry['path']).resolve()
+        plans.append({'name': entry.get('name', path.name), 'path': str(path)})
+    names = [plan['name'] for plan in plans]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Noms de plans en double dans le manifeste: {', '.join(duplicates)}")
+    return plans
+
+
+def prepare_plan(root: Path):
+    """Préparer le dossier d'un plan: fichiers raw absents liés depuis le dépôt"""
+    assumptions_path = root / "data" / "structured" / "assumptions.yaml"
+    if not assumptions_path.exists():
+        raise FileNotFoundError(f"assumptions.yaml absent: {assumptions_path}")
+    (root / "data" / "outputs").mkdir(parents=True, exist_ok=True)
+    for relative_path in RAW_FILES:
+        target = root / relative_path
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            target.symlink_to(BASE_PATH / relative_path)
+        except OSError:  # Pas de liens symboliques (Windows sans droits)
+            import shutil
+            shutil.copy2(BASE_PATH / relative_path, target)
+
+
+def plan_kpis(root: Path):
+    """Indicateurs de synthèse d'un plan (projections 50M)"""
+    from projection_io import find_projections, load_projections
+
+    projections_path = find_projections(root / "data" / "structured", "projections_50m")
+    if not projections_path.exists():
+        return {}
+    projections = load_projections(projections_path)
+    first_period_end = min(14, len(projections))
+    return {
+        'months': len(projections),
+        'arr_m14': projections[first_period_end - 1]['metrics']['arr'],
+        'arr_final': projections[-1]['metrics']['arr'],
+        'ca_total': sum(month_data['revenue']['total'] for month_data in projections),
+        'min_cash': min(month_data['metrics']['cash'] for month_data in projections),
+        'team_final': projections[-1]['metrics']['team_size'],
+    }
+
+
+def run_plan(plan, args, store: ArtifactStore = None):
+    """Pipeline complet d'un plan, en process (exécuté dans un worker du pool)
+
+    La sortie console des étapes va dans logs/run_.../pipeline.log du plan.
+    """
+    root = Path(plan['path'])
+    start = time.perf_counter()
+    result = {'name': plan['name'], 'path': plan['path'], 'status': 'ok', 'failed': []}
+    try:
+        prepare_plan(root)
+        os.environ[PLAN_ENV_VAR] = str(root)
+        log_dir = root / "logs" / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        os.environ[telemetry.ENV_VAR] = str(log_dir / "telemetry.jsonl")
+        result['log_dir'] = str(log_dir)
+
+        stages = [stage for stage in SCRIPTS if stage['skip_flag'] is None]
+        cache = StageCache(root / ".cache" / "run_state.json", root)
+        context = PipelineContext()
+        activate(context)
+        try:
+            with open(log_dir / "pipeline.log", 'w', encoding='utf-8') as log, \
+                    contextlib.redirect_stdout(log):
+                status = run_stages(stages, args, cache, log_dir, 1, in_process=True, store=store)
+            write_telemetry(log_dir)
+            result['failed'] = [stage['name'] for stage in stages
+                                if status.get(stage['script']) in ('failed', 'blocked')]
+            if result['failed']:
+                result['status'] = 'failed'
+            result.update(plan_kpis(root))
+        finally:
+            deactivate()
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['elapsed'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+SUMMARY_COLUMNS = ['name', 'status', 'elapsed', 'months', 'arr_m14', 'arr_final',
+                   'ca_total', 'min_cash', 'team_final', 'failed', 'error', 'path']
+
+
+def write_portfolio_summary(results, summary_path: Path):
+    """Tableau consolidé du portefeuille (CSV + JSON)"""
+    import csv
+
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(summary_path.with_suffix('.csv'), 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        for result in results:
+            writer.writerow({**result, 'failed': '; '.join(result.get('failed', []))})
+
+
+def run_portfolio(args, store: ArtifactStore = None):
+    """Mode --manifest: un pipeline par plan, plans répartis sur un pool de process"""
+    from rich.table import Table
+
+    manifest_path = args.manifest.resolve()
+    try:
+        plans = load_manifest(manifest_path)
+    except (OSError, ValueError, KeyError) as e:
+        console.print(f"[red]❌ Manifeste illisible ({manifest_path}) : {e}[/]")
+        return 1
+    if not plans:
+        console.print(f"[yellow]⚠️  Aucun plan dans {manifest_path}[/]")
+        return 1
+
+    workers = max(1, min(args.jobs, len(plans)))
+    console.print(f"\n[bold cyan]🗂️  Portefeuille : {len(plans)} plan(s), {workers} worker(s)[/]")
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_plan, plan, args, store): plan for plan in plans}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['status'] == 'ok':
+                console.print(f"[green]✅ {result['name']} ({result['elapsed']:.1f}s)[/]")
+            else:
+                detail = result.get('error') or ', '.join(result['failed'])
+                console.print(f"[red]❌ {result['name']} : {detail}[/]")
+    elapsed = time.perf_counter() - start
+
+    order = [plan['name'] for plan in plans]
+    results.sort(key=lambda result: order.index(result['name']))
+    summary_path = args.summary or manifest_path.parent / "portfolio_summary.csv"
+    write_portfolio_summary(results, summary_path)
+
+    table = Table(show_header=True, header_style="bold cyan")
+    for column in ("Plan", "Statut", "Durée", "ARR M14", "ARR fin", "CA cumulé", "Cash min", "Équipe"):
+        table.add_column(column, justify="left" if column in ("Plan", "Statut") else "right")
+    for result in results:
+        money = lambda key: f"{result[key]:,.0f}€" if key in result else "-"
+        table.add_row(
+            result['name'],
+            "[green]ok[/]" if result['status'] == 'ok' else "[red]échec[/]",
+            f"{result['elapsed']:.1f}s",
+            money('arr_m14'), money('arr_final'), money('ca_total'), money('min_cash'),
+            str(result.get('team_final', '-'))
         )
-        
-        # Afficher output si verbose
-        if args.verbose and result.stdout:
-            console.print(result.stdout)
-        
-        console.print(f"[green]✅ {script_info['name']} terminé avec succès[/]")
-        return True
-        
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]❌ Erreur dans {script_info['name']}[/]")
-        console.print(f"[red]{e.stderr}[/]")
-        return False
+    console.print(table)
+    console.print(f"[cyan]⏱️  {len(plans)} plan(s) en {elapsed:.1f}s "
+                  f"(somme des plans : {sum(r['elapsed'] for r in results):.1f}s)[/]")
+    console.print(f"[dim]Synthèse : {summary_path.with_suffix('.csv')} (+ .json)[/]")
+    return 0 if all(result['status'] == 'ok' for result in results) else 1
 
 
 def main():
@@ -174,6 +1158,67 @@ def main():
         action='store_true',
         help="Exécuter seulement la validation"
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="Relancer toutes les étapes (ignorer le cache)"
+    )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Étapes exécutées en parallèle (défaut: nombre de coeurs)"
+    )
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help="Exécuter les étapes dans ce process (imports et fichiers parsés partagés)"
+    )
+    parser.add_argument(
+        '--artifact-cache',
+        type=Path,
+        default=ARTIFACT_CACHE_PATH,
+        help="Dossier du cache d'artefacts (local ou partagé, défaut: .cache/artifacts)"
+    )
+    parser.add_argument(
+        '--artifact-cache-max-mb',
+        type=int,
+        default=DEFAULT_MAX_MB,
+        help="Taille max du cache d'artefacts en Mo (éviction LRU)"
+    )
+    parser.add_argument(
+        '--no-artifact-cache',
+        action='store_true',
+        help="Ne pas lire ni alimenter le cache d'artefacts"
+    )
+    parser.add_argument(
+        '--cache-stats',
+        action='store_true',
+        help="Afficher le contenu du cache d'artefacts et quitter"
+    )
+    parser.add_argument(
+        '--manifest',
+        type=Path,
+        default=None,
+        help="Manifeste YAML des dossiers de plans (mode portefeuille)"
+    )
+    parser.add_argument(
+        '--summary',
+        type=Path,
+        default=None,
+        help="Tableau de synthèse du portefeuille (défaut: portfolio_summary.csv à côté du manifeste)"
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help="Rester actif et relancer les étapes concernées à chaque modification"
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help="Profil cProfile de chaque étape (logs/run_.../<étape>.prof)"
+    )
     parser.add_argument(
         '--verbose',
         '-v',
@@ -182,6 +1227,7 @@ def main():
     )
     
     args = parser.parse_args()
+    from rich.panel import Panel  # Après parse_args: --help n'importe pas rich
     
     # Header
     console.print(Panel.fit(
@@ -191,6 +1237,15 @@ def main():
     ))
     
     start_time = datetime.now()
+    store = None
+    if not args.no_artifact_cache:
+        store = ArtifactStore(args.artifact_cache, args.artifact_cache_max_mb * 1024 * 1024)
+
+    if args.cache_stats:
+        if store is None:
+            store = ArtifactStore(args.artifact_cache)
+        print_cache_stats(store)
+        sys.exit(0)
     
     # Checks préliminaires
     if not check_dependencies():
@@ -199,38 +1254,77 @@ def main():
     if not check_source_files():
         sys.exit(1)
     
+    if args.watch:
+        sys.exit(watch(args, store))
+
+    if args.manifest:
+        sys.exit(run_portfolio(args, store))
+
+    log_dir = BASE_PATH / "logs" / f"run_{start_time.strftime('%Y%m%d_%H%M%S')}"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    # Hérité par les sous-process: chaque étape y ajoute ses sous-étapes
+    os.environ[telemetry.ENV_VAR] = str(log_dir / "telemetry.jsonl")
+
     # Mode validation uniquement
     if args.validate_only:
         console.print("\n[bold yellow]⚡ Mode validation uniquement[/]")
-        validation_script = next(s for s in SCRIPTS if '6.' in s['name'])
-        success = run_script(validation_script, args)
-        sys.exit(0 if success else 1)
+        validation_script = next(s for s in SCRIPTS if s['name'].startswith('6.'))
+        status = run_stages([validation_script], args, None, log_dir, 1, args.in_process)
+        write_telemetry(log_dir)
+        sys.exit(0 if status[validation_script['script']] == 'ok' else 1)
     
-    # Exécution séquentielle
-    console.print("\n[bold cyan]🚀 Démarrage génération BP...[/]")
+    # Exécution (étapes indépendantes en parallèle, ou en process)
+    if args.in_process:
+        console.print("\n[bold cyan]🚀 Démarrage génération BP (en process)...[/]")
+        context = PipelineContext()
+        activate(context)
+    else:
+        console.print(f"\n[bold cyan]🚀 Démarrage génération BP ({args.jobs} en parallèle)...[/]")
     
-    success_count = 0
-    for script_info in SCRIPTS:
-        if run_script(script_info, args):
-            success_count += 1
-        else:
-            console.print(f"\n[red]❌ Échec à l'étape {script_info['name']}[/]")
-            console.print("[yellow]Vérifier les logs pour détails[/]")
-            sys.exit(1)
+    cache = StageCache()
+    status = run_stages(SCRIPTS, args, cache, log_dir, max(1, args.jobs), args.in_process, store)
+    if args.in_process:
+        deactivate()
+        console.print(
+            f"[dim]Contexte partagé : {context.hits} lecture(s) évitée(s), "
+            f"{context.misses} fichier(s) parsé(s)[/]"
+        )
+    records = write_telemetry(log_dir)
+    print_telemetry(records)
+    
+    failed = [s['name'] for s in SCRIPTS if status.get(s['script']) == 'failed']
+    blocked = [s['name'] for s in SCRIPTS if status.get(s['script']) == 'blocked']
+    if failed:
+        console.print("\n[red]❌ Échec par étape :[/]")
+        for stage in SCRIPTS:
+            state = status.get(stage['script'])
+            label = {'ok': '[green]✅ ok[/]', 'cached': '[dim]⏭️  à jour[/]',
+                     'restored': '[dim]📦 restauré[/]',
+                     'skipped': '[yellow]⏭️  skip[/]', 'failed': '[red]❌ échec[/]',
+                     'blocked': '[yellow]⛔ bloqué[/]'}.get(state, state)
+            console.print(f"  {stage['name']}: {label}")
+        console.print(f"[yellow]Vérifier les logs : {log_dir}[/]")
+        sys.exit(1)
     
     # Résumé final
     elapsed = datetime.now() - start_time
+    cached_count = len(cache.up_to_date)
+    executed_count = sum(1 for state in status.values() if state == 'ok')
+    restored_count = sum(1 for state in status.values() if state == 'restored')
     
     console.print("\n" + "="*60)
     console.print(Panel.fit(
         f"[bold green]✅ Génération BP terminée avec succès ![/]\n\n"
         f"[cyan]📊 Livrables générés :[/]\n"
         f"  • data/structured/assumptions.yaml\n"
-        f"  • data/structured/projections.json\n"
+        f"  • data/structured/projections_50m.jsonl\n"
         f"  • data/outputs/BP_14M_Nov2025-Dec2026.xlsx\n"
+        f"  • data/outputs/BP_50M_Nov2025-Dec2029.xlsx\n"
+        f"  • data/outputs/BP_50M_FINAL_Nov2025-Dec2029.xlsx\n"
         f"  • data/outputs/BM_Updated_14M.docx\n\n"
         f"[cyan]⏱️  Durée totale : {elapsed.total_seconds():.1f}s[/]\n"
-        f"[cyan]✓ Scripts exécutés : {success_count}/{len(SCRIPTS)}[/]",
+        f"[cyan]✓ Scripts exécutés : {executed_count}/{len(SCRIPTS)}"
+        f" ({cached_count} à jour, {restored_count} restauré(s) du cache)[/]",
         border_style="green"
     ))
     
@@ -240,7 +1334,7 @@ def main():
     console.print("  2. Review data/outputs/BM_Updated_14M.docx")
     console.print("  3. Ajuster assumptions.yaml si nécessaire")
     console.print("  4. Regénérer : python run.py")
-    console.print("\n[dim]Logs détaillés : logs/run_YYYYMMDD_HHMMSS.log[/]")
+    console.print(f"\n[dim]Logs détaillés : {log_dir.relative_to(BASE_PATH)}/[/]")
 
 
 if __name__ == "__main__":
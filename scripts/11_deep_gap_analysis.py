@@ -4,7 +4,6 @@ Gap Analysis Approfondie: RAW vs FINAL
 Analyse méthodique sheet par sheet pour identifier tous les éléments manquants
 """
 
-import openpyxl
 from pathlib import Path
 import yaml
 from rich.console import Console
@@ -12,6 +11,8 @@ from rich.table import Table
 from rich import box
 import logging
 
+from workbook_snapshot import load_workbook  # Parsé au plus une fois par contenu
+
 console = Console()
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -23,11 +24,11 @@ class DeepGapAnalyzer:
         self.final_path = final_path
 
         logger.info(f"📂 Chargement RAW: {raw_path.name}")
-        self.raw_wb = openpyxl.load_workbook(raw_path, data_only=False)
+        self.raw_wb = load_workbook(raw_path, data_only=False)
         logger.info(f"✓ RAW: {len(self.raw_wb.sheetnames)} sheets")
 
         logger.info(f"📂 Chargement FINAL: {final_path.name}")
-        self.final_wb = openpyxl.load_workbook(final_path, data_only=False)
+        self.final_wb = load_workbook(final_path, data_only=False)
         logger.info(f"✓ FINAL: {len(self.final_wb.sheetnames)} sheets")
 
         logger.info(f"📂 Chargement assumptions: {assumptions_path.name}")
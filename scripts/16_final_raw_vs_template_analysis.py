@@ -4,12 +4,13 @@ Analyse finale RAW vs TEMPLATE (post Phase 6)
 Identifier ce qui reste à faire
 """
 
-import openpyxl
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
+from workbook_snapshot import load_workbook  # Parsé au plus une fois par contenu
+
 console = Console()
 
 base_path = Path(__file__).parent.parent
@@ -23,8 +24,8 @@ console.print("[bold cyan]══════════════════
 console.print(f"[cyan]RAW:[/cyan] {raw_file.name}")
 console.print(f"[cyan]TEMPLATE:[/cyan] {template_file.name}\n")
 
-wb_raw = openpyxl.load_workbook(raw_file, data_only=False)
-wb_template = openpyxl.load_workbook(template_file, data_only=False)
+wb_raw = load_workbook(raw_file, data_only=False)
+wb_template = load_workbook(template_file, data_only=False)
 
 # ═══ COMPARAISON SHEETS ═══
 console.print("[bold yellow]═══ 1. COMPARAISON SHEETS ═══[/bold yellow]\n")
@@ -2,21 +2,31 @@
 """
 GenieFactory BP - Script 3: Calcul Projections (Étendu 50 mois)
 Calcule ARR, CA, charges, EBITDA pour chaque mois M1-M50 (Nov 2025 - Dec 2029)
+L'horizon est paramétrable (--months), le départ vient de timeline.start_month.
 
 Input:
   - data/structured/assumptions.yaml
 
 Output:
-  - data/structured/projections_50m.json
+  - data/structured/projections_50m.jsonl (un mois par ligne)
+    ou data/structured/projections_50m.json avec --format json
+  - data/structured/projections.jsonl (première période M1-M14, livrables 14 mois)
+
+Usage:
+    python scripts/3_calculate_projections.py                  # Moteur dict (mois par mois)
+    python scripts/3_calculate_projections.py --engine array   # Moteur vectorisé NumPy
+    python scripts/3_calculate_projections.py --months 120     # Plan 10 ans
 """
 
 import json
-import yaml
 import logging
-from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
-from dateutil.relativedelta import relativedelta
+import argparse
+from typing import Dict, Any, List, Iterator
+
+from assumptions_plan import AssumptionsPlan
+from projection_io import JsonlProjectionWriter
+from pipeline_context import load_yaml, publish, plan_root
+from telemetry import span
 
 # Configuration logging
 logging.basicConfig(
@@ -27,88 +37,70 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+ENGINES = ('dict', 'array')
+
+
 class ProjectionCalculator:
-    """Calculateur de projections financières (50 mois)"""
+    """Calculateur de projections financières (50 mois)
+
+    engine='dict'  : calcul mois par mois (calculate_month)
+    engine='array' : calcul vectorisé par colonnes (ArrayProjectionEngine),
+                     JSON identique octet pour octet
+
+    Les hypothèses sont compilées une fois (AssumptionsPlan) : les lectures
+    par mois (prix, volumes, équipe, FTE, budgets) sont indexées en O(1).
+
+    months_data sert de checkpoints: seuls les clients Hub et le cash passent
+    d'un mois au suivant, donc recalculate() ne refait que les mois à partir
+    de la première modification.
+    """
 
-    def __init__(self, assumptions: Dict[str, Any], months_count: int = 50):
+    def __init__(self, assumptions: Dict[str, Any], months_count: int = 50, engine: str = 'dict'):
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu: {engine} (attendu: {', '.join(ENGINES)})")
         self.assumptions = assumptions
         self.months_data = []
         self.months_count = months_count
+        self.engine = engine
+        self.plan = AssumptionsPlan(assumptions, months_count)
 
     def get_month_date(self, month_index: int) -> str:
-        """Calculer la date d'un mois (M1 = Nov 2025)"""
-        start_date = datetime(2025, 11, 1)  # Nov 2025
-        month_date = start_date + relativedelta(months=month_index - 1)
-        return month_date.strftime('%Y-%m')
+        """Calculer la date d'un mois (M1 = timeline.start_month, Nov 2025)"""
+        return self.plan.calendar.date_for_month(month_index)
 
     def get_year_for_month(self, month: int) -> int:
         """Déterminer l'année pour un mois donné
-        M1-M14: 2025-2026
-        M15-M26: 2027
-        M27-M38: 2028
-        M39-M50: 2029
+        M1-M14: 2025-2026 (libellée 2025)
+        puis années civiles: M15-M26 = 2027, M27-M38 = 2028, ...
         """
-        if month <= 14:
-            return 2025  # 2025-2026
-        elif month <= 26:
-            return 2027
-        elif month <= 38:
-            return 2028
-        else:
-            return 2029
+        return self.plan.calendar.year_for_month(month)
+
+    def log_milestone(self, month_data: Dict[str, Any]):
+        """Logger un milestone de fin de période annuelle"""
+        month = month_data['month']
+        logger.info(f"\n  🎯 MILESTONE M{month} ({self.plan.calendar.month_label(month)}):")
+        logger.info(f"    ARR: {month_data['metrics']['arr']:,.0f}€ | Cash: {month_data['metrics']['cash']:,.0f}€")
 
     def get_hackathon_price(self, month: int) -> float:
         """Obtenir le prix hackathon pour un mois donné"""
-        periods = self.assumptions['pricing']['hackathon']['periods']
-        for period in periods:
-            if period['start_month'] <= month <= period['end_month']:
-                return period['price_eur']
-        return periods[0]['price_eur']  # Défaut
+        return self.plan.hackathon_price[month - 1]
 
     def get_factory_price(self, month: int) -> float:
         """Obtenir le prix factory pour un mois donné"""
-        periods = self.assumptions['pricing']['factory']['periods']
-        for period in periods:
-            if period['start_month'] <= month <= period['end_month']:
-                return period['price_eur']
-        return periods[0]['price_eur']
+        return self.plan.factory_price[month - 1]
 
     def get_services_price(self, month: int) -> float:
         """Obtenir le prix services pour un mois donné"""
-        periods = self.assumptions['pricing']['services']['implementation']['periods']
-        for period in periods:
-            if period['start_month'] <= month <= period['end_month']:
-                return period['price_eur']
-        return periods[0]['price_eur']
+        return self.plan.services_price[month - 1]
 
     def get_team_size(self, month: int) -> int:
         """Obtenir la taille de l'équipe pour un mois donné"""
-        evolution = self.assumptions['costs']['personnel']['team_evolution']
-        # Trouver la dernière valeur <= month
-        team_size = 5  # Défaut
-        for m in range(1, month + 1):
-            key = f'm{m}'
-            if key in evolution:
-                team_size = evolution[key]
-        return team_size
+        return self.plan.team_size[month - 1]
 
     def calculate_hackathon_revenue(self, month: int) -> Dict[str, Any]:
         """Calculer revenus hackathons"""
-        # M1-M14: short term
-        volumes = self.assumptions['sales_assumptions']['hackathon']['volumes_monthly']
-        nb_hackathons = volumes.get(f'm{month}', None)
-
-        # M15-M50: long term sales
-        if nb_hackathons is None and month > 14:
-            long_term = self.assumptions.get('sales_assumptions', {}).get('long_term_sales', {})
-            if long_term:
-                nb_hackathons = long_term['hackathon'].get(f'm{month}', 0)
-            else:
-                nb_hackathons = 0
-
-        if nb_hackathons is None:
-            nb_hackathons = 0
-
+        # M1-M14: short term, M15-M50: long term sales (résolus dans le plan)
+        nb_hackathons = self.plan.hackathon_volume[month - 1]
         price = self.get_hackathon_price(month)
         revenue = nb_hackathons * price
 
@@ -120,33 +112,15 @@ class ProjectionCalculator:
 
     def calculate_factory_revenue(self, month: int) -> Dict[str, Any]:
         """Calculer revenus factory (conversion hackathons avec délai)"""
-        # Check both short and long term for conversion rate
-        long_term_sales = self.assumptions.get('sales_assumptions', {}).get('long_term_sales', {})
-        if long_term_sales and 'factory' in long_term_sales:
-            conversion_rate = long_term_sales['factory'].get('conversion_rate', 0.35)
-        else:
-            conversion_rate = self.assumptions['sales_assumptions']['factory']['conversion_rate']
-
-        delay = self.assumptions['sales_assumptions']['factory'].get('delay_months', 2)
+        conversion_rate = self.plan.factory_conversion_rate
+        delay = self.plan.factory_delay
 
         # Factory M = conversion des hackathons (M - delay)
         source_month = month - delay
         if source_month < 1:
             return {'volume': 0, 'price_unit': 0, 'revenue': 0}
 
-        # Hackathons source - check both short and long term
-        hackathon_volumes = self.assumptions['sales_assumptions']['hackathon']['volumes_monthly']
-        source_hackathons = hackathon_volumes.get(f'm{source_month}', None)
-
-        # If not found in short term and source_month > 14, check long term
-        if source_hackathons is None and source_month > 14:
-            if long_term_sales and 'hackathon' in long_term_sales:
-                source_hackathons = long_term_sales['hackathon'].get(f'm{source_month}', 0)
-            else:
-                source_hackathons = 0
-
-        if source_hackathons is None:
-            source_hackathons = 0
+        source_hackathons = self.plan.hackathon_volume[source_month - 1]
 
         # Conversion
         nb_factory = source_hackathons * conversion_rate
@@ -163,8 +137,8 @@ class ProjectionCalculator:
 
     def calculate_hub_revenue(self, month: int) -> Dict[str, Any]:
         """Calculer revenus Enterprise Hub (MRR avec churn et upgrades)"""
-        hub_config = self.assumptions['sales_assumptions']['enterprise_hub']
-        launch_month = self.assumptions['pricing']['enterprise_hub']['launch_month']
+        plan = self.plan
+        launch_month = plan.hub_launch_month
 
         if month < launch_month:
             return {
@@ -184,53 +158,34 @@ class ProjectionCalculator:
             customers_business = prev_hub['customers']['business']
             customers_enterprise = prev_hub['customers']['enterprise']
 
-        # Nouveaux clients ce mois
-        # Pour M1-M14: utiliser volumes définis
-        # Pour M15-M50: utiliser long_term_sales
-        new_customers = hub_config['new_customers_monthly'].get(f'm{month}', None)
-
-        if new_customers is None and month > 14:
-            # Check long_term_sales first (more specific)
-            long_term_sales = self.assumptions.get('sales_assumptions', {}).get('long_term_sales', {})
-            if long_term_sales and 'enterprise_hub' in long_term_sales:
-                new_customers = long_term_sales['enterprise_hub'].get(f'm{month}', None)
-
-            # Fallback to long_term_projections by year
-            if new_customers is None and 'long_term_projections' in self.assumptions:
-                year = self.get_year_for_month(month)
-                lt_proj = self.assumptions['long_term_projections']['years'].get(str(year), {})
-                new_customers = lt_proj.get('new_customers_hub_monthly', 8)  # Défaut 8/mois
+        # Nouveaux clients ce mois (M1-M14 volumes définis, M15-M50 long terme)
+        new_customers = plan.hub_new_customers[month - 1]
 
-            if new_customers is None:
-                new_customers = 8  # Conservateur
-        elif new_customers is None:
-            new_customers = 0
-
-        tier_dist = hub_config['tier_distribution_at_launch']
+        tier_dist = plan.hub_tier_distribution
 
         new_starter = new_customers * tier_dist['starter']
         new_business = new_customers * tier_dist['business']
         new_enterprise = new_customers * tier_dist['enterprise']
 
         # Churn
-        churn_rate = hub_config['churn_monthly']
+        churn_rate = plan.hub_churn_monthly
         customers_starter = customers_starter * (1 - churn_rate) + new_starter
         customers_business = customers_business * (1 - churn_rate) + new_business
         customers_enterprise = customers_enterprise * (1 - churn_rate) + new_enterprise
 
         # Upgrades (simplifié - seulement après 3 mois)
         if month >= launch_month + 3:
-            upgrade_rate = hub_config['upgrade_patterns']['starter_to_business_rate']
+            upgrade_rate = plan.hub_upgrade_rate
             upgrades = customers_starter * upgrade_rate * 0.1  # 10% par mois des eligibles
             customers_starter -= upgrades
             customers_business += upgrades
 
         # MRR
-        tiers = self.assumptions['pricing']['enterprise_hub']['tiers']
+        tier_prices = plan.hub_tier_prices
         mrr = (
-            customers_starter * tiers['starter']['monthly_eur'] +
-            customers_business * tiers['business']['monthly_eur'] +
-            customers_enterprise * tiers['enterprise']['monthly_eur']
+            customers_starter * tier_prices['starter'] +
+            customers_business * tier_prices['business'] +
+            customers_enterprise * tier_prices['enterprise']
         )
 
         arr = mrr * 12
@@ -269,7 +224,6 @@ class ProjectionCalculator:
     def calculate_personnel_costs(self, month: int) -> Dict[str, Any]:
         """Calculer coûts personnel (détaillé par rôle)"""
         team_size = self.get_team_size(month)
-        year = self.get_year_for_month(month)
 
         # Vérifier si personnel_details existe
         if 'personnel_details' not in self.assumptions:
@@ -292,21 +246,14 @@ class ProjectionCalculator:
         personnel_details = self.assumptions['personnel_details']
         charges_sociales_rate = personnel_details['charges_sociales_rate']
 
-        # Déterminer la clé de timeline selon l'année
-        if year == 2025:
-            timeline_key = 'm1_m14'
-        else:
-            timeline_key = f'y{year}'
-
         total_brut = 0
         total_fte = 0
         roles_detail = {}
 
-        for role_name, role_data in personnel_details['roles'].items():
-            fte = role_data['fte_timeline'].get(timeline_key, 0)
+        for role_name, fte_by_month in self.plan.role_fte.items():
+            fte = fte_by_month[month - 1]
             if fte > 0:
-                salary_annual = role_data['salary_brut_annual']
-                salary_monthly = salary_annual / 12
+                salary_monthly = self.plan.role_salary_monthly[role_name]
                 cost_monthly = salary_monthly * fte
 
                 total_brut += cost_monthly
@@ -394,26 +341,20 @@ class ProjectionCalculator:
 
     def calculate_marketing_costs(self, month: int) -> Dict[str, Any]:
         """Calculer coûts marketing (détaillé par canal)"""
-        year = self.get_year_for_month(month)
-
         # Vérifier si marketing_budgets existe (nouveau format)
         if 'marketing_budgets' in self.assumptions:
-            marketing_new = self.assumptions['marketing_budgets']
-
-            # Digital ads selon l'année
-            digital_budget = marketing_new['digital_ads']['monthly_budgets'].get(f'y{year}', 2000)
+            # Budgets par canal selon l'année (résolus dans le plan)
+            budgets = self.plan.marketing
+            digital_budget = budgets['digital_ads'][month - 1]
 
-            # Events selon l'année (pas tous les mois - trimestriels)
-            events_monthly = marketing_new['events']['monthly_budgets'].get(f'y{year}', 1000)
+            # Events (pas tous les mois - trimestriels)
+            events_monthly = budgets['events'][month - 1]
             events_budget = 0
             if month % 3 == 0:  # Trimestres (M3, M6, M9, M12, etc.)
                 events_budget = events_monthly * 3  # Budget trimestriel
 
-            # Content selon l'année
-            content_budget = marketing_new['content']['monthly_budgets'].get(f'y{year}', 1000)
-
-            # Partnerships selon l'année
-            partnerships_budget = marketing_new['partnerships']['monthly_budgets'].get(f'y{year}', 500)
+            content_budget = budgets['content'][month - 1]
+            partnerships_budget = budgets['partnerships'][month - 1]
 
             total = digital_budget + events_budget + content_budget + partnerships_budget
 
@@ -483,11 +424,7 @@ class ProjectionCalculator:
         burn_rate = -ebitda if ebitda < 0 else 0
 
         # Cash position (avec fundings)
-        fundings = self.assumptions['financial_kpis']['cash_management']['fundings']
-        funding_this_month = 0
-        for funding in fundings:
-            if funding['month'] == month:
-                funding_this_month = funding['amount']
+        funding_this_month = self.plan.funding[month - 1]
 
         # Cash cumulé
         prev_cash = 0
@@ -538,29 +475,106 @@ class ProjectionCalculator:
 
     def calculate_all_months(self) -> List[Dict[str, Any]]:
         """Calculer projections pour tous les mois (M1-M50 par défaut)"""
-        logger.info(f"\n🔢 CALCUL PROJECTIONS M1-M{self.months_count}")
+        for _ in self.iter_months():
+            pass
+        return self.months_data
+
+    def iter_months(self) -> Iterator[Dict[str, Any]]:
+        """Calculer et produire les mois un par un (écriture streaming)"""
+        logger.info(f"\n🔢 CALCUL PROJECTIONS M1-M{self.months_count} (moteur {self.engine})")
         logger.info("="*60)
 
+        if self.engine == 'array':
+            yield from self.calculate_all_months_array()
+            return
+
+        self.months_data = []
+        milestones = set(self.plan.calendar.period_end_months())
         for month in range(1, self.months_count + 1):
             month_data = self.calculate_month(month)
             self.months_data.append(month_data)
 
-            # Log milestones
-            if month in [14, 26, 38, 50]:
-                year_label = {14: "2026", 26: "2027", 38: "2028", 50: "2029"}[month]
-                logger.info(f"\n  🎯 MILESTONE M{month} (Dec {year_label}):")
-                logger.info(f"    ARR: {month_data['metrics']['arr']:,.0f}€ | Cash: {month_data['metrics']['cash']:,.0f}€")
+            # Log milestones (fin de chaque période annuelle)
+            if month in milestones:
+                self.log_milestone(month_data)
+
+            yield month_data
+
+    def recalculate(self, assumptions: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Recalcul incrémental après modification des hypothèses
+
+        Compare le nouveau plan à l'actuel et ne recalcule que les mois à partir
+        du premier mois touché (ex: m37 de long_term_sales, funding M36). Les
+        mois précédents sont conservés tels quels. `assumptions` doit être un
+        nouveau dict (ex: copie modifiée), pas l'ancien modifié sur place.
+        """
+        new_plan = AssumptionsPlan(assumptions, self.months_count)
+        start = self.plan.first_changed_month(new_plan) if self.months_data else 1
+
+        self.assumptions = assumptions
+        self.plan = new_plan
+
+        if start is None:
+            logger.info("✓ Aucune modification détectée, projections inchangées")
+            return self.months_data
+
+        if self.engine == 'array':
+            # Le moteur vectorisé recalcule tout l'horizon (coût négligeable)
+            return self.calculate_all_months_array()
+
+        logger.info(f"🔁 Recalcul incrémental M{start}-M{self.months_count}")
+        del self.months_data[start - 1:]
+        for month in range(start, self.months_count + 1):
+            self.months_data.append(self.calculate_month(month))
+
+        return self.months_data
+
+    def calculate_all_months_array(self) -> List[Dict[str, Any]]:
+        """Calculer tous les mois d'un coup avec le moteur vectorisé"""
+        from projection_engine import ArrayProjectionEngine  # NumPy: seulement pour ce moteur
+
+        engine = ArrayProjectionEngine(self.assumptions, self.months_count, plan=self.plan)
+        self.months_data = engine.to_months(engine.compute())
+
+        milestones = set(self.plan.calendar.period_end_months())
+        for month_data in self.months_data:
+            if month_data['month'] in milestones:
+                self.log_milestone(month_data)
 
         return self.months_data
 
 
 def main():
     """Fonction principale"""
+    parser = argparse.ArgumentParser(
+        description="Calcul des projections financières 50 mois"
+    )
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default='dict',
+        help="Moteur de calcul: dict (mois par mois) ou array (vectorisé NumPy)"
+    )
+    parser.add_argument(
+        '--months',
+        type=int,
+        default=50,
+        help="Horizon en mois (défaut 50: Nov 2025 - Dec 2029)"
+    )
+    parser.add_argument(
+        '--format',
+        choices=('jsonl', 'json'),
+        default='jsonl',
+        help="Sortie: jsonl (un mois par ligne, streaming) ou json (liste indentée)"
+    )
+    args = parser.parse_args()
+    months_count = args.months
+
     logger.info("="*60)
-    logger.info("🚀 CALCUL PROJECTIONS - GenieFactory BP 50 Mois (Nov 2025 - Dec 2029)")
+    logger.info(f"🚀 CALCUL PROJECTIONS - GenieFactory BP {months_count} Mois")
     logger.info("="*60)
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger assumptions
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
@@ -570,83 +584,89 @@ def main():
         return 1
 
     logger.info(f"📂 Chargement assumptions: {assumptions_path}")
-    with open(assumptions_path, 'r', encoding='utf-8') as f:
-        assumptions = yaml.safe_load(f)
+    assumptions = load_yaml(assumptions_path)
 
     logger.info(f"✓ Assumptions chargées (version {assumptions.get('version', '1.0')})")
     logger.info(f"  • ARR target M14: {assumptions['financial_kpis']['target_arr_dec_2026']:,}€")
-    logger.info(f"  • Période: Nov 2025 - Dec 2029 (50 mois)")
+    calendar = AssumptionsPlan(assumptions, months_count).calendar
+    logger.info(
+        f"  • Période: {calendar.month_label(1)} - {calendar.month_label(months_count)} "
+        f"({months_count} mois)"
+    )
     if 'long_term_projections' in assumptions:
         logger.info(f"  • Extensions long terme détectées (2027-2029)")
 
-    # Calculer projections 50 mois
-    calculator = ProjectionCalculator(assumptions, months_count=50)
-    projections = calculator.calculate_all_months()
-
-    # Sauvegarder
-    output_path = base_path / "data" / "structured" / "projections_50m.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(projections, f, indent=2, ensure_ascii=False)
+    # Calculer projections sur l'horizon demandé
+    calculator = ProjectionCalculator(assumptions, months_count=months_count, engine=args.engine)
+
+    # Sauvegarder (JSON Lines écrit au fil du calcul, ou ancien JSON indenté)
+    structured_path = base_path / "data" / "structured"
+    with span('calculate_projections', engine=args.engine, months=months_count):
+        if args.format == 'jsonl':
+            output_path = structured_path / "projections_50m.jsonl"
+            with JsonlProjectionWriter(output_path) as writer:
+                writer.write_all(calculator.iter_months())
+            projections = calculator.months_data
+        else:
+            projections = calculator.calculate_all_months()
+            output_path = structured_path / "projections_50m.json"
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(projections, f, indent=2, ensure_ascii=False)
+    publish(output_path, 'projections', projections)  # run.py --in-process
+
+    # Première période seule (M1-M14) pour les livrables 14 mois:
+    # BP Excel 14M, graphiques, BM Word et validation
+    first_period = calculator.plan.calendar.periods[0].last
+    if args.format == 'jsonl':
+        first_period_path = structured_path / "projections.jsonl"
+        with JsonlProjectionWriter(first_period_path) as writer:
+            writer.write_all(projections[:first_period])
+    else:
+        first_period_path = structured_path / "projections.json"
+        with open(first_period_path, 'w', encoding='utf-8') as f:
+            json.dump(projections[:first_period], f, indent=2, ensure_ascii=False)
+    publish(first_period_path, 'projections', projections[:first_period])
 
     logger.info("\n" + "="*60)
-    logger.info("✅ PROJECTIONS 50 MOIS CALCULÉES")
+    logger.info(f"✅ PROJECTIONS {months_count} MOIS CALCULÉES")
     logger.info("="*60)
     logger.info(f"📁 Fichier généré: {output_path}")
+    logger.info(f"📁 Première période (M1-M{first_period}): {first_period_path}")
     logger.info(f"📊 {len(projections)} mois de projections")
 
-    # Résumé - Milestones clés
+    # Résumé - Milestones clés (lancement, avant seed, fin de chaque période)
     logger.info("\n📊 RÉSUMÉ MILESTONES:")
-
-    m1 = projections[0]
-    m11 = projections[10]
-    m14 = projections[13]
-    m26 = projections[25]
-    m38 = projections[37]
-    m50 = projections[49]
-
-    logger.info(f"\n  M1 (Nov 2025) - Lancement:")
-    logger.info(f"    • CA: {m1['revenue']['total']:,.0f}€")
-    logger.info(f"    • ARR: {m1['metrics']['arr']:,.0f}€")
-    logger.info(f"    • Équipe: {m1['metrics']['team_size']} ETP")
-
-    logger.info(f"\n  M11 (Sept 2026) - Avant Seed:")
-    logger.info(f"    • CA: {m11['revenue']['total']:,.0f}€")
-    logger.info(f"    • ARR: {m11['metrics']['arr']:,.0f}€")
-    logger.info(f"    • Équipe: {m11['metrics']['team_size']} ETP")
-    logger.info(f"    • Cash: {m11['metrics']['cash']:,.0f}€")
-
-    logger.info(f"\n  M14 (Dec 2026) - Fin année 1:")
-    logger.info(f"    • CA: {m14['revenue']['total']:,.0f}€")
-    logger.info(f"    • ARR: {m14['metrics']['arr']:,.0f}€")
-    logger.info(f"    • Équipe: {m14['metrics']['team_size']} ETP")
-    logger.info(f"    • Cash: {m14['metrics']['cash']:,.0f}€")
-
-    logger.info(f"\n  M26 (Dec 2027) - Fin année 2:")
-    logger.info(f"    • CA: {m26['revenue']['total']:,.0f}€")
-    logger.info(f"    • ARR: {m26['metrics']['arr']:,.0f}€")
-    logger.info(f"    • Équipe: {m26['metrics']['team_size']} ETP")
-    logger.info(f"    • Cash: {m26['metrics']['cash']:,.0f}€")
-
-    logger.info(f"\n  M38 (Dec 2028) - Fin année 3:")
-    logger.info(f"    • CA: {m38['revenue']['total']:,.0f}€")
-    logger.info(f"    • ARR: {m38['metrics']['arr']:,.0f}€")
-    logger.info(f"    • Équipe: {m38['metrics']['team_size']} ETP")
-    logger.info(f"    • Cash: {m38['metrics']['cash']:,.0f}€")
-
-    logger.info(f"\n  M50 (Dec 2029) - Fin année 4:")
-    logger.info(f"    • CA: {m50['revenue']['total']:,.0f}€")
-    logger.info(f"    • ARR: {m50['metrics']['arr']:,.0f}€")
-    logger.info(f"    • Équipe: {m50['metrics']['team_size']} ETP")
-    logger.info(f"    • Cash: {m50['metrics']['cash']:,.0f}€")
+    calendar = calculator.plan.calendar
+
+    summary_points = [(1, "Lancement")]
+    if months_count > 11:
+        summary_points.append((11, "Avant Seed"))
+    for index, period in enumerate(calendar.periods, start=1):
+        if period.last > 1:
+            summary_points.append((period.last, f"Fin année {index}"))
+
+    for month, title in summary_points:
+        data = projections[month - 1]
+        logger.info(f"\n  M{month} ({calendar.month_label(month)}) - {title}:")
+        logger.info(f"    • CA: {data['revenue']['total']:,.0f}€")
+        logger.info(f"    • ARR: {data['metrics']['arr']:,.0f}€")
+        logger.info(f"    • Équipe: {data['metrics']['team_size']} ETP")
+        if month > 1:
+            logger.info(f"    • Cash: {data['metrics']['cash']:,.0f}€")
 
     # Vérifications rapides
     logger.info("\n🔍 CHECKS RAPIDES:")
 
-    arr_m14 = m14['metrics']['arr']
+    # Target ARR = fin de la 1ère période (M14, Dec 2026)
+    first_period = calendar.periods[0]
+    arr_first = projections[first_period.last - 1]['metrics']['arr']
     target = assumptions['financial_kpis']['target_arr_dec_2026']
-    arr_ok = (target * 0.9) <= arr_m14 <= (target * 1.1)
+    arr_ok = (target * 0.9) <= arr_first <= (target * 1.1)
 
-    logger.info(f"  {'✓' if arr_ok else '✗'} ARR M14: {arr_m14:,.0f}€ (target {target:,.0f}€ ±10%)")
+    logger.info(
+        f"  {'✓' if arr_ok else '✗'} ARR M{first_period.last}: {arr_first:,.0f}€ "
+        f"(target {target:,.0f}€ ±10%)"
+    )
 
     cash_ok = all(m['metrics']['cash'] >= 0 for m in projections)
     logger.info(f"  {'✓' if cash_ok else '✗'} Cash position: {'Toujours positive' if cash_ok else 'NÉGATIF détecté!'}")
@@ -654,17 +674,26 @@ def main():
     max_burn = max(m['metrics']['burn_rate'] for m in projections)
     logger.info(f"  ℹ️  Burn rate max: {max_burn:,.0f}€/mois")
 
-    ca_total_14 = sum(m['revenue']['total'] for m in projections[:14])
-    ca_total_50 = sum(m['revenue']['total'] for m in projections)
+    ca_total_first = sum(m['revenue']['total'] for m in projections[:first_period.last])
+    ca_total = sum(m['revenue']['total'] for m in projections)
+    last_period = calendar.periods[-1]
     logger.info(f"\n  📈 CA cumulé:")
-    logger.info(f"    • 14 mois (2025-2026): {ca_total_14:,.0f}€")
-    logger.info(f"    • 50 mois (2025-2029): {ca_total_50:,.0f}€")
+    logger.info(f"    • {first_period.length} mois ({first_period.label}): {ca_total_first:,.0f}€")
+    logger.info(
+        f"    • {months_count} mois ({first_period.first_date[:4]}-{last_period.last_date[:4]}): "
+        f"{ca_total:,.0f}€"
+    )
 
     if arr_ok and cash_ok:
         logger.info("\n✅ Tous les checks essentiels passent!")
-        logger.info("   → Prêt pour Phase suivante: génération Excel 50M")
+        logger.info(f"   → Prêt pour Phase suivante: génération Excel {months_count}M")
     else:
         logger.warning("\n⚠️ Certains checks échouent - ajuster assumptions.yaml")
+        if not arr_ok:
+            logger.warning(
+                f"   → Levier calculé: python scripts/goal_seek.py "
+                f"--lever hub_new_customers_multiplier --target arr@{first_period.last}={target}"
+            )
 
     return 0
 
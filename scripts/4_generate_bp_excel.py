@@ -11,19 +11,20 @@ Output:
   - data/outputs/BP_14M_Nov2025-Dec2026.xlsx (8 sheets avec formules)
 """
 
-import json
-import yaml
 import logging
-from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 
 import openpyxl
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import LineChart, BarChart, Reference
 from openpyxl.utils import get_column_letter
 
+from projection_io import find_projections, load_projections
+from pipeline_context import load_yaml, plan_root
+from excel_styles import StyleRegistry
+from telemetry import instrument, span
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -41,39 +42,12 @@ class BPExcelGenerator:
         self.assumptions = assumptions
         self.wb = Workbook()
         self.wb.remove(self.wb.active)  # Supprimer sheet par défaut
+        self.styles = StyleRegistry(self.wb)
 
         # Colonnes pour M1-M14 (F à S)
         self.month_cols = [get_column_letter(6 + i) for i in range(14)]  # F-S
 
-    def create_styles(self):
-        """Définir les styles réutilisables"""
-        self.style_header = {
-            'font': Font(bold=True, size=11, color='FFFFFF'),
-            'fill': PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
-            'alignment': Alignment(horizontal='center', vertical='center')
-        }
-
-        self.style_total = {
-            'font': Font(bold=True, size=10),
-            'fill': PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
-            'alignment': Alignment(horizontal='right')
-        }
-
-        self.style_currency = {
-            'number_format': '#,##0 €',
-            'alignment': Alignment(horizontal='right')
-        }
-
-        self.style_arr = {
-            'font': Font(bold=True, color='00B050'),
-            'number_format': '#,##0 €'
-        }
-
-    def apply_style(self, cell, style_dict):
-        """Appliquer un style à une cellule"""
-        for key, value in style_dict.items():
-            setattr(cell, key, value)
-
+    @instrument()
     def create_pl_sheet(self):
         """Créer sheet P&L avec formules"""
         logger.info("📊 Création sheet P&L...")
@@ -82,31 +56,31 @@ class BPExcelGenerator:
 
         # Headers
         ws['A1'] = "Compte de Résultat"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         # Ligne headers mois
         ws['E2'] = "Période"
-        self.apply_style(ws['E2'], self.style_header)
+        self.styles.apply(ws['E2'], 'header')
 
         for idx, col in enumerate(self.month_cols):
             month_num = idx + 1
             ws[f'{col}2'] = f"M{month_num}"
-            self.apply_style(ws[f'{col}2'], self.style_header)
+            self.styles.apply(ws[f'{col}2'], 'header')
 
         # REVENUS
         row = 3
         ws[f'A{row}'] = "CHIFFRE D'AFFAIRES"
-        ws[f'A{row}'].font = Font(bold=True, size=11)
+        self.styles.apply(ws[f'A{row}'], 'section')
 
         # CA Total (formule SUM)
         row += 1
         ws[f'E{row}'] = "CA TOTAL"
-        self.apply_style(ws[f'E{row}'], self.style_total)
+        self.styles.apply(ws[f'E{row}'], 'total')
 
         for idx, col in enumerate(self.month_cols):
             # Formule: SUM des lignes revenus (row+1 à row+4)
             ws[f'{col}{row}'] = f'=SUM({col}{row+1}:{col}{row+4})'
-            self.apply_style(ws[f'{col}{row}'], {**self.style_currency, **self.style_total})
+            self.styles.apply(ws[f'{col}{row}'], 'total_currency')
 
         # Détail revenus
         revenue_labels = [
@@ -126,7 +100,7 @@ class BPExcelGenerator:
                 else:
                     value = self.projections[idx]['revenue'][key]['revenue']
                 ws[f'{col}{row}'] = value
-                self.apply_style(ws[f'{col}{row}'], self.style_currency)
+                self.styles.apply(ws[f'{col}{row}'], 'currency')
 
         # Blank row
         row += 1
@@ -134,17 +108,17 @@ class BPExcelGenerator:
         # CHARGES
         row += 1
         ws[f'A{row}'] = "CHARGES"
-        ws[f'A{row}'].font = Font(bold=True, size=11)
+        self.styles.apply(ws[f'A{row}'], 'section')
 
         # Charges Total
         row += 1
         charges_total_row = row
         ws[f'E{row}'] = "CHARGES TOTALES"
-        self.apply_style(ws[f'E{row}'], self.style_total)
+        self.styles.apply(ws[f'E{row}'], 'total')
 
         for idx, col in enumerate(self.month_cols):
             ws[f'{col}{row}'] = f'=SUM({col}{row+1}:{col}{row+4})'
-            self.apply_style(ws[f'{col}{row}'], {**self.style_currency, **self.style_total})
+            self.styles.apply(ws[f'{col}{row}'], 'total_currency')
 
         # Détail charges
         cost_labels = [
@@ -163,8 +137,10 @@ class BPExcelGenerator:
                     value = self.projections[idx]['costs']['personnel']['total']
                 else:
                     value = self.projections[idx]['costs'][label.lower()]
+                    if isinstance(value, dict):  # Détail par poste: total
+                        value = value['total']
                 ws[f'{col}{row}'] = value
-                self.apply_style(ws[f'{col}{row}'], self.style_currency)
+                self.styles.apply(ws[f'{col}{row}'], 'currency')
 
         # Blank row
         row += 1
@@ -173,21 +149,19 @@ class BPExcelGenerator:
         row += 1
         ebitda_row = row
         ws[f'E{row}'] = "EBITDA"
-        ws[f'E{row}'].font = Font(bold=True, size=11, color='FF0000')
+        self.styles.apply(ws[f'E{row}'], 'section_red')
 
         for idx, col in enumerate(self.month_cols):
             # Formule: CA Total - Charges Total
             ws[f'{col}{row}'] = f'={col}4-{col}{charges_total_row}'
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-            # Rouge si négatif
-            ws[f'{col}{row}'].font = Font(bold=True, color='FF0000')
+            self.styles.apply(ws[f'{col}{row}'], 'currency_red')  # Rouge si négatif
 
         # Burn rate
         row += 1
         ws[f'E{row}'] = "Burn Rate"
         for idx, col in enumerate(self.month_cols):
             ws[f'{col}{row}'] = f'=IF({col}{ebitda_row}<0,-{col}{ebitda_row},0)'
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
+            self.styles.apply(ws[f'{col}{row}'], 'currency')
 
         # ARR
         row += 1
@@ -197,18 +171,24 @@ class BPExcelGenerator:
             # ARR = MRR Hub × 12
             arr_value = self.projections[idx]['metrics']['arr']
             ws[f'{col}{row}'] = arr_value
-            self.apply_style(ws[f'{col}{row}'], self.style_arr)
+            self.styles.apply(ws[f'{col}{row}'], 'arr')
+
+        # Levées de fonds
+        row += 1
+        funding_row = row
+        ws[f'E{row}'] = "Levées de fonds"
+        for idx, col in enumerate(self.month_cols):
+            ws[f'{col}{row}'] = self.projections[idx]['metrics']['funding']
+            self.styles.apply(ws[f'{col}{row}'], 'currency')
 
-        # Cash position
+        # Cash position (cumul: cash mois précédent + EBITDA + levées)
         row += 1
         ws[f'E{row}'] = "Cash Position"
         for idx, col in enumerate(self.month_cols):
-            month_idx = idx
-            cash = self.projections[month_idx]['metrics']['cash']
-            ws[f'{col}{row}'] = cash
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-            if cash < 50000:
-                ws[f'{col}{row}'].font = Font(color='FF0000')
+            previous = f'{self.month_cols[idx - 1]}{row}+' if idx > 0 else ''
+            ws[f'{col}{row}'] = f'={previous}{col}{ebitda_row}+{col}{funding_row}'
+            cash = self.projections[idx]['metrics']['cash']
+            self.styles.apply(ws[f'{col}{row}'], 'currency_alert' if cash < 50000 else 'currency')
 
         # Ajuster largeurs colonnes
         ws.column_dimensions['E'].width = 25
@@ -217,6 +197,7 @@ class BPExcelGenerator:
 
         logger.info(f"✓ Sheet P&L créée ({row} rows)")
 
+    @instrument()
     def create_synthese_sheet(self):
         """Créer sheet Synthèse (dashboard)"""
         logger.info("📊 Création sheet Synthèse...")
@@ -225,34 +206,36 @@ class BPExcelGenerator:
 
         # Titre
         ws['A1'] = "GenieFactory - Business Plan 14 Mois"
-        ws['A1'].font = Font(bold=True, size=16)
+        self.styles.apply(ws['A1'], 'title')
         ws['A2'] = "Période: Nov 2025 - Dec 2026"
-        ws['A2'].font = Font(size=11, italic=True)
+        self.styles.apply(ws['A2'], 'subtitle')
 
         # KPIs clés
         row = 4
         ws[f'A{row}'] = "MÉTRIQUES CLÉS"
-        ws[f'A{row}'].font = Font(bold=True, size=14)
+        self.styles.apply(ws[f'A{row}'], 'heading')
 
+        # Formules vers le P&L (CA ligne 4, EBITDA 17, Burn 18, ARR 19, Cash 21)
+        first, last = self.month_cols[0], self.month_cols[-1]
         kpis = [
-            ('ARR M14 (Dec 2026)', self.projections[13]['metrics']['arr']),
-            ('ARR M11 (Sept 2026)', self.projections[10]['metrics']['arr']),
-            ('CA Total 14 mois', sum(m['revenue']['total'] for m in self.projections)),
-            ('EBITDA Total', sum(m['metrics']['ebitda'] for m in self.projections)),
-            ('Burn Rate Max', max(m['metrics']['burn_rate'] for m in self.projections)),
+            ('ARR M14 (Dec 2026)', f"='P&L'!{last}19"),
+            ('ARR M11 (Sept 2026)', f"='P&L'!{self.month_cols[10]}19"),
+            ('CA Total 14 mois', f"=SUM('P&L'!{first}4:{last}4)"),
+            ('EBITDA Total', f"=SUM('P&L'!{first}17:{last}17)"),
+            ('Burn Rate Max', f"=MAX('P&L'!{first}18:{last}18)"),
             ('Équipe M14', self.projections[13]['metrics']['team_size']),
-            ('Cash M14', self.projections[13]['metrics']['cash'])
+            ('Cash M14', f"='P&L'!{last}21")
         ]
 
         for idx, (label, value) in enumerate(kpis):
             row += 1
             ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
+            self.styles.apply(ws[f'A{row}'], 'bold')
             ws[f'B{row}'] = value
             if 'ARR' in label:
-                self.apply_style(ws[f'B{row}'], self.style_arr)
+                self.styles.apply(ws[f'B{row}'], 'arr')
             else:
-                self.apply_style(ws[f'B{row}'], self.style_currency)
+                self.styles.apply(ws[f'B{row}'], 'currency')
 
         # Validation ARR M14
         row += 2
@@ -262,18 +245,18 @@ class BPExcelGenerator:
 
         if (target * 0.9) <= arr_m14 <= (target * 1.1):
             status = "✓ OK"
-            color = '00B050'
+            status_style = 'status_ok'
         else:
             status = "⚠️ Hors target"
-            color = 'FF0000'
+            status_style = 'status_ko'
 
         ws[f'B{row}'] = status
-        ws[f'B{row}'].font = Font(bold=True, color=color)
+        self.styles.apply(ws[f'B{row}'], status_style)
 
         # Hypothèses principales
         row += 3
         ws[f'A{row}'] = "HYPOTHÈSES PRINCIPALES"
-        ws[f'A{row}'].font = Font(bold=True, size=14)
+        self.styles.apply(ws[f'A{row}'], 'heading')
 
         hypotheses = [
             ('Hackathon pricing M1-M6', f"{self.assumptions['pricing']['hackathon']['periods'][0]['price_eur']:,}€"),
@@ -333,6 +316,7 @@ class BPExcelGenerator:
 
         logger.info("✓ Graphiques ajoutés")
 
+    @instrument()
     def create_ventes_sheet(self):
         """Créer sheet Ventes (pipeline détaillé)"""
         logger.info("📊 Création sheet Ventes...")
@@ -341,14 +325,14 @@ class BPExcelGenerator:
 
         # Headers
         ws['E1'] = "PIPELINE VENTES"
-        ws['E1'].font = Font(bold=True, size=12)
+        self.styles.apply(ws['E1'], 'subheading')
 
         ws['E2'] = "Période"
-        self.apply_style(ws['E2'], self.style_header)
+        self.styles.apply(ws['E2'], 'header')
 
         for idx, col in enumerate(self.month_cols):
             ws[f'{col}2'] = f"M{idx+1}"
-            self.apply_style(ws[f'{col}2'], self.style_header)
+            self.styles.apply(ws[f'{col}2'], 'header')
 
         # Volumes
         row = 3
@@ -364,11 +348,12 @@ class BPExcelGenerator:
             ws[f'E{row}'] = label
             for idx, col in enumerate(self.month_cols):
                 ws[f'{col}{row}'] = values[idx]
-                ws[f'{col}{row}'].number_format = '0.0'
+                self.styles.apply(ws[f'{col}{row}'], 'decimal')
 
         ws.column_dimensions['E'].width = 25
         logger.info("✓ Sheet Ventes créée")
 
+    @instrument()
     def create_parametres_sheet(self):
         """Créer sheet Paramètres (pricing reference)"""
         logger.info("📊 Création sheet Paramètres...")
@@ -376,14 +361,14 @@ class BPExcelGenerator:
         ws = self.wb.create_sheet("Paramètres")
 
         ws['A1'] = "GRILLE TARIFAIRE"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         # Headers
         row = 3
         headers = ['Offre', 'M1-M6', 'M7-M14', 'Évolution']
         for idx, header in enumerate(headers, start=1):
             cell = ws.cell(row, idx, header)
-            self.apply_style(cell, self.style_header)
+            self.styles.apply(cell, 'header')
 
         # Pricing data
         pricing_rows = [
@@ -423,6 +408,7 @@ class BPExcelGenerator:
 
         logger.info("✓ Sheet Paramètres créée")
 
+    @instrument()
     def create_financement_sheet(self):
         """Créer sheet Financement"""
         logger.info("📊 Création sheet Financement...")
@@ -430,14 +416,14 @@ class BPExcelGenerator:
         ws = self.wb.create_sheet("Financement")
 
         ws['A1'] = "PLAN DE FINANCEMENT"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "Événement"
         ws[f'B{row}'] = "Mois"
         ws[f'C{row}'] = "Montant"
         for col in ['A', 'B', 'C']:
-            self.apply_style(ws[f'{col}{row}'], self.style_header)
+            self.styles.apply(ws[f'{col}{row}'], 'header')
 
         # Milestones
         for milestone in self.assumptions['timeline']['milestones']:
@@ -446,19 +432,19 @@ class BPExcelGenerator:
                 ws[f'A{row}'] = milestone['name']
                 ws[f'B{row}'] = f"M{milestone['month']}"
                 ws[f'C{row}'] = milestone['amount_eur']
-                self.apply_style(ws[f'C{row}'], self.style_currency)
+                self.styles.apply(ws[f'C{row}'], 'currency')
 
         # Breakdown Pre-seed
         row += 2
         ws[f'A{row}'] = "Détail Pre-seed:"
-        ws[f'A{row}'].font = Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
 
         breakdown = self.assumptions['timeline']['milestones'][0]['breakdown']
         for source, amount in breakdown.items():
             row += 1
             ws[f'A{row}'] = f"  {source.replace('_', ' ').title()}"
             ws[f'C{row}'] = amount
-            self.apply_style(ws[f'C{row}'], self.style_currency)
+            self.styles.apply(ws[f'C{row}'], 'currency')
 
         ws.column_dimensions['A'].width = 35
         ws.column_dimensions['B'].width = 10
@@ -466,6 +452,7 @@ class BPExcelGenerator:
 
         logger.info("✓ Sheet Financement créée")
 
+    @instrument()
     def create_monitoring_sheet(self):
         """Créer sheet Monitoring (métriques SaaS)"""
         logger.info("📊 Création sheet Monitoring...")
@@ -473,15 +460,15 @@ class BPExcelGenerator:
         ws = self.wb.create_sheet("Monitoring")
 
         ws['A1'] = "MÉTRIQUES SAAS - Enterprise Hub"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         # Headers
         ws['E2'] = "Mois"
-        self.apply_style(ws['E2'], self.style_header)
+        self.styles.apply(ws['E2'], 'header')
 
         for idx, col in enumerate(self.month_cols):
             ws[f'{col}2'] = f"M{idx+1}"
-            self.apply_style(ws[f'{col}2'], self.style_header)
+            self.styles.apply(ws[f'{col}2'], 'header')
 
         # Métriques
         row = 3
@@ -500,19 +487,19 @@ class BPExcelGenerator:
             for idx, col in enumerate(self.month_cols):
                 ws[f'{col}{row}'] = values[idx]
                 if 'MRR' in label or 'ARR' in label:
-                    self.apply_style(ws[f'{col}{row}'], self.style_arr)
+                    self.styles.apply(ws[f'{col}{row}'], 'arr')
                 else:
-                    ws[f'{col}{row}'].number_format = '0.0'
+                    self.styles.apply(ws[f'{col}{row}'], 'decimal')
 
         ws.column_dimensions['E'].width = 20
         logger.info("✓ Sheet Monitoring créée")
 
+    @instrument()
     def generate(self) -> Workbook:
         """Générer le workbook complet"""
         logger.info("\n🔧 GÉNÉRATION BP EXCEL")
         logger.info("="*60)
 
-        self.create_styles()
         self.create_synthese_sheet()
         self.create_pl_sheet()
         self.create_ventes_sheet()
@@ -533,24 +520,22 @@ def main():
     logger.info("🚀 GÉNÉRATION BP EXCEL - GenieFactory BP 14 Mois")
     logger.info("="*60)
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger projections
-    projections_path = base_path / "data" / "structured" / "projections.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections")
     if not projections_path.exists():
-        logger.error(f"❌ Fichier projections.json non trouvé: {projections_path}")
+        logger.error(f"❌ Fichier projections non trouvé: {projections_path}")
         logger.error("   Exécuter d'abord: python scripts/3_calculate_projections.py")
         return 1
 
     logger.info(f"📂 Chargement projections: {projections_path}")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
 
     # Charger assumptions
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
     logger.info(f"📂 Chargement assumptions: {assumptions_path}")
-    with open(assumptions_path, 'r', encoding='utf-8') as f:
-        assumptions = yaml.safe_load(f)
+    assumptions = load_yaml(assumptions_path)
 
     # Générer Excel
     generator = BPExcelGenerator(projections, assumptions)
@@ -561,7 +546,8 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / "BP_14M_Nov2025-Dec2026.xlsx"
 
-    wb.save(output_path)
+    with span('save_workbook'):
+        wb.save(output_path)
 
     logger.info("\n" + "="*60)
     logger.info("✅ BP EXCEL GÉNÉRÉ")
@@ -4,25 +4,29 @@ GenieFactory BP 50 Mois - Script 4b: Génération BP Excel Complet
 Crée BP_50M_Nov2025-Dec2029.xlsx avec 15 sheets et structure identique au source
 
 Input:
-  - data/structured/projections_50m.json
+  - data/structured/projections_50m.jsonl (ou ancien projections_50m.json)
   - data/structured/assumptions.yaml
 
 Output:
   - data/outputs/BP_50M_Nov2025-Dec2029.xlsx (15 sheets, ~122 colonnes P&L)
+
+Backend (--backend): streaming par défaut (openpyxl write_only, une feuille
+tamponnée à la fois, voir excel_stream.py), memory pour un Workbook complet.
+
+openpyxl (et les styles / le streaming qui en dépendent) n'est importé qu'à
+la création du générateur : --help reste léger (scripts/startup_budget.py).
 """
 
-import json
-import yaml
+import re
 import logging
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Tuple
+import argparse
+from collections.abc import Mapping
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, numbers
-from openpyxl.chart import LineChart, BarChart, Reference
-from openpyxl.utils import get_column_letter
+from projection_calendar import ProjectionCalendar
+from projection_io import find_projections, load_projections
+from pipeline_context import load_yaml, plan_root
+from telemetry import instrument, span
 
 # Configuration logging
 logging.basicConfig(
@@ -33,16 +37,148 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class RowSpec(NamedTuple):
+    """Ligne déclarative d'une sheet mensuelle (écrite en une fois par write_rows)"""
+    label: str
+    path: Optional[str] = None          # Chemin de la métrique ('revenue.hackathon.revenue'); None: titre
+    style: str = 'currency'             # Style des valeurs (clé de excel_styles.STYLES)
+    label_style: Optional[str] = None   # Style du libellé (colonne A)
+    aggregation: Optional[str] = 'sum'  # Totaux annuels: 'sum', 'last' (stock) ou None
+    note: str = ''                      # Colonne B
+    key: Optional[str] = None           # Nom de la ligne (retrouver son numéro)
+    formula: Optional[str] = None       # Formule mensuelle au lieu de la valeur: '={ca_total}-{charges_total}'
+                                        # ({clé}: même colonne, {prev_clé}: mois précédent, 0 en M1)
+
+
+BLANK = RowSpec('')
+
+FORMULA_FIELD = re.compile(r'\{(prev_)?(\w+)\}')
+
+
+def spec_rows(specs: List[RowSpec], row: int) -> Dict[str, int]:
+    """Numéros des lignes nommées (RowSpec.key) écrites à partir de `row`"""
+    return {spec.key: row + offset for offset, spec in enumerate(specs) if spec.key}
+
+
+def metric_value(month_data: Mapping, keys: List[str]) -> Any:
+    """Valeur d'un mois au chemin `keys` (0 si absente)
+
+    Un poste agrégé (nombre au lieu du détail, ex: costs.infrastructure dans
+    projections.json) vaut son propre total.
+    """
+    value = month_data
+    for index, key in enumerate(keys):
+        if not isinstance(value, Mapping):
+            return value if keys[index:] == ['total'] else 0
+        value = value.get(key, 0)
+    return value
+
+
+# Totaux, EBITDA et cash en formules: le P&L reste vivant dans Excel
+# (path: métrique des projections que la formule reproduit)
+PL_FIRST_ROW = 3
+PL_ROWS = [
+    RowSpec("CHIFFRE D'AFFAIRES", label_style='section_header'),
+    RowSpec("  Hackathons", 'revenue.hackathon.revenue', key='hackathon'),
+    RowSpec("  Factory Projects", 'revenue.factory.revenue'),
+    RowSpec("  Enterprise Hub (MRR)", 'revenue.enterprise_hub.mrr'),
+    RowSpec("  Services", 'revenue.services.revenue', key='services'),
+    BLANK,
+    RowSpec("TOTAL CHIFFRE D'AFFAIRES", 'revenue.total', 'currency_bold', 'total', key='ca_total',
+            formula='=SUM({hackathon}:{services})'),
+    BLANK,
+    RowSpec("CHARGES D'EXPLOITATION", label_style='section_header'),
+    RowSpec("  Charges de personnel", 'costs.personnel.total', key='personnel'),
+    RowSpec("  Infrastructure technique", 'costs.infrastructure.total'),
+    RowSpec("  Marketing & Commercial", 'costs.marketing.total'),
+    RowSpec("  Frais généraux & Admin", 'costs.admin', key='admin'),
+    BLANK,
+    RowSpec("TOTAL CHARGES", 'costs.total', 'currency_bold', 'total', key='charges_total',
+            formula='=SUM({personnel}:{admin})'),
+    BLANK,
+    RowSpec("EBITDA", 'metrics.ebitda', 'currency_bold', 'total', key='ebitda',
+            formula='={ca_total}-{charges_total}'),
+    RowSpec("Levées de fonds", 'metrics.funding', key='funding'),
+    BLANK,
+    RowSpec("ARR (Run Rate)", 'metrics.arr', 'arr', aggregation='last', key='arr'),
+    RowSpec("Cash Position", 'metrics.cash', aggregation='last', key='cash',
+            formula='={prev_cash}+{ebitda}+{funding}'),
+    RowSpec("Équipe (ETP)", 'metrics.team_size', 'count', aggregation='last', key='team'),
+]
+
+INFRASTRUCTURE_ROWS = [
+    RowSpec("INFRASTRUCTURE CLOUD", label_style='section_header'),
+    RowSpec("  Cloud (AWS/Azure)", 'costs.infrastructure.cloud', note="Variable"),
+    BLANK,
+    RowSpec("OUTILS SAAS", label_style='section_header'),
+    RowSpec("  SaaS Tools (Notion, Slack, etc.)", 'costs.infrastructure.saas_tools', note="Par user"),
+    RowSpec("  R&D Externe", 'costs.infrastructure.rd_external', note="Fixe"),
+    BLANK,
+    RowSpec("TOTAL INFRASTRUCTURE", 'costs.infrastructure.total', 'currency_bold', 'total'),
+]
+
+MARKETING_ROWS = [
+    RowSpec("BUDGET MARKETING", label_style='section_header'),
+    RowSpec("  Digital Ads (Google, LinkedIn)", 'costs.marketing.digital_ads', note="Mensuel"),
+    RowSpec("  Events & Salons", 'costs.marketing.events', note="Trimestriel"),
+    RowSpec("  Content Marketing", 'costs.marketing.content', note="Mensuel"),
+    RowSpec("  Partenariats", 'costs.marketing.partnerships', note="Mensuel"),
+    BLANK,
+    RowSpec("TOTAL MARKETING", 'costs.marketing.total', 'currency_bold', 'total'),
+]
+
+VENTES_ROWS = [
+    RowSpec("HACKATHONS", label_style='section_header'),
+    RowSpec("  Nombre de hackathons", 'revenue.hackathon.volume', 'count'),
+    RowSpec("  CA Hackathons", 'revenue.hackathon.revenue'),
+    BLANK,
+    RowSpec("FACTORY PROJECTS", label_style='section_header'),
+    RowSpec("  Nombre de projets Factory", 'revenue.factory.volume', 'decimal'),
+    RowSpec("  CA Factory", 'revenue.factory.revenue'),
+    BLANK,
+    RowSpec("ENTERPRISE HUB", label_style='section_header'),
+    RowSpec("  Clients Hub actifs", 'revenue.enterprise_hub.customers.total', 'decimal',
+            aggregation='last'),
+    RowSpec("  Nouveaux clients Hub", 'revenue.enterprise_hub.new_customers', 'count'),
+    RowSpec("  MRR Hub", 'revenue.enterprise_hub.mrr'),
+    RowSpec("  ARR Hub", 'revenue.enterprise_hub.arr', 'arr', aggregation='last'),
+]
+
+PERSONNEL_ROLES = [
+    'directeur_general', 'product_owner', 'tech_senior', 'tech_junior',
+    'commercial', 'bd_junior', 'stagiaire', 'consultant'
+]
+
+
 class BPExcel50MGenerator:
     """Générateur BP Excel 50 mois - reproduction exacte structure source"""
 
-    def __init__(self, projections: List[Dict], assumptions: Dict):
+    def __init__(self, projections: List[Dict], assumptions: Dict, streaming: bool = False):
+        from openpyxl import Workbook
+        from excel_stream import SheetStream
+        from excel_styles import StyleRegistry
+
         self.projections = projections
         self.assumptions = assumptions
-        self.wb = Workbook()
-        self.wb.remove(self.wb.active)  # Supprimer sheet par défaut
 
-        # Structure colonnes comme source:
+        # streaming: workbook write_only, une seule feuille tamponnée en mémoire
+        # (mémoire constante quel que soit l'horizon); le workbook retourné
+        # par generate() ne peut alors qu'être sauvegardé
+        self.streaming = streaming
+        self.wb = Workbook(write_only=streaming)
+        if streaming:
+            self.sheets = SheetStream(self.wb)
+        else:
+            self.wb.remove(self.wb.active)  # Supprimer sheet par défaut
+        self.styles = StyleRegistry(self.wb)
+
+        # Horizon et périodes annuelles déduits des projections
+        self.months_count = len(projections)
+        self.months = range(1, self.months_count + 1)
+        self.calendar = ProjectionCalendar.from_assumptions(assumptions, self.months_count)
+        self.first_total_label = f"Total {self.calendar.periods[0].short_label}"
+
+        # Structure colonnes comme source (horizon 50 mois):
         # Colonnes C: Total 2025-2026
         # Colonnes D-Q: M1-M14 (Nov 25 - Dec 26)
         # Colonne R: Total 2027
@@ -51,928 +187,374 @@ class BPExcel50MGenerator:
         # Colonnes AF-AQ: M27-M38 (Jan 28 - Dec 28)
         # Colonne AR: Total 2029
         # Colonnes AS-BD: M39-M50 (Jan 29 - Dec 29)
+        # Au-delà: une colonne Total + 12 mois par année supplémentaire
 
         self.setup_column_structure()
 
     def setup_column_structure(self):
-        """Définir la structure des colonnes pour les 50 mois + totaux annuels"""
+        """Définir la structure des colonnes pour tous les mois + totaux annuels"""
+        from openpyxl.utils import get_column_letter, column_index_from_string
+
         self.columns_map = {}
 
         # Colonne A: Labels
         # Colonne B: Notes/formules
-        # Colonne C: Total 2025-2026
+        # Colonne C: Total 1ère période (2025-2026)
 
         col_idx = 4  # Commence à D
 
-        # M1-M14 (Nov 2025 - Dec 2026)
-        for month in range(1, 15):
-            self.columns_map[month] = get_column_letter(col_idx)
-            col_idx += 1
-
-        # Colonne R: Total 2027
-        self.columns_map['total_2027'] = get_column_letter(col_idx)
-        col_idx += 1
-
-        # M15-M26 (2027)
-        for month in range(15, 27):
-            self.columns_map[month] = get_column_letter(col_idx)
-            col_idx += 1
+        for index, period in enumerate(self.calendar.periods):
+            # Colonne Total avant chaque année civile (R: 2027, AE: 2028, ...)
+            if index > 0:
+                self.columns_map[f'total_{period.year}'] = get_column_letter(col_idx)
+                col_idx += 1
+
+            for month in period.months:
+                self.columns_map[month] = get_column_letter(col_idx)
+                col_idx += 1
+
+        # Index numériques (écriture par ws.cell, sans adresse 'D12' à analyser)
+        self.month_letters = [self.columns_map[month] for month in self.months]
+        self.month_columns = [column_index_from_string(letter) for letter in self.month_letters]
+        self.total_columns = [(self.calendar.periods[0], 3)] + [
+            (period, column_index_from_string(self.columns_map[f'total_{period.year}']))
+            for period in self.calendar.periods[1:]
+        ]
+        self.metric_vectors: Dict[str, List[Any]] = {}
 
-        # Colonne AE: Total 2028
-        self.columns_map['total_2028'] = get_column_letter(col_idx)
-        col_idx += 1
+        logger.info(f"✓ Structure colonnes définie: {len(self.columns_map)} colonnes")
 
-        # M27-M38 (2028)
-        for month in range(27, 39):
-            self.columns_map[month] = get_column_letter(col_idx)
-            col_idx += 1
+    def new_sheet(self, title: str, index: int = None):
+        """Créer une feuille (tamponnée puis écrite sur disque en mode streaming)"""
+        if self.streaming:
+            return self.sheets.new_sheet(title, index)
+        return self.wb.create_sheet(title, index)
+
+    def write_year_headers(self, ws):
+        """En-têtes années (ligne 1) fusionnés au-dessus des mois de chaque période"""
+        for period in self.calendar.periods:
+            first_col = self.columns_map[period.first]
+            last_col = self.columns_map[period.last]
+            ws[f'{first_col}1'] = period.label
+            if first_col != last_col:
+                ws.merge_cells(f'{first_col}1:{last_col}1')
+            self.styles.apply(ws[f'{first_col}1'], 'header_year')
+
+    def write_month_headers(self, ws, label_a: str, label_b: str, calendar_months: bool = False):
+        """En-têtes lignes 1-2: années fusionnées, mois, totaux annuels
+
+        calendar_months: M11, M12, M1... (mois civil, P&L) au lieu de M1..Mn
+        """
+        self.write_year_headers(ws)
+
+        ws['A2'] = label_a
+        ws['B2'] = label_b
+        ws['C2'] = self.first_total_label
+
+        for month, col_idx in zip(self.months, self.month_columns):
+            month_num = int(self.calendar.dates[month - 1][5:7]) if calendar_months else month
+            cell = ws.cell(row=2, column=col_idx, value=f"M{month_num}")
+            self.styles.apply(cell, 'header_month')
+
+        for period, col_idx in self.total_columns[1:]:
+            cell = ws.cell(row=2, column=col_idx, value=f"Total {period.label}")
+            self.styles.apply(cell, 'header_month')
+
+    def metric(self, path: str) -> List[Any]:
+        """Vecteur mensuel d'une métrique (chemin pointé), extrait une seule fois"""
+        vector = self.metric_vectors.get(path)
+        if vector is None:
+            keys = path.split('.')
+            vector = [metric_value(month_data, keys) for month_data in self.projections]
+            self.metric_vectors[path] = vector
+        return vector
+
+    def write_rows(self, ws, specs: List['RowSpec'], row: int) -> Tuple[int, Dict[str, int]]:
+        """Écrire des lignes déclaratives à partir de `row`
+
+        Retourne (ligne suivante, {RowSpec.key: ligne}).
+        """
+        rows = {}
+        for spec in specs:
+            if spec.key:
+                rows[spec.key] = row
+            if spec.label:
+                cell = ws.cell(row=row, column=1, value=spec.label)
+                if spec.label_style:
+                    self.styles.apply(cell, spec.label_style)
+            if spec.note:
+                ws.cell(row=row, column=2, value=spec.note)
+            if spec.formula:
+                self.write_metric_row(ws, row, self.row_formulas(spec.formula, rows),
+                                      spec.style, spec.aggregation)
+            elif spec.path:
+                self.write_metric_row(ws, row, self.metric(spec.path), spec.style, spec.aggregation)
+            row += 1
+        return row, rows
+
+    def row_formulas(self, formula: str, rows: Dict[str, int]) -> List[str]:
+        """Formule mensuelle d'une ligne pour chaque mois ({clé} -> cellule de la même colonne)
+
+        Les clés sont résolues une fois par ligne ('={prev_cash}+{ebitda}' -> '={p}23+{c}20'),
+        puis seules les lettres de colonnes changent d'un mois à l'autre.
+        """
+        def template(first_month: bool) -> str:
+            def field(match):
+                if match.group(1):
+                    return '0' if first_month else f"{{p}}{rows[match.group(2)]}"
+                return f"{{c}}{rows[match.group(2)]}"
+            return FORMULA_FIELD.sub(field, formula)
+
+        letters = self.month_letters
+        monthly = template(first_month=False)
+        return [template(first_month=True).format(c=letters[0])] + [
+            monthly.format(c=letter, p=previous) for previous, letter in zip(letters, letters[1:])
+        ]
 
-        # Colonne AR: Total 2029
-        self.columns_map['total_2029'] = get_column_letter(col_idx)
-        col_idx += 1
+    def write_metric_row(self, ws, row: int, values: List[Any], style: str,
+                         aggregation: Optional[str]):
+        """Une ligne complète: valeurs (ou formules) mensuelles puis totaux annuels
 
-        # M39-M50 (2029)
-        for month in range(39, 51):
-            self.columns_map[month] = get_column_letter(col_idx)
-            col_idx += 1
+        Totaux annuels en formules: =SUM(premier:dernier mois) ou =dernier mois (stock).
+        """
+        style_name = self.styles.name(style)
+        cells = [ws.cell(row=row, column=col_idx, value=value)
+                 for col_idx, value in zip(self.month_columns, values)]
 
-        logger.info(f"✓ Structure colonnes définie: {len(self.columns_map)} colonnes")
+        if aggregation:
+            for period, col_idx in self.total_columns:
+                first, last = self.columns_map[period.first], self.columns_map[period.last]
+                total = f"=SUM({first}{row}:{last}{row})" if aggregation == 'sum' else f"={last}{row}"
+                cells.append(ws.cell(row=row, column=col_idx, value=total))
 
-    def create_styles(self):
-        """Définir les styles réutilisables"""
-        self.style_header_year = {
-            'font': Font(bold=True, size=12, color='FFFFFF'),
-            'fill': PatternFill(start_color='1F4E78', end_color='1F4E78', fill_type='solid'),
-            'alignment': Alignment(horizontal='center', vertical='center')
-        }
-
-        self.style_header_month = {
-            'font': Font(bold=True, size=10, color='FFFFFF'),
-            'fill': PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
-            'alignment': Alignment(horizontal='center', vertical='center')
-        }
-
-        self.style_total = {
-            'font': Font(bold=True, size=10),
-            'fill': PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
-            'alignment': Alignment(horizontal='right')
-        }
-
-        self.style_currency = {
-            'number_format': '#,##0 €',
-            'alignment': Alignment(horizontal='right')
-        }
-
-        self.style_arr = {
-            'font': Font(bold=True, color='00B050'),
-            'number_format': '#,##0 €',
-            'alignment': Alignment(horizontal='right')
-        }
-
-        self.style_section_header = {
-            'font': Font(bold=True, size=11, color='FFFFFF'),
-            'fill': PatternFill(start_color='548235', end_color='548235', fill_type='solid'),
-            'alignment': Alignment(horizontal='left')
-        }
-
-    def apply_style(self, cell, style_dict):
-        """Appliquer un style à une cellule"""
-        for key, value in style_dict.items():
-            setattr(cell, key, value)
+        for cell in cells:
+            cell.style = style_name
 
+    @instrument()
     def create_pl_sheet(self):
-        """Créer sheet P&L avec 50 mois (structure exacte source)"""
-        logger.info("📊 Création sheet P&L (50 mois)...")
+        """Créer sheet P&L sur tout l'horizon (structure exacte source)"""
+        logger.info(f"📊 Création sheet P&L ({self.months_count} mois)...")
 
-        ws = self.wb.create_sheet("P&L")
+        ws = self.new_sheet("P&L")
 
         # Titre
-        ws['A1'] = "Compte de Résultat Prévisionnel - Nov 2025 à Dec 2029"
-        ws['A1'].font = Font(bold=True, size=14)
-
-        # Row 1: Années
-        ws['D1'] = "2025-2026"
-        ws.merge_cells('D1:Q1')
-        self.apply_style(ws['D1'], self.style_header_year)
-
-        ws['S1'] = "2027"
-        ws.merge_cells('S1:AD1')
-        self.apply_style(ws['S1'], self.style_header_year)
-
-        ws['AF1'] = "2028"
-        ws.merge_cells('AF1:AQ1')
-        self.apply_style(ws['AF1'], self.style_header_year)
-
-        ws['AS1'] = "2029"
-        ws.merge_cells('AS1:BD1')
-        self.apply_style(ws['AS1'], self.style_header_year)
-
-        # Row 2: Mois
-        ws['A2'] = "Rubrique"
-        ws['B2'] = "Notes"
-        ws['C2'] = "Total 25-26"
-
-        # Headers mois M1-M50
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            month_data = self.projections[month - 1]
-            date_str = month_data['date']  # 2025-11 format
-            month_num = int(date_str.split('-')[1])
-            ws[f'{col}2'] = f"M{month_num}"
-            self.apply_style(ws[f'{col}2'], self.style_header_month)
-
-        # Headers totaux annuels
-        for total_col, year in [('R2', '2027'), ('AE2', '2028'), ('AR2', '2029')]:
-            ws[total_col] = f"Total {year}"
-            self.apply_style(ws[total_col], self.style_header_month)
-
-        # === REVENUS ===
-        row = 3
-        ws[f'A{row}'] = "CHIFFRE D'AFFAIRES"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        # CA Hackathons
-        ws[f'A{row}'] = "  Hackathons"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['hackathon']['revenue']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # CA Factory
-        ws[f'A{row}'] = "  Factory Projects"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['factory']['revenue']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # CA Hub (MRR)
-        ws[f'A{row}'] = "  Enterprise Hub (MRR)"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['enterprise_hub']['mrr']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # CA Services
-        ws[f'A{row}'] = "  Services"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['services']['revenue']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Total CA
-        row += 1
-        ws[f'A{row}'] = "TOTAL CHIFFRE D'AFFAIRES"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        ca_total_row = row
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['total']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        ws['A1'] = (
+            f"Compte de Résultat Prévisionnel - "
+            f"{self.calendar.month_label(1)} à {self.calendar.month_label(self.months_count)}"
+        )
+        self.styles.apply(ws['A1'], 'heading')
 
-        # === CHARGES ===
-        row += 1
-        ws[f'A{row}'] = "CHARGES D'EXPLOITATION"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        # Charges personnel
-        ws[f'A{row}'] = "  Charges de personnel"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['costs']['personnel']['total']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        # Lignes 1-2: années, mois (civils), totaux annuels
+        self.write_month_headers(ws, "Rubrique", "Notes", calendar_months=True)
 
-        # Infrastructure
-        ws[f'A{row}'] = "  Infrastructure technique"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            infra = self.projections[month - 1]['costs']['infrastructure']
-            value = infra if isinstance(infra, (int, float)) else infra['total']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Marketing
-        ws[f'A{row}'] = "  Marketing & Commercial"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            marketing = self.projections[month - 1]['costs']['marketing']
-            value = marketing if isinstance(marketing, (int, float)) else marketing['total']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Admin
-        ws[f'A{row}'] = "  Frais généraux & Admin"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['costs']['admin']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Total charges
-        row += 1
-        ws[f'A{row}'] = "TOTAL CHARGES"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        charges_total_row = row
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['costs']['total']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # === RÉSULTAT ===
-        row += 1
-        ws[f'A{row}'] = "EBITDA"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        ebitda_row = row
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['metrics']['ebitda']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # ARR
-        row += 1
-        ws[f'A{row}'] = "ARR (Run Rate)"
-        arr_row = row
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['metrics']['arr']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_arr)
-        row += 1
-
-        # Cash position
-        ws[f'A{row}'] = "Cash Position"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['metrics']['cash']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Team size
-        ws[f'A{row}'] = "Équipe (ETP)"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['metrics']['team_size']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].number_format = '0'
-        row += 1
+        row, self.pl_rows = self.write_rows(ws, PL_ROWS, PL_FIRST_ROW)
 
         # Largeurs colonnes
         ws.column_dimensions['A'].width = 30
         ws.column_dimensions['B'].width = 15
         ws.column_dimensions['C'].width = 12
 
-        logger.info(f"✓ Sheet P&L créée: {row} lignes × 50 mois")
+        logger.info(f"✓ Sheet P&L créée: {row} lignes × {self.months_count} mois")
 
+    @instrument()
     def create_charges_personnel_sheet(self):
         """Créer sheet Charges de personnel et FG (détail par rôle)"""
         logger.info("👥 Création sheet Charges Personnel...")
 
-        ws = self.wb.create_sheet("Charges Personnel")
+        ws = self.new_sheet("Charges Personnel")
 
         # Titre
         ws['A1'] = "Charges de Personnel et Frais Généraux - Détail par Rôle"
-        ws['A1'].font = Font(bold=True, size=14)
-
-        # Headers similaires au P&L
-        ws['D1'] = "2025-2026"
-        ws.merge_cells('D1:Q1')
-        self.apply_style(ws['D1'], self.style_header_year)
+        self.styles.apply(ws['A1'], 'heading')
 
-        ws['S1'] = "2027"
-        ws.merge_cells('S1:AD1')
-        self.apply_style(ws['S1'], self.style_header_year)
-
-        ws['AF1'] = "2028"
-        ws.merge_cells('AF1:AQ1')
-        self.apply_style(ws['AF1'], self.style_header_year)
-
-        ws['AS1'] = "2029"
-        ws.merge_cells('AS1:BD1')
-        self.apply_style(ws['AS1'], self.style_header_year)
-
-        # Row 2: Mois
-        ws['A2'] = "Rôle / Poste"
-        ws['B2'] = "Salaire Annuel"
-        ws['C2'] = "Total 25-26"
-
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            ws[f'{col}2'] = f"M{month}"
-            self.apply_style(ws[f'{col}2'], self.style_header_month)
+        self.write_month_headers(ws, "Rôle / Poste", "Salaire Annuel")
 
         # Vérifier si personnel_details existe
         if 'personnel_details' not in self.assumptions:
             logger.warning("⚠️ personnel_details non trouvé dans assumptions - sheet simplifiée")
-            row = 3
-            ws[f'A{row}'] = "Charges de personnel totales"
-            for month in range(1, 51):
-                col = self.columns_map[month]
-                value = self.projections[month - 1]['costs']['personnel']['total']
-                ws[f'{col}{row}'] = value
-                self.apply_style(ws[f'{col}{row}'], self.style_currency)
+            self.write_rows(ws, [RowSpec("Charges de personnel totales", 'costs.personnel.total')], 3)
             return
 
-        # Détail par rôle
-        personnel_details = self.assumptions['personnel_details']
-        row = 3
-
-        ws[f'A{row}'] = "SALAIRES BRUTS"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        # Pour chaque rôle
-        roles_order = [
-            'directeur_general', 'product_owner', 'tech_senior', 'tech_junior',
-            'commercial', 'bd_junior', 'stagiaire', 'consultant'
+        # Détail par rôle (rôles absents des assumptions ignorés)
+        roles = self.assumptions['personnel_details']['roles']
+        role_rows = [
+            RowSpec(f"  {roles[role_name]['title']}", f'costs.personnel.roles.{role_name}.cost_monthly',
+                    note=f"{roles[role_name]['salary_brut_annual']:,.0f} €")
+            for role_name in PERSONNEL_ROLES if role_name in roles
         ]
 
-        for role_name in roles_order:
-            if role_name not in personnel_details['roles']:
-                continue
-
-            role_data = personnel_details['roles'][role_name]
-            ws[f'A{row}'] = f"  {role_data['title']}"
-            ws[f'B{row}'] = f"{role_data['salary_brut_annual']:,.0f} €"
-
-            # Pour chaque mois, extraire le coût de ce rôle
-            for month in range(1, 51):
-                col = self.columns_map[month]
-                costs_personnel = self.projections[month - 1]['costs']['personnel']
-
-                if 'roles' in costs_personnel and role_name in costs_personnel['roles']:
-                    value = costs_personnel['roles'][role_name]['cost_monthly']
-                else:
-                    value = 0
-
-                ws[f'{col}{row}'] = value
-                self.apply_style(ws[f'{col}{row}'], self.style_currency)
-
-            row += 1
-
-        # Total salaires bruts
-        row += 1
-        ws[f'A{row}'] = "TOTAL SALAIRES BRUTS"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            costs_personnel = self.projections[month - 1]['costs']['personnel']
-            value = costs_personnel.get('salary_brut', 0)
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Charges sociales
-        row += 1
-        ws[f'A{row}'] = "CHARGES SOCIALES (45%)"
-        ws[f'A{row}'].font = Font(bold=True)
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            costs_personnel = self.projections[month - 1]['costs']['personnel']
-            value = costs_personnel.get('charges_sociales', 0)
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Freelances
-        ws[f'A{row}'] = "Freelances / Consultants"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            costs_personnel = self.projections[month - 1]['costs']['personnel']
-            value = costs_personnel.get('freelance', 0)
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Total charges personnel
-        row += 1
-        ws[f'A{row}'] = "TOTAL CHARGES DE PERSONNEL"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['costs']['personnel']['total']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True, size=11)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # FTE total
-        row += 1
-        ws[f'A{row}'] = "Effectif Total (ETP)"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['metrics']['team_size']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].number_format = '0.0'
-        row += 1
+        row, _ = self.write_rows(ws, [
+            RowSpec("SALAIRES BRUTS", label_style='section_header'),
+            *role_rows,
+            BLANK,
+            RowSpec("TOTAL SALAIRES BRUTS", 'costs.personnel.salary_brut', 'currency_bold', 'total'),
+            BLANK,
+            RowSpec("CHARGES SOCIALES (45%)", 'costs.personnel.charges_sociales', label_style='bold'),
+            RowSpec("Freelances / Consultants", 'costs.personnel.freelance'),
+            BLANK,
+            RowSpec("TOTAL CHARGES DE PERSONNEL", 'costs.personnel.total', 'currency_total', 'total'),
+            BLANK,
+            RowSpec("Effectif Total (ETP)", 'metrics.team_size', 'decimal', aggregation='last'),
+        ], 3)
 
         ws.column_dimensions['A'].width = 30
         ws.column_dimensions['B'].width = 15
 
-        logger.info(f"✓ Sheet Charges Personnel créée: {len(roles_order)} rôles")
+        logger.info(f"✓ Sheet Charges Personnel créée: {len(PERSONNEL_ROLES)} rôles")
 
+    @instrument()
     def create_infrastructure_sheet(self):
         """Créer sheet Infrastructure Technique (Cloud + SaaS)"""
         logger.info("☁️ Création sheet Infrastructure Technique...")
 
-        ws = self.wb.create_sheet("Infrastructure")
+        ws = self.new_sheet("Infrastructure")
 
         # Titre
         ws['A1'] = "Infrastructure Technique - Cloud & SaaS Tools"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
-        # Headers
-        ws['D1'] = "2025-2026"
-        ws.merge_cells('D1:Q1')
-        self.apply_style(ws['D1'], self.style_header_year)
-
-        ws['S1'] = "2027"
-        ws.merge_cells('S1:AD1')
-        self.apply_style(ws['S1'], self.style_header_year)
-
-        ws['AF1'] = "2028"
-        ws.merge_cells('AF1:AQ1')
-        self.apply_style(ws['AF1'], self.style_header_year)
-
-        ws['AS1'] = "2029"
-        ws.merge_cells('AS1:BD1')
-        self.apply_style(ws['AS1'], self.style_header_year)
-
-        ws['A2'] = "Poste de coût"
-        ws['B2'] = "Type"
-        ws['C2'] = "Total 25-26"
-
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            ws[f'{col}2'] = f"M{month}"
-            self.apply_style(ws[f'{col}2'], self.style_header_month)
-
-        row = 3
-
-        # Cloud costs
-        ws[f'A{row}'] = "INFRASTRUCTURE CLOUD"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        ws[f'A{row}'] = "  Cloud (AWS/Azure)"
-        ws[f'B{row}'] = "Variable"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            infra = self.projections[month - 1]['costs']['infrastructure']
-            if isinstance(infra, dict) and 'cloud' in infra:
-                value = infra['cloud']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # SaaS tools
-        row += 1
-        ws[f'A{row}'] = "OUTILS SAAS"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        ws[f'A{row}'] = "  SaaS Tools (Notion, Slack, etc.)"
-        ws[f'B{row}'] = "Par user"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            infra = self.projections[month - 1]['costs']['infrastructure']
-            if isinstance(infra, dict) and 'saas_tools' in infra:
-                value = infra['saas_tools']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # R&D externe
-        ws[f'A{row}'] = "  R&D Externe"
-        ws[f'B{row}'] = "Fixe"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            infra = self.projections[month - 1]['costs']['infrastructure']
-            if isinstance(infra, dict) and 'rd_external' in infra:
-                value = infra['rd_external']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Total
-        row += 1
-        ws[f'A{row}'] = "TOTAL INFRASTRUCTURE"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            infra = self.projections[month - 1]['costs']['infrastructure']
-            value = infra if isinstance(infra, (int, float)) else infra.get('total', 0)
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        self.write_month_headers(ws, "Poste de coût", "Type")
+        self.write_rows(ws, INFRASTRUCTURE_ROWS, 3)
 
         ws.column_dimensions['A'].width = 35
         ws.column_dimensions['B'].width = 15
 
         logger.info("✓ Sheet Infrastructure créée")
 
+    @instrument()
     def create_marketing_sheet(self):
         """Créer sheet Marketing (budget par canal)"""
         logger.info("📢 Création sheet Marketing...")
 
-        ws = self.wb.create_sheet("Marketing")
+        ws = self.new_sheet("Marketing")
 
         # Titre
         ws['A1'] = "Marketing & Acquisition - Budget par Canal"
-        ws['A1'].font = Font(bold=True, size=14)
-
-        # Headers
-        ws['D1'] = "2025-2026"
-        ws.merge_cells('D1:Q1')
-        self.apply_style(ws['D1'], self.style_header_year)
-
-        ws['S1'] = "2027"
-        ws.merge_cells('S1:AD1')
-        self.apply_style(ws['S1'], self.style_header_year)
+        self.styles.apply(ws['A1'], 'heading')
 
-        ws['AF1'] = "2028"
-        ws.merge_cells('AF1:AQ1')
-        self.apply_style(ws['AF1'], self.style_header_year)
-
-        ws['AS1'] = "2029"
-        ws.merge_cells('AS1:BD1')
-        self.apply_style(ws['AS1'], self.style_header_year)
-
-        ws['A2'] = "Canal Marketing"
-        ws['B2'] = "Type"
-        ws['C2'] = "Total 25-26"
-
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            ws[f'{col}2'] = f"M{month}"
-            self.apply_style(ws[f'{col}2'], self.style_header_month)
-
-        row = 3
-
-        ws[f'A{row}'] = "BUDGET MARKETING"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        # Digital ads
-        ws[f'A{row}'] = "  Digital Ads (Google, LinkedIn)"
-        ws[f'B{row}'] = "Mensuel"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            marketing = self.projections[month - 1]['costs']['marketing']
-            if isinstance(marketing, dict) and 'digital_ads' in marketing:
-                value = marketing['digital_ads']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Events
-        ws[f'A{row}'] = "  Events & Salons"
-        ws[f'B{row}'] = "Trimestriel"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            marketing = self.projections[month - 1]['costs']['marketing']
-            if isinstance(marketing, dict) and 'events' in marketing:
-                value = marketing['events']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Content
-        ws[f'A{row}'] = "  Content Marketing"
-        ws[f'B{row}'] = "Mensuel"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            marketing = self.projections[month - 1]['costs']['marketing']
-            if isinstance(marketing, dict) and 'content' in marketing:
-                value = marketing['content']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Partnerships
-        ws[f'A{row}'] = "  Partenariats"
-        ws[f'B{row}'] = "Mensuel"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            marketing = self.projections[month - 1]['costs']['marketing']
-            if isinstance(marketing, dict) and 'partnerships' in marketing:
-                value = marketing['partnerships']
-            else:
-                value = 0
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Total
-        row += 1
-        ws[f'A{row}'] = "TOTAL MARKETING"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            marketing = self.projections[month - 1]['costs']['marketing']
-            value = marketing if isinstance(marketing, (int, float)) else marketing.get('total', 0)
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        self.write_month_headers(ws, "Canal Marketing", "Type")
+        self.write_rows(ws, MARKETING_ROWS, 3)
 
         ws.column_dimensions['A'].width = 35
         ws.column_dimensions['B'].width = 15
 
         logger.info("✓ Sheet Marketing créée")
 
+    @instrument()
     def create_ventes_sheet(self):
         """Créer sheet Ventes (pipeline commercial)"""
         logger.info("💼 Création sheet Ventes...")
 
-        ws = self.wb.create_sheet("Ventes")
+        ws = self.new_sheet("Ventes")
 
         # Titre
         ws['A1'] = "Prévisions de Ventes - Pipeline Commercial"
-        ws['A1'].font = Font(bold=True, size=14)
-
-        # Headers
-        ws['D1'] = "2025-2026"
-        ws.merge_cells('D1:Q1')
-        self.apply_style(ws['D1'], self.style_header_year)
-
-        ws['S1'] = "2027"
-        ws.merge_cells('S1:AD1')
-        self.apply_style(ws['S1'], self.style_header_year)
-
-        ws['AF1'] = "2028"
-        ws.merge_cells('AF1:AQ1')
-        self.apply_style(ws['AF1'], self.style_header_year)
-
-        ws['AS1'] = "2029"
-        ws.merge_cells('AS1:BD1')
-        self.apply_style(ws['AS1'], self.style_header_year)
-
-        ws['A2'] = "Segment / Métrique"
-        ws['B2'] = "Prix unitaire"
-        ws['C2'] = "Total 25-26"
-
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            ws[f'{col}2'] = f"M{month}"
-            self.apply_style(ws[f'{col}2'], self.style_header_month)
-
-        row = 3
-
-        # Hackathons
-        ws[f'A{row}'] = "HACKATHONS"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        ws[f'A{row}'] = "  Nombre de hackathons"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['hackathon']['volume']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].number_format = '0'
-        row += 1
-
-        ws[f'A{row}'] = "  CA Hackathons"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['hackathon']['revenue']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        # Factory
-        row += 1
-        ws[f'A{row}'] = "FACTORY PROJECTS"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        ws[f'A{row}'] = "  Nombre de projets Factory"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['factory']['volume']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].number_format = '0.0'
-        row += 1
-
-        ws[f'A{row}'] = "  CA Factory"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['factory']['revenue']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        self.styles.apply(ws['A1'], 'heading')
 
-        # Hub
-        row += 1
-        ws[f'A{row}'] = "ENTERPRISE HUB"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
-        row += 1
-
-        ws[f'A{row}'] = "  Clients Hub actifs"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['enterprise_hub']['customers']['total']
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].number_format = '0.0'
-        row += 1
-
-        ws[f'A{row}'] = "  Nouveaux clients Hub"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['enterprise_hub'].get('new_customers', 0)
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].number_format = '0'
-        row += 1
-
-        ws[f'A{row}'] = "  MRR Hub"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['enterprise_hub']['mrr']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        ws[f'A{row}'] = "  ARR Hub"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            value = self.projections[month - 1]['revenue']['enterprise_hub']['arr']
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_arr)
-        row += 1
+        self.write_month_headers(ws, "Segment / Métrique", "Prix unitaire")
+        self.write_rows(ws, VENTES_ROWS, 3)
 
         ws.column_dimensions['A'].width = 35
         ws.column_dimensions['B'].width = 15
 
         logger.info("✓ Sheet Ventes créée")
 
+    @instrument()
     def create_synthese_sheet(self):
         """Créer sheet Synthèse (dashboard annuel)"""
+        from openpyxl.utils import get_column_letter
+
         logger.info("📊 Création sheet Synthèse...")
 
-        ws = self.wb.create_sheet("Synthèse", 0)  # Insert at beginning
+        ws = self.new_sheet("Synthèse", 0)  # Insert at beginning
 
         # Titre
-        ws['A1'] = "Business Plan GenieFactory - Synthèse 2025-2029"
-        ws['A1'].font = Font(bold=True, size=16, color='1F4E78')
+        first_year = self.calendar.dates[0][:4]
+        last_year = self.calendar.dates[-1][:4]
+        ws['A1'] = f"Business Plan GenieFactory - Synthèse {first_year}-{last_year}"
+        self.styles.apply(ws['A1'], 'title_blue')
 
         row = 3
         ws[f'A{row}'] = "Vue Annuelle Consolidée"
-        ws[f'A{row}'].font = Font(bold=True, size=14)
+        self.styles.apply(ws[f'A{row}'], 'heading')
         row += 2
 
-        # Headers
-        ws['A5'] = "Métrique"
-        ws['B5'] = "2025-2026 (14M)"
-        ws['C5'] = "2027"
-        ws['D5'] = "2028"
-        ws['E5'] = "2029"
-        ws['F5'] = "TOTAL 50M"
+        # Headers: une colonne par période annuelle + total horizon
+        periods = self.calendar.periods
+        period_cols = [get_column_letter(2 + index) for index in range(len(periods))]
+        total_col = get_column_letter(2 + len(periods))
 
-        for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}5'], self.style_header_month)
-
-        row = 6
-
-        # CA total
-        ws[f'A{row}'] = "Chiffre d'Affaires"
-        ca_2025_2026 = sum(p['revenue']['total'] for p in self.projections[:14])
-        ca_2027 = sum(p['revenue']['total'] for p in self.projections[14:26])
-        ca_2028 = sum(p['revenue']['total'] for p in self.projections[26:38])
-        ca_2029 = sum(p['revenue']['total'] for p in self.projections[38:50])
-        ca_total = ca_2025_2026 + ca_2027 + ca_2028 + ca_2029
-
-        ws[f'B{row}'] = ca_2025_2026
-        ws[f'C{row}'] = ca_2027
-        ws[f'D{row}'] = ca_2028
-        ws[f'E{row}'] = ca_2029
-        ws[f'F{row}'] = ca_total
-        for col in ['B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-            ws[f'{col}{row}'].font = Font(bold=True)
-        row += 1
-
-        # ARR fin de période
-        ws[f'A{row}'] = "ARR (fin période)"
-        arr_m14 = self.projections[13]['metrics']['arr']
-        arr_m26 = self.projections[25]['metrics']['arr']
-        arr_m38 = self.projections[37]['metrics']['arr']
-        arr_m50 = self.projections[49]['metrics']['arr']
-
-        ws[f'B{row}'] = arr_m14
-        ws[f'C{row}'] = arr_m26
-        ws[f'D{row}'] = arr_m38
-        ws[f'E{row}'] = arr_m50
-        ws[f'F{row}'] = arr_m50  # Dernière valeur
-        for col in ['B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}{row}'], self.style_arr)
-        row += 1
+        ws['A5'] = "Métrique"
+        for index, (col, period) in enumerate(zip(period_cols, periods)):
+            ws[f'{col}5'] = f"{period.label} ({period.length}M)" if index == 0 else period.label
+        ws[f'{total_col}5'] = f"TOTAL {self.months_count}M"
 
-        # Charges totales
-        ws[f'A{row}'] = "Charges totales"
-        charges_2025_2026 = sum(p['costs']['total'] for p in self.projections[:14])
-        charges_2027 = sum(p['costs']['total'] for p in self.projections[14:26])
-        charges_2028 = sum(p['costs']['total'] for p in self.projections[26:38])
-        charges_2029 = sum(p['costs']['total'] for p in self.projections[38:50])
-        charges_total = charges_2025_2026 + charges_2027 + charges_2028 + charges_2029
-
-        ws[f'B{row}'] = charges_2025_2026
-        ws[f'C{row}'] = charges_2027
-        ws[f'D{row}'] = charges_2028
-        ws[f'E{row}'] = charges_2029
-        ws[f'F{row}'] = charges_total
-        for col in ['B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        for col in ['A'] + period_cols + [total_col]:
+            self.styles.apply(ws[f'{col}5'], 'header_month')
 
-        # EBITDA
-        ws[f'A{row}'] = "EBITDA"
-        ws[f'B{row}'] = ca_2025_2026 - charges_2025_2026
-        ws[f'C{row}'] = ca_2027 - charges_2027
-        ws[f'D{row}'] = ca_2028 - charges_2028
-        ws[f'E{row}'] = ca_2029 - charges_2029
-        ws[f'F{row}'] = ca_total - charges_total
-        for col in ['B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-            ws[f'{col}{row}'].font = Font(bold=True, color='00B050' if ws[f'{col}{row}'].value > 0 else 'C00000')
-        row += 1
+        # Valeurs = totaux annuels du P&L (formules), total horizon = somme des périodes
+        pl_rows = spec_rows(PL_ROWS, PL_FIRST_ROW)
+        pl_totals = [get_column_letter(col_idx) for _, col_idx in self.total_columns]
+        first_col, last_col = period_cols[0], period_cols[-1]
 
-        # Cash fin de période
-        ws[f'A{row}'] = "Cash (fin période)"
-        ws[f'B{row}'] = self.projections[13]['metrics']['cash']
-        ws[f'C{row}'] = self.projections[25]['metrics']['cash']
-        ws[f'D{row}'] = self.projections[37]['metrics']['cash']
-        ws[f'E{row}'] = self.projections[49]['metrics']['cash']
-        ws[f'F{row}'] = self.projections[49]['metrics']['cash']
-        for col in ['B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        def pl_reference(key: str) -> List[str]:
+            return [f"='P&L'!{total}{pl_rows[key]}" for total in pl_totals]
 
-        # Équipe
-        ws[f'A{row}'] = "Équipe (ETP)"
-        ws[f'B{row}'] = self.projections[13]['metrics']['team_size']
-        ws[f'C{row}'] = self.projections[25]['metrics']['team_size']
-        ws[f'D{row}'] = self.projections[37]['metrics']['team_size']
-        ws[f'E{row}'] = self.projections[49]['metrics']['team_size']
-        for col in ['B', 'C', 'D', 'E']:
-            ws[f'{col}{row}'].number_format = '0'
-        row += 1
+        def write_line(row: int, label: str, formulas: List[str], total: str, style):
+            ws[f'A{row}'] = label
+            for col, formula in zip(period_cols + [total_col], formulas + [total]):
+                ws[f'{col}{row}'] = formula
+                if style:
+                    self.styles.apply(ws[f'{col}{row}'], style(col) if callable(style) else style)
+
+        ca_row, arr_row, charges_row, ebitda_row, cash_row, team_row = range(6, 12)
+
+        write_line(ca_row, "Chiffre d'Affaires", pl_reference('ca_total'),
+                   f"=SUM({first_col}{ca_row}:{last_col}{ca_row})", 'currency_bold')
+        write_line(arr_row, "ARR (fin période)", pl_reference('arr'),
+                   f"={last_col}{arr_row}", 'arr')  # Dernière valeur
+        write_line(charges_row, "Charges totales", pl_reference('charges_total'),
+                   f"=SUM({first_col}{charges_row}:{last_col}{charges_row})", 'currency')
+
+        # EBITDA: couleur selon le signe des projections (pas de valeur calculée à l'écriture)
+        ebitda = self.metric('metrics.ebitda')
+        ebitda_signs = {col: sum(ebitda[period.first - 1:period.last])
+                        for col, period in zip(period_cols, periods)}
+        ebitda_signs[total_col] = sum(ebitda)
+        write_line(ebitda_row, "EBITDA",
+                   [f"={col}{ca_row}-{col}{charges_row}" for col in period_cols],
+                   f"={total_col}{ca_row}-{total_col}{charges_row}",
+                   lambda col: 'currency_gain' if ebitda_signs[col] > 0 else 'currency_loss')
+
+        write_line(cash_row, "Cash (fin période)", pl_reference('cash'),
+                   f"={last_col}{cash_row}", 'currency')
+
+        # Équipe (pas de total horizon)
+        ws[f'A{team_row}'] = "Équipe (ETP)"
+        for col, formula in zip(period_cols, pl_reference('team')):
+            ws[f'{col}{team_row}'] = formula
+            self.styles.apply(ws[f'{col}{team_row}'], 'count')
 
         # Largeurs
         ws.column_dimensions['A'].width = 25
-        for col in ['B', 'C', 'D', 'E', 'F']:
+        for col in period_cols + [total_col]:
             ws.column_dimensions[col].width = 15
 
         logger.info("✓ Sheet Synthèse créée")
 
+    @instrument()
     def create_parametres_sheet(self):
         """Créer sheet Paramètres (pricing et assumptions)"""
         logger.info("⚙️ Création sheet Paramètres...")
 
-        ws = self.wb.create_sheet("Paramètres")
+        ws = self.new_sheet("Paramètres")
 
         ws['A1'] = "Paramètres et Hypothèses Clés"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "PRICING"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         # Hackathon pricing
@@ -999,7 +581,7 @@ class BPExcel50MGenerator:
         # KPIs
         row += 2
         ws[f'A{row}'] = "KPIS CLES"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         ws[f'A{row}'] = "ARR Target M14"
@@ -1019,14 +601,15 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet Paramètres créée")
 
+    @instrument()
     def create_financement_sheet(self):
         """Créer sheet Financement"""
         logger.info("💰 Création sheet Financement...")
 
-        ws = self.wb.create_sheet("Financement")
+        ws = self.new_sheet("Financement")
 
         ws['A1'] = "Plan de Financement"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "Tour"
@@ -1034,7 +617,7 @@ class BPExcel50MGenerator:
         ws[f'C{row}'] = "Montant"
         ws[f'D{row}'] = "Valorisation post"
         for col in ['A', 'B', 'C', 'D']:
-            self.apply_style(ws[f'{col}{row}'], self.style_header_month)
+            self.styles.apply(ws[f'{col}{row}'], 'header_month')
         row += 1
 
         # Pre-seed
@@ -1042,8 +625,8 @@ class BPExcel50MGenerator:
         ws[f'B{row}'] = "M1 (Nov 2025)"
         ws[f'C{row}'] = 250000
         ws[f'D{row}'] = 1500000
-        self.apply_style(ws[f'C{row}'], self.style_currency)
-        self.apply_style(ws[f'D{row}'], self.style_currency)
+        self.styles.apply(ws[f'C{row}'], 'currency')
+        self.styles.apply(ws[f'D{row}'], 'currency')
         row += 1
 
         # Seed
@@ -1051,8 +634,8 @@ class BPExcel50MGenerator:
         ws[f'B{row}'] = "M11 (Sept 2026)"
         ws[f'C{row}'] = 500000
         ws[f'D{row}'] = 4000000
-        self.apply_style(ws[f'C{row}'], self.style_currency)
-        self.apply_style(ws[f'D{row}'], self.style_currency)
+        self.styles.apply(ws[f'C{row}'], 'currency')
+        self.styles.apply(ws[f'D{row}'], 'currency')
         row += 1
 
         ws.column_dimensions['A'].width = 20
@@ -1062,18 +645,19 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet Financement créée")
 
+    @instrument()
     def create_strategie_vente_sheet(self):
         """Créer sheet Stratégie de vente"""
         logger.info("🎯 Création sheet Stratégie de vente...")
 
-        ws = self.wb.create_sheet("Stratégie de vente")
+        ws = self.new_sheet("Stratégie de vente")
 
         ws['A1'] = "Stratégie de Vente - Pipeline & Conversion"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "PHASES DE VENTE"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         phases = [
@@ -1086,7 +670,7 @@ class BPExcel50MGenerator:
         ws['B4'] = "Description"
         ws['C4'] = "Pricing"
         for col in ['A', 'B', 'C']:
-            self.apply_style(ws[f'{col}4'], self.style_header_month)
+            self.styles.apply(ws[f'{col}4'], 'header_month')
 
         row = 5
         for phase, desc, price in phases:
@@ -1097,7 +681,7 @@ class BPExcel50MGenerator:
 
         row += 2
         ws[f'A{row}'] = "TAUX DE CONVERSION"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         conversions = [
@@ -1117,18 +701,19 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet Stratégie de vente créée")
 
+    @instrument()
     def create_gtmarket_sheet(self):
         """Créer sheet GTMarket (Go-to-Market)"""
         logger.info("🚀 Création sheet GTMarket...")
 
-        ws = self.wb.create_sheet("GTMarket")
+        ws = self.new_sheet("GTMarket")
 
         ws['A1'] = "Go-to-Market Strategy - Phases de Déploiement"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "PHASES DE DÉPLOIEMENT"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         phases = [
@@ -1144,7 +729,7 @@ class BPExcel50MGenerator:
         ws['B5'] = "Phase"
         ws['C5'] = "Objectifs"
         for col in ['A', 'B', 'C']:
-            self.apply_style(ws[f'{col}5'], self.style_header_month)
+            self.styles.apply(ws[f'{col}5'], 'header_month')
 
         row = 6
         for period, phase, obj in phases:
@@ -1159,81 +744,40 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet GTMarket créée")
 
+    @instrument()
     def create_sous_traitance_sheet(self):
         """Créer sheet Sous-traitance"""
         logger.info("🔧 Création sheet Sous-traitance...")
 
-        ws = self.wb.create_sheet("Sous-traitance")
+        ws = self.new_sheet("Sous-traitance")
 
         ws['A1'] = "Coûts de Sous-traitance & Freelances"
-        ws['A1'].font = Font(bold=True, size=14)
-
-        # Headers
-        ws['D1'] = "2025-2026"
-        ws.merge_cells('D1:Q1')
-        self.apply_style(ws['D1'], self.style_header_year)
-
-        ws['S1'] = "2027"
-        ws.merge_cells('S1:AD1')
-        self.apply_style(ws['S1'], self.style_header_year)
-
-        ws['AF1'] = "2028"
-        ws.merge_cells('AF1:AQ1')
-        self.apply_style(ws['AF1'], self.style_header_year)
+        self.styles.apply(ws['A1'], 'heading')
 
-        ws['AS1'] = "2029"
-        ws.merge_cells('AS1:BD1')
-        self.apply_style(ws['AS1'], self.style_header_year)
-
-        ws['A2'] = "Type de prestation"
-        ws['B2'] = "Description"
-        ws['C2'] = "Total 25-26"
-
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            ws[f'{col}2'] = f"M{month}"
-            self.apply_style(ws[f'{col}2'], self.style_header_month)
-
-        row = 3
-
-        ws[f'A{row}'] = "Freelances / Consultants"
-        ws[f'B{row}'] = "Dev, Design, Conseil"
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            costs_personnel = self.projections[month - 1]['costs']['personnel']
-            value = costs_personnel.get('freelance', 0)
-            ws[f'{col}{row}'] = value
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
-
-        ws[f'A{row}'] = "Total Sous-traitance"
-        self.apply_style(ws[f'A{row}'], self.style_total)
-        for month in range(1, 51):
-            col = self.columns_map[month]
-            costs_personnel = self.projections[month - 1]['costs']['personnel']
-            value = costs_personnel.get('freelance', 0)
-            ws[f'{col}{row}'] = value
-            ws[f'{col}{row}'].font = Font(bold=True)
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
-        row += 1
+        self.write_month_headers(ws, "Type de prestation", "Description")
+        self.write_rows(ws, [
+            RowSpec("Freelances / Consultants", 'costs.personnel.freelance', note="Dev, Design, Conseil"),
+            RowSpec("Total Sous-traitance", 'costs.personnel.freelance', 'currency_bold', 'total'),
+        ], 3)
 
         ws.column_dimensions['A'].width = 30
         ws.column_dimensions['B'].width = 30
 
         logger.info("✓ Sheet Sous-traitance créée")
 
+    @instrument()
     def create_direction_sheet(self):
         """Créer sheet DIRECTION (scénarios management)"""
         logger.info("👔 Création sheet DIRECTION...")
 
-        ws = self.wb.create_sheet("DIRECTION")
+        ws = self.new_sheet("DIRECTION")
 
         ws['A1'] = "Équipe de Direction - Scénarios de Rémunération"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "SCÉNARIOS SALAIRES DIRECTION"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         scenarios = [
@@ -1246,7 +790,7 @@ class BPExcel50MGenerator:
         ws['B5'] = "Description"
         ws['C5'] = "Budget annuel"
         for col in ['A', 'B', 'C']:
-            self.apply_style(ws[f'{col}5'], self.style_header_month)
+            self.styles.apply(ws[f'{col}5'], 'header_month')
 
         row = 6
         for scenario, desc, budget in scenarios:
@@ -1257,7 +801,7 @@ class BPExcel50MGenerator:
 
         row += 2
         ws[f'A{row}'] = "ÉQUIPE DIRECTION 2025-2029"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         direction = [
@@ -1279,18 +823,19 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet DIRECTION créée")
 
+    @instrument()
     def create_fundings_detailed_sheet(self):
         """Créer sheet Fundings (détaillé avec dilution)"""
         logger.info("💰 Création sheet Fundings (détaillé)...")
 
-        ws = self.wb.create_sheet("Fundings")
+        ws = self.new_sheet("Fundings")
 
         ws['A1'] = "Plan de Financement Détaillé - Levées et Dilution"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "TOURS DE FINANCEMENT"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         ws['A5'] = "Tour"
@@ -1300,7 +845,7 @@ class BPExcel50MGenerator:
         ws['E5'] = "Valorisation post"
         ws['F5'] = "Dilution"
         for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-            self.apply_style(ws[f'{col}5'], self.style_header_month)
+            self.styles.apply(ws[f'{col}5'], 'header_month')
 
         row = 6
 
@@ -1312,7 +857,7 @@ class BPExcel50MGenerator:
         ws[f'E{row}'] = 1500000
         ws[f'F{row}'] = "16.7%"
         for col in ['C', 'D', 'E']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
+            self.styles.apply(ws[f'{col}{row}'], 'currency')
         row += 1
 
         # Seed
@@ -1323,7 +868,7 @@ class BPExcel50MGenerator:
         ws[f'E{row}'] = 4000000
         ws[f'F{row}'] = "12.5%"
         for col in ['C', 'D', 'E']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
+            self.styles.apply(ws[f'{col}{row}'], 'currency')
         row += 1
 
         # Series A (prévisionnel)
@@ -1334,12 +879,12 @@ class BPExcel50MGenerator:
         ws[f'E{row}'] = 20000000
         ws[f'F{row}'] = "10.0%"
         for col in ['C', 'D', 'E']:
-            self.apply_style(ws[f'{col}{row}'], self.style_currency)
+            self.styles.apply(ws[f'{col}{row}'], 'currency')
         row += 1
 
         row += 2
         ws[f'A{row}'] = "UTILISATION DES FONDS"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         utilisation = [
@@ -1360,23 +905,24 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet Fundings (détaillé) créée")
 
+    @instrument()
     def create_navigation_sheet(self):
         """Créer sheet >> (navigation)"""
         logger.info("🧭 Création sheet Navigation...")
 
-        ws = self.wb.create_sheet(">>")
+        ws = self.new_sheet(">>")
 
         ws['A1'] = "Navigation - Accès Rapide aux Sheets"
-        ws['A1'].font = Font(bold=True, size=16, color='1F4E78')
+        self.styles.apply(ws['A1'], 'title_blue')
 
         row = 3
         ws[f'A{row}'] = "📊 SHEETS PRINCIPALES"
-        ws[f'A{row}'].font = Font(bold=True, size=12, color='1F4E78')
+        self.styles.apply(ws[f'A{row}'], 'subheading_blue')
         row += 2
 
         main_sheets = [
             ("1. Synthèse", "Dashboard annuel consolidé"),
-            ("2. P&L", "Compte de résultat 50 mois"),
+            ("2. P&L", f"Compte de résultat {self.months_count} mois"),
             ("3. Ventes", "Pipeline commercial détaillé"),
             ("4. Charges Personnel", "Détail par rôle et FTE"),
         ]
@@ -1384,12 +930,12 @@ class BPExcel50MGenerator:
         for sheet_name, description in main_sheets:
             ws[f'A{row}'] = sheet_name
             ws[f'B{row}'] = description
-            ws[f'A{row}'].font = Font(bold=True, color='4472C4')
+            self.styles.apply(ws[f'A{row}'], 'link')
             row += 1
 
         row += 1
         ws[f'A{row}'] = "💰 SHEETS FINANCIÈRES"
-        ws[f'A{row}'].font = Font(bold=True, size=12, color='548235')
+        self.styles.apply(ws[f'A{row}'], 'subheading_green')
         row += 2
 
         finance_sheets = [
@@ -1407,7 +953,7 @@ class BPExcel50MGenerator:
 
         row += 1
         ws[f'A{row}'] = "📈 SHEETS STRATÉGIE"
-        ws[f'A{row}'].font = Font(bold=True, size=12, color='C00000')
+        self.styles.apply(ws[f'A{row}'], 'subheading_darkred')
         row += 2
 
         strategy_sheets = [
@@ -1428,18 +974,19 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet Navigation créée")
 
+    @instrument()
     def create_positionnement_sheet(self):
         """Créer sheet Positionnement (analyse concurrentielle)"""
         logger.info("🎯 Création sheet Positionnement...")
 
-        ws = self.wb.create_sheet("Positionnement")
+        ws = self.new_sheet("Positionnement")
 
         ws['A1'] = "Positionnement & Analyse Concurrentielle"
-        ws['A1'].font = Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         row = 3
         ws[f'A{row}'] = "DIFFÉRENCIATION GÉNIEFACTORY"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         differentiation = [
@@ -1455,7 +1002,7 @@ class BPExcel50MGenerator:
 
         row += 2
         ws[f'A{row}'] = "MATRICE CONCURRENTIELLE"
-        self.apply_style(ws[f'A{row}'], self.style_section_header)
+        self.styles.apply(ws[f'A{row}'], 'section_header')
         row += 1
 
         ws[f'A{row}'] = "Concurrent"
@@ -1463,7 +1010,7 @@ class BPExcel50MGenerator:
         ws[f'C{row}'] = "Forces"
         ws[f'D{row}'] = "Faiblesses"
         for col in ['A', 'B', 'C', 'D']:
-            self.apply_style(ws[f'{col}{row}'], self.style_header_month)
+            self.styles.apply(ws[f'{col}{row}'], 'header_month')
         row += 1
 
         competitors = [
@@ -1486,11 +1033,10 @@ class BPExcel50MGenerator:
 
         logger.info("✓ Sheet Positionnement créée")
 
+    @instrument()
     def generate(self):
         """Générer le workbook complet"""
-        logger.info("\n🔨 Génération workbook BP 50 mois complet...")
-
-        self.create_styles()
+        logger.info(f"\n🔨 Génération workbook BP {self.months_count} mois complet...")
 
         # Créer les sheets dans l'ordre
         logger.info("\n📑 Création de 15 sheets complètes...")
@@ -1540,6 +1086,9 @@ class BPExcel50MGenerator:
         # 15. Marketing (budget par canal)
         self.create_marketing_sheet()
 
+        if self.streaming:
+            self.sheets.close()
+
         logger.info("\n✓ Workbook complet généré - 15 sheets")
         logger.info(f"  Sheets: {len(self.wb.sheetnames)}")
         logger.info(f"  Ordre: {', '.join(self.wb.sheetnames)}")
@@ -1548,45 +1097,57 @@ class BPExcel50MGenerator:
 
 def main():
     """Fonction principale"""
+    parser = argparse.ArgumentParser(
+        description="Génération BP Excel 50 mois (15 sheets)"
+    )
+    parser.add_argument(
+        '--backend',
+        choices=('streaming', 'memory'),
+        default='streaming',
+        help="streaming (write_only, mémoire constante) ou memory (Workbook openpyxl complet)"
+    )
+    args = parser.parse_args()
+
     logger.info("="*60)
     logger.info("🚀 GÉNÉRATION BP EXCEL 50 MOIS - GenieFactory")
     logger.info("="*60)
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger projections 50M
-    projections_path = base_path / "data" / "structured" / "projections_50m.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections_50m")
     if not projections_path.exists():
-        logger.error(f"❌ Fichier projections_50m.json non trouvé: {projections_path}")
+        logger.error(f"❌ Fichier projections_50m non trouvé: {projections_path}")
         logger.error("   Exécuter d'abord: python scripts/3_calculate_projections.py")
         return 1
 
     logger.info(f"📂 Chargement projections: {projections_path}")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
 
-    logger.info(f"✓ Projections chargées: {len(projections)} mois")
+    logger.info(f"✓ Projections chargées: {len(projections)} mois (horizon détecté)")
 
     # Charger assumptions
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
     logger.info(f"📂 Chargement assumptions: {assumptions_path}")
-    with open(assumptions_path, 'r', encoding='utf-8') as f:
-        assumptions = yaml.safe_load(f)
+    assumptions = load_yaml(assumptions_path)
 
     logger.info(f"✓ Assumptions chargées (version {assumptions.get('version', '1.0')})")
 
     # Générer Excel
-    generator = BPExcel50MGenerator(projections, assumptions)
+    generator = BPExcel50MGenerator(projections, assumptions,
+                                    streaming=args.backend == 'streaming')
     wb = generator.generate()
 
-    # Sauvegarder
-    output_path = base_path / "data" / "outputs" / "BP_50M_Nov2025-Dec2029.xlsx"
+    # Sauvegarder (nom dérivé de l'horizon: BP_50M_Nov2025-Dec2029.xlsx par défaut)
+    months_count = generator.months_count
+    output_path = base_path / "data" / "outputs" / f"BP_{months_count}M_{generator.calendar.span_label}.xlsx"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    wb.save(output_path)
+    with span('save_workbook'):
+        wb.save(output_path)
 
     logger.info("\n" + "="*60)
-    logger.info("✅ BP EXCEL 50 MOIS GÉNÉRÉ")
+    logger.info(f"✅ BP EXCEL {months_count} MOIS GÉNÉRÉ")
     logger.info("="*60)
     logger.info(f"📁 Fichier: {output_path}")
     logger.info(f"📊 Taille: {output_path.stat().st_size / 1024:.1f} KB")
@@ -1594,7 +1155,10 @@ def main():
 
     logger.info("\n✓ Excel prêt à ouvrir dans MS Excel ou LibreOffice")
     logger.info(f"   → {len(wb.sheetnames)} sheets créés")
-    logger.info("   → Couverture complète: 50 mois (Nov 2025 - Dec 2029)")
+    logger.info(
+        f"   → Couverture complète: {months_count} mois "
+        f"({generator.calendar.month_label(1)} - {generator.calendar.month_label(months_count)})"
+    )
 
     return 0
 
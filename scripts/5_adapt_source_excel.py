@@ -6,12 +6,13 @@ tout en préservant toutes les formules Excel existantes
 
 import openpyxl
 from pathlib import Path
-import json
 from rich.console import Console
 from rich.progress import track
 from datetime import datetime
 import logging
 
+from projection_io import find_projections, load_projections
+
 console = Console()
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 logger = logging.getLogger(__name__)
@@ -351,10 +352,9 @@ def main():
     base_path = Path(__file__).parent.parent
 
     # Charger les projections
-    projections_path = base_path / "data" / "structured" / "projections_50m.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections_50m")
     console.print(f"[yellow]📂 Chargement projections:[/yellow] {projections_path.name}")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
     console.print(f"[green]✓ {len(projections)} mois chargés[/green]")
 
     # Charger les assumptions
@@ -377,7 +377,7 @@ def main():
     console.print(f"\n[bold green]✅ FICHIER ADAPTÉ GÉNÉRÉ[/bold green]")
     console.print(f"[green]📁 {output_file}[/green]")
     console.print(f"\n[cyan]→ Toutes les formules Excel préservées[/cyan]")
-    console.print(f"[cyan]→ Données injectées depuis projections_50m.json[/cyan]")
+    console.print(f"[cyan]→ Données injectées depuis {projections_path.name}[/cyan]")
     console.print(f"[cyan]→ Ouvrir dans Excel pour voir les formules recalculer[/cyan]\n")
 
 
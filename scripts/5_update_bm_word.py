@@ -12,8 +12,6 @@ Output:
   - data/outputs/BM_Updated_14M.docx
 """
 
-import json
-import yaml
 import re
 import logging
 from pathlib import Path
@@ -24,6 +22,10 @@ from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_ALIGN_PARAGRAPH
 
+from projection_io import find_projections, load_projections
+from pipeline_context import load_yaml, plan_root
+from telemetry import instrument
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,6 +44,7 @@ class BMWordUpdater:
         self.assumptions = assumptions
         self.doc = None
 
+    @instrument()
     def load(self):
         """Charger le document Word source"""
         logger.info(f"📂 Chargement BM Word: {self.source_path}")
@@ -465,7 +468,7 @@ ARR {arr_m14/1000:.0f}K€ à M14 (Dec 2026) = Déclenchement earn-out fondateur
         """Insérer graphiques PNG dans le document"""
         logger.info("🖼️ Insertion graphiques...")
 
-        charts_dir = Path(__file__).parent.parent / "data" / "outputs" / "charts"
+        charts_dir = plan_root() / "data" / "outputs" / "charts"
 
         # Vérifier existence dossier
         if not charts_dir.exists():
@@ -501,6 +504,7 @@ ARR {arr_m14/1000:.0f}K€ à M14 (Dec 2026) = Déclenchement earn-out fondateur
 
         logger.info("✓ Graphiques insérés")
 
+    @instrument()
     def update(self):
         """Mise à jour complète du document"""
         logger.info("\n🔧 MISE À JOUR BM WORD")
@@ -542,6 +546,7 @@ ARR {arr_m14/1000:.0f}K€ à M14 (Dec 2026) = Déclenchement earn-out fondateur
 
         logger.info("\n✓ Document mis à jour")
 
+    @instrument()
     def save(self, output_path: Path):
         """Sauvegarder le document"""
         self.doc.save(output_path)
@@ -554,10 +559,10 @@ def main():
     logger.info("🚀 UPDATE BM WORD - GenieFactory BP 14 Mois")
     logger.info("="*60)
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger données
-    projections_path = base_path / "data" / "structured" / "projections.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections")
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
     source_word_path = base_path / "data" / "raw" / "Business Plan GenieFactory-SEPT2025.docx"
 
@@ -566,12 +571,10 @@ def main():
         return 1
 
     logger.info(f"📂 Chargement projections: {projections_path}")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
 
     logger.info(f"📂 Chargement assumptions: {assumptions_path}")
-    with open(assumptions_path, 'r', encoding='utf-8') as f:
-        assumptions = yaml.safe_load(f)
+    assumptions = load_yaml(assumptions_path)
 
     # Update document
     updater = BMWordUpdater(source_word_path, projections, assumptions)
@@ -11,22 +11,26 @@ Inputs:
 
 Output:
   - Rapport validation (console + logs/validation_report_YYYYMMDD.txt)
+
+openpyxl, python-docx et l'évaluateur de formules ne sont importés que par
+les checks Excel / Word : --help reste léger (scripts/startup_budget.py).
 """
 
-import json
-import yaml
 import re
 import logging
+import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Tuple
 
-import openpyxl
-from docx import Document
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from projection_io import find_projections, load_projections
+from pipeline_context import load_yaml, plan_root
+from telemetry import instrument
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,7 +51,17 @@ class Validator:
         self.errors = []
         self.warnings = []
         self.checks_passed = []
+        self.evaluators = {}  # Workbook chargé une fois pour tous les checks Excel
+
+    def excel_values(self, excel_path: Path) -> 'FormulaEvaluator':
+        """Valeurs calculées du BP Excel (formules évaluées en Python, sans cache Excel)"""
+        if excel_path not in self.evaluators:
+            import openpyxl
+            from excel_formulas import FormulaEvaluator
+            self.evaluators[excel_path] = FormulaEvaluator(openpyxl.load_workbook(excel_path))
+        return self.evaluators[excel_path]
 
+    @instrument()
     def check_arr_targets(self) -> bool:
         """Vérifier ARR targets"""
         console.print("\n[cyan]📊 CHECKS ARR TARGETS[/]")
@@ -92,6 +106,7 @@ class Validator:
 
         return len(self.errors) == 0
 
+    @instrument()
     def check_cash_position(self) -> bool:
         """Vérifier cash jamais négatif"""
         console.print("\n[cyan]💰 CHECK CASH POSITION[/]")
@@ -122,6 +137,7 @@ class Validator:
             console.print(f"  ✓ Cash toujours positif [green](min: {min_cash:,.0f}€ à M{min_cash_month})[/]")
             return True
 
+    @instrument()
     def check_burn_rate(self) -> bool:
         """Vérifier burn rate acceptable"""
         console.print("\n[cyan]🔥 CHECK BURN RATE[/]")
@@ -150,6 +166,7 @@ class Validator:
             )
             return False
 
+    @instrument()
     def check_team_size(self) -> bool:
         """Vérifier taille équipe raisonnable"""
         console.print("\n[cyan]👥 CHECK ÉQUIPE[/]")
@@ -175,6 +192,7 @@ class Validator:
             )
             return True
 
+    @instrument()
     def check_conversion_rates(self) -> bool:
         """Vérifier taux de conversion"""
         console.print("\n[cyan]📈 CHECK TAUX CONVERSION[/]")
@@ -205,18 +223,23 @@ class Validator:
 
         return True
 
+    @instrument()
     def check_excel_formulas(self, excel_path: Path) -> bool:
         """Vérifier formules Excel actives"""
+        from openpyxl.utils import get_column_letter
+
         console.print("\n[cyan]📊 CHECK FORMULES EXCEL[/]")
 
         try:
-            wb = openpyxl.load_workbook(excel_path, data_only=False)
-            pl_sheet = wb['P&L']
+            values = self.excel_values(excel_path)
+            pl_sheet = values.wb['P&L']
 
             formulas_found = 0
             formulas_checked = [
                 ('F4', 'SUM'),  # CA Total M1
-                ('F16', '*'),   # ARR M1
+                ('F11', 'SUM'),  # Charges Total M1
+                ('F17', '-'),   # EBITDA M1
+                ('G21', '+'),   # Cash M2 (cumul)
             ]
 
             for cell_ref, expected_pattern in formulas_checked:
@@ -232,7 +255,6 @@ class Validator:
                 console.print(
                     f"  ✓ Formules Excel actives [green]({formulas_found} vérifiées)[/]"
                 )
-                return True
             else:
                 self.warnings.append(
                     f"Peu de formules détectées: {formulas_found}/{len(formulas_checked)}"
@@ -240,27 +262,49 @@ class Validator:
                 console.print(
                     f"  ⚠ Formules Excel: {formulas_found}/{len(formulas_checked)} [yellow](hardcoded?)[/]"
                 )
-                return True
+
+            # Valeurs calculées des formules ↔ projections (colonnes F-S = M1-M14)
+            rows = {'CA Total': (4, 'revenue', 'total'), 'Charges': (11, 'costs', 'total'),
+                    'EBITDA': (17, 'metrics', 'ebitda'), 'Cash': (21, 'metrics', 'cash')}
+            mismatches = []
+            for label, (row, section, key) in rows.items():
+                for idx, month_data in enumerate(self.projections[:14]):
+                    computed = values.value('P&L', f"{get_column_letter(6 + idx)}{row}")
+                    expected = month_data[section][key]
+                    if not isinstance(computed, (int, float)) or abs(computed - expected) > 1:
+                        mismatches.append(f"{label} M{idx + 1}: {computed} ≠ {expected:,.0f}€")
+
+            if mismatches:
+                self.errors.append(
+                    f"Formules Excel ≠ projections: {len(mismatches)} écarts ({mismatches[0]})"
+                )
+                console.print(f"  ✗ Valeurs calculées: [red]{len(mismatches)} écarts[/] ({mismatches[0]})")
+                return False
+
+            self.checks_passed.append("Valeurs calculées des formules = projections (CA, charges, EBITDA, cash)")
+            console.print("  ✓ Valeurs calculées = projections [green](CA, charges, EBITDA, cash)[/]")
+            return True
 
         except Exception as e:
             self.warnings.append(f"Erreur lecture Excel: {str(e)}")
             console.print(f"  ⚠ Impossible vérifier formules Excel: {str(e)}")
             return True
 
+    @instrument()
     def check_excel_word_consistency(self, excel_path: Path, word_path: Path) -> bool:
         """Vérifier cohérence Excel ↔ Word"""
+        from docx import Document
+
         console.print("\n[cyan]🔗 CHECK COHÉRENCE EXCEL ↔ WORD[/]")
 
         try:
             # ARR M14 depuis projections
             arr_proj = self.projections[13]['metrics']['arr']
 
-            # ARR depuis Excel
-            wb = openpyxl.load_workbook(excel_path, data_only=True)
-            pl_sheet = wb['P&L']
-            arr_excel = pl_sheet['S19'].value  # Dernière colonne (M14), ligne ARR (row 19)
+            # ARR depuis Excel (valeur calculée: pas de cache data_only sur un fichier généré)
+            arr_excel = self.excel_values(excel_path).value('P&L', 'S19')  # M14, ligne ARR (row 19)
 
-            if arr_excel is None:
+            if not isinstance(arr_excel, (int, float)):
                 arr_excel = 0
 
             # ARR depuis Word (extraction pattern)
@@ -321,6 +365,7 @@ class Validator:
             console.print(f"  ⚠ Erreur: {str(e)}")
             return True
 
+    @instrument()
     def generate_report(self) -> str:
         """Générer rapport de validation"""
         status = "✅ PASSED" if len(self.errors) == 0 else "❌ FAILED"
@@ -360,16 +405,18 @@ class Validator:
 
 def main():
     """Fonction principale"""
+    argparse.ArgumentParser(description="Validation finale du BP 14 mois (targets, Excel, Word)").parse_args()
+
     console.print(Panel.fit(
         "[bold cyan]🔍 VALIDATION FINALE[/]\n"
         "[dim]GenieFactory BP 14 Mois[/]",
         border_style="cyan"
     ))
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger données
-    projections_path = base_path / "data" / "structured" / "projections.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections")
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
     excel_path = base_path / "data" / "outputs" / "BP_14M_Nov2025-Dec2026.xlsx"
     word_path = base_path / "data" / "outputs" / "BM_Updated_14M.docx"
@@ -387,11 +434,9 @@ def main():
 
     # Charger
     console.print("\n[cyan]📂 Chargement données...[/]")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
 
-    with open(assumptions_path, 'r', encoding='utf-8') as f:
-        assumptions = yaml.safe_load(f)
+    assumptions = load_yaml(assumptions_path)
 
     # Validation
     validator = Validator(projections, assumptions)
@@ -5,13 +5,20 @@ Adapte la structure selon assumptions.yaml tout en préservant les formules
 """
 
 import openpyxl
+import openpyxl.formatting.rule
 from pathlib import Path
+import json
 import yaml
 from rich.console import Console
 from rich.progress import track
 import logging
 from copy import copy
 
+from pipeline_context import load_yaml, plan_root
+from excel_styles import StyleRegistry
+from workbook_snapshot import load_workbook, save_workbook
+from telemetry import instrument
+
 console = Console()
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 logger = logging.getLogger(__name__)
@@ -20,14 +27,17 @@ logger = logging.getLogger(__name__)
 class TemplateCreator:
     """Créer un template Excel adapté depuis le RAW"""
 
-    def __init__(self, raw_path: Path, assumptions: dict):
+    def __init__(self, raw_path: Path, assumptions: dict, sensitivity: dict = None):
         self.raw_path = raw_path
         self.assumptions = assumptions
+        self.sensitivity = sensitivity  # Résultat de sensitivity.py (optionnel)
 
         logger.info(f"📂 Chargement fichier RAW: {raw_path.name}")
-        self.wb = openpyxl.load_workbook(raw_path)
+        self.wb = load_workbook(raw_path)  # Snapshot si ce contenu a déjà été parsé
+        self.styles = StyleRegistry(self.wb)
         logger.info(f"✓ {len(self.wb.sheetnames)} sheets chargés")
 
+    @instrument()
     def update_parametres_sheet(self):
         """
         Adapter le sheet Paramètres selon assumptions.yaml
@@ -161,14 +171,13 @@ class TemplateCreator:
 
         # NOUVELLE SECTION: Coûts RH (colonne R+) - PHASE 4
         ws['R1'].value = "COÛTS RH"
-        ws['R1'].font = openpyxl.styles.Font(bold=True, size=12, color="FFFFFF")
-        ws['R1'].fill = openpyxl.styles.PatternFill(start_color="9966FF", end_color="9966FF", fill_type="solid")
+        self.styles.apply(ws['R1'], 'banner_violet')
 
         ws['R2'].value = "Paramètre"
         ws['S2'].value = "Valeur"
 
         for col in ['R', 'S']:
-            ws[f'{col}2'].font = openpyxl.styles.Font(bold=True)
+            self.styles.apply(ws[f'{col}2'], 'bold')
 
         costs = self.assumptions.get('costs', {})
         social_charges = costs.get('social_charges_rate', 0.45)
@@ -192,14 +201,13 @@ class TemplateCreator:
 
         # NOUVELLE SECTION: Volumes Commerciaux (colonne R+) - PHASE 4
         ws[f'R{row+1}'].value = "VOLUMES COMMERCIAUX"
-        ws[f'R{row+1}'].font = openpyxl.styles.Font(bold=True, size=12, color="FFFFFF")
-        ws[f'R{row+1}'].fill = openpyxl.styles.PatternFill(start_color="FF9900", end_color="FF9900", fill_type="solid")
+        self.styles.apply(ws[f'R{row+1}'], 'banner_amber')
 
         row = row + 2
         ws[f'R{row}'].value = "Produit"
         ws[f'S{row}'].value = "Volume/mois (moy)"
-        ws[f'R{row}'].font = openpyxl.styles.Font(bold=True)
-        ws[f'S{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'R{row}'], 'bold')
+        self.styles.apply(ws[f'S{row}'], 'bold')
 
         row += 1
 
@@ -230,6 +238,7 @@ class TemplateCreator:
 
         logger.info("✓ Paramètres enrichis avec financial_kpis, validation_rules, hypothèses business, coûts RH, et volumes commerciaux")
 
+    @instrument()
     def update_financement_sheet(self):
         """
         Adapter le sheet Financement selon assumptions.yaml
@@ -264,6 +273,7 @@ class TemplateCreator:
 
         logger.info("✓ Financement adapté avec funding YAML")
 
+    @instrument()
     def update_fundings_sheet_with_captable(self):
         """
         RESTRUCTURATION FUNDINGS - État de l'Art PHASE 6
@@ -282,7 +292,7 @@ class TemplateCreator:
         ws = self.wb['Fundings']
 
         # Charger funding_captable.yaml
-        base_path = Path(__file__).parent.parent
+        base_path = plan_root()
         captable_path = base_path / "data" / "structured" / "funding_captable.yaml"
 
         if not captable_path.exists():
@@ -294,8 +304,7 @@ class TemplateCreator:
 
         # ═══ SECTION A: FUNDING ROUNDS TIMELINE ═══
         ws['A1'].value = "A. FUNDING ROUNDS TIMELINE (DILUTIF)"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A1'].fill = openpyxl.styles.PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid")
+        self.styles.patch(ws['A1'], 'title_banner_blue')
 
         ws['A3'].value = "Phase"
         ws['B3'].value = "Timing"
@@ -307,7 +316,7 @@ class TemplateCreator:
         ws['H3'].value = "Multiple ARR"
 
         for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}3'].font = openpyxl.styles.Font(bold=True)
+            self.styles.patch(ws[f'{col}3'], 'bold')
 
         funding_rounds = captable_data.get('funding_rounds', {})
         row = 4
@@ -346,8 +355,7 @@ class TemplateCreator:
 
         # ═══ SECTION B: CAP TABLE DYNAMIQUE ═══
         ws['A12'].value = "B. CAP TABLE - DILUTION PROGRESSIVE"
-        ws['A12'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A12'].fill = openpyxl.styles.PatternFill(start_color="FF6600", end_color="FF6600", fill_type="solid")
+        self.styles.patch(ws['A12'], 'title_banner_orange')
 
         ws['A14'].value = "Phase"
         ws['B14'].value = "FRT"
@@ -358,7 +366,7 @@ class TemplateCreator:
         ws['G14'].value = "Total"
 
         for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G']:
-            ws[f'{col}14'].font = openpyxl.styles.Font(bold=True)
+            self.styles.patch(ws[f'{col}14'], 'bold')
 
         captable = captable_data.get('captable', {})
         dilution_stages = captable.get('dilution_stages', {})
@@ -408,8 +416,7 @@ class TemplateCreator:
 
         # ═══ SECTION C: SOURCES NON-DILUTIVES ═══
         ws['A22'].value = "C. SOURCES NON-DILUTIVES (Subventions & Aides)"
-        ws['A22'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A22'].fill = openpyxl.styles.PatternFill(start_color="00CC66", end_color="00CC66", fill_type="solid")
+        self.styles.patch(ws['A22'], 'title_banner_green')
 
         ws['A24'].value = "Source"
         ws['B24'].value = "Timing"
@@ -418,7 +425,7 @@ class TemplateCreator:
         ws['E24'].value = "Type"
 
         for col in ['A', 'B', 'C', 'D', 'E']:
-            ws[f'{col}24'].font = openpyxl.styles.Font(bold=True)
+            self.styles.patch(ws[f'{col}24'], 'bold')
 
         row = 25
         non_dilutive_sources = [
@@ -439,15 +446,14 @@ class TemplateCreator:
 
         # ═══ SECTION D: METRICS FUNDRAISING ═══
         ws['A33'].value = "D. METRICS FUNDRAISING CLÉS"
-        ws['A33'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A33'].fill = openpyxl.styles.PatternFill(start_color="9966FF", end_color="9966FF", fill_type="solid")
+        self.styles.patch(ws['A33'], 'title_banner_violet')
 
         ws['A35'].value = "Métrique"
         ws['B35'].value = "Valeur"
         ws['C35'].value = "Commentaire"
 
         for col in ['A', 'B', 'C']:
-            ws[f'{col}35'].font = openpyxl.styles.Font(bold=True)
+            self.styles.patch(ws[f'{col}35'], 'bold')
 
         row = 36
         metrics_data = [
@@ -467,6 +473,7 @@ class TemplateCreator:
 
         logger.info("✓ Fundings restructuré (Timeline + Cap Table + Non-dilutif + Metrics)")
 
+    @instrument()
     def update_strategie_vente_sheet(self):
         """
         Adapter le sheet Stratégie de vente selon assumptions.yaml
@@ -530,6 +537,7 @@ class TemplateCreator:
 
         return result
 
+    @instrument()
     def update_charges_personnel_sheet(self):
         """
         PILOTAGE PERSONNEL PAR YAML - PHASE 6
@@ -641,6 +649,7 @@ class TemplateCreator:
 
         logger.info(f"✓ Personnel piloté depuis YAML ({updated_count} profils, {headcount_updated} avec timelines, charges {charges_rate*100:.0f}%)")
 
+    @instrument()
     def update_infrastructure_detailed_sheet(self):
         """
         Adapter le sheet Infrastructure technique selon assumptions.yaml
@@ -686,6 +695,7 @@ class TemplateCreator:
 
         logger.info("✓ Infrastructure technique adaptée (cloud + SaaS)")
 
+    @instrument()
     def update_marketing_detailed_sheet(self):
         """
         Adapter le sheet Marketing selon assumptions.yaml
@@ -726,6 +736,7 @@ class TemplateCreator:
 
         logger.info(f"✓ Marketing adapté ({len(channels)} canaux)")
 
+    @instrument()
     def add_arr_mrr_to_pl(self):
         """
         Ajouter lignes ARR et MRR en haut du P&L
@@ -760,17 +771,18 @@ class TemplateCreator:
 
         # Ligne ARR
         ws[f'A{insert_row}'].value = "ARR (Annual Recurring Revenue)"
-        ws[f'A{insert_row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{insert_row}'], 'bold')
 
         # Ligne MRR
         ws[f'A{insert_row+1}'].value = "MRR (Monthly Recurring Revenue)"
-        ws[f'A{insert_row+1}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{insert_row+1}'], 'bold')
 
         # Ligne séparatrice
         ws[f'A{insert_row+2}'].value = "---"
 
         logger.info(f"✓ ARR/MRR ajoutés en lignes {insert_row}-{insert_row+1} du P&L")
 
+    @instrument()
     def create_cash_flow_sheet(self):
         """
         Créer un nouveau sheet Cash Flow Statement
@@ -783,7 +795,7 @@ class TemplateCreator:
 
         # Headers
         ws['A1'].value = "CASH FLOW STATEMENT"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=14)
+        self.styles.apply(ws['A1'], 'heading')
 
         ws['A2'].value = "Catégorie"
         ws['B2'].value = "Description"
@@ -796,7 +808,7 @@ class TemplateCreator:
         # Section Operating Activities
         row = 3
         ws[f'A{row}'].value = "OPERATING ACTIVITIES"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         operating_items = [
@@ -813,12 +825,12 @@ class TemplateCreator:
             row += 1
 
         ws[f'A{row}'].value = "= Cash Flow Opérationnel"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 2
 
         # Section Investing Activities
         ws[f'A{row}'].value = "INVESTING ACTIVITIES"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         ws[f'A{row}'].value = "  CAPEX (équipements)"
@@ -826,12 +838,12 @@ class TemplateCreator:
         row += 1
 
         ws[f'A{row}'].value = "= Cash Flow Investissement"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 2
 
         # Section Financing Activities
         ws[f'A{row}'].value = "FINANCING ACTIVITIES"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         financing_items = [
@@ -846,22 +858,22 @@ class TemplateCreator:
             row += 1
 
         ws[f'A{row}'].value = "= Cash Flow Financement"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 2
 
         # Total et balance
         ws[f'A{row}'].value = "TOTAL CASH FLOW (mois)"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, color="0000FF")
+        self.styles.apply(ws[f'A{row}'], 'bold_blue')
         row += 1
 
         ws[f'A{row}'].value = "CASH BALANCE (cumulé)"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12, color="FF0000")
+        self.styles.apply(ws[f'A{row}'], 'subheading_red')
         ws[f'B{row}'].value = "Trésorerie disponible"
         row += 2
 
         # Métriques
         ws[f'A{row}'].value = "MÉTRIQUES"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         ws[f'A{row}'].value = "  Burn Rate (€/mois)"
@@ -878,6 +890,7 @@ class TemplateCreator:
 
         logger.info("✓ Sheet Cash Flow créé avec structure complète")
 
+    @instrument()
     def remove_gtmarket_sheet(self):
         """
         Supprimer le sheet GTMarket (110 cols × 1000 rows, peu de valeur ajoutée)
@@ -890,6 +903,7 @@ class TemplateCreator:
         else:
             logger.warning("⚠️ Sheet GTMarket introuvable, skip")
 
+    @instrument()
     def enrich_synthese_dashboard(self):
         """
         Enrichir le sheet Synthèse avec dashboard KPIs
@@ -908,17 +922,16 @@ class TemplateCreator:
 
         # Dashboard header
         ws[f'{start_col}1'].value = "DASHBOARD EXÉCUTIF"
-        ws[f'{start_col}1'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws[f'{start_col}1'].fill = openpyxl.styles.PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid")
+        self.styles.apply(ws[f'{start_col}1'], 'title_banner_blue')
 
         # Section 1: ARR Milestones
         row = 3
         ws[f'{start_col}{row}'].value = "ARR MILESTONES"
-        ws[f'{start_col}{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'{start_col}{row}'], 'bold')
         row += 1
 
         # Charger cap table pour les targets
-        base_path = Path(__file__).parent.parent
+        base_path = plan_root()
         captable_path = base_path / "data" / "structured" / "funding_captable.yaml"
 
         if captable_path.exists():
@@ -951,7 +964,7 @@ class TemplateCreator:
 
         # Section 2: KPIs Critiques
         ws[f'{start_col}{row}'].value = "KPIs CRITIQUES"
-        ws[f'{start_col}{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'{start_col}{row}'], 'bold')
         row += 1
 
         financial_kpis = self.assumptions.get('financial_kpis', {})
@@ -978,7 +991,7 @@ class TemplateCreator:
 
         # Section 3: Hypothèses Critiques
         ws[f'{start_col}{row}'].value = "HYPOTHÈSES CRITIQUES"
-        ws[f'{start_col}{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'{start_col}{row}'], 'bold')
         row += 1
 
         critical_assumptions = self.assumptions.get('critical_assumptions', [])
@@ -995,6 +1008,7 @@ class TemplateCreator:
 
         logger.info("✓ Dashboard exécutif ajouté dans Synthèse")
 
+    @instrument()
     def create_scenarios_sheet(self):
         """
         Créer nouveau sheet Scenarios (base/upside/downside)
@@ -1007,8 +1021,7 @@ class TemplateCreator:
 
         # Header
         ws['A1'].value = "SCENARIOS D'ÉVOLUTION"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A1'].fill = openpyxl.styles.PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid")
+        self.styles.apply(ws['A1'], 'title_banner_blue')
 
         ws['A2'].value = "Basé sur assumptions.yaml - 3 scénarios probabilisés"
 
@@ -1020,7 +1033,7 @@ class TemplateCreator:
         ws['E4'].value = "Notes"
 
         for col in ['A', 'B', 'C', 'D', 'E']:
-            ws[f'{col}4'].font = openpyxl.styles.Font(bold=True)
+            self.styles.apply(ws[f'{col}4'], 'bold')
 
         # Charger scenarios depuis YAML
         scenarios = self.assumptions.get('scenarios', {})
@@ -1032,7 +1045,7 @@ class TemplateCreator:
 
         # Section ARR
         ws[f'A{row}'].value = "ARR M14"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         ws[f'B{row}'].value = base.get('arr_m14', 800000)
         ws[f'C{row}'].value = upside.get('arr_m14', 952000)
         ws[f'D{row}'].value = downside.get('arr_m14', 648000)
@@ -1047,7 +1060,7 @@ class TemplateCreator:
 
         # Section Hypothèses Hackathon
         ws[f'A{row}'].value = "HYPOTHÈSES HACKATHON"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         ws[f'A{row}'].value = "Volume multiplier"
@@ -1066,7 +1079,7 @@ class TemplateCreator:
 
         # Section Hypothèses Hub
         ws[f'A{row}'].value = "HYPOTHÈSES ENTERPRISE HUB"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         ws[f'A{row}'].value = "Launch delay"
@@ -1084,7 +1097,7 @@ class TemplateCreator:
 
         # Section Impact Financier
         ws[f'A{row}'].value = "IMPACT FINANCIER ESTIMÉ"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         # Calculs approximatifs
@@ -1106,7 +1119,7 @@ class TemplateCreator:
 
         # Hypothèses critiques
         ws[f'A{row}'].value = "HYPOTHÈSES CRITIQUES"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         critical_assumptions = self.assumptions.get('critical_assumptions', [])
@@ -1126,6 +1139,78 @@ class TemplateCreator:
 
         logger.info("✓ Sheet Scenarios créé (base/upside/downside)")
 
+    @instrument()
+    def create_sensitivity_sheet(self):
+        """
+        Créer sheet Sensibilité (tornado)
+        Hypothèses classées par impact sur ARR, creux de trésorerie et CA cumulé
+        """
+        logger.info("\n🌪️ Création sheet Sensibilité...")
+
+        if not self.sensitivity:
+            logger.warning("⚠️ sensitivity.json absent - lancer scripts/sensitivity.py (sheet ignoré)")
+            return
+
+        from sensitivity import METRICS, tornado_table
+
+        ws = self.wb.create_sheet("Sensibilité")
+        delta = self.sensitivity['delta']
+
+        # Header
+        ws['A1'].value = "ANALYSE DE SENSIBILITÉ (TORNADO)"
+        self.styles.apply(ws['A1'], 'title_banner_blue')
+
+        ws['A2'].value = (
+            f"Chaque hypothèse d'assumptions.yaml perturbée de ±{delta:.0%} "
+            f"({self.sensitivity['leaves']} hypothèses, {self.sensitivity['months_count']} mois)"
+        )
+
+        row = 4
+        for metric, label in METRICS.items():
+            if metric == 'arr_first_period':
+                label = f"ARR M{self.sensitivity['first_period_end']}"
+            base_value = self.sensitivity['base'][metric]
+
+            ws[f'A{row}'].value = f"{label.upper()} (base {base_value:,.0f}€)"
+            self.styles.apply(ws[f'A{row}'], 'bold')
+            row += 1
+
+            headers = ["Hypothèse", "Valeur", f"-{delta:.0%}", f"+{delta:.0%}", "Écart", "Écart / base"]
+            for col, header in zip(['A', 'B', 'C', 'D', 'E', 'F'], headers):
+                ws[f'{col}{row}'].value = header
+                self.styles.apply(ws[f'{col}{row}'], 'bold')
+            row += 1
+
+            first_row = row
+            for line in tornado_table(self.sensitivity, metric):
+                ws[f'A{row}'].value = line['path']
+                ws[f'B{row}'].value = line['value']
+                ws[f'C{row}'].value = round(line['low'])
+                ws[f'D{row}'].value = round(line['high'])
+                ws[f'E{row}'].value = round(line['swing'])
+                if line['swing_pct'] is not None:
+                    ws[f'F{row}'].value = line['swing_pct']
+                    self.styles.apply(ws[f'F{row}'], 'percent')
+                row += 1
+
+            # Barres proportionnelles à l'écart (lecture tornado)
+            if row > first_row:
+                ws.conditional_formatting.add(
+                    f'E{first_row}:E{row - 1}',
+                    openpyxl.formatting.rule.DataBarRule(
+                        start_type='min', end_type='max', color="0066CC"
+                    )
+                )
+            row += 1
+
+        # Ajuster largeur colonnes
+        ws.column_dimensions['A'].width = 60
+        for col in ['B', 'C', 'D', 'E', 'F']:
+            ws.column_dimensions[col].width = 16
+
+        logger.info(f"✓ Sheet Sensibilité créé ({len(self.sensitivity['rows'])} hypothèses avec impact)")
+
+    @instrument()
     def create_unit_economics_sheet(self):
         """
         Créer nouveau sheet Unit Economics
@@ -1138,8 +1223,7 @@ class TemplateCreator:
 
         # Header
         ws['A1'].value = "UNIT ECONOMICS PAR PRODUIT"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A1'].fill = openpyxl.styles.PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid")
+        self.styles.apply(ws['A1'], 'title_banner_blue')
 
         ws['A3'].value = "Produit"
         ws['B3'].value = "Prix Moyen"
@@ -1151,7 +1235,7 @@ class TemplateCreator:
         ws['H3'].value = "Notes"
 
         for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws[f'{col}3'].font = openpyxl.styles.Font(bold=True)
+            self.styles.apply(ws[f'{col}3'], 'bold')
 
         row = 4
 
@@ -1229,7 +1313,7 @@ class TemplateCreator:
 
         # Résumé
         ws[f'A{row}'].value = "RÉSUMÉ"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         ws[f'A{row}'].value = "LTV/CAC Moyen Pondéré"
@@ -1258,6 +1342,7 @@ class TemplateCreator:
 
         logger.info("✓ Sheet Unit Economics créé (CAC/LTV par produit)")
 
+    @instrument()
     def add_granular_metrics_to_ventes(self):
         """
         Ajouter métriques granulaires dans Ventes
@@ -1278,11 +1363,11 @@ class TemplateCreator:
         # Ajouter section Volumes Hub par Tier
         row = last_row
         ws[f'A{row}'].value = "VOLUMES ENTERPRISE HUB PAR TIER"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12)
+        self.styles.apply(ws[f'A{row}'], 'subheading')
         row += 1
 
         ws[f'A{row}'].value = "Tier"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         # Lignes par tier
@@ -1293,7 +1378,7 @@ class TemplateCreator:
         ws[f'A{row}'].value = "Nouveaux clients Enterprise (mois)"
         row += 1
         ws[f'A{row}'].value = "Total nouveaux clients Hub (mois)"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 2
 
         # Clients actifs cumulés
@@ -1304,7 +1389,7 @@ class TemplateCreator:
         ws[f'A{row}'].value = "Clients actifs Enterprise (cumulé)"
         row += 1
         ws[f'A{row}'].value = "Total clients actifs Hub"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 2
 
         # Churn mensuel
@@ -1314,6 +1399,7 @@ class TemplateCreator:
 
         logger.info("✓ Métriques granulaires ajoutées dans Ventes")
 
+    @instrument()
     def add_productivity_ia_to_ventes(self):
         """
         Ajouter productivité IA dans Ventes - PHASE 4
@@ -1331,23 +1417,22 @@ class TemplateCreator:
         # Ajouter section PRODUCTIVITÉ IA (avant volumes Hub, ligne 45)
         row = 45
         ws[f'A{row}'].value = "PRODUCTIVITÉ IA (GenieFactory)"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12, color="FFFFFF")
-        ws[f'A{row}'].fill = openpyxl.styles.PatternFill(start_color="FF3366", end_color="FF3366", fill_type="solid")
+        self.styles.patch(ws[f'A{row}'], 'banner_pink')
         row += 1
 
         ws[f'A{row}'].value = "Métrique"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.patch(ws[f'A{row}'], 'bold')
         row += 1
 
         # Total ETP
         ws[f'A{row}'].value = "Total ETP"
-        ws[f'A{row}'].font = openpyxl.styles.Font(italic=True)
+        self.styles.patch(ws[f'A{row}'], 'italic')
         # Note: Les valeurs seront injectées par le script d'injection
         row += 1
 
         # Ratio productivité IA
         ws[f'A{row}'].value = "Productivité IA (ratio)"
-        ws[f'A{row}'].font = openpyxl.styles.Font(italic=True)
+        self.styles.patch(ws[f'A{row}'], 'italic')
         # Valeur fixe: 3.0× (peut être ajustée selon assumptions.yaml)
         productivity_ratio = 3.0
         ws[f'B{row}'].value = f"{productivity_ratio}×"
@@ -1355,16 +1440,17 @@ class TemplateCreator:
 
         # Équivalent ETP trad.
         ws[f'A{row}'].value = "Équivalent ETP trad."
-        ws[f'A{row}'].font = openpyxl.styles.Font(italic=True)
+        self.styles.patch(ws[f'A{row}'], 'italic')
         # Formule: Total ETP × Ratio IA (sera ajustée lors injection)
         row += 1
 
         # Ajouter note explicative
         ws[f'A{row}'].value = "Note: GenieFactory permet à 1 ETP de faire le travail de 3 ETP traditionnels"
-        ws[f'A{row}'].font = openpyxl.styles.Font(size=9, italic=True, color="666666")
+        self.styles.patch(ws[f'A{row}'], 'note')
 
         logger.info("✓ Productivité IA ajoutée dans Ventes (pitch core GenieFactory)")
 
+    @instrument()
     def improve_infrastructure_labels(self):
         """
         Améliorer labels Infrastructure - PHASE 5
@@ -1391,11 +1477,12 @@ class TemplateCreator:
         # Trouver la dernière ligne utilisée
         last_row = 20
         ws[f'A{last_row}'].value = "Total Infrastructure (mensuel)"
-        ws[f'A{last_row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{last_row}'], 'bold')
         # Formule sera ajoutée si nécessaire
 
         logger.info("✓ Labels Infrastructure améliorés (Hosting, Licences, total)")
 
+    @instrument()
     def improve_marketing_labels(self):
         """
         Améliorer labels Marketing - PHASE 5
@@ -1412,8 +1499,7 @@ class TemplateCreator:
         # Ajouter section "Ventes" (ligne 25+)
         row = 25
         ws[f'A{row}'].value = "Ventes (Support Marketing)"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-        ws[f'A{row}'].fill = openpyxl.styles.PatternFill(start_color="00CC66", end_color="00CC66", fill_type="solid")
+        self.styles.apply(ws[f'A{row}'], 'banner_green')
         row += 1
 
         ws[f'A{row}'].value = "Support ventes (docs, présent., démos)"
@@ -1422,7 +1508,7 @@ class TemplateCreator:
         # Ajouter "Campagnes Collaboration" (ligne 28+)
         row = 28
         ws[f'A{row}'].value = "Campagnes Collaboration"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
         ws[f'A{row}'].value = "Partenariats tech, co-marketing"
         row += 1
@@ -1430,12 +1516,13 @@ class TemplateCreator:
         # Ajouter "Campagnes Ciblées" (ligne 31+)
         row = 31
         ws[f'A{row}'].value = "Campagnes Ciblées"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
         ws[f'A{row}'].value = "ABM (Account-Based Marketing)"
 
         logger.info("✓ Labels Marketing améliorés (Ventes, Campagnes)")
 
+    @instrument()
     def enhance_fundings_visualization(self):
         """
         Améliorer visualisation dilution dans Fundings
@@ -1450,7 +1537,7 @@ class TemplateCreator:
         ws = self.wb['Fundings']
 
         # Charger cap table
-        base_path = Path(__file__).parent.parent
+        base_path = plan_root()
         captable_path = base_path / "data" / "structured" / "funding_captable.yaml"
 
         if not captable_path.exists():
@@ -1462,8 +1549,7 @@ class TemplateCreator:
 
         # Ajouter section Évolution Dilution (colonne H+)
         ws['H1'].value = "ÉVOLUTION DILUTION FONDATEURS"
-        ws['H1'].font = openpyxl.styles.Font(bold=True, size=12, color="FFFFFF")
-        ws['H1'].fill = openpyxl.styles.PatternFill(start_color="FF6600", end_color="FF6600", fill_type="solid")
+        self.styles.patch(ws['H1'], 'banner_orange')
 
         ws['H2'].value = "Fondateur"
         ws['I2'].value = "Bootstrap"
@@ -1473,7 +1559,7 @@ class TemplateCreator:
         ws['M2'].value = "Dilution Totale"
 
         for col in ['H', 'I', 'J', 'K', 'L', 'M']:
-            ws[f'{col}2'].font = openpyxl.styles.Font(bold=True)
+            self.styles.patch(ws[f'{col}2'], 'bold')
 
         row = 3
 
@@ -1486,7 +1572,7 @@ class TemplateCreator:
         ws[f'K{row}'].value = f"{dilution_stages.get('post_seed', {}).get('equity', {}).get('FRT', 34.5)}%"
         ws[f'L{row}'].value = f"{dilution_stages.get('post_series_a', {}).get('equity', {}).get('FRT', 27.7)}%"
         ws[f'M{row}'].value = "-60.4%"
-        ws[f'M{row}'].font = openpyxl.styles.Font(color="FF0000")
+        self.styles.patch(ws[f'M{row}'], 'text_red')
         row += 1
 
         # PCO
@@ -1496,7 +1582,7 @@ class TemplateCreator:
         ws[f'K{row}'].value = f"{dilution_stages.get('post_seed', {}).get('equity', {}).get('PCO', 17.1)}%"
         ws[f'L{row}'].value = f"{dilution_stages.get('post_series_a', {}).get('equity', {}).get('PCO', 19.8)}%"
         ws[f'M{row}'].value = "+31.9%"
-        ws[f'M{row}'].font = openpyxl.styles.Font(color="00CC00")
+        self.styles.patch(ws[f'M{row}'], 'text_green')
         row += 1
 
         # MAM
@@ -1506,12 +1592,12 @@ class TemplateCreator:
         ws[f'K{row}'].value = f"{dilution_stages.get('post_seed', {}).get('equity', {}).get('MAM', 15.6)}%"
         ws[f'L{row}'].value = f"{dilution_stages.get('post_series_a', {}).get('equity', {}).get('MAM', 17.2)}%"
         ws[f'M{row}'].value = "+14.7%"
-        ws[f'M{row}'].font = openpyxl.styles.Font(color="00CC00")
+        self.styles.patch(ws[f'M{row}'], 'text_green')
         row += 2
 
         # Section Valorisation
         ws[f'H{row}'].value = "VALORISATION PAR ROUND"
-        ws[f'H{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.patch(ws[f'H{row}'], 'bold')
         row += 1
 
         ws[f'H{row}'].value = "Round"
@@ -1519,7 +1605,7 @@ class TemplateCreator:
         ws[f'J{row}'].value = "Valorisation Post"
         ws[f'K{row}'].value = "Multiple ARR"
         for col in ['H', 'I', 'J', 'K']:
-            ws[f'{col}{row}'].font = openpyxl.styles.Font(bold=True)
+            self.styles.patch(ws[f'{col}{row}'], 'bold')
         row += 1
 
         rounds_data = [
@@ -1541,6 +1627,7 @@ class TemplateCreator:
 
         logger.info("✓ Visualisation Fundings améliorée (dilution + valorisation)")
 
+    @instrument()
     def create_data_quality_sheet(self):
         """
         Créer sheet Data Quality avec checks automatiques
@@ -1552,8 +1639,7 @@ class TemplateCreator:
 
         # Header
         ws['A1'].value = "DATA QUALITY CHECKS"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A1'].fill = openpyxl.styles.PatternFill(start_color="CC0000", end_color="CC0000", fill_type="solid")
+        self.styles.apply(ws['A1'], 'title_banner_red')
 
         ws['A2'].value = "Vérifications automatiques de cohérence"
 
@@ -1566,7 +1652,7 @@ class TemplateCreator:
         ws['F4'].value = "Notes"
 
         for col in ['A', 'B', 'C', 'D', 'E', 'F']:
-            ws[f'{col}4'].font = openpyxl.styles.Font(bold=True)
+            self.styles.apply(ws[f'{col}4'], 'bold')
 
         validation_rules = self.assumptions.get('validation_rules', {})
 
@@ -1628,7 +1714,7 @@ class TemplateCreator:
 
         # Section Cohérence
         ws[f'A{row}'].value = "CHECKS DE COHÉRENCE"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True)
+        self.styles.apply(ws[f'A{row}'], 'bold')
         row += 1
 
         ws[f'A{row}'].value = "CA Total = Somme produits"
@@ -1655,6 +1741,7 @@ class TemplateCreator:
 
         logger.info("✓ Sheet Data Quality créé avec 6 checks automatiques")
 
+    @instrument()
     def create_documentation_sheet(self):
         """
         Créer sheet Documentation
@@ -1666,14 +1753,13 @@ class TemplateCreator:
 
         # Header
         ws['A1'].value = "DOCUMENTATION DU BUSINESS PLAN"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=14, color="FFFFFF")
-        ws['A1'].fill = openpyxl.styles.PatternFill(start_color="666666", end_color="666666", fill_type="solid")
+        self.styles.apply(ws['A1'], 'title_banner_grey')
 
         row = 3
 
         # Section META
         ws[f'A{row}'].value = "MÉTADONNÉES"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12)
+        self.styles.apply(ws[f'A{row}'], 'subheading')
         row += 1
 
         meta = self.assumptions.get('meta', {})
@@ -1697,7 +1783,7 @@ class TemplateCreator:
 
         # Section REVISION HISTORY
         ws[f'A{row}'].value = "HISTORIQUE DES RÉVISIONS"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12)
+        self.styles.apply(ws[f'A{row}'], 'subheading')
         row += 1
 
         ws[f'A{row}'].value = "Version"
@@ -1705,7 +1791,7 @@ class TemplateCreator:
         ws[f'C{row}'].value = "Auteur"
         ws[f'D{row}'].value = "Changements"
         for col in ['A', 'B', 'C', 'D']:
-            ws[f'{col}{row}'].font = openpyxl.styles.Font(bold=True)
+            self.styles.apply(ws[f'{col}{row}'], 'bold')
         row += 1
 
         revision_history = self.assumptions.get('revision_history', [])
@@ -1721,7 +1807,7 @@ class TemplateCreator:
 
         # Section USAGE NOTES
         ws[f'A{row}'].value = "NOTES D'UTILISATION"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12)
+        self.styles.apply(ws[f'A{row}'], 'subheading')
         row += 1
 
         usage_notes = self.assumptions.get('usage_notes', '')
@@ -1736,7 +1822,7 @@ class TemplateCreator:
 
         # Section STRUCTURE FICHIERS
         ws[f'A{row}'].value = "STRUCTURE DU BP"
-        ws[f'A{row}'].font = openpyxl.styles.Font(bold=True, size=12)
+        self.styles.apply(ws[f'A{row}'], 'subheading')
         row += 1
 
         structure = [
@@ -1746,7 +1832,7 @@ class TemplateCreator:
             ("Mapping", "YAML → Excel 100% complet"),
             ("Formules", "3108 formules Excel préservées"),
             ("Sheets totaux", "17 (14 RAW + 3 nouveaux)"),
-            ("Nouveaux sheets", "Cash Flow, Scenarios, Unit Economics"),
+            ("Nouveaux sheets", "Cash Flow, Scenarios, Sensibilité, Unit Economics"),
         ]
 
         for label, value in structure:
@@ -1762,6 +1848,7 @@ class TemplateCreator:
 
         logger.info("✓ Sheet Documentation créé (meta + history + notes)")
 
+    @instrument()
     def clean_data_cells(self):
         """
         Nettoyer les cellules de données (pas les formules)
@@ -1794,6 +1881,7 @@ class TemplateCreator:
 
             logger.info(f"  {sheet_name}: {cleaned} cellules nettoyées")
 
+    @instrument()
     def add_template_markers(self):
         """
         Ajouter des marqueurs visuels pour identifier le template
@@ -1805,12 +1893,11 @@ class TemplateCreator:
         ws['A1'].value = "🔧 TEMPLATE BP 50 MOIS - Gabarit à valider"
 
         # Style
-        from openpyxl.styles import Font, PatternFill
-        ws['A1'].font = Font(bold=True, size=14, color="FF0000")
-        ws['A1'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+        self.styles.patch(ws['A1'], 'warning_banner')
 
         logger.info("✓ Marqueurs ajoutés")
 
+    @instrument()
     def preserve_formulas_info(self):
         """
         Logger des infos sur les formules préservées
@@ -1852,6 +1939,7 @@ class TemplateCreator:
 
         # 3. PHASE 2 - Améliorations MOYENNE PRIORITÉ
         self.create_scenarios_sheet()  # ✅ NEW: Scenarios (base/upside/downside)
+        self.create_sensitivity_sheet()  # ✅ NEW: Sensibilité (tornado ±x%)
         self.create_unit_economics_sheet()  # ✅ NEW: Unit Economics (CAC/LTV par produit)
 
         # 4. PHASE 3 - Améliorations BASSE PRIORITÉ
@@ -1888,6 +1976,7 @@ class TemplateCreator:
         logger.info("   • Synthèse: dashboard exécutif ajouté")
         logger.info("   PHASE 2:")
         logger.info("   • Scenarios: base/upside/downside créé")
+        logger.info("   • Sensibilité: tornado des hypothèses créé")
         logger.info("   • Unit Economics: CAC/LTV par produit créé")
         logger.info("   PHASE 3:")
         logger.info("   • Ventes: métriques granulaires par tier ajoutées")
@@ -1904,10 +1993,11 @@ class TemplateCreator:
         logger.info("   • Fundings: État de l'art (Timeline + Cap Table + Non-dilutif + Metrics)")
         logger.info("   • Personnel: Piloté par assumptions.yaml (8 rôles avec timeline)")
 
+    @instrument()
     def save(self, output_path: Path):
         """Sauvegarder le template"""
         logger.info(f"\n💾 Sauvegarde: {output_path}")
-        self.wb.save(output_path)
+        save_workbook(self.wb, output_path)  # + snapshot: relu sans parsing par l'étape suivante
         size_kb = output_path.stat().st_size / 1024
         logger.info(f"✓ Template sauvegardé: {size_kb:.1f} KB")
 
@@ -1917,21 +2007,28 @@ def main():
     console.print("[bold cyan]   CRÉATION TEMPLATE EXCEL DEPUIS RAW[/bold cyan]")
     console.print("[bold cyan]═══════════════════════════════════════════════════════[/bold cyan]\n")
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger assumptions
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
     console.print(f"[yellow]📂 Chargement assumptions:[/yellow] {assumptions_path.name}")
-    with open(assumptions_path, 'r', encoding='utf-8') as f:
-        assumptions = yaml.safe_load(f)
+    assumptions = load_yaml(assumptions_path)
     console.print(f"[green]✓ Assumptions chargées (v{assumptions.get('version', '?')})[/green]\n")
 
+    # Tornado (optionnel, produit par sensitivity.py)
+    sensitivity = None
+    sensitivity_path = base_path / "data" / "structured" / "sensitivity.json"
+    if sensitivity_path.exists():
+        with open(sensitivity_path, 'r', encoding='utf-8') as f:
+            sensitivity = json.load(f)
+        console.print(f"[green]✓ Sensibilité chargée ({sensitivity_path.name})[/green]\n")
+
     # Fichiers
     raw_file = base_path / "data" / "raw" / "BP FABRIQ_PRODUCT-OCT2025.xlsx"
     template_file = base_path / "data" / "outputs" / "BP_50M_TEMPLATE.xlsx"
 
     # Créer le template
-    creator = TemplateCreator(raw_file, assumptions)
+    creator = TemplateCreator(raw_file, assumptions, sensitivity)
     creator.create_template()
     creator.save(template_file)
 
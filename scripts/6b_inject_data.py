@@ -6,11 +6,16 @@ pour générer le fichier FINAL
 
 import openpyxl
 from pathlib import Path
-import json
 from rich.console import Console
 from rich.progress import track
 import logging
 
+from projection_io import find_projections, load_projections
+from pipeline_context import plan_root
+from excel_styles import StyleRegistry
+from workbook_snapshot import load_workbook, save_workbook
+from telemetry import instrument
+
 console = Console()
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 logger = logging.getLogger(__name__)
@@ -22,16 +27,19 @@ class DataInjector:
     def __init__(self, template_path: Path, projections: list):
         self.template_path = template_path
         self.projections = projections
+        self.months_count = len(projections)
+        self.months = range(1, self.months_count + 1)
 
         logger.info(f"📂 Chargement TEMPLATE: {template_path.name}")
-        self.wb = openpyxl.load_workbook(template_path)
+        self.wb = load_workbook(template_path)  # Snapshot si ce contenu a déjà été parsé
+        self.styles = StyleRegistry(self.wb)
         logger.info(f"✓ {len(self.wb.sheetnames)} sheets chargés")
 
         # Mapper les colonnes
         self.setup_month_mapping()
 
     def setup_month_mapping(self):
-        """Mapper les 50 mois aux colonnes Excel"""
+        """Mapper les mois des projections aux colonnes Excel du template"""
         self.month_to_col = {}
 
         pl_sheet = self.wb['P&L']
@@ -52,11 +60,18 @@ class DataInjector:
                 self.month_to_col[current_month] = col_letter
                 current_month += 1
 
-            if current_month > 50:
+            if current_month > self.months_count:
                 break
 
-        logger.info(f"✓ Mapping: {len(self.month_to_col)} mois (M1→{self.month_to_col.get(1)}, M50→{self.month_to_col.get(50)})")
+        last = self.months_count
+        logger.info(f"✓ Mapping: {len(self.month_to_col)} mois (M1→{self.month_to_col.get(1)}, M{last}→{self.month_to_col.get(last)})")
+        if len(self.month_to_col) < self.months_count:
+            logger.warning(
+                f"⚠️ Template limité à {len(self.month_to_col)} mois: "
+                f"M{len(self.month_to_col) + 1}-M{self.months_count} non injectés"
+            )
 
+    @instrument()
     def inject_pl_data(self):
         """Injecter données P&L"""
         logger.info("\n📊 Injection P&L...")
@@ -78,7 +93,7 @@ class DataInjector:
         }
 
         injected = 0
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -111,6 +126,7 @@ class DataInjector:
 
         logger.info(f"✓ P&L: {injected} cellules injectées")
 
+    @instrument()
     def inject_ventes_data(self):
         """Injecter données Ventes"""
         logger.info("\n💼 Injection Ventes...")
@@ -128,7 +144,7 @@ class DataInjector:
         }
 
         injected = 0
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -156,6 +172,7 @@ class DataInjector:
 
         logger.info(f"✓ Ventes: {injected} cellules injectées")
 
+    @instrument()
     def inject_personnel_data(self):
         """Injecter données Personnel"""
         logger.info("\n👥 Injection Charges Personnel...")
@@ -163,7 +180,7 @@ class DataInjector:
         ws = self.wb['Charges de personnel et FG']
 
         injected = 0
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -178,6 +195,7 @@ class DataInjector:
 
         logger.info(f"✓ Personnel: {injected} cellules injectées")
 
+    @instrument()
     def inject_infrastructure_data(self):
         """Injecter données Infrastructure"""
         logger.info("\n☁️ Injection Infrastructure...")
@@ -185,7 +203,7 @@ class DataInjector:
         ws = self.wb['Infrastructure technique']
 
         injected = 0
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -206,6 +224,7 @@ class DataInjector:
 
         logger.info(f"✓ Infrastructure: {injected} cellules injectées")
 
+    @instrument()
     def inject_marketing_data(self):
         """Injecter données Marketing"""
         logger.info("\n📢 Injection Marketing...")
@@ -213,7 +232,7 @@ class DataInjector:
         ws = self.wb['Marketing']
 
         injected = 0
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -228,6 +247,7 @@ class DataInjector:
 
         logger.info(f"✓ Marketing: {injected} cellules injectées")
 
+    @instrument()
     def inject_sous_traitance_data(self):
         """Injecter données Sous-traitance"""
         logger.info("\n🔧 Injection Sous-traitance...")
@@ -235,7 +255,7 @@ class DataInjector:
         ws = self.wb['Sous traitance']
 
         injected = 0
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -250,6 +270,7 @@ class DataInjector:
 
         logger.info(f"✓ Sous-traitance: {injected} cellules injectées")
 
+    @instrument()
     def inject_cash_flow_data(self):
         """Injecter données Cash Flow"""
         logger.info("\n💰 Injection Cash Flow...")
@@ -294,7 +315,7 @@ class DataInjector:
 
         injected = 0
 
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -388,6 +409,7 @@ class DataInjector:
 
         logger.info(f"✓ Cash Flow: {injected} cellules injectées")
 
+    @instrument()
     def inject_arr_mrr_in_pl(self):
         """Injecter ARR/MRR dans P&L"""
         logger.info("\n📈 Injection ARR/MRR dans P&L...")
@@ -412,7 +434,7 @@ class DataInjector:
 
         injected = 0
 
-        for month in range(1, 51):
+        for month in self.months:
             if month not in self.month_to_col:
                 continue
 
@@ -439,11 +461,10 @@ class DataInjector:
         ws = self.wb.worksheets[0]
         if ws['A1'].value and 'TEMPLATE' in str(ws['A1'].value):
             ws['A1'].value = "Business Plan GenieFactory - 50 Mois (Nov 2025 - Dec 2029)"
-            from openpyxl.styles import Font, PatternFill
-            ws['A1'].font = Font(bold=True, size=14, color="000000")
-            ws['A1'].fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
+            self.styles.patch(ws['A1'], 'title_plain')
             logger.info("✓ Marqueur retiré")
 
+    @instrument()
     def inject_all(self):
         """Injecter toutes les données + Phase 1 améliorations"""
         logger.info("\n🔨 INJECTION DONNÉES (avec Phase 1)")
@@ -462,10 +483,11 @@ class DataInjector:
         logger.info("\n" + "=" * 60)
         logger.info("✅ INJECTION TERMINÉE (Phase 1 complète)")
 
+    @instrument()
     def save(self, output_path: Path):
         """Sauvegarder le fichier final"""
         logger.info(f"\n💾 Sauvegarde: {output_path}")
-        self.wb.save(output_path)
+        save_workbook(self.wb, output_path)  # + snapshot: relu sans parsing par l'étape suivante
         size_kb = output_path.stat().st_size / 1024
         logger.info(f"✓ Fichier FINAL sauvegardé: {size_kb:.1f} KB")
 
@@ -475,13 +497,12 @@ def main():
     console.print("[bold cyan]   INJECTION DONNÉES DANS TEMPLATE[/bold cyan]")
     console.print("[bold cyan]═══════════════════════════════════════════════════════[/bold cyan]\n")
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger projections
-    projections_path = base_path / "data" / "structured" / "projections_50m.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections_50m")
     console.print(f"[yellow]📂 Chargement projections:[/yellow] {projections_path.name}")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
     console.print(f"[green]✓ {len(projections)} mois chargés[/green]\n")
 
     # Fichiers
@@ -495,7 +516,7 @@ def main():
 
     console.print(f"\n[bold green]✅ FICHIER FINAL GÉNÉRÉ[/bold green]")
     console.print(f"[green]📁 {final_file}[/green]")
-    console.print(f"\n[cyan]→ Données Python injectées depuis projections_50m.json[/cyan]")
+    console.print(f"\n[cyan]→ Données Python injectées depuis {projections_path.name}[/cyan]")
     console.print(f"[cyan]→ Toutes les formules Excel préservées[/cyan]")
     console.print(f"[cyan]→ Prêt pour validation finale[/cyan]\n")
 
@@ -3,13 +3,14 @@
 Valider les 3 fichiers: RAW, TEMPLATE, FINAL
 """
 
-import openpyxl
 from pathlib import Path
-import json
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
+from projection_io import find_projections, load_projections
+from workbook_snapshot import load_workbook
+
 console = Console()
 
 
@@ -229,16 +230,15 @@ def main():
     raw_file = base_path / "data" / "raw" / "BP FABRIQ_PRODUCT-OCT2025.xlsx"
     template_file = base_path / "data" / "outputs" / "BP_50M_TEMPLATE.xlsx"
     final_file = base_path / "data" / "outputs" / "BP_50M_FINAL_Nov2025-Dec2029.xlsx"
-    projections_file = base_path / "data" / "structured" / "projections_50m.json"
+    projections_file = find_projections(base_path / "data" / "structured", "projections_50m")
 
     console.print(f"\n[yellow]📂 Chargement fichiers...[/yellow]")
 
-    raw_wb = openpyxl.load_workbook(raw_file, data_only=False)
-    template_wb = openpyxl.load_workbook(template_file, data_only=False)
-    final_wb = openpyxl.load_workbook(final_file, data_only=False)
+    raw_wb = load_workbook(raw_file, data_only=False)
+    template_wb = load_workbook(template_file, data_only=False)
+    final_wb = load_workbook(final_file, data_only=False)
 
-    with open(projections_file) as f:
-        projections = json.load(f)
+    projections = load_projections(projections_file)
 
     console.print(f"[green]✓ RAW: {len(raw_wb.sheetnames)} sheets[/green]")
     console.print(f"[green]✓ TEMPLATE: {len(template_wb.sheetnames)} sheets[/green]")
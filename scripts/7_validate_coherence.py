@@ -14,7 +14,6 @@ Output:
   - data/structured/corrections_proposed.yaml
 """
 
-import json
 import yaml
 import re
 import logging
@@ -26,6 +25,8 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from projection_io import find_projections, load_projections
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -363,13 +364,12 @@ def main():
     base_path = Path(__file__).parent.parent
 
     # Charger données
-    projections_path = base_path / "data" / "structured" / "projections.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections")
     assumptions_path = base_path / "data" / "structured" / "assumptions.yaml"
     rules_path = base_path / "data" / "validation_rules.yaml"
     word_path = base_path / "data" / "outputs" / "BM_Updated_14M.docx"
 
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
 
     with open(assumptions_path, 'r', encoding='utf-8') as f:
         assumptions = yaml.safe_load(f)
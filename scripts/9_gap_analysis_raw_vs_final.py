@@ -4,7 +4,6 @@ Analyse comparative RAW vs TEMPLATE vs FINAL
 Identifier les gaps et proposer des améliorations
 """
 
-import openpyxl
 from pathlib import Path
 import yaml
 import json
@@ -13,6 +12,8 @@ from rich.table import Table
 from rich import box
 from collections import defaultdict
 
+from workbook_snapshot import load_workbook  # Parsé au plus une fois par contenu
+
 console = Console()
 
 
@@ -21,9 +22,9 @@ class GapAnalyzer:
 
     def __init__(self, raw_path: Path, template_path: Path, final_path: Path):
         console.print("[yellow]📂 Chargement des fichiers...[/yellow]")
-        self.raw_wb = openpyxl.load_workbook(raw_path, data_only=False)
-        self.template_wb = openpyxl.load_workbook(template_path, data_only=False)
-        self.final_wb = openpyxl.load_workbook(final_path, data_only=False)
+        self.raw_wb = load_workbook(raw_path, data_only=False)
+        self.template_wb = load_workbook(template_path, data_only=False)
+        self.final_wb = load_workbook(final_path, data_only=False)
         console.print("[green]✓ 3 fichiers chargés[/green]\n")
 
     def analyze_sheets_coverage(self):
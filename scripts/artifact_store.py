@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Cache d'artefacts adressé par contenu
+
+Partage les sorties des étapes (projections, workbooks, graphiques, Word)
+entre runs, branches, postes et jobs CI : au lieu de régénérer une sortie,
+run.py la restaure depuis le cache si une étape a déjà tourné avec le même
+code et les mêmes entrées.
+
+Organisation du dossier (local ou montage NFS partagé) :
+    objects/ab/abcdef...   contenu des fichiers, nommé par son SHA-256
+    stages/<clé>.json      manifeste d'une exécution: sortie -> SHA-256
+
+La clé d'une exécution est l'empreinte de l'étape calculée par run.py
+(hash du script + contenu de toutes ses entrées). Les écritures passent
+par un fichier temporaire renommé (os.replace) : plusieurs machines
+peuvent alimenter le même cache sans se corrompre.
+
+Éviction LRU bornée en taille : la date de modification d'un manifeste
+sert de date de dernier usage (mise à jour à chaque restauration); au-delà
+de la taille max, les manifestes les plus anciens sont supprimés puis les
+objets qui ne sont plus référencés.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+DEFAULT_MAX_MB = 2048
+
+
+class ArtifactStore:
+    """Cache d'artefacts partagé (objets par SHA-256 + manifestes par étape)"""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.objects = self.root / "objects"
+        self.manifests = self.root / "stages"
+        self.restored = []  # Étapes restaurées pendant ce run
+        self.stored = []
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects / sha256[:2] / sha256
+
+    def _write_atomic(self, target: Path, write):
+        """Écrire via un fichier temporaire du même dossier puis renommer"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _read_manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.manifests / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def restore(self, key: str, base_path: Path) -> Optional[List[str]]:
+        """Restaurer les sorties d'une exécution connue
+
+        Retourne les chemins restaurés, ou None si la clé est absente ou
+        qu'un objet manque (cache partiellement évincé).
+        """
+        manifest = self._read_manifest(key)
+        if manifest is None:
+            return None
+        outputs = manifest['outputs']
+        if not all(self._object_path(entry['sha256']).exists() for entry in outputs.values()):
+            return None
+
+        try:
+            for relative_path, entry in outputs.items():
+                source = self._object_path(entry['sha256'])
+                with open(source, 'rb') as src:
+                    self._write_atomic(base_path / relative_path,
+                                       lambda f, src=src: shutil.copyfileobj(src, f))
+        except FileNotFoundError:
+            return None  # Objet évincé entre-temps par un autre process
+
+        manifest['hits'] = manifest.get('hits', 0) + 1
+        manifest['last_used'] = datetime.now().isoformat(timespec='seconds')
+        self._save_manifest(key, manifest)  # mtime = dernier usage (LRU)
+        self.restored.append(manifest['stage'])
+        return list(outputs)
+
+    def store(self, key: str, stage_name: str, base_path: Path, outputs: Dict[str, str]):
+        """Enregistrer les sorties d'une exécution réussie ({chemin: SHA-256})"""
+        entries = {}
+        for relative_path, sha256 in outputs.items():
+            source = base_path / relative_path
+            target = self._object_path(sha256)
+            if not target.exists():
+                with open(source, 'rb') as src:
+                    self._write_atomic(target, lambda f, src=src: shutil.copyfileobj(src, f))
+            entries[relative_path] = {'sha256': sha256, 'size': source.stat().st_size}
+
+        now = datetime.now().isoformat(timespec='seconds')
+        self._save_manifest(key, {
+            'stage': stage_name, 'outputs': entries, 'created': now, 'last_used': now, 'hits': 0
+        })
+        self.stored.append(stage_name)
+        self.evict()
+
+    def _save_manifest(self, key: str, manifest: Dict[str, Any]):
+        content = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+        self._write_atomic(self.manifests / f"{key}.json", lambda f: f.write(content))
+
+    def _manifest_files(self) -> List[Path]:
+        if not self.manifests.exists():
+            return []
+        return list(self.manifests.glob('*.json'))
+
+    def _object_files(self) -> List[Path]:
+        if not self.objects.exists():
+            return []
+        return [path for path in self.objects.glob('*/*') if not path.name.startswith('.tmp-')]
+
+    def evict(self) -> int:
+        """Réduire le cache sous la taille max (LRU); retourne le nombre de manifestes supprimés"""
+        objects = {path.name: path.stat().st_size for path in self._object_files()}
+        if sum(objects.values()) <= self.max_bytes:
+            return 0
+
+        manifests = sorted(self._manifest_files(), key=lambda path: path.stat().st_mtime)
+        referenced = {}
+        for path in manifests:
+            manifest = self._read_manifest(path.stem) or {'outputs': {}}
+            referenced[path] = {entry['sha256'] for entry in manifest['outputs'].values()}
+
+        removed = 0
+        live = set().union(*referenced.values()) if referenced else set()
+        total = sum(size for name, size in objects.items() if name in live)
+        for path in manifests:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            removed += 1
+            del referenced[path]
+            still_live = set().union(*referenced.values()) if referenced else set()
+            total -= sum(objects.get(name, 0) for name in live - still_live)
+            live = still_live
+
+        for name in objects:
+            if name not in live:
+                self._object_path(name).unlink(missing_ok=True)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Contenu du cache: taille, entrées et hits par étape"""
+        objects = self._object_files()
+        by_stage: Dict[str, Dict[str, Any]] = {}
+        for path in self._manifest_files():
+            manifest = self._read_manifest(path.stem)
+            if manifest is None:
+                continue
+            stage = by_stage.setdefault(manifest['stage'], {'entries': 0, 'hits': 0, 'bytes': 0,
+                                                            'last_used': ''})
+            stage['entries'] += 1
+            stage['hits'] += manifest.get('hits', 0)
+            stage['bytes'] += sum(entry['size'] for entry in manifest['outputs'].values())
+            stage['last_used'] = max(stage['last_used'], manifest.get('last_used', ''))
+        return {
+            'root': str(self.root),
+            'objects': len(objects),
+            'bytes': sum(path.stat().st_size for path in objects),
+            'max_bytes': self.max_bytes,
+            'stages': by_stage,
+        }
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Plan d'hypothèses compilé
+
+Compile assumptions.yaml une seule fois en tableaux denses indexés par mois
+(index 0 = M1) : prix par période, volumes, nouveaux clients Hub, taille
+d'équipe, FTE par rôle, budgets marketing et fundings. Les moteurs de
+projection (dict et array) n'ont ensuite plus que des lectures indexées O(1),
+au lieu de parcourir les `periods` ou les clés `m{n}` à chaque mois.
+
+Les tableaux sont des listes Python (types d'origine conservés, sérialisables
+en JSON tels quels). Le moteur vectorisé les convertit en np.ndarray.
+"""
+
+from typing import Dict, Any, List, Optional
+
+from projection_calendar import ProjectionCalendar
+
+# Sections d'assumptions.yaml compilées en tableaux par mois.
+# Tout le reste (taux, tiers, coûts fixes...) s'applique à tous les mois.
+MONTHLY_PATHS = [
+    'pricing.hackathon.periods',
+    'pricing.factory.periods',
+    'pricing.services.implementation.periods',
+    'sales_assumptions.hackathon.volumes_monthly',
+    'sales_assumptions.long_term_sales.hackathon',
+    'sales_assumptions.long_term_sales.enterprise_hub',
+    'sales_assumptions.enterprise_hub.new_customers_monthly',
+    'long_term_projections.years',
+    'costs.personnel.team_evolution',
+    'personnel_details.roles.*.fte_timeline',
+    'marketing_budgets.*.monthly_budgets',
+    'financial_kpis.cash_management.fundings',
+]
+
+# Tableaux du plan comparés mois par mois
+MONTHLY_FIELDS = [
+    'hackathon_price', 'factory_price', 'services_price',
+    'hackathon_volume', 'hub_new_customers', 'team_size', 'funding',
+]
+
+
+def resolve_periods(periods: List[Dict], months_count: int) -> List[float]:
+    """Prix par mois depuis une liste de périodes (1ère période = défaut)"""
+    prices = []
+    for month in range(1, months_count + 1):
+        price = periods[0]['price_eur']
+        for period in periods:
+            if period['start_month'] <= month <= period['end_month']:
+                price = period['price_eur']
+                break
+        prices.append(price)
+    return prices
+
+
+def last_declared(mapping: Dict[str, Any], prefix: str) -> Optional[int]:
+    """Plus grand index déclaré parmi les clés `{prefix}{n}` (None si aucune)"""
+    declared = [
+        int(name[len(prefix):]) for name in mapping
+        if isinstance(name, str) and name.startswith(prefix) and name[len(prefix):].isdigit()
+    ]
+    return max(declared) if declared else None
+
+
+def carry_forward(mapping: Dict[str, Any], prefix: str, index: int,
+                  last: Optional[int]) -> Optional[Any]:
+    """Valeur `{prefix}{index}` ou, au-delà de la dernière clé `last`, la dernière valeur
+
+    Permet d'étendre l'horizon (ex: 120 mois) sans que les volumes ou FTE
+    retombent à 0 après la dernière clé du YAML (m50, y2029...).
+    """
+    key = f'{prefix}{index}'
+    if key in mapping:
+        return mapping[key]
+    if last is not None and index > last:
+        return mapping[f'{prefix}{last}']
+    return None
+
+
+def _strip_path(data: Any, keys: List[str]) -> Any:
+    """Copie de `data` sans le chemin `keys` ('*' = toutes les clés)"""
+    if not isinstance(data, dict):
+        return data
+    key, rest = keys[0], keys[1:]
+    targets = list(data.keys()) if key == '*' else [key]
+    stripped = dict(data)
+    for target in targets:
+        if target not in stripped:
+            continue
+        if rest:
+            stripped[target] = _strip_path(stripped[target], rest)
+        else:
+            del stripped[target]
+    return stripped
+
+
+def without_monthly_sections(assumptions: Dict[str, Any]) -> Dict[str, Any]:
+    """Hypothèses sans les sections par mois (partie commune à tous les mois)"""
+    stripped = assumptions
+    for path in MONTHLY_PATHS:
+        stripped = _strip_path(stripped, path.split('.'))
+    return stripped
+
+
+class AssumptionsPlan:
+    """Hypothèses compilées en tableaux par mois (lecture O(1))"""
+
+    def __init__(self, assumptions: Dict[str, Any], months_count: int = 50,
+                 calendar: Optional[ProjectionCalendar] = None):
+        self.assumptions = assumptions
+        self.months_count = months_count
+        self.calendar = calendar or ProjectionCalendar.from_assumptions(assumptions, months_count)
+        self.years = self.calendar.years
+
+        self._compile_pricing()
+        self._compile_sales()
+        self._compile_personnel()
+        self._compile_marketing()
+        self._compile_fundings()
+
+    def first_changed_month(self, other: 'AssumptionsPlan') -> Optional[int]:
+        """Premier mois dont les entrées diffèrent entre deux plans (None si identiques)
+
+        Une modification hors sections par mois (taux, tiers, coûts fixes...)
+        touche tous les mois: retourne 1. Les deux plans doivent porter sur
+        des dicts d'hypothèses distincts (pas un même dict modifié sur place).
+        """
+        if self.months_count != other.months_count:
+            return 1
+        if without_monthly_sections(self.assumptions) != without_monthly_sections(other.assumptions):
+            return 1
+
+        candidates = []
+        for field in MONTHLY_FIELDS:
+            candidates.append(_first_difference(getattr(self, field), getattr(other, field)))
+        for name in set(self.role_fte) | set(other.role_fte):
+            candidates.append(_first_difference(self.role_fte.get(name), other.role_fte.get(name)))
+        for name in set(self.marketing) | set(other.marketing):
+            candidates.append(_first_difference(self.marketing.get(name), other.marketing.get(name)))
+
+        changed = [index for index in candidates if index is not None]
+        return min(changed) + 1 if changed else None
+
+    def _compile_pricing(self):
+        """Prix hackathon / factory / services par mois"""
+        pricing = self.assumptions['pricing']
+        self.hackathon_price = resolve_periods(pricing['hackathon']['periods'], self.months_count)
+        self.factory_price = resolve_periods(pricing['factory']['periods'], self.months_count)
+        self.services_price = resolve_periods(
+            pricing['services']['implementation']['periods'], self.months_count
+        )
+
+        hub_pricing = pricing['enterprise_hub']
+        self.hub_launch_month = hub_pricing['launch_month']
+        self.hub_tier_prices = {
+            tier: hub_pricing['tiers'][tier]['monthly_eur']
+            for tier in ('starter', 'business', 'enterprise')
+        }
+
+    def _compile_sales(self):
+        """Volumes hackathons, conversion factory, nouveaux clients Hub"""
+        sales = self.assumptions['sales_assumptions']
+        long_term = sales.get('long_term_sales', {})
+
+        # Court terme (1ère période du calendrier, M1-M14) puis long_term_sales
+        first_period_end = self.calendar.periods[0].last if self.calendar.periods else 0
+
+        # Hackathons
+        volumes = sales['hackathon']['volumes_monthly']
+        long_term_hack = long_term.get('hackathon', {}) if long_term else {}
+        last_hack = last_declared(long_term_hack, 'm')
+        self.hackathon_volume = []
+        for month in range(1, self.months_count + 1):
+            nb = volumes.get(f'm{month}', None)
+            if nb is None and month > first_period_end:
+                nb = carry_forward(long_term_hack, 'm', month, last_hack)
+            self.hackathon_volume.append(nb if nb is not None else 0)
+
+        # Factory: long_term_sales prioritaire pour le taux de conversion
+        if long_term and 'factory' in long_term:
+            self.factory_conversion_rate = long_term['factory'].get('conversion_rate', 0.35)
+        else:
+            self.factory_conversion_rate = sales['factory']['conversion_rate']
+        self.factory_delay = sales['factory'].get('delay_months', 2)
+
+        # Enterprise Hub
+        hub_config = sales['enterprise_hub']
+        self.hub_tier_distribution = dict(hub_config['tier_distribution_at_launch'])
+        self.hub_churn_monthly = hub_config['churn_monthly']
+        self.hub_upgrade_rate = hub_config['upgrade_patterns']['starter_to_business_rate']
+
+        long_term_hub = long_term.get('enterprise_hub') if long_term else None
+        lt_years = self.assumptions.get('long_term_projections', {}).get('years', {})
+        last_hub = last_declared(long_term_hub, 'm') if long_term_hub else None
+        self.hub_new_customers = []
+        for month in range(1, self.months_count + 1):
+            new_customers = hub_config['new_customers_monthly'].get(f'm{month}', None)
+
+            if new_customers is None and month > first_period_end:
+                if long_term_hub:
+                    new_customers = carry_forward(long_term_hub, 'm', month, last_hub)
+
+                if new_customers is None and 'long_term_projections' in self.assumptions:
+                    lt_proj = lt_years.get(str(self.years[month - 1]), {})
+                    new_customers = lt_proj.get('new_customers_hub_monthly', 8)  # Défaut 8/mois
+
+                if new_customers is None:
+                    new_customers = 8  # Conservateur
+            elif new_customers is None:
+                new_customers = 0
+
+            self.hub_new_customers.append(new_customers)
+
+    def _compile_personnel(self):
+        """Taille d'équipe et FTE par rôle, par mois"""
+        evolution = self.assumptions['costs']['personnel']['team_evolution']
+        self.team_size = []
+        team_size = 5  # Défaut
+        for month in range(1, self.months_count + 1):
+            team_size = evolution.get(f'm{month}', team_size)
+            self.team_size.append(team_size)
+
+        self.timeline_keys = self.calendar.timeline_keys
+
+        # FTE par rôle (mode détaillé personnel_details)
+        self.role_fte = {}
+        self.role_salary_monthly = {}
+        details = self.assumptions.get('personnel_details')
+        if details is None:
+            return
+        for role_name, role_data in details['roles'].items():
+            timeline = role_data['fte_timeline']
+            last_year = last_declared(timeline, 'y')
+            self.role_fte[role_name] = [
+                timeline[key] if key in timeline else carry_forward(timeline, 'y', year, last_year) or 0
+                for key, year in zip(self.timeline_keys, self.years)
+            ]
+            self.role_salary_monthly[role_name] = role_data['salary_brut_annual'] / 12
+
+    def _compile_marketing(self):
+        """Budgets marketing par canal, résolus par mois depuis l'année"""
+        self.marketing = {}
+        budgets = self.assumptions.get('marketing_budgets')
+        if budgets is None:
+            return
+
+        defaults = {'digital_ads': 2000, 'events': 1000, 'content': 1000, 'partnerships': 500}
+        for channel, default in defaults.items():
+            monthly = budgets[channel]['monthly_budgets']
+            last_year = last_declared(monthly, 'y')
+            resolved = {year: carry_forward(monthly, 'y', year, last_year) for year in set(self.years)}
+            self.marketing[channel] = [
+                resolved[year] if resolved[year] is not None else default for year in self.years
+            ]
+
+    def _compile_fundings(self):
+        """Funding par mois (dernier funding déclaré pour un mois l'emporte)"""
+        self.funding = [0] * self.months_count
+        fundings = self.assumptions['financial_kpis']['cash_management']['fundings']
+        for funding in fundings:
+            if 1 <= funding['month'] <= self.months_count:
+                self.funding[funding['month'] - 1] = funding['amount']
+
+
+def _first_difference(left: Optional[List], right: Optional[List]) -> Optional[int]:
+    """Index du premier écart entre deux tableaux par mois (None si égaux)"""
+    if left is None or right is None:
+        return None if left is right else 0
+    for index, (a, b) in enumerate(zip(left, right)):
+        if a != b:
+            return index
+    return None
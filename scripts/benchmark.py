@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Benchmark des étapes du pipeline (suivi des régressions)
+
+Chronomètre chaque étape sur les fichiers du dépôt (data/raw, data/outputs,
+data/structured) et sur des entrées synthétiques agrandies :
+  - projections.<moteur>.<N>m : ProjectionCalculator à 14/50/120/600 mois
+  - parity.<N>m               : moteurs dict et array à N mois, sorties JSON
+                                identiques octet pour octet (sinon cas en échec)
+  - excel.<backend>.<N>m      : BPExcel50MGenerator.generate + sauvegarde (50 et
+                                120 mois), backend streaming (défaut de 4b) et memory
+  - template.create           : TemplateCreator.create_template (RAW Excel)
+  - inject.inject_all         : DataInjector.inject_all (BP_50M_TEMPLATE.xlsx)
+  - word.update               : BMWordUpdater.update (BM Word source)
+  - validate.<check>          : chaque check du Validator
+
+Les projections des cas Excel / Word / validation sont celles du dépôt, lues
+comme par le pipeline (find_projections : .jsonl ou .json le plus récent);
+l'horizon 120 mois est obtenu en répétant la dernière année
+(scaled_projections), indépendamment du moteur.
+
+Chaque cas est exécuté --repeat fois (préparation non chronométrée : le
+workbook à injecter est rechargé avant chaque mesure); on retient la
+médiane. Le résultat est ajouté à data/benchmarks/history.jsonl. Un cas
+dont la médiane dépasse de plus de --threshold la médiane des --window
+derniers runs de la même machine est une régression : le script la
+signale et sort en erreur (code 1), comme pour un cas en échec.
+
+Un run avec régression ou cas en échec est historisé avec son statut
+('regression' / 'error') mais ne sert pas de référence : quelques runs
+lents ne deviennent pas la nouvelle médiane. --accept historise le run
+comme référence (ralentissement voulu).
+
+Usage:
+    python scripts/benchmark.py                      # Tous les cas
+    python scripts/benchmark.py --only 'projections.*' --repeat 5
+    python scripts/benchmark.py --only 'parity.*' --repeat 1 --no-save   # Moteurs identiques
+    python scripts/benchmark.py --no-save            # Mesurer sans historiser
+    python scripts/benchmark.py --accept             # Nouvelle référence malgré les régressions
+"""
+
+import io
+import copy
+import json
+import time
+import socket
+import logging
+import argparse
+import platform
+import tempfile
+import importlib
+import statistics
+import subprocess
+import contextlib
+from fnmatch import fnmatch
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+import yaml
+
+from projection_io import find_projections, load_projections
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+BASE_PATH = Path(__file__).parent.parent
+HISTORY_PATH = BASE_PATH / "data" / "benchmarks" / "history.jsonl"
+
+PROJECTION_HORIZONS = [14, 50, 120, 600]
+EXCEL_HORIZONS = [50, 120]
+EXCEL_BACKENDS = ['streaming', 'memory']
+
+# Écart absolu en dessous duquel une hausse n'est pas une régression (bruit)
+MIN_DELTA_S = 0.005
+
+
+class Case:
+    """Cas de benchmark: setup() non chronométré, puis run(état)"""
+
+    def __init__(self, name: str, run: Callable[[Any], Any],
+                 setup: Optional[Callable[[], Any]] = None):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda: None)
+
+
+def scaled_projections(projections: List[Dict], months_count: int) -> List[Dict]:
+    """Projections agrandies à months_count mois (dernière année répétée)"""
+    scaled = [copy.deepcopy(month_data) for month_data in projections[:months_count]]
+    pattern = projections[-12:]
+    while len(scaled) < months_count:
+        month_data = copy.deepcopy(pattern[(len(scaled) - len(projections)) % len(pattern)])
+        month_data['month'] = len(scaled) + 1
+        scaled.append(month_data)
+    return scaled
+
+
+def generate_excel(excel_50m, projections: List[Dict], assumptions: Dict[str, Any], backend: str):
+    """Générer et sauvegarder le BP Excel comme 4b (fichier temporaire)"""
+    generator = excel_50m.BPExcel50MGenerator(projections, assumptions,
+                                              streaming=backend == 'streaming')
+    wb = generator.generate()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        wb.save(Path(temp_dir) / "bp.xlsx")
+
+
+def check_engine_parity(calculation, assumptions: Dict[str, Any], months_count: int):
+    """Moteur array == moteur dict (JSON écrit par l'étape 3, types int / float compris)"""
+    outputs = {
+        engine: [json.dumps(month_data, indent=2, ensure_ascii=False) for month_data in
+                 calculation.ProjectionCalculator(assumptions, months_count=months_count,
+                                                  engine=engine).calculate_all_months()]
+        for engine in ('dict', 'array')
+    }
+    if outputs['dict'] == outputs['array']:
+        return
+    for month, (expected, actual) in enumerate(zip(outputs['dict'], outputs['array']), start=1):
+        if expected != actual:
+            raise AssertionError(f"moteur array ≠ dict dès M{month}")
+    raise AssertionError(f"moteur array: {len(outputs['array'])} mois, dict: {len(outputs['dict'])}")
+
+
+def build_cases(assumptions: Dict[str, Any]) -> List[Case]:
+    """Cas de benchmark sur les fichiers du dépôt"""
+    calculation = importlib.import_module('3_calculate_projections')
+    excel_50m = importlib.import_module('4b_generate_bp_excel_50m')
+    word = importlib.import_module('5_update_bm_word')
+    validate = importlib.import_module('6_validate')
+    template = importlib.import_module('6a_create_template')
+    injection = importlib.import_module('6b_inject_data')
+
+    structured = BASE_PATH / "data" / "structured"
+    outputs = BASE_PATH / "data" / "outputs"
+    raw_excel = BASE_PATH / "data" / "raw" / "BP FABRIQ_PRODUCT-OCT2025.xlsx"
+    raw_word = BASE_PATH / "data" / "raw" / "Business Plan GenieFactory-SEPT2025.docx"
+    template_path = outputs / "BP_50M_TEMPLATE.xlsx"
+    excel_path = outputs / "BP_14M_Nov2025-Dec2026.xlsx"
+    word_path = outputs / "BM_Updated_14M.docx"
+
+    projections_50m = load_projections(find_projections(structured, "projections_50m"))
+    projections_14m = load_projections(find_projections(structured, "projections"))
+
+    cases = []
+    for engine in calculation.ENGINES:
+        for months_count in PROJECTION_HORIZONS:
+            cases.append(Case(
+                f"projections.{engine}.{months_count}m",
+                lambda _, engine=engine, months_count=months_count:
+                    calculation.ProjectionCalculator(
+                        assumptions, months_count=months_count, engine=engine
+                    ).calculate_all_months()
+            ))
+    for months_count in PROJECTION_HORIZONS:
+        cases.append(Case(
+            f"parity.{months_count}m",
+            lambda _, months_count=months_count: check_engine_parity(calculation, assumptions, months_count)
+        ))
+
+    for months_count in EXCEL_HORIZONS:
+        projections = scaled_projections(projections_50m, months_count)
+        for backend in EXCEL_BACKENDS:
+            cases.append(Case(
+                f"excel.{backend}.{months_count}m",
+                lambda _, projections=projections, backend=backend:
+                    generate_excel(excel_50m, projections, assumptions, backend)
+            ))
+
+    cases.append(Case(
+        "template.create",
+        lambda _: template.TemplateCreator(raw_excel, assumptions).create_template()
+    ))
+    cases.append(Case(
+        "inject.inject_all",
+        lambda injector: injector.inject_all(),
+        setup=lambda: injection.DataInjector(template_path, projections_50m)
+    ))
+    cases.append(Case(
+        "word.update",
+        lambda _: word.BMWordUpdater(raw_word, projections_14m, assumptions).update()
+    ))
+
+    checks = {
+        'check_arr_targets': (),
+        'check_cash_position': (),
+        'check_burn_rate': (),
+        'check_team_size': (),
+        'check_conversion_rates': (),
+        'check_excel_formulas': (excel_path,),
+        'check_excel_word_consistency': (excel_path, word_path),
+    }
+    for check, check_args in checks.items():
+        cases.append(Case(
+            f"validate.{check}",
+            lambda validator, check=check, check_args=check_args:
+                getattr(validator, check)(*check_args),
+            setup=lambda: validate.Validator(projections_14m, assumptions)
+        ))
+    return cases
+
+
+def time_case(case: Case, repeat: int) -> Dict[str, Any]:
+    """Exécuter un cas `repeat` fois (sorties des étapes masquées)"""
+    wall, cpu = [], []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            state = case.setup()
+            start, cpu_start = time.perf_counter(), time.process_time()
+            case.run(state)
+            wall.append(time.perf_counter() - start)
+            cpu.append(time.process_time() - cpu_start)
+    return {
+        'median_s': round(statistics.median(wall), 6),
+        'min_s': round(min(wall), 6),
+        'cpu_s': round(statistics.median(cpu), 6),
+        'runs': repeat,
+    }
+
+
+def machine_id() -> str:
+    """Identifiant de la machine (les temps ne sont comparés qu'entre runs d'une même machine)"""
+    return f"{socket.gethostname()}/{platform.machine()}/py{platform.python_version()}"
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_PATH,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_regressions(results: Dict[str, Dict], history: List[Dict], machine: str,
+                     window: int, threshold: float) -> List[Tuple[str, float, float]]:
+    """Cas plus lents que la médiane des `window` derniers runs de référence de la machine
+
+    Runs de référence : sans régression ni échec, ou acceptés (--accept).
+    Retourne [(cas, médiane actuelle, référence)].
+    """
+    previous = [record for record in history
+                if record.get('machine') == machine and record.get('status', 'ok') == 'ok']
+    regressions = []
+    for name, result in results.items():
+        if 'error' in result:
+            continue
+        timings = [record['cases'][name]['median_s'] for record in previous
+                   if 'median_s' in record['cases'].get(name, {})][-window:]
+        if not timings:
+            continue
+        baseline = statistics.median(timings)
+        current = result['median_s']
+        if current > baseline * (1 + threshold) and current - baseline > MIN_DELTA_S:
+            regressions.append((name, current, baseline))
+    return regressions
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Benchmark des étapes du pipeline BP")
+    parser.add_argument('--assumptions', type=Path,
+                        default=BASE_PATH / "data" / "structured" / "assumptions.yaml",
+                        help="Fichier assumptions.yaml")
+    parser.add_argument('--only', action='append', default=None,
+                        help="Motif des cas à exécuter (ex: 'projections.*'), répétable")
+    parser.add_argument('--repeat', type=int, default=3, help="Mesures par cas (médiane)")
+    parser.add_argument('--history', type=Path, default=HISTORY_PATH,
+                        help="Historique JSON Lines des runs")
+    parser.add_argument('--window', type=int, default=5,
+                        help="Runs précédents servant de référence")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Ralentissement toléré avant régression (0.25 = +25%%)")
+    parser.add_argument('--no-save', action='store_true', help="Ne pas ajouter le run à l'historique")
+    parser.add_argument('--accept', action='store_true',
+                        help="Historiser le run comme référence malgré les régressions")
+    args = parser.parse_args()
+
+    with open(args.assumptions, 'r', encoding='utf-8') as f:
+        assumptions = yaml.safe_load(f)
+
+    cases = build_cases(assumptions)
+    if args.only:
+        cases = [case for case in cases if any(fnmatch(case.name, pattern) for pattern in args.only)]
+    if not cases:
+        logger.error(f"❌ Aucun cas ne correspond à {args.only}")
+        return 1
+
+    logger.info(f"⏱️  Benchmark: {len(cases)} cas × {args.repeat} mesures")
+    results = {}
+    logging.disable(logging.INFO)  # Logs des étapes masqués pendant les mesures
+    try:
+        for case in cases:
+            try:
+                results[case.name] = time_case(case, args.repeat)
+            except Exception as e:
+                results[case.name] = {'error': f"{type(e).__name__}: {e}"}
+    finally:
+        logging.disable(logging.NOTSET)
+
+    for name, result in results.items():
+        if 'error' in result:
+            logger.error(f"  ❌ {name}: {result['error']}")
+        else:
+            logger.info(f"  • {name}: {result['median_s'] * 1000:,.1f} ms "
+                        f"(min {result['min_s'] * 1000:,.1f} ms)")
+
+    machine = machine_id()
+    history = load_history(args.history)
+    regressions = find_regressions(results, history, machine, args.window, args.threshold)
+    errors = [name for name, result in results.items() if 'error' in result]
+
+    if not args.no_save:
+        if errors:
+            status = 'error'
+        elif regressions and not args.accept:
+            status = 'regression'
+        else:
+            status = 'ok'
+        record = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'machine': machine,
+            'repeat': args.repeat,
+            'status': status,  # Seuls les runs 'ok' servent de référence
+            'cases': results,
+        }
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        logger.info(f"\n📁 Historique: {args.history}")
+
+    if regressions:
+        logger.error(f"\n❌ {len(regressions)} RÉGRESSION(S) (> +{args.threshold:.0%} "
+                     f"vs médiane des {args.window} derniers runs):")
+        for name, current, baseline in regressions:
+            logger.error(f"  • {name}: {current * 1000:,.1f} ms vs {baseline * 1000:,.1f} ms "
+                         f"(+{current / baseline - 1:.0%})")
+    if errors:
+        logger.error(f"\n❌ {len(errors)} cas en échec: {', '.join(errors)}")
+    if errors or (regressions and not args.accept):
+        return 1
+    if regressions:
+        logger.info("\n✅ Régressions acceptées (nouvelle référence)")
+        return 0
+
+    logger.info("\n✅ Aucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
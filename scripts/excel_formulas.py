@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Évaluation des formules Excel en Python
+
+Les générateurs (4, 4b) écrivent de vraies formules (totaux annuels, CA,
+EBITDA, cash cumulé) pour que le BP reste vivant dans Excel. openpyxl
+n'enregistre aucune valeur calculée : relu avec data_only=True, un fichier
+fraîchement généré n'a que des None. FormulaEvaluator calcule les valeurs
+à partir des formules, sans Excel ni LibreOffice.
+
+Sous-ensemble supporté (celui des générateurs et des formules usuelles du
+template) :
+  - nombres, textes, TRUE/FALSE, références A1 / $A$1 / 'Feuille'!A1, plages A1:B3
+  - opérateurs + - * / ^ & % et comparaisons = <> < > <= >=
+  - fonctions SUM, MIN, MAX, AVERAGE, COUNT, ABS, ROUND, IF, IFERROR, AND, OR, NOT
+
+Comme Excel : cellule vide = 0 dans un calcul, textes ignorés par SUM,
+erreurs (#DIV/0!, #VALUE!, #REF!) propagées. Une fonction inconnue vaut
+#NAME? ; une formule illisible lève FormulaError.
+
+Les antécédents d'une cellule sont calculés avec une pile explicite : une
+chaîne de références de n'importe quelle longueur, sur une ou plusieurs
+feuilles, ne consomme pas la pile Python. Une formule trop imbriquée pour
+être lue vaut #VALUE!, une référence circulaire #NAME?.
+
+Usage:
+    evaluator = FormulaEvaluator(openpyxl.load_workbook(path))
+    evaluator.value('P&L', 'S19')         # Valeur calculée (ou constante)
+    evaluator.sheet_values('P&L')         # {coordonnée: valeur} de toute la feuille
+"""
+
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_to_tuple
+
+DIV0 = '#DIV/0!'
+VALUE = '#VALUE!'
+REF = '#REF!'
+NAME = '#NAME?'
+ERRORS = {DIV0, VALUE, REF, NAME, '#N/A', '#NUM!', '#NULL!'}
+
+TOKEN = re.compile(r"""
+    \s*(?:
+      (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<string>"(?:[^"]|"")*")
+    | (?P<error>\#(?:DIV/0!|VALUE!|REF!|NAME\?|N/A|NUM!|NULL!))
+    | (?P<function>[A-Za-z_][\w.]*)\s*\(
+    | (?P<reference>(?:(?:'(?:[^']|'')+'|[A-Za-z_][\w.]*)!)?
+                    \$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?)
+    | (?P<boolean>TRUE|FALSE)\b
+    | (?P<operator><=|>=|<>|[-+*/^&=<>%(),])
+    )""", re.VERBOSE | re.IGNORECASE)
+
+COMPARISONS = {
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '>': lambda a, b: a > b,
+    '<=': lambda a, b: a <= b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+class FormulaError(ValueError):
+    """Formule hors du sous-ensemble supporté (syntaxe)"""
+
+
+def tokenize(formula: str) -> List[Tuple[str, str]]:
+    """'=SUM(D4:D7)*2' -> [('function', 'SUM'), ('reference', 'D4:D7'), ...]"""
+    text = formula[1:] if formula.startswith('=') else formula
+    tokens, position = [], 0
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            if text[position:].strip() == '':
+                break
+            raise FormulaError(f"Formule illisible à la position {position}: {formula}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class Parser:
+    """Formule -> arbre (tuples), précédence Excel: comparaison < & < +- < */ < ^ < signe < %"""
+
+    def __init__(self, formula: str, sheet: str):
+        self.formula = formula
+        self.sheet = sheet
+        self.tokens = tokenize(formula)
+        self.position = 0
+
+    def parse(self):
+        node = self.comparison()
+        if self.position != len(self.tokens):
+            raise FormulaError(f"Jeton inattendu '{self.tokens[self.position][1]}': {self.formula}")
+        return node
+
+    def peek(self) -> Optional[str]:
+        if self.position < len(self.tokens) and self.tokens[self.position][0] == 'operator':
+            return self.tokens[self.position][1]
+        return None
+
+    def take(self) -> Tuple[str, str]:
+        if self.position >= len(self.tokens):
+            raise FormulaError(f"Formule incomplète: {self.formula}")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def expect(self, operator: str):
+        kind, text = self.take()
+        if kind != 'operator' or text != operator:
+            raise FormulaError(f"'{operator}' attendu au lieu de '{text}': {self.formula}")
+
+    def binary(self, operand, operators):
+        node = operand()
+        while self.peek() in operators:
+            operator = self.take()[1]
+            node = ('binary', operator, node, operand())
+        return node
+
+    def comparison(self):
+        return self.binary(self.concatenation, COMPARISONS)
+
+    def concatenation(self):
+        return self.binary(self.additive, ('&',))
+
+    def additive(self):
+        return self.binary(self.multiplicative, ('+', '-'))
+
+    def multiplicative(self):
+        return self.binary(self.power, ('*', '/'))
+
+    def power(self):
+        return self.binary(self.unary, ('^',))
+
+    def unary(self):
+        if self.peek() in ('-', '+'):
+            operator = self.take()[1]
+            operand = self.unary()
+            return ('negate', operand) if operator == '-' else operand
+        return self.percent()
+
+    def percent(self):
+        node = self.primary()
+        while self.peek() == '%':
+            self.take()
+            node = ('binary', '/', node, ('constant', 100))
+        return node
+
+    def primary(self):
+        kind, text = self.take()
+        if kind == 'number':
+            value = float(text)
+            return ('constant', int(value) if value.is_integer() and 'e' not in text.lower() else value)
+        if kind == 'string':
+            return ('constant', text[1:-1].replace('""', '"'))
+        if kind == 'boolean':
+            return ('constant', text.upper() == 'TRUE')
+        if kind == 'error':
+            return ('constant', text.upper())
+        if kind == 'reference':
+            return self.reference(text)
+        if kind == 'function':
+            return self.function(text.upper())
+        if text == '(':
+            node = self.comparison()
+            self.expect(')')
+            return node
+        raise FormulaError(f"Jeton inattendu '{text}': {self.formula}")
+
+    def function(self, name: str):
+        arguments = []
+        if self.peek() != ')':
+            arguments.append(self.comparison())
+            while self.peek() == ',':
+                self.take()
+                arguments.append(self.comparison())
+        self.expect(')')
+        return ('function', name, arguments)
+
+    def reference(self, text: str):
+        sheet = self.sheet
+        if '!' in text:
+            sheet, text = text.rsplit('!', 1)
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+        text = text.replace('$', '').upper()
+        if ':' not in text:
+            row, column = coordinate_to_tuple(text)
+            return ('cell', sheet, row, column)
+        start, end = text.split(':')
+        (row1, col1), (row2, col2) = coordinate_to_tuple(start), coordinate_to_tuple(end)
+        return ('range', sheet, min(row1, row2), min(col1, col2), max(row1, row2), max(col1, col2))
+
+
+def references(node) -> List[Tuple[str, int, int]]:
+    """Cellules lues par un arbre de formule (plages développées)"""
+    keys, nodes = [], [node]
+    while nodes:
+        node = nodes.pop()
+        kind = node[0]
+        if kind == 'cell':
+            keys.append(node[1:])
+        elif kind == 'range':
+            sheet, row1, col1, row2, col2 = node[1:]
+            keys.extend((sheet, row, column)
+                        for row in range(row1, row2 + 1) for column in range(col1, col2 + 1))
+        elif kind == 'negate':
+            nodes.append(node[1])
+        elif kind == 'binary':
+            nodes.extend(node[2:])
+        elif kind == 'function':
+            nodes.extend(node[2])
+    return keys
+
+
+def is_error(value) -> bool:
+    return isinstance(value, str) and value in ERRORS
+
+
+def to_number(value):
+    """Valeur scalaire -> nombre (vide = 0, booléen = 0/1); #VALUE! si texte non numérique"""
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if is_error(value):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return VALUE
+
+
+def to_text(value) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _comparable(value):
+    """Excel compare nombres < textes < booléens (textes sans casse)"""
+    if value is None:
+        value = 0
+    if isinstance(value, bool):
+        return (2, value)
+    if isinstance(value, str):
+        return (1, value.lower())
+    return (0, value)
+
+
+class FormulaEvaluator:
+    """Valeurs calculées d'un workbook openpyxl chargé avec ses formules (data_only=False)"""
+
+    def __init__(self, wb):
+        self.wb = wb
+        self.values: Dict[Tuple[str, int, int], Any] = {}
+        self.pending = set()             # Cellules en attente de leurs antécédents (références circulaires)
+        self.nodes: Dict[Tuple[str, int, int], Any] = {}  # Formules parsées des cellules en attente
+        self.evaluated_sheets = set()
+        self.errors: Dict[str, str] = {}  # 'Feuille!A1' -> formule illisible
+
+    def value(self, sheet: str, coordinate: str) -> Any:
+        """Valeur calculée d'une cellule ('P&L', 'S19')"""
+        self.evaluate_sheet(sheet)
+        row, column = coordinate_to_tuple(coordinate.replace('$', ''))
+        return self.cell_value(sheet, row, column)
+
+    def sheet_values(self, sheet: str) -> Dict[str, Any]:
+        """Toutes les valeurs non vides d'une feuille, par coordonnée"""
+        self.evaluate_sheet(sheet)
+        return {
+            f"{get_column_letter(column)}{row}": value
+            for (name, row, column), value in self.values.items()
+            if name == sheet and value is not None
+        }
+
+    def evaluate_sheet(self, sheet: str):
+        """Calculer une feuille ligne à ligne, de gauche à droite
+
+        Les antécédents d'une cellule (même feuille ou autre feuille) sont
+        résolus par resolve(), sans récursion.
+        """
+        ws = self.worksheet(sheet)
+        if ws is None:
+            raise KeyError(f"Feuille introuvable: {sheet}")
+        if sheet in self.evaluated_sheets:
+            return
+        self.evaluated_sheets.add(sheet)
+        # Cellules existantes seulement: iter_rows() créerait toutes les cellules vides
+        for row, column in sorted(ws._cells):
+            if ws._cells[(row, column)].value is not None:
+                self.cell_value(sheet, row, column)
+
+    def worksheet(self, sheet: str):
+        if sheet not in self.wb.sheetnames:
+            return None
+        return self.wb[sheet]
+
+    def cell_value(self, sheet: str, row: int, column: int) -> Any:
+        key = (sheet, row, column)
+        if key not in self.values:
+            if self.worksheet(sheet) is None:
+                return REF
+            self.resolve(key)
+        return self.values[key]
+
+    def resolve(self, root: Tuple[str, int, int]):
+        """Calculer une cellule après ses antécédents, avec une pile explicite
+
+        Une cellule n'est évaluée qu'une fois toutes les cellules qu'elle lit
+        en cache : evaluate() ne descend jamais dans une autre formule, et une
+        chaîne de 400 mois entre feuilles ne dépasse pas la limite de récursion.
+        """
+        stack = [root]
+        while stack:
+            key = stack[-1]
+            if key in self.values:
+                stack.pop()
+                continue
+            if key not in self.pending:
+                node = self.parse_cell(key)
+                if node is None:  # Constante ou formule illisible: valeur déjà en cache
+                    stack.pop()
+                    continue
+                self.nodes[key] = node
+                self.pending.add(key)
+
+            node = self.nodes[key]
+            missing = [dep for dep in references(node)
+                       if dep not in self.values and self.worksheet(dep[0]) is not None]
+            if any(dep in self.pending for dep in missing):
+                # Antécédent en attente = ancêtre de la cellule sur la pile
+                self.fail(key, f"Référence circulaire: {self.label(key)}", NAME)
+            elif missing:
+                stack.extend(reversed(missing))
+                continue
+            else:
+                self.values[key] = self.compute(key, node)
+            self.pending.discard(key)
+            del self.nodes[key]
+            stack.pop()
+
+    def parse_cell(self, key: Tuple[str, int, int]):
+        """Arbre de la formule d'une cellule (None: valeur mise en cache directement)"""
+        sheet, row, column = key
+        # Lecture sans ws.cell(): une plage (SUM(A1:A1000)) ne crée pas de cellules vides
+        cell = self.worksheet(sheet)._cells.get((row, column))
+        raw = None if cell is None else cell.value
+        formula = getattr(raw, 'text', raw)  # ArrayFormula du template
+        if not (isinstance(formula, str) and formula.startswith('=') and len(formula) > 1):
+            self.values[key] = raw
+            return None
+        try:
+            return Parser(formula, sheet).parse()
+        except FormulaError as e:
+            self.fail(key, str(e), NAME)
+        except RecursionError:
+            self.fail(key, f"Formule trop imbriquée: {formula[:80]}", VALUE)
+        return None
+
+    def compute(self, key: Tuple[str, int, int], node) -> Any:
+        """Évaluer une formule dont les antécédents sont en cache"""
+        try:
+            value = self.evaluate(node)
+        except FormulaError as e:
+            self.errors[self.label(key)] = str(e)
+            return NAME
+        except RecursionError:
+            self.errors[self.label(key)] = "Formule trop imbriquée"
+            return VALUE
+        if isinstance(value, list):
+            return VALUE  # Plage hors fonction
+        return value
+
+    def fail(self, key: Tuple[str, int, int], message: str, value: str):
+        self.errors[self.label(key)] = message
+        self.values[key] = value
+
+    @staticmethod
+    def label(key: Tuple[str, int, int]) -> str:
+        sheet, row, column = key
+        return f"{sheet}!{get_column_letter(column)}{row}"
+
+    def range_values(self, sheet: str, row1: int, col1: int, row2: int, col2: int) -> List[Any]:
+        return [self.cell_value(sheet, row, column)
+                for row in range(row1, row2 + 1) for column in range(col1, col2 + 1)]
+
+    def evaluate(self, node) -> Any:
+        kind = node[0]
+        if kind == 'constant':
+            return node[1]
+        if kind == 'cell':
+            return self.cell_value(*node[1:])
+        if kind == 'range':
+            return self.range_values(*node[1:])
+        if kind == 'negate':
+            operand = to_number(self.scalar(node[1]))
+            return operand if is_error(operand) else -operand
+        if kind == 'binary':
+            return self.binary(node[1], self.scalar(node[2]), self.scalar(node[3]))
+        if kind == 'function':
+            return self.function(node[1], node[2])
+        raise FormulaError(f"Nœud inconnu: {kind}")
+
+    def scalar(self, node) -> Any:
+        value = self.evaluate(node)
+        return VALUE if isinstance(value, list) else value
+
+    def binary(self, operator: str, left, right) -> Any:
+        for operand in (left, right):
+            if is_error(operand):
+                return operand
+        if operator in COMPARISONS:
+            return COMPARISONS[operator](_comparable(left), _comparable(right))
+        if operator == '&':
+            return to_text(left) + to_text(right)
+
+        left, right = to_number(left), to_number(right)
+        for operand in (left, right):
+            if is_error(operand):
+                return operand
+        if operator == '+':
+            return left + right
+        if operator == '-':
+            return left - right
+        if operator == '*':
+            return left * right
+        if operator == '/':
+            return DIV0 if right == 0 else left / right
+        if operator == '^':
+            try:
+                return left ** right
+            except (ZeroDivisionError, OverflowError):
+                return '#NUM!'
+        raise FormulaError(f"Opérateur inconnu: {operator}")
+
+    def numbers(self, arguments) -> List[Any]:
+        """Arguments numériques d'une fonction d'agrégation (plages: nombres seuls)"""
+        numbers = []
+        for argument in arguments:
+            value = self.evaluate(argument)
+            if isinstance(value, list):
+                for item in value:
+                    if is_error(item):
+                        return [item]
+                    if isinstance(item, (int, float)) and not isinstance(item, bool):
+                        numbers.append(item)
+            else:
+                value = to_number(value)
+                if is_error(value):
+                    return [value]
+                numbers.append(value)
+        return numbers
+
+    def function(self, name: str, arguments: List) -> Any:
+        if name in ('SUM', 'MIN', 'MAX', 'AVERAGE', 'COUNT'):
+            numbers = self.numbers(arguments)
+            if numbers and is_error(numbers[0]):
+                return numbers[0]
+            if name == 'SUM':
+                return sum(numbers)
+            if name == 'COUNT':
+                return len(numbers)
+            if name == 'AVERAGE':
+                return sum(numbers) / len(numbers) if numbers else DIV0
+            if not numbers:
+                return 0
+            return min(numbers) if name == 'MIN' else max(numbers)
+
+        if name == 'IF':
+            if not 2 <= len(arguments) <= 3:
+                return VALUE
+            condition = self.scalar(arguments[0])
+            if is_error(condition):
+                return condition
+            condition = to_number(condition)
+            if is_error(condition):
+                return condition
+            if condition:
+                return self.scalar(arguments[1])
+            return self.scalar(arguments[2]) if len(arguments) == 3 else False
+
+        if name == 'IFERROR':
+            if len(arguments) != 2:
+                return VALUE
+            value = self.scalar(arguments[0])
+            return self.scalar(arguments[1]) if is_error(value) else value
+
+        if name in ('AND', 'OR'):
+            flags = self.numbers(arguments)
+            if flags and is_error(flags[0]):
+                return flags[0]
+            return all(flags) if name == 'AND' else any(flags)
+
+        if name in ('ABS', 'NOT', 'ROUND'):
+            values = [to_number(self.scalar(argument)) for argument in arguments]
+            for value in values:
+                if is_error(value):
+                    return value
+            if name == 'ABS' and len(values) == 1:
+                return abs(values[0])
+            if name == 'NOT' and len(values) == 1:
+                return not values[0]
+            if name == 'ROUND' and len(values) == 2:
+                return _round_half_away(values[0], int(values[1]))
+            return VALUE
+
+        return NAME
+
+
+def _round_half_away(value, digits: int):
+    """ROUND Excel: arrondi au plus loin de zéro (round() Python arrondit au pair)"""
+    factor = 10 ** digits
+    scaled = abs(value) * factor
+    rounded = int(scaled + 0.5) / factor
+    return rounded if value >= 0 else -rounded
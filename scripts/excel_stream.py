@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Écriture Excel en streaming (openpyxl write_only)
+
+Un Workbook openpyxl classique garde en mémoire un objet Cell par cellule
+de toutes les feuilles jusqu'au save : la mémoire croît avec l'horizon
+(mois), le nombre de feuilles et de scénarios générés dans un même process.
+
+BufferedSheet offre la même API que les générateurs utilisent sur une
+Worksheet (ws['A1'] = ..., ws['A1'].font / .style = ..., merge_cells,
+column_dimensions, cell) mais ne stocke que des valeurs et des styles légers
+(__slots__). flush() écrit ensuite les lignes dans l'ordre vers une
+feuille write_only, qui part directement dans un fichier temporaire :
+au plus une feuille est en mémoire à la fois, quel que soit le nombre de
+feuilles du workbook.
+
+Usage:
+    wb = Workbook(write_only=True)
+    sheets = SheetStream(wb)
+    ws = sheets.new_sheet("P&L")      # Feuille précédente écrite sur disque
+    ws['A1'] = "Titre"
+    ws['A1'].font = Font(bold=True)
+    sheets.close()                     # Dernière feuille
+    wb.save(path)
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils.cell import coordinate_to_tuple
+
+# Style nommé d'abord: les attributs suivants le retouchent
+STYLE_ATTRIBUTES = ('style', 'font', 'fill', 'alignment', 'border', 'number_format')
+
+
+@lru_cache(maxsize=None)
+def _coordinate(address: str) -> Tuple[int, int]:
+    """'D12' -> (12, 4) (adresses réutilisées d'une feuille à l'autre)"""
+    return coordinate_to_tuple(address)
+
+
+class BufferedCell:
+    """Valeur et style d'une cellule en attente d'écriture"""
+
+    __slots__ = ('value',) + STYLE_ATTRIBUTES
+
+    def __init__(self, value=None):
+        self.value = value
+        self.style = self.font = self.fill = self.alignment = self.border = self.number_format = None
+
+
+class ColumnWidth:
+    __slots__ = ('width',)
+
+    def __init__(self):
+        self.width = None
+
+
+class BufferedSheet:
+    """Feuille tamponnée: API Worksheet minimale, écrite ligne à ligne par flush()"""
+
+    def __init__(self, title: str):
+        self.title = title
+        self.rows: Dict[int, Dict[int, BufferedCell]] = defaultdict(dict)
+        self.merged: List[str] = []
+        self.column_dimensions: Dict[str, ColumnWidth] = defaultdict(ColumnWidth)
+
+    def __getitem__(self, address: str) -> BufferedCell:
+        return self.cell(*_coordinate(address))
+
+    def __setitem__(self, address: str, value):
+        self[address].value = value
+
+    def cell(self, row: int, column: int, value=None) -> BufferedCell:
+        """Comme Worksheet.cell: cellule par indices (value écrite si non None)"""
+        cells = self.rows[row]
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = BufferedCell()
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def merge_cells(self, range_string: str):
+        self.merged.append(range_string)
+
+    def flush(self, ws):
+        """Écrire la feuille dans une Worksheet write_only (largeurs et fusions d'abord)"""
+        for letter, dimension in self.column_dimensions.items():
+            if dimension.width is not None:
+                ws.column_dimensions[letter].width = dimension.width
+        for range_string in self.merged:
+            ws.merged_cells.add(range_string)
+
+        for row_idx in range(1, max(self.rows, default=0) + 1):
+            cells = self.rows.get(row_idx)
+            if not cells:
+                ws.append([])
+                continue
+            values = [None] * max(cells)
+            for col_idx, cell in cells.items():
+                values[col_idx - 1] = self._write_only_cell(ws, cell)
+            ws.append(values)
+        self.rows.clear()
+
+    @staticmethod
+    def _write_only_cell(ws, cell: BufferedCell):
+        styles = [(name, getattr(cell, name)) for name in STYLE_ATTRIBUTES
+                  if getattr(cell, name) is not None]
+        if not styles:
+            return cell.value
+        target = WriteOnlyCell(ws, value=cell.value)
+        for name, style in styles:
+            setattr(target, name, style)
+        return target
+
+
+class SheetStream:
+    """Création des feuilles d'un workbook write_only, une feuille tamponnée à la fois"""
+
+    def __init__(self, wb):
+        self.wb = wb
+        self.current: Optional[Tuple[BufferedSheet, object]] = None
+
+    def new_sheet(self, title: str, index: Optional[int] = None) -> BufferedSheet:
+        """Écrire la feuille en cours puis en ouvrir une nouvelle (index: position dans le classeur)"""
+        self.close()
+        sheet = BufferedSheet(title)
+        self.current = (sheet, self.wb.create_sheet(title, index))
+        return sheet
+
+    def close(self):
+        if self.current is not None:
+            sheet, ws = self.current
+            sheet.flush(ws)
+            self.current = None
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Registre de styles nommés des workbooks générés
+
+Les générateurs (4, 4b) et le template / l'injection (6a, 6b) assignaient
+des Font / PatternFill / Alignment neufs cellule par cellule. openpyxl
+déduplique ces objets dans la table de styles, mais chaque assignation
+coûte une recherche par attribut, et les mêmes définitions étaient
+recopiées dans chaque script.
+
+STYLES centralise les définitions; StyleRegistry les enregistre comme
+NamedStyle une seule fois par workbook (au premier usage) puis les
+applique par nom : une seule assignation par cellule, et les styles
+apparaissent dans la galerie "Styles de cellule" d'Excel (préfixe "BP ").
+
+Un style nommé remplace tout le format de la cellule (police, fond,
+alignement, bordure, format de nombre) : sur une cellule existante du
+template dont le format doit être conservé, patch() ne pose que les
+attributs définis par le style (retouche partielle, comme avant).
+
+Usage:
+    styles = StyleRegistry(wb)
+    styles.apply(ws['A1'], 'heading')
+    name = styles.name('currency')    # Nom à assigner en masse: cell.style = name
+    styles.patch(ws['B3'], 'bold')     # Cellule du template: bordure / format conservés
+"""
+
+from typing import Dict, Any
+
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+PREFIX = 'BP '
+
+EUR = '#,##0 €'
+CENTER = Alignment(horizontal='center', vertical='center')
+RIGHT = Alignment(horizontal='right')
+LEFT = Alignment(horizontal='left')
+
+
+def _solid(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def _banner(color: str, size: int = None) -> Dict[str, Any]:
+    """Texte blanc gras sur fond coloré (titres de section du template)"""
+    return {'font': Font(bold=True, size=size, color='FFFFFF'), 'fill': _solid(color)}
+
+
+STYLES: Dict[str, Dict[str, Any]] = {
+    # En-têtes de tableaux
+    'header_year': {'font': Font(bold=True, size=12, color='FFFFFF'), 'fill': _solid('1F4E78'),
+                    'alignment': CENTER},
+    'header_month': {'font': Font(bold=True, size=10, color='FFFFFF'), 'fill': _solid('4472C4'),
+                     'alignment': CENTER},
+    'header': {'font': Font(bold=True, size=11, color='FFFFFF'), 'fill': _solid('4472C4'),
+               'alignment': CENTER},
+    'section_header': {'font': Font(bold=True, size=11, color='FFFFFF'), 'fill': _solid('548235'),
+                       'alignment': LEFT},
+    'total': {'font': Font(bold=True, size=10), 'fill': _solid('D9E1F2'), 'alignment': RIGHT},
+    'total_currency': {'font': Font(bold=True, size=10), 'fill': _solid('D9E1F2'), 'alignment': RIGHT,
+                       'number_format': EUR},
+
+    # Valeurs
+    'currency': {'number_format': EUR, 'alignment': RIGHT},
+    'currency_bold': {'font': Font(bold=True), 'number_format': EUR, 'alignment': RIGHT},
+    'currency_total': {'font': Font(bold=True, size=11), 'number_format': EUR, 'alignment': RIGHT},
+    'currency_gain': {'font': Font(bold=True, color='00B050'), 'number_format': EUR, 'alignment': RIGHT},
+    'currency_loss': {'font': Font(bold=True, color='C00000'), 'number_format': EUR, 'alignment': RIGHT},
+    'currency_red': {'font': Font(bold=True, color='FF0000'), 'number_format': EUR, 'alignment': RIGHT},
+    'currency_alert': {'font': Font(color='FF0000'), 'number_format': EUR, 'alignment': RIGHT},
+    'arr': {'font': Font(bold=True, color='00B050'), 'number_format': EUR, 'alignment': RIGHT},
+    'count': {'number_format': '0'},
+    'decimal': {'number_format': '0.0'},
+    'percent': {'number_format': '0.0%'},
+
+    # Textes
+    'title': {'font': Font(bold=True, size=16)},
+    'title_blue': {'font': Font(bold=True, size=16, color='1F4E78')},
+    'title_plain': {'font': Font(bold=True, size=14, color='000000'), 'fill': _solid('FFFFFF')},
+    'subtitle': {'font': Font(size=11, italic=True)},
+    'heading': {'font': Font(bold=True, size=14)},
+    'subheading': {'font': Font(bold=True, size=12)},
+    'subheading_blue': {'font': Font(bold=True, size=12, color='1F4E78')},
+    'subheading_green': {'font': Font(bold=True, size=12, color='548235')},
+    'subheading_darkred': {'font': Font(bold=True, size=12, color='C00000')},
+    'subheading_red': {'font': Font(bold=True, size=12, color='FF0000')},
+    'section': {'font': Font(bold=True, size=11)},
+    'section_red': {'font': Font(bold=True, size=11, color='FF0000')},
+    'bold': {'font': Font(bold=True)},
+    'bold_blue': {'font': Font(bold=True, color='0000FF')},
+    'link': {'font': Font(bold=True, color='4472C4')},
+    'status_ok': {'font': Font(bold=True, color='00B050')},
+    'status_ko': {'font': Font(bold=True, color='FF0000')},
+    'italic': {'font': Font(italic=True)},
+    'note': {'font': Font(size=9, italic=True, color='666666')},
+    'text_red': {'font': Font(color='FF0000')},
+    'text_green': {'font': Font(color='00CC00')},
+
+    # Bandeaux du template (texte blanc sur fond coloré)
+    'title_banner_blue': _banner('0066CC', 14),
+    'title_banner_orange': _banner('FF6600', 14),
+    'title_banner_green': _banner('00CC66', 14),
+    'title_banner_violet': _banner('9966FF', 14),
+    'title_banner_red': _banner('CC0000', 14),
+    'title_banner_grey': _banner('666666', 14),
+    'banner_violet': _banner('9966FF', 12),
+    'banner_amber': _banner('FF9900', 12),
+    'banner_orange': _banner('FF6600', 12),
+    'banner_pink': _banner('FF3366', 12),
+    'banner_green': _banner('00CC66'),
+    'warning_banner': {'font': Font(bold=True, size=14, color='FF0000'), 'fill': _solid('FFFF00')},
+}
+
+
+class StyleRegistry:
+    """Styles nommés d'un workbook: enregistrés au premier usage, appliqués par nom"""
+
+    def __init__(self, wb):
+        self.wb = wb
+        self.registered = set(wb.named_styles)  # Template rechargé: styles déjà présents
+
+    def name(self, key: str) -> str:
+        """Nom du NamedStyle de `key` (enregistré dans le workbook si besoin)"""
+        name = PREFIX + key
+        if name not in self.registered:
+            # Police et bordure par défaut du workbook (Calibri 11) si le style n'en fixe pas
+            attributes = {'font': DEFAULT_FONT, 'border': DEFAULT_BORDER, **STYLES[key]}
+            self.wb.add_named_style(NamedStyle(name=name, **attributes))
+            self.registered.add(name)
+        return name
+
+    def apply(self, cell, key: str):
+        cell.style = self.name(key)
+
+    def patch(self, cell, key: str):
+        """Poser les seuls attributs du style (cellule existante du template)"""
+        for attribute, value in STYLES[key].items():
+            setattr(cell, attribute, value)
@@ -8,15 +8,20 @@ Input:
 
 Output:
   - data/outputs/charts/*.png
+
+matplotlib n'est importé qu'au premier graphique : --help reste léger
+(scripts/startup_budget.py).
 """
 
-import json
 import logging
+import argparse
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from typing import List, Dict
 
+from projection_io import find_projections, load_projections
+from pipeline_context import plan_root
+from telemetry import instrument
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,13 +30,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Style français
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['font.size'] = 10
 
+def pyplot():
+    """matplotlib.pyplot, configuré au premier appel (import différé)"""
+    import matplotlib.pyplot as plt
+
+    # Style français
+    plt.rcParams['font.family'] = 'DejaVu Sans'
+    plt.rcParams['font.size'] = 10
+    return plt
 
+
+@instrument()
 def create_arr_evolution_chart(projections: List[Dict], output_path: Path):
     """Créer graphique évolution ARR"""
+    plt = pyplot()
     logger.info("📈 Création graphique ARR...")
 
     months = [f"M{p['month']}" for p in projections]
@@ -64,8 +77,10 @@ def create_arr_evolution_chart(projections: List[Dict], output_path: Path):
     logger.info(f"✓ Graphique ARR sauvegardé: {output_path}")
 
 
+@instrument()
 def create_ca_mensuel_chart(projections: List[Dict], output_path: Path):
     """Créer graphique CA mensuel"""
+    plt = pyplot()
     logger.info("📊 Création graphique CA mensuel...")
 
     months = [f"M{p['month']}" for p in projections]
@@ -94,8 +109,10 @@ def create_ca_mensuel_chart(projections: List[Dict], output_path: Path):
     logger.info(f"✓ Graphique CA sauvegardé: {output_path}")
 
 
+@instrument()
 def create_revenue_mix_chart(projections: List[Dict], output_path: Path):
     """Créer camembert répartition revenus"""
+    plt = pyplot()
     logger.info("🥧 Création camembert revenue mix...")
 
     # Calculer totaux sur 14 mois
@@ -127,8 +144,11 @@ def create_revenue_mix_chart(projections: List[Dict], output_path: Path):
     logger.info(f"✓ Camembert revenue mix sauvegardé: {output_path}")
 
 
+@instrument()
 def create_ebitda_chart(projections: List[Dict], output_path: Path):
     """Créer graphique EBITDA mensuel"""
+    plt = pyplot()
+    import matplotlib.patches as mpatches
     logger.info("💰 Création graphique EBITDA...")
 
     months = [f"M{p['month']}" for p in projections]
@@ -157,8 +177,10 @@ def create_ebitda_chart(projections: List[Dict], output_path: Path):
     logger.info(f"✓ Graphique EBITDA sauvegardé: {output_path}")
 
 
+@instrument()
 def create_cash_chart(projections: List[Dict], output_path: Path):
     """Créer graphique cash position"""
+    plt = pyplot()
     logger.info("💵 Création graphique cash position...")
 
     months = [f"M{p['month']}" for p in projections]
@@ -193,8 +215,10 @@ def create_cash_chart(projections: List[Dict], output_path: Path):
     logger.info(f"✓ Graphique cash sauvegardé: {output_path}")
 
 
+@instrument()
 def create_team_evolution_chart(projections: List[Dict], output_path: Path):
     """Créer graphique évolution équipe"""
+    plt = pyplot()
     logger.info("👥 Création graphique évolution équipe...")
 
     months = [f"M{p['month']}" for p in projections]
@@ -225,17 +249,18 @@ def create_team_evolution_chart(projections: List[Dict], output_path: Path):
 
 def main():
     """Fonction principale"""
+    argparse.ArgumentParser(description="Génération des graphiques PNG du BP 14 mois").parse_args()
+
     logger.info("="*60)
     logger.info("🎨 GÉNÉRATION GRAPHIQUES PNG")
     logger.info("="*60)
 
-    base_path = Path(__file__).parent.parent
+    base_path = plan_root()
 
     # Charger projections
-    projections_path = base_path / "data" / "structured" / "projections.json"
+    projections_path = find_projections(base_path / "data" / "structured", "projections")
     logger.info(f"📂 Chargement projections: {projections_path}")
-    with open(projections_path, 'r', encoding='utf-8') as f:
-        projections = json.load(f)
+    projections = load_projections(projections_path)
 
     # Créer dossier charts
     charts_dir = base_path / "data" / "outputs" / "charts"
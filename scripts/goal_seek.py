@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Goal seek (solveur inverse)
+
+Au lieu d'ajuster assumptions.yaml à la main jusqu'à tomber dans la cible
+(ARR M14 = 800K€ ±10%), trouve la valeur d'un ou plusieurs leviers qui
+atteint une ou plusieurs cibles. Chaque évaluation passe par le moteur
+vectorisé (ArrayProjectionEngine, ~1 ms).
+
+Leviers :
+  - alias / chemins pointés de scenario_batch (conversion_rate, starter_price,
+    'pricing.enterprise_hub.tiers.business.monthly_eur', ...)
+  - leviers du plan compilé (monte_carlo.perturbed_plan) :
+    hub_new_customers_multiplier, hackathon_volume_multiplier,
+    factory_conversion, hub_churn_monthly
+    La solution est traduite en valeurs à reporter dans assumptions.yaml
+    (clés sources du plan × multiplicateur), vérifiées par une projection
+    recompilée depuis ces valeurs.
+
+Cibles ('métrique[@mois]=valeur') :
+  - arr@14=800000    ARR du mois (défaut: fin de la 1ère période)
+  - cash@50=1e6      cash du mois (défaut: dernier mois)
+  - revenue@14=...   CA du mois
+  - min_cash=0       plancher de cash sur tout l'horizon
+  - break_even=30    EBITDA >= 0 à partir du mois 30 au plus tard
+
+Méthodes :
+  - 1 levier / 1 cible : encadrement [bas, haut] puis regula falsi (Illinois)
+    avec repli sur bisection; bisection seule pour break_even (entier)
+  - n leviers / n cibles : Newton amorti, jacobien par différences finies,
+    leviers bornés
+
+Usage:
+    python scripts/goal_seek.py --lever hub_new_customers_multiplier --target arr@14=800000
+    python scripts/goal_seek.py --lever starter_price=100:1000 --target min_cash=0
+    python scripts/goal_seek.py --lever conversion_rate --lever hub_new_customers_multiplier \\
+                                --target arr@14=800000 --target cash@50=2000000
+
+NumPy (moteur, solveur) n'est importé qu'au premier calcul : --help reste
+léger (scripts/startup_budget.py).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import yaml
+import logging
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Callable
+
+from assumptions_plan import AssumptionsPlan
+from scenario_batch import OVERRIDE_ALIASES, apply_overrides, compute_kpis, _path_exists
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Leviers appliqués directement au plan compilé (pas de recompilation)
+PLAN_LEVERS = {
+    'hub_new_customers_multiplier': 1.0,
+    'hackathon_volume_multiplier': 1.0,
+    'factory_conversion': None,   # Valeur de base lue dans le plan
+    'hub_churn_monthly': None,
+}
+
+# Clés d'assumptions.yaml d'où le plan tire chaque levier ('*' = toutes les clés)
+PLAN_LEVER_PATHS = {
+    'hub_new_customers_multiplier': [
+        'sales_assumptions.enterprise_hub.new_customers_monthly.*',
+        'sales_assumptions.long_term_sales.enterprise_hub.*',
+        'long_term_projections.years.*.new_customers_hub_monthly',
+    ],
+    'hackathon_volume_multiplier': [
+        'sales_assumptions.hackathon.volumes_monthly.*',
+        'sales_assumptions.long_term_sales.hackathon.*',
+    ],
+    'factory_conversion': OVERRIDE_ALIASES['conversion_rate'],
+    'hub_churn_monthly': OVERRIDE_ALIASES['churn_monthly'],
+}
+
+# Bornes par défaut (sinon [0, 4 × valeur de base])
+DEFAULT_BOUNDS = {
+    'hub_new_customers_multiplier': (0.0, 5.0),
+    'hackathon_volume_multiplier': (0.0, 5.0),
+    'factory_conversion': (0.0, 1.0),
+    'conversion_rate': (0.0, 1.0),
+    'hub_churn_monthly': (0.0, 0.2),
+    'churn_monthly': (0.0, 0.2),
+    'upgrade_rate': (0.0, 1.0),
+    'charges_sociales_rate': (0.0, 1.0),
+}
+
+# Écart relatif max accepté quand la cible tombe entre deux paliers
+# (clients Hub arrondis à 2 décimales: l'ARR varie par sauts)
+STEP_TOLERANCE = 1e-3
+
+METRICS = {
+    'arr': 'hub.arr',
+    'cash': 'cash',
+    'revenue': 'revenue.total',
+    'ebitda': 'ebitda',
+    'min_cash': None,
+    'break_even': None,
+}
+
+
+class Target:
+    """Cible: métrique (au mois `month`) = `value`"""
+
+    def __init__(self, metric: str, value: float, month: Optional[int] = None):
+        if metric not in METRICS:
+            raise ValueError(f"Métrique inconnue: {metric} (attendu: {', '.join(METRICS)})")
+        self.metric = metric
+        self.value = float(value)
+        self.month = month
+
+    @property
+    def discrete(self) -> bool:
+        return self.metric == 'break_even'
+
+    def label(self) -> str:
+        if self.metric == 'break_even':
+            return f"break-even ≤ M{int(self.value)}"
+        suffix = f" M{self.month}" if self.month else ''
+        return f"{self.metric}{suffix} = {self.value:,.0f}"
+
+    def measure(self, cols: Dict[str, np.ndarray]) -> float:
+        """Valeur atteinte sur une projection en colonnes"""
+        if self.metric == 'min_cash':
+            return float(cols['cash'].min())
+        if self.metric == 'break_even':
+            month = compute_kpis(cols)['break_even_month']
+            return float(month if month is not None else len(cols['month']) + 1)
+        return float(cols[METRICS[self.metric]][self.month - 1])
+
+    def residual(self, cols: Dict[str, np.ndarray]) -> float:
+        """Écart relatif à la cible (0 = atteinte)"""
+        return (self.measure(cols) - self.value) / max(abs(self.value), 1.0)
+
+
+def expand_path(data: Any, pattern: List[str], prefix: Tuple[str, ...] = ()) -> List[Tuple[str, float]]:
+    """Feuilles numériques désignées par un chemin pointé ('*' = toutes les clés)"""
+    if not pattern:
+        if isinstance(data, (int, float)) and not isinstance(data, bool):
+            return [('.'.join(prefix), data)]
+        return []
+    if not isinstance(data, dict):
+        return []
+    key, rest = pattern[0], pattern[1:]
+    keys = list(data) if key == '*' else [k for k in data if str(k) == key]
+    leaves = []
+    for name in keys:
+        leaves.extend(expand_path(data[name], rest, prefix + (str(name),)))
+    return leaves
+
+
+def parse_target(text: str) -> Target:
+    """Parser 'arr@14=800000', 'min_cash=0', 'break_even=30'"""
+    if '=' not in text:
+        raise argparse.ArgumentTypeError(f"Format attendu métrique[@mois]=valeur : {text}")
+    name, value = text.split('=', 1)
+    month = None
+    if '@' in name:
+        name, month_text = name.split('@', 1)
+        month = int(month_text.lstrip('mM'))
+    try:
+        return Target(name.strip(), float(value), month)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_lever(text: str) -> Tuple[str, Optional[Tuple[float, float]]]:
+    """Parser 'levier' ou 'levier=bas:haut'"""
+    if '=' not in text:
+        return text.strip(), None
+    name, bounds = text.split('=', 1)
+    low, high = (float(v) for v in bounds.split(':'))
+    return name.strip(), (low, high)
+
+
+class GoalSeekModel:
+    """Évaluation des projections pour des valeurs de leviers données"""
+
+    def __init__(self, assumptions: Dict[str, Any], months_count: int = 50):
+        self.assumptions = assumptions
+        self.months_count = months_count
+        self.plan = AssumptionsPlan(assumptions, months_count)
+        self.evaluations = 0
+
+    def base_value(self, lever: str) -> float:
+        """Valeur actuelle d'un levier dans les hypothèses de base"""
+        if lever in PLAN_LEVERS:
+            if PLAN_LEVERS[lever] is not None:
+                return PLAN_LEVERS[lever]
+            return float(getattr(self.plan, {
+                'factory_conversion': 'factory_conversion_rate',
+                'hub_churn_monthly': 'hub_churn_monthly',
+            }[lever]))
+
+        paths = [p.split('.') for p in OVERRIDE_ALIASES.get(lever, [lever])]
+        for keys in paths:
+            if _path_exists(self.assumptions, keys):
+                value: Any = self.assumptions
+                for key in keys:
+                    value = value[int(key)] if isinstance(value, list) else value[key]
+                return float(value)
+        raise KeyError(f"Levier introuvable dans les hypothèses: {lever}")
+
+    def default_bounds(self, lever: str) -> Tuple[float, float]:
+        if lever in DEFAULT_BOUNDS:
+            return DEFAULT_BOUNDS[lever]
+        base = self.base_value(lever)
+        if base == 0:
+            raise ValueError(f"Bornes requises pour {lever} (valeur de base nulle)")
+        return tuple(sorted((0.0, 4 * base)))
+
+    def yaml_overrides(self, values: Dict[str, float]) -> Dict[str, float]:
+        """Valeurs d'assumptions.yaml équivalentes aux leviers (chemin pointé -> valeur)
+
+        Un multiplicateur s'applique à chaque clé source du plan; un levier
+        du plan à valeur (factory_conversion...) à chacun de ses chemins.
+        """
+        overrides = {}
+        for lever, value in values.items():
+            if lever not in PLAN_LEVERS:
+                overrides[lever] = value
+                continue
+            for pattern in PLAN_LEVER_PATHS[lever]:
+                for path, base in expand_path(self.assumptions, pattern.split('.')):
+                    overrides[path] = base * value if lever.endswith('_multiplier') else value
+        return overrides
+
+    def evaluate(self, values: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """Projection (colonnes) avec les leviers fixés à `values`"""
+        from projection_engine import ArrayProjectionEngine
+        from monte_carlo import perturbed_plan
+
+        self.evaluations += 1
+        overrides = {name: value for name, value in values.items() if name not in PLAN_LEVERS}
+        draw = {name: value for name, value in values.items() if name in PLAN_LEVERS}
+
+        assumptions = self.assumptions
+        plan = self.plan
+        if overrides:
+            assumptions = apply_overrides(self.assumptions, overrides)
+            plan = AssumptionsPlan(assumptions, self.months_count, calendar=self.plan.calendar)
+        if draw:
+            plan = perturbed_plan(plan, draw)
+        return ArrayProjectionEngine(assumptions, self.months_count, plan=plan).compute()
+
+
+def solve_bracket(f: Callable[[float], float], low: float, high: float,
+                  tol: float = 1e-6, xtol: float = 1e-9,
+                  max_iter: int = 100) -> Tuple[float, int, bool]:
+    """Racine de f sur [low, high] : regula falsi (Illinois), repli bisection
+
+    Retourne (x, itérations, encadrée). `encadrée` = False si |f(x)| > tol :
+    l'intervalle s'est refermé sur un saut de f (arrondis des clients Hub),
+    x est alors l'extrémité la plus proche de la cible.
+    Lève ValueError si f ne change pas de signe sur l'intervalle.
+    """
+    f_low, f_high = f(low), f(high)
+    if abs(f_low) <= tol:
+        return low, 0, True
+    if abs(f_high) <= tol:
+        return high, 0, True
+    if (f_low > 0) == (f_high > 0):
+        raise ValueError(
+            f"Cible hors d'atteinte sur [{low:g}, {high:g}] "
+            f"(écarts relatifs {f_low:+.3f} / {f_high:+.3f})"
+        )
+
+    side = 0
+    best_x, best_f = (low, f_low) if abs(f_low) < abs(f_high) else (high, f_high)
+    for iteration in range(1, max_iter + 1):
+        x = (low * f_high - high * f_low) / (f_high - f_low)
+        # Pas de réduction suffisante (fonction en escalier) : bisection
+        if not low < x < high or iteration % 4 == 0:
+            x = (low + high) / 2
+        f_x = f(x)
+        if abs(f_x) < abs(best_f):
+            best_x, best_f = x, f_x
+
+        if abs(f_x) <= tol:
+            return x, iteration, True
+
+        if (f_x > 0) == (f_high > 0):
+            high, f_high = x, f_x
+            if side == -1:
+                f_low /= 2
+            side = -1
+        else:
+            low, f_low = x, f_x
+            if side == 1:
+                f_high /= 2
+            side = 1
+
+        if high - low <= xtol * max(1.0, abs(x)):
+            break
+    return best_x, iteration, False
+
+
+def solve_threshold(satisfied: Callable[[float], bool], base: float, low: float, high: float,
+                    xtol: float = 1e-6, max_iter: int = 60) -> Tuple[float, int]:
+    """Valeur la plus proche de `base` qui satisfait un critère monotone
+
+    Bisection entre la valeur actuelle et la borne qui satisfait la cible
+    (ex: break-even ≤ mois cible).
+    """
+    if satisfied(base):
+        return base, 0
+    ends = [end for end in sorted((low, high), key=lambda end: abs(end - base)) if satisfied(end)]
+    if not ends:
+        raise ValueError(f"Cible hors d'atteinte sur [{low:g}, {high:g}]")
+
+    good, bad = ends[0], base
+    for iteration in range(1, max_iter + 1):
+        middle = (good + bad) / 2
+        if satisfied(middle):
+            good = middle
+        else:
+            bad = middle
+        if abs(good - bad) <= xtol * max(1.0, abs(good)):
+            return good, iteration
+    return good, max_iter
+
+
+def solve_newton(F: Callable[[np.ndarray], np.ndarray], x0: np.ndarray,
+                 lower: np.ndarray, upper: np.ndarray,
+                 tol: float = 1e-6, max_iter: int = 30) -> Tuple[np.ndarray, int, bool]:
+    """Newton amorti borné (jacobien par différences finies)
+
+    Retourne (x, itérations, exacte); exacte = False si plus aucun pas ne
+    réduit l'écart (borne atteinte ou palier).
+    """
+    import numpy as np
+
+    x = np.clip(x0, lower, upper)
+    r = F(x)
+    span = upper - lower
+    for iteration in range(1, max_iter + 1):
+        if np.max(np.abs(r)) <= tol:
+            return x, iteration - 1, True
+
+        step = 1e-4 * np.maximum(span, 1e-9)
+        jacobian = np.empty((len(r), len(x)))
+        for j in range(len(x)):
+            shifted = x.copy()
+            # Pas vers l'intérieur des bornes
+            shifted[j] = x[j] + step[j] if x[j] + step[j] <= upper[j] else x[j] - step[j]
+            jacobian[:, j] = (F(shifted) - r) / (shifted[j] - x[j])
+
+        try:
+            delta = np.linalg.solve(jacobian, -r)
+        except np.linalg.LinAlgError:
+            delta = np.linalg.lstsq(jacobian, -r, rcond=None)[0]
+
+        # Recherche linéaire: réduire le pas tant que l'écart ne diminue pas
+        norm = np.linalg.norm(r)
+        factor = 1.0
+        while factor > 1e-3:
+            candidate = np.clip(x + factor * delta, lower, upper)
+            r_candidate = F(candidate)
+            if np.linalg.norm(r_candidate) < norm:
+                break
+            factor /= 2
+        if factor <= 1e-3:
+            return x, iteration, False  # Plus de progrès possible dans les bornes
+        x, r = candidate, r_candidate
+    return x, max_iter, bool(np.max(np.abs(r)) <= tol)
+
+
+def goal_seek(assumptions: Dict[str, Any], levers: List[str], targets: List[Target],
+              bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+              months_count: int = 50, tol: float = 1e-6) -> Dict[str, Any]:
+    """Trouver les valeurs de `levers` qui atteignent `targets`
+
+    Autant de leviers que de cibles. `tol` est l'écart relatif accepté
+    sur chaque cible (1e-6 × 800K€ ≈ 1€).
+    """
+    if not levers or len(levers) != len(targets):
+        raise ValueError(f"Autant de leviers que de cibles requis ({len(levers)} / {len(targets)})")
+
+    model = GoalSeekModel(assumptions, months_count)
+    first_period_end = model.plan.calendar.periods[0].last
+    for target in targets:
+        if target.month is None and target.metric in ('arr', 'revenue', 'ebitda'):
+            target.month = first_period_end
+        elif target.month is None and target.metric == 'cash':
+            target.month = months_count
+        if target.month is not None and not 1 <= target.month <= months_count:
+            raise ValueError(f"Mois hors horizon pour {target.metric}: M{target.month}")
+
+    bounds = dict(bounds or {})
+    limits = [bounds.get(lever) or model.default_bounds(lever) for lever in levers]
+    base = {lever: model.base_value(lever) for lever in levers}
+
+    start = time.perf_counter()
+    exact = True
+    if len(levers) == 1:
+        lever, target = levers[0], targets[0]
+        low, high = limits[0]
+        if target.discrete:
+            value, iterations = solve_threshold(
+                lambda x: target.measure(model.evaluate({lever: x})) <= target.value,
+                min(max(base[lever], low), high), low, high
+            )
+        else:
+            value, iterations, exact = solve_bracket(
+                lambda x: target.residual(model.evaluate({lever: x})),
+                low, high, tol=tol
+            )
+        solution = {lever: value}
+    else:
+        if any(target.discrete for target in targets):
+            raise ValueError("break_even n'est supporté qu'avec un seul levier")
+        import numpy as np
+
+        lower = np.array([l for l, _ in limits], dtype=float)
+        upper = np.array([h for _, h in limits], dtype=float)
+
+        def residuals(x: np.ndarray) -> np.ndarray:
+            cols = model.evaluate(dict(zip(levers, x.tolist())))
+            return np.array([target.residual(cols) for target in targets])
+
+        x0 = np.array([base[lever] for lever in levers], dtype=float)
+        x, iterations, exact = solve_newton(residuals, x0, lower, upper, tol=tol)
+        solution = dict(zip(levers, x.tolist()))
+    elapsed = time.perf_counter() - start
+
+    cols = model.evaluate(solution)
+    # Solution reportée dans les hypothèses puis recompilée (leviers du plan)
+    yaml_values = model.yaml_overrides(solution)
+    yaml_cols = model.evaluate(yaml_values) if any(lever in PLAN_LEVERS for lever in levers) else cols
+    results = []
+    converged = True
+    for target in targets:
+        achieved = target.measure(cols)
+        if target.discrete:
+            ok = achieved <= target.value
+        else:
+            residual = abs(target.residual(cols))
+            ok = residual <= tol or (not exact and residual <= STEP_TOLERANCE)
+        converged = converged and ok
+        results.append({
+            'metric': target.metric,
+            'month': target.month,
+            'target': target.value,
+            'achieved': achieved,
+            'achieved_yaml': target.measure(yaml_cols),
+            'ok': ok,
+        })
+
+    return {
+        'levers': {
+            lever: {'value': solution[lever], 'base': base[lever], 'bounds': list(limit)}
+            for lever, limit in zip(levers, limits)
+        },
+        'yaml_overrides': yaml_values,
+        'targets': results,
+        'converged': converged,
+        'exact': exact,
+        'iterations': iterations,
+        'evaluations': model.evaluations,
+        'elapsed_ms': elapsed * 1000,
+    }
+
+
+def main():
+    """Fonction principale"""
+    # Configuration logging (ici et pas à l'import: module aussi importé par d'autres scripts)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    base_path = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="Goal seek: leviers pour atteindre une cible")
+    parser.add_argument('--base', type=Path,
+                        default=base_path / "data" / "structured" / "assumptions.yaml",
+                        help="Fichier assumptions.yaml")
+    parser.add_argument('--lever', action='append', required=True,
+                        help="Levier (alias, chemin pointé ou levier du plan), option =bas:haut")
+    parser.add_argument('--target', type=parse_target, action='append', required=True,
+                        help="Cible métrique[@mois]=valeur (arr, cash, revenue, ebitda, min_cash, break_even)")
+    parser.add_argument('--months', type=int, default=50, help="Horizon en mois")
+    parser.add_argument('--tol', type=float, default=1e-6, help="Écart relatif accepté")
+    parser.add_argument('--output', type=Path, help="Fichier JSON de sortie (optionnel)")
+    args = parser.parse_args()
+
+    with open(args.base, 'r', encoding='utf-8') as f:
+        assumptions = yaml.safe_load(f)
+
+    levers, bounds = [], {}
+    for text in args.lever:
+        name, limit = parse_lever(text)
+        levers.append(name)
+        if limit:
+            bounds[name] = limit
+
+    logger.info(f"🎯 Goal seek: {', '.join(t.label() for t in args.target)}")
+    try:
+        result = goal_seek(assumptions, levers, args.target, bounds, args.months, args.tol)
+    except (ValueError, KeyError) as e:
+        logger.error(f"❌ {e}")
+        return 1
+
+    for lever, info in result['levers'].items():
+        logger.info(f"  • {lever}: {info['value']:,.6g} (actuel {info['base']:,.6g})")
+    if any(lever in PLAN_LEVERS for lever in levers):
+        # Levier du plan compilé: valeurs à reporter dans assumptions.yaml
+        yaml_values = {path: value for path, value in result['yaml_overrides'].items() if path not in levers}
+        logger.info(f"  → À reporter dans assumptions.yaml ({len(yaml_values)} clés) :")
+        for path, value in yaml_values.items():
+            logger.info(f"     {path}: {value:,.6g}")
+        for target in result['targets']:
+            if abs(target['achieved_yaml'] - target['achieved']) > 1e-6 * max(abs(target['achieved']), 1.0):
+                logger.warning(
+                    f"  ⚠️ {target['metric']}: {target['achieved_yaml']:,.0f} avec ces valeurs "
+                    f"(mois sans clé dans le YAML: valeur par défaut non multipliée)"
+                )
+    for target in result['targets']:
+        month = f" M{target['month']}" if target['month'] else ''
+        logger.info(
+            f"  {'✓' if target['ok'] else '✗'} {target['metric']}{month}: "
+            f"{target['achieved']:,.0f} (cible {target['target']:,.0f})"
+        )
+    if not result['converged']:
+        logger.warning("⚠️ Cible non atteinte dans les bornes (élargir --lever levier=bas:haut)")
+    elif not result['exact']:
+        logger.info("  ℹ️  Cible entre deux paliers (arrondis clients Hub): valeur la plus proche")
+    logger.info(
+        f"✓ {result['evaluations']} évaluations, {result['iterations']} itérations "
+        f"en {result['elapsed_ms']:.0f} ms"
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        logger.info(f"📁 Résultat: {args.output}")
+
+    return 0 if result['converged'] else 1
+
+
+if __name__ == "__main__":
+    exit(main())
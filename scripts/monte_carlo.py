@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Simulation Monte Carlo des projections
+
+Remplace la lecture statique du bloc `scenarios` (base_case / upside /
+downside) par un mode stochastique : chaque tirage perturbe les hypothèses
+clés puis passe par le moteur vectorisé (ArrayProjectionEngine).
+
+Variables aléatoires (bornes dérivées du bloc `scenarios` d'assumptions.yaml) :
+  - hackathon_volume_multiplier : triangulaire (downside, 1.0, upside)
+  - factory_conversion          : triangulaire (downside, base, upside)
+  - hub_churn_monthly           : triangulaire (0.5× base, base, 2× base)
+  - hub_new_customers_multiplier: triangulaire (0.8, 1.0, 1.2)
+  - hub_launch_delay_months     : discret {0, downside} pondéré par la proba downside
+
+Un bloc optionnel `monte_carlo.distributions` dans assumptions.yaml remplace
+ces défauts, ex:
+    monte_carlo:
+      distributions:
+        hub_churn_monthly: {type: triangular, low: 0.005, mode: 0.008, high: 0.02}
+        hub_launch_delay_months: {type: discrete, values: [0, 1, 3], probabilities: [0.6, 0.3, 0.1]}
+
+Les tirages sont répartis par blocs sur un pool de process. Chaque bloc a
+sa propre graine (SeedSequence.spawn) : le résultat ne dépend que de
+--seed, --paths et --chunk-size, pas du nombre de workers.
+
+Sorties : courbes P10/P50/P90 de l'ARR et du cash par mois, probabilité de
+cash négatif avant chaque levée de fonds.
+
+Usage:
+    python scripts/monte_carlo.py --paths 100000 --seed 42
+"""
+
+import os
+import copy
+import json
+import time
+import yaml
+import logging
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+from assumptions_plan import AssumptionsPlan
+from projection_engine import ArrayProjectionEngine
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = [10, 50, 90]
+
+
+def default_distributions(assumptions: Dict[str, Any], plan: AssumptionsPlan) -> Dict[str, Dict]:
+    """Distributions par défaut, dérivées du bloc `scenarios`"""
+    scenarios = assumptions.get('scenarios', {})
+    upside = scenarios.get('upside', {})
+    downside = scenarios.get('downside', {})
+
+    conv_low = downside.get('conversion_factory', plan.factory_conversion_rate * 0.8)
+    conv_high = max(upside.get('conversion_factory', plan.factory_conversion_rate * 1.2),
+                    plan.factory_conversion_rate)
+    delay = downside.get('hub_launch_delay_months', 2)
+    p_delay = downside.get('probability', 0.2)
+    churn = plan.hub_churn_monthly
+
+    return {
+        'hackathon_volume_multiplier': {
+            'type': 'triangular',
+            'low': downside.get('hackathon_volume_multiplier', 0.8),
+            'mode': 1.0,
+            'high': upside.get('hackathon_volume_multiplier', 1.2),
+        },
+        'factory_conversion': {
+            'type': 'triangular',
+            'low': conv_low,
+            'mode': min(max(plan.factory_conversion_rate, conv_low), conv_high),
+            'high': conv_high,
+        },
+        'hub_churn_monthly': {
+            'type': 'triangular', 'low': churn * 0.5, 'mode': churn, 'high': churn * 2,
+        },
+        'hub_new_customers_multiplier': {
+            'type': 'triangular', 'low': 0.8, 'mode': 1.0, 'high': 1.2,
+        },
+        'hub_launch_delay_months': {
+            'type': 'discrete', 'values': [0, delay], 'probabilities': [1 - p_delay, p_delay],
+        },
+    }
+
+
+def sample(distributions: Dict[str, Dict], size: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Tirer `size` valeurs pour chaque variable aléatoire"""
+    draws = {}
+    for name, spec in distributions.items():
+        if spec['type'] == 'triangular':
+            if spec['low'] == spec['high']:
+                draws[name] = np.full(size, spec['low'], dtype=float)
+            else:
+                draws[name] = rng.triangular(spec['low'], spec['mode'], spec['high'], size)
+        elif spec['type'] == 'normal':
+            values = rng.normal(spec['mean'], spec['std'], size)
+            draws[name] = np.clip(values, spec.get('min', -np.inf), spec.get('max', np.inf))
+        elif spec['type'] == 'uniform':
+            draws[name] = rng.uniform(spec['low'], spec['high'], size)
+        elif spec['type'] == 'discrete':
+            draws[name] = rng.choice(spec['values'], size, p=spec['probabilities'])
+        else:
+            raise ValueError(f"Distribution inconnue pour {name}: {spec['type']}")
+    return draws
+
+
+def perturbed_plan(base_plan: AssumptionsPlan, draw: Dict[str, float]) -> AssumptionsPlan:
+    """Copie légère du plan compilé avec les valeurs tirées"""
+    plan = copy.copy(base_plan)
+    if 'hackathon_volume_multiplier' in draw:
+        factor = draw['hackathon_volume_multiplier']
+        plan.hackathon_volume = [v * factor for v in base_plan.hackathon_volume]
+    if 'factory_conversion' in draw:
+        plan.factory_conversion_rate = draw['factory_conversion']
+    if 'hub_churn_monthly' in draw:
+        plan.hub_churn_monthly = draw['hub_churn_monthly']
+    if 'hub_new_customers_multiplier' in draw:
+        factor = draw['hub_new_customers_multiplier']
+        plan.hub_new_customers = [v * factor for v in base_plan.hub_new_customers]
+    if 'hub_launch_delay_months' in draw:
+        plan.hub_launch_month = base_plan.hub_launch_month + int(draw['hub_launch_delay_months'])
+    return plan
+
+
+# État par worker (initialisé une fois par process, pas à chaque bloc)
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(assumptions: Dict[str, Any], months_count: int, distributions: Dict[str, Dict]):
+    """Initialiser un worker: compiler le plan de base une seule fois"""
+    _worker_state['assumptions'] = assumptions
+    _worker_state['months_count'] = months_count
+    _worker_state['distributions'] = distributions
+    _worker_state['plan'] = AssumptionsPlan(assumptions, months_count)
+
+
+def simulate_chunk(task: Tuple[int, np.random.SeedSequence]) -> Tuple[np.ndarray, np.ndarray]:
+    """Simuler un bloc de chemins; retourne (arr, cash) de forme (size, mois)"""
+    size, seed_seq = task
+    assumptions = _worker_state['assumptions']
+    months_count = _worker_state['months_count']
+    base_plan = _worker_state['plan']
+
+    rng = np.random.default_rng(seed_seq)
+    draws = sample(_worker_state['distributions'], size, rng)
+
+    arr = np.empty((size, months_count))
+    cash = np.empty((size, months_count))
+    for i in range(size):
+        draw = {name: values[i] for name, values in draws.items()}
+        plan = perturbed_plan(base_plan, draw)
+        cols = ArrayProjectionEngine(assumptions, months_count, plan=plan).compute()
+        arr[i] = cols['hub.arr']
+        cash[i] = cols['cash']
+    return arr, cash
+
+
+def run_simulation(assumptions: Dict[str, Any], paths: int, seed: int = 42,
+                   months_count: int = 50, workers: int = None,
+                   chunk_size: int = 1000) -> Dict[str, Any]:
+    """Lancer la simulation et agréger percentiles et probabilités de rupture"""
+    base_plan = AssumptionsPlan(assumptions, months_count)
+    distributions = default_distributions(assumptions, base_plan)
+    distributions.update(assumptions.get('monte_carlo', {}).get('distributions', {}))
+
+    sizes = [chunk_size] * (paths // chunk_size)
+    if paths % chunk_size:
+        sizes.append(paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = list(zip(sizes, seeds))
+
+    workers = workers or os.cpu_count() or 1
+    initargs = (assumptions, months_count, distributions)
+    if workers == 1:
+        _init_worker(*initargs)
+        results = [simulate_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            results = list(pool.map(simulate_chunk, tasks))
+
+    arr = np.concatenate([r[0] for r in results])
+    cash = np.concatenate([r[1] for r in results])
+
+    arr_pct = np.percentile(arr, PERCENTILES, axis=0)
+    cash_pct = np.percentile(cash, PERCENTILES, axis=0)
+
+    # Rupture de cash: cash < 0 sur au moins un mois avant la levée
+    negative = cash < 0
+    funding_risk = []
+    for funding in assumptions['financial_kpis']['cash_management']['fundings']:
+        month = funding['month']
+        before = negative[:, :max(0, min(month, months_count + 1) - 1)]
+        probability = float(before.any(axis=1).mean()) if before.shape[1] else 0.0
+        funding_risk.append({
+            'month': month,
+            'source': funding.get('source', ''),
+            'amount': funding['amount'],
+            'probability_cash_out_before': probability,
+        })
+
+    return {
+        'paths': paths,
+        'seed': seed,
+        'months_count': months_count,
+        'distributions': distributions,
+        'arr': {f'p{p}': arr_pct[i].tolist() for i, p in enumerate(PERCENTILES)},
+        'cash': {f'p{p}': cash_pct[i].tolist() for i, p in enumerate(PERCENTILES)},
+        'probability_cash_out': float(negative.any(axis=1).mean()),
+        'funding_risk': funding_risk,
+    }
+
+
+def main():
+    """Fonction principale"""
+    # Configuration logging (ici et pas à l'import: module aussi importé par d'autres scripts)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    base_path = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="Simulation Monte Carlo des projections")
+    parser.add_argument('--base', type=Path,
+                        default=base_path / "data" / "structured" / "assumptions.yaml",
+                        help="Fichier assumptions.yaml")
+    parser.add_argument('--paths', type=int, default=100000, help="Nombre de tirages")
+    parser.add_argument('--seed', type=int, default=42, help="Graine aléatoire")
+    parser.add_argument('--months', type=int, default=50, help="Horizon en mois")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Nombre de process (défaut: nombre de coeurs)")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="Tirages par bloc")
+    parser.add_argument('--output', type=Path,
+                        default=base_path / "data" / "structured" / "monte_carlo.json",
+                        help="Fichier JSON de sortie")
+    args = parser.parse_args()
+
+    with open(args.base, 'r', encoding='utf-8') as f:
+        assumptions = yaml.safe_load(f)
+
+    logger.info(f"🎲 Monte Carlo: {args.paths:,} tirages, seed {args.seed}, {args.months} mois")
+    start = time.perf_counter()
+    result = run_simulation(assumptions, args.paths, args.seed, args.months,
+                            args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+    logger.info(f"✓ Simulation terminée en {elapsed:.1f}s")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    logger.info(f"📁 Résultats: {args.output}")
+
+    if args.months >= 14:
+        logger.info("\n📊 ARR M14:")
+        for p in PERCENTILES:
+            logger.info(f"  P{p}: {result['arr'][f'p{p}'][13]:,.0f}€")
+    logger.info(f"\n📊 Cash M{args.months}:")
+    for p in PERCENTILES:
+        logger.info(f"  P{p}: {result['cash'][f'p{p}'][-1]:,.0f}€")
+
+    logger.info("\n💰 Risque de rupture de cash avant chaque levée:")
+    for risk in result['funding_risk']:
+        logger.info(
+            f"  M{risk['month']} ({risk['source']}): {risk['probability_cash_out_before']:.1%}"
+        )
+    logger.info(f"  Sur tout l'horizon: {result['probability_cash_out']:.1%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Contexte partagé du pipeline en process
+
+En mode `python run.py --in-process`, toutes les étapes tournent dans le
+même interpréteur. Le contexte garde les fichiers déjà parsés
+(assumptions.yaml, projections) pour que chaque étape ne les relise pas :
+
+    assumptions = load_yaml(assumptions_path)                # parsé une seule fois
+    publish(output_path, 'projections', projections)         # transmis à l'étape suivante
+
+Une entrée est associée à (mtime, taille) du fichier : si le fichier change
+sur disque (étape 2 qui régénère assumptions.yaml, édition manuelle), il
+est relu. Hors contexte actif (script lancé seul), les fonctions lisent
+simplement le fichier.
+
+plan_root() donne la racine des données (data/raw, data/structured,
+data/outputs) : le dépôt, ou le dossier du plan en cours en mode
+portefeuille (run.py --manifest, variable BP_PLAN_DIR).
+
+load_yaml retourne une copie (les étapes peuvent modifier les hypothèses);
+les projections publiées sont partagées telles quelles et doivent être
+traitées en lecture seule.
+"""
+
+import os
+import copy
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Tuple
+
+
+PLAN_ENV_VAR = 'BP_PLAN_DIR'
+
+
+def plan_root() -> Path:
+    """Racine des données du plan courant (BP_PLAN_DIR, sinon racine du dépôt)"""
+    return Path(os.environ.get(PLAN_ENV_VAR) or Path(__file__).parent.parent)
+
+
+class PipelineContext:
+    """Artefacts parsés, indexés par chemin de fichier"""
+
+    def __init__(self):
+        self.artifacts: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: Path, kind: str, loader: Callable[[Path], Any]) -> Any:
+        """Artefact `kind` du fichier (chargé par `loader` si absent ou périmé)"""
+        path = Path(path)
+        key = (str(path.resolve()), kind)
+        stamp = self._stamp(path)
+        cached = self.artifacts.get(key)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        value = loader(path)
+        self.artifacts[key] = (stamp, value)
+        return value
+
+    def put(self, path: Path, kind: str, value: Any):
+        """Enregistrer un artefact que l'étape vient d'écrire sur disque"""
+        path = Path(path)
+        self.artifacts[(str(path.resolve()), kind)] = (self._stamp(path), value)
+
+
+_current: Optional[PipelineContext] = None
+
+
+def activate(context: PipelineContext):
+    global _current
+    _current = context
+
+
+def deactivate():
+    global _current
+    _current = None
+
+
+def current() -> Optional[PipelineContext]:
+    """Contexte actif (None hors run.py --in-process)"""
+    return _current
+
+
+def _read_yaml(path: Path) -> Any:
+    import yaml  # Import différé: run.py --help n'en a pas besoin
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def load_yaml(path: Path) -> Any:
+    """Lire un fichier YAML (parsé une fois par run en mode en process)"""
+    if _current is None:
+        return _read_yaml(path)
+    return copy.deepcopy(_current.get(path, 'yaml', _read_yaml))
+
+
+def publish(path: Path, kind: str, value: Any):
+    """Transmettre un artefact écrit aux étapes suivantes (sans effet hors contexte)"""
+    if _current is not None:
+        _current.put(path, kind, value)
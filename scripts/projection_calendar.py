@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Calendrier des projections
+
+Décrit l'horizon mensuel à partir d'une date de départ et d'un nombre de
+mois, au lieu des bornes codées en dur (M14 / M26 / M38 / M50) :
+  - dates 'YYYY-MM' de chaque mois
+  - périodes annuelles : la 1ère période va du départ jusqu'à décembre de
+    l'année suivante (Nov 2025 → Dec 2026 = 14 mois, libellée 2025), puis
+    années civiles (2027, 2028, ...)
+  - clés de timeline des hypothèses ('m1_m14', 'y2027', ...)
+
+Tout est calculé en un seul passage (coût linéaire en nombre de mois).
+Le pas est mensuel : toutes les hypothèses (clés m{n}, budgets et churn
+mensuels) sont exprimées par mois.
+"""
+
+from typing import Dict, Any, List, Optional
+
+DEFAULT_START_MONTH = '2025-11'  # M1 = Nov 2025
+
+MONTH_NAMES_FR = ['Jan', 'Fév', 'Mars', 'Avr', 'Mai', 'Juin',
+                  'Juil', 'Août', 'Sept', 'Oct', 'Nov', 'Dec']
+
+
+class CalendarPeriod:
+    """Période annuelle du plan (mois first..last inclus)"""
+
+    def __init__(self, year: int, first: int, last: int, first_date: str, last_date: str):
+        self.year = year
+        self.first = first
+        self.last = last
+        self.first_date = first_date
+        self.last_date = last_date
+
+    @property
+    def months(self) -> range:
+        return range(self.first, self.last + 1)
+
+    @property
+    def length(self) -> int:
+        return self.last - self.first + 1
+
+    @property
+    def label(self) -> str:
+        """Libellé d'en-tête: '2025-2026' si la période couvre 2 années civiles"""
+        start_year = int(self.first_date[:4])
+        end_year = int(self.last_date[:4])
+        return str(end_year) if start_year == end_year else f"{start_year}-{end_year}"
+
+    @property
+    def short_label(self) -> str:
+        """Libellé court pour les totaux: '25-26' ou '2027'"""
+        start_year = int(self.first_date[:4])
+        end_year = int(self.last_date[:4])
+        if start_year == end_year:
+            return str(end_year)
+        return f"{start_year % 100:02d}-{end_year % 100:02d}"
+
+
+class ProjectionCalendar:
+    """Calendrier mensuel des projections (départ + horizon)"""
+
+    def __init__(self, months_count: int = 50, start_month: str = DEFAULT_START_MONTH):
+        self.months_count = months_count
+        self.start_month = start_month
+
+        start_year, start_mon = (int(part) for part in str(start_month).split('-')[:2])
+        # 1ère période: jusqu'à décembre de l'année suivante (sauf départ en janvier)
+        first_period_end_year = start_year + 1 if start_mon > 1 else start_year
+
+        self.dates: List[str] = []
+        self.years: List[int] = []
+        self.timeline_keys: List[str] = []
+        self.periods: List[CalendarPeriod] = []
+
+        year, mon = start_year, start_mon
+        for month in range(1, months_count + 1):
+            date = f"{year:04d}-{mon:02d}"
+            label_year = start_year if year <= first_period_end_year else year
+
+            if not self.periods or self.periods[-1].year != label_year:
+                self.periods.append(CalendarPeriod(label_year, month, month, date, date))
+            else:
+                self.periods[-1].last = month
+                self.periods[-1].last_date = date
+
+            self.dates.append(date)
+            self.years.append(label_year)
+
+            mon += 1
+            if mon > 12:
+                year, mon = year + 1, 1
+
+        # Clé de la 1ère période complète (m1_m14), même si l'horizon la tronque
+        first_length = (first_period_end_year - start_year) * 12 + 12 - start_mon + 1
+        for label_year in self.years:
+            if self.periods and label_year == self.periods[0].year:
+                self.timeline_keys.append(f'm1_m{first_length}')
+            else:
+                self.timeline_keys.append(f'y{label_year}')
+
+    @classmethod
+    def from_assumptions(cls, assumptions: Optional[Dict[str, Any]],
+                         months_count: int = 50) -> 'ProjectionCalendar':
+        """Calendrier depuis timeline.start_month d'assumptions.yaml"""
+        timeline = (assumptions or {}).get('timeline', {}) or {}
+        return cls(months_count, str(timeline.get('start_month', DEFAULT_START_MONTH)))
+
+    def date_for_month(self, month: int) -> str:
+        """Date 'YYYY-MM' du mois (M1 = départ)"""
+        return self.dates[month - 1]
+
+    def year_for_month(self, month: int) -> int:
+        """Année de rattachement du mois"""
+        return self.years[month - 1]
+
+    def month_label(self, month: int) -> str:
+        """Libellé lisible du mois (ex: 'Dec 2026')"""
+        year, mon = self.dates[month - 1].split('-')
+        return f"{MONTH_NAMES_FR[int(mon) - 1]} {year}"
+
+    def period_end_months(self) -> List[int]:
+        """Dernier mois de chaque période (milestones annuels)"""
+        return [period.last for period in self.periods]
+
+    @property
+    def span_label(self) -> str:
+        """Libellé de l'horizon (ex: 'Nov2025-Dec2029')"""
+        if not self.dates:
+            return ''
+        names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+        def compact(date: str) -> str:
+            year, mon = date.split('-')
+            return f"{names[int(mon) - 1]}{year}"
+
+        return f"{compact(self.dates[0])}-{compact(self.dates[-1])}"
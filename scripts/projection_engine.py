@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Moteur de projections vectorisé (NumPy)
+
+Alternative "colonnes" à ProjectionCalculator.calculate_month : au lieu de
+construire un dict imbriqué par mois, toutes les métriques (hackathon, factory,
+hub, services, personnel, infra, marketing, cash, EBITDA) sont calculées comme
+des tableaux indexés par mois, en une seule passe.
+
+Les règles métier sont strictement celles de 3_calculate_projections.py
+(mêmes défauts, mêmes arrondis, mêmes types int / float) : les deux
+moteurs doivent produire un JSON identique octet pour octet. Seules deux
+récurrences restent séquentielles :
+  - clients Hub (arrondis à 2 décimales à chaque mois, comme le moteur dict)
+  - cash cumulé (même ordre d'addition que le moteur dict)
+
+Les hypothèses sont lues depuis un AssumptionsPlan compilé (tableaux par mois).
+
+Usage:
+    engine = ArrayProjectionEngine(assumptions, months_count=50)
+    columns = engine.compute()          # Dict[str, np.ndarray]
+    months = engine.to_months(columns)  # format projections_50m.json
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from assumptions_plan import AssumptionsPlan
+
+logger = logging.getLogger(__name__)
+
+
+def _dict_type(value, *operands):
+    """Typer une valeur comme le moteur dict : int si tous ses opérandes sont des int"""
+    return int(value) if all(type(operand) is int for operand in operands) else value
+
+
+class ArrayProjectionEngine:
+    """Moteur de projections par colonnes (un tableau NumPy par métrique)"""
+
+    def __init__(self, assumptions: Dict[str, Any], months_count: int = 50,
+                 plan: Optional[AssumptionsPlan] = None):
+        self.assumptions = assumptions
+        self.months_count = months_count
+        self.plan = plan if plan is not None else AssumptionsPlan(assumptions, months_count)
+        self.months = np.arange(1, months_count + 1)
+
+    def month_dates(self) -> List[str]:
+        """Dates 'YYYY-MM' de M1 à Mn"""
+        return self.plan.calendar.dates
+
+    # ------------------------------------------------------------------
+    # Blocs de calcul
+    # ------------------------------------------------------------------
+
+    def _compute_hub(self, cols: Dict[str, np.ndarray]):
+        """Récurrence clients Hub (churn + upgrades), arrondie comme le moteur dict"""
+        plan = self.plan
+        launch_month = plan.hub_launch_month
+        tier_prices = plan.hub_tier_prices
+        tier_dist = plan.hub_tier_distribution
+        churn_rate = plan.hub_churn_monthly
+        upgrade_rate = plan.hub_upgrade_rate
+        new_customers = plan.hub_new_customers
+
+        n = self.months_count
+        starter = np.zeros(n)
+        business = np.zeros(n)
+        enterprise = np.zeros(n)
+        total = np.zeros(n)
+        mrr = np.zeros(n)
+        new_col = np.zeros(n)
+
+        prev = (0, 0, 0)
+        for month in range(launch_month, n + 1):
+            i = month - 1
+            cs, cb, ce = prev if month > launch_month else (0, 0, 0)
+
+            new = new_customers[i]
+            cs = cs * (1 - churn_rate) + new * tier_dist['starter']
+            cb = cb * (1 - churn_rate) + new * tier_dist['business']
+            ce = ce * (1 - churn_rate) + new * tier_dist['enterprise']
+
+            if month >= launch_month + 3:
+                upgrades = cs * upgrade_rate * 0.1
+                cs -= upgrades
+                cb += upgrades
+
+            mrr[i] = (
+                cs * tier_prices['starter'] +
+                cb * tier_prices['business'] +
+                ce * tier_prices['enterprise']
+            )
+            prev = (round(cs, 2), round(cb, 2), round(ce, 2))
+            starter[i], business[i], enterprise[i] = prev
+            total[i] = round(cs + cb + ce, 2)
+            new_col[i] = new
+
+        cols['hub.starter'] = starter
+        cols['hub.business'] = business
+        cols['hub.enterprise'] = enterprise
+        cols['hub.customers'] = total
+        cols['hub.new_customers'] = new_col
+        cols['hub.mrr'] = mrr
+        cols['hub.arr'] = mrr * 12
+
+    def _compute_personnel(self, cols: Dict[str, np.ndarray]):
+        """Personnel : somme vectorisée des FTE par rôle (ordre des rôles conservé)"""
+        personnel_config = self.assumptions['costs']['personnel']
+        n = self.months_count
+
+        if 'personnel_details' not in self.assumptions:
+            team_size = np.array(self.plan.team_size, dtype=np.int64)
+            employees = np.maximum(0, team_size - 4)  # 4 fondateurs
+            salary_cost = employees * personnel_config['salaries']['employee_monthly']
+            freelance = personnel_config['freelance_monthly_budget']
+            cols['personnel.team_size'] = team_size
+            cols['personnel.employees'] = employees
+            cols['personnel.salary_brut'] = salary_cost.astype(float)
+            cols['personnel.charges_sociales'] = np.zeros(n)
+            cols['personnel.freelance'] = np.full(n, freelance, dtype=float)
+            cols['personnel.total'] = salary_cost + freelance
+            return
+
+        rate = self.assumptions['personnel_details']['charges_sociales_rate']
+        freelance = personnel_config.get('freelance_monthly_budget', 0)
+
+        # Les rôles à 0 FTE ajoutent 0.0 : somme identique au moteur dict
+        total_brut = np.zeros(n)
+        total_fte = np.zeros(n)
+        for role_name, fte_by_month in self.plan.role_fte.items():
+            fte = np.array(fte_by_month, dtype=float)
+            fte[fte < 0] = 0
+            cost = self.plan.role_salary_monthly[role_name] * fte
+            total_brut += cost
+            total_fte += fte
+            cols[f'personnel.roles.{role_name}.fte'] = fte
+            cols[f'personnel.roles.{role_name}.cost_monthly'] = cost
+
+        charges = total_brut * rate
+        cols['personnel.team_size'] = np.rint(total_fte).astype(np.int64)
+        cols['personnel.fte_total'] = total_fte
+        cols['personnel.salary_brut'] = total_brut
+        cols['personnel.charges_sociales'] = charges
+        cols['personnel.freelance'] = np.full(n, freelance, dtype=float)
+        cols['personnel.total'] = total_brut + charges + freelance
+
+    def _compute_infrastructure(self, cols: Dict[str, np.ndarray]):
+        """Infrastructure : cloud par palier de clients + SaaS par utilisateur"""
+        nb_clients = cols['hub.customers']
+        team_size = cols['personnel.team_size']
+
+        if 'infrastructure_costs' not in self.assumptions:
+            infra_config = self.assumptions['costs']['infrastructure']
+            tools = sum(infra_config['tools_monthly'].values())
+            cols['infra.total'] = (
+                infra_config['base_monthly'] +
+                nb_clients * infra_config['per_client_monthly'] +
+                tools
+            )
+            return
+
+        infra = self.assumptions['infrastructure_costs']
+        scaling_tiers = infra['cloud'].get('scaling_tiers', {})
+        cost_per_client = np.select(
+            [nb_clients > 100, nb_clients > 50],
+            [
+                scaling_tiers.get('tier3', {}).get('cost_per_client', 30),
+                scaling_tiers.get('tier2', {}).get('cost_per_client', 40)
+            ],
+            default=scaling_tiers.get('tier1', {}).get('cost_per_client', 50)
+        )
+        cloud = infra['cloud']['base_monthly'] + nb_clients * cost_per_client
+        cols['infra.cost_per_client'] = cost_per_client
+
+        saas_tools = infra['saas_tools']
+        notion = np.maximum(team_size, saas_tools['notion'].get('min_users', 5)) * saas_tools['notion']['cost_per_user']
+        slack = np.maximum(team_size, saas_tools['slack'].get('min_users', 5)) * saas_tools['slack']['cost_per_user']
+        github = np.maximum(team_size // 2, saas_tools['github'].get('min_users', 2)) * saas_tools['github']['cost_per_developer']
+        analytics = saas_tools.get('analytics', {}).get('monthly_flat', 0)
+        crm = np.maximum(team_size // 4, saas_tools['crm'].get('min_users', 2)) * saas_tools['crm']['cost_per_user']
+        saas = notion + slack + github + analytics + crm
+
+        rd_external = infra.get('rd_external', {}).get('monthly_budget', 0)
+
+        cols['infra.cloud'] = cloud
+        cols['infra.saas_tools'] = saas
+        cols['infra.rd_external'] = np.full(self.months_count, rd_external)
+        cols['infra.total'] = cloud + saas + rd_external
+
+    def _compute_marketing(self, cols: Dict[str, np.ndarray]):
+        """Marketing : budgets annuels par canal, events trimestriels"""
+        quarter = self.months % 3 == 0
+
+        if 'marketing_budgets' not in self.assumptions:
+            marketing_config = self.assumptions['costs']['marketing']
+            events = np.where(
+                np.isin(self.months, [3, 6, 9, 12]),
+                marketing_config['events_quarterly'], 0
+            )
+            cols['marketing.total'] = (
+                marketing_config['base_monthly'] + marketing_config['content_monthly'] + events
+            )
+            return
+
+        budgets = {channel: np.array(values) for channel, values in self.plan.marketing.items()}
+        digital = budgets['digital_ads']
+        events = np.where(quarter, budgets['events'] * 3, 0)
+        content = budgets['content']
+        partnerships = budgets['partnerships']
+
+        cols['marketing.digital_ads'] = digital
+        cols['marketing.events'] = events
+        cols['marketing.content'] = content
+        cols['marketing.partnerships'] = partnerships
+        cols['marketing.total'] = digital + events + content + partnerships
+
+    def compute(self) -> Dict[str, np.ndarray]:
+        """Calculer toutes les métriques M1-Mn en colonnes"""
+        n = self.months_count
+        plan = self.plan
+
+        cols: Dict[str, np.ndarray] = {'month': self.months, 'year': np.array(plan.years)}
+
+        # REVENUS - Hackathons
+        hack_volume = np.array(plan.hackathon_volume, dtype=float)
+        hack_price = np.array(plan.hackathon_price, dtype=float)
+        cols['hackathon.volume'] = hack_volume
+        cols['hackathon.price_unit'] = hack_price
+        cols['hackathon.revenue'] = hack_volume * hack_price
+
+        # REVENUS - Factory (conversion des hackathons M - delay)
+        source_month = self.months - plan.factory_delay
+        active = source_month >= 1
+        source_hackathons = np.zeros(n)
+        source_hackathons[active] = hack_volume[source_month[active] - 1]
+        factory_price = np.where(active, np.array(plan.factory_price, dtype=float), 0)
+        factory_volume = source_hackathons * plan.factory_conversion_rate
+        cols['factory.source_month'] = source_month
+        cols['factory.source_hackathons'] = source_hackathons
+        cols['factory.volume'] = factory_volume
+        cols['factory.price_unit'] = factory_price
+        cols['factory.revenue'] = factory_volume * factory_price
+
+        # REVENUS - Enterprise Hub
+        self._compute_hub(cols)
+
+        # REVENUS - Services (50% hackathons + 20% factory)
+        services_volume = hack_volume * 0.5 + factory_volume * 0.2
+        services_price = np.array(plan.services_price, dtype=float)
+        cols['services.volume'] = services_volume
+        cols['services.price_unit'] = services_price
+        cols['services.revenue'] = services_volume * services_price
+
+        cols['revenue.total'] = (
+            cols['hackathon.revenue'] +
+            cols['factory.revenue'] +
+            cols['hub.mrr'] +
+            cols['services.revenue']
+        )
+
+        # COÛTS
+        self._compute_personnel(cols)
+        self._compute_infrastructure(cols)
+        self._compute_marketing(cols)
+        admin = self.assumptions['costs']['office_admin']['monthly']
+        cols['admin'] = np.full(n, admin)
+
+        cols['costs.total'] = (
+            cols['personnel.total'] +
+            cols['infra.total'] +
+            cols['marketing.total'] +
+            admin
+        )
+
+        # MÉTRIQUES
+        ebitda = cols['revenue.total'] - cols['costs.total']
+        cols['ebitda'] = ebitda
+        cols['burn_rate'] = np.where(ebitda < 0, -ebitda, 0)
+
+        funding = np.array(plan.funding, dtype=float)
+        cols['funding'] = funding
+
+        # Cash cumulé (même ordre d'addition que le moteur dict)
+        cash = np.empty(n)
+        prev_cash = 0
+        revenue_total = cols['revenue.total'].tolist()
+        costs_total = cols['costs.total'].tolist()
+        funding_list = funding.tolist()
+        for i in range(n):
+            prev_cash = prev_cash + revenue_total[i] - costs_total[i] + funding_list[i]
+            cash[i] = prev_cash
+        cols['cash'] = cash
+
+        return cols
+
+    # ------------------------------------------------------------------
+    # Conversion vers le format JSON historique
+    # ------------------------------------------------------------------
+
+    def to_months(self, cols: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Convertir les colonnes au format liste de dicts (projections_50m.json)
+
+        Les valeurs reprises du plan (volumes, prix, FTE, levées...) ne
+        passent pas par les tableaux float : leurs types (int / float) et
+        ceux des valeurs calculées sont ceux du moteur dict, pour un JSON
+        identique octet pour octet quel que soit le moteur.
+        """
+        lists = {key: values.tolist() for key, values in cols.items()}
+        plan = self.plan
+        dates = self.month_dates()
+        launch_month = self.assumptions['pricing']['enterprise_hub']['launch_month']
+        detailed_personnel = 'personnel_details' in self.assumptions
+        detailed_infra = 'infrastructure_costs' in self.assumptions
+        detailed_marketing = 'marketing_budgets' in self.assumptions
+        role_salaries = plan.role_salary_monthly
+        role_names = list(role_salaries)
+        personnel_config = self.assumptions['costs']['personnel']
+        freelance = personnel_config.get('freelance_monthly_budget', 0)
+        if detailed_personnel:
+            charges_rate = self.assumptions['personnel_details']['charges_sociales_rate']
+        if detailed_infra:
+            infra = self.assumptions['infrastructure_costs']
+            cloud_base = infra['cloud']['base_monthly']
+            rd_external = infra.get('rd_external', {}).get('monthly_budget', 0)
+        else:
+            infra_config = self.assumptions['costs']['infrastructure']
+            infra_operands = (infra_config['base_monthly'], infra_config['per_client_monthly'],
+                              sum(infra_config['tools_monthly'].values()))
+
+        months_data = []
+        cash = 0
+        for i in range(self.months_count):
+            month = i + 1
+            hack_volume = plan.hackathon_volume[i]
+            hack_price = plan.hackathon_price[i]
+
+            source_month = lists['factory.source_month'][i]
+            if source_month < 1:
+                factory = {'volume': 0, 'price_unit': 0, 'revenue': 0}
+            else:
+                source_hackathons = plan.hackathon_volume[source_month - 1]
+                factory_volume = _dict_type(lists['factory.volume'][i], source_hackathons,
+                                            plan.factory_conversion_rate)
+                factory_price = plan.factory_price[i]
+                factory = {
+                    'volume': factory_volume,
+                    'price_unit': factory_price,
+                    'revenue': _dict_type(lists['factory.revenue'][i], factory_volume, factory_price),
+                    'source_month': source_month,
+                    'source_hackathons': source_hackathons
+                }
+
+            if month < launch_month:
+                hub = {
+                    'customers': {'starter': 0, 'business': 0, 'enterprise': 0, 'total': 0},
+                    'mrr': 0,
+                    'arr': 0
+                }
+            else:
+                hub = {
+                    'customers': {
+                        'starter': lists['hub.starter'][i],
+                        'business': lists['hub.business'][i],
+                        'enterprise': lists['hub.enterprise'][i],
+                        'total': lists['hub.customers'][i]
+                    },
+                    'new_customers': plan.hub_new_customers[i],
+                    'mrr': lists['hub.mrr'][i],
+                    'arr': lists['hub.arr'][i]
+                }
+
+            if detailed_personnel:
+                roles = {}
+                for role_name in role_names:
+                    fte = plan.role_fte[role_name][i]
+                    if fte > 0:
+                        salary_monthly = role_salaries[role_name]
+                        roles[role_name] = {
+                            'fte': fte,
+                            'salary_monthly': salary_monthly,
+                            'cost_monthly': _dict_type(
+                                lists[f'personnel.roles.{role_name}.cost_monthly'][i], salary_monthly, fte
+                            )
+                        }
+                salary_brut = _dict_type(lists['personnel.salary_brut'][i],
+                                         *(role['cost_monthly'] for role in roles.values()))
+                charges = _dict_type(lists['personnel.charges_sociales'][i], salary_brut, charges_rate)
+                personnel = {
+                    'team_size': lists['personnel.team_size'][i],
+                    'fte_total': _dict_type(lists['personnel.fte_total'][i],
+                                            *(role['fte'] for role in roles.values())),
+                    'salary_brut': salary_brut,
+                    'charges_sociales': charges,
+                    'freelance': freelance,
+                    'total': _dict_type(lists['personnel.total'][i], salary_brut, charges, freelance),
+                    'roles': roles
+                }
+            else:
+                salary_cost = _dict_type(lists['personnel.salary_brut'][i],
+                                         personnel_config['salaries']['employee_monthly'])
+                personnel = {
+                    'team_size': lists['personnel.team_size'][i],
+                    'employees': lists['personnel.employees'][i],
+                    'salary_cost': salary_cost,
+                    'freelance': freelance,
+                    'total': _dict_type(lists['personnel.total'][i], salary_cost, freelance)
+                }
+
+            nb_clients = hub['customers']['total']
+            if detailed_infra:
+                cloud = _dict_type(lists['infra.cloud'][i], cloud_base, nb_clients,
+                                   lists['infra.cost_per_client'][i])
+                saas = lists['infra.saas_tools'][i]
+                infrastructure = {
+                    'cloud': cloud,
+                    'saas_tools': saas,
+                    'rd_external': rd_external,
+                    'total': _dict_type(lists['infra.total'][i], cloud, saas, rd_external)
+                }
+            else:
+                infrastructure = {'total': _dict_type(lists['infra.total'][i], nb_clients, *infra_operands)}
+
+            if detailed_marketing:
+                budgets = [plan.marketing[channel][i] for channel in ('digital_ads', 'content', 'partnerships')]
+                events = plan.marketing['events'][i] * 3 if month % 3 == 0 else 0
+                marketing = {
+                    'digital_ads': budgets[0],
+                    'events': events,
+                    'content': budgets[1],
+                    'partnerships': budgets[2],
+                    'total': _dict_type(lists['marketing.total'][i], events, *budgets)
+                }
+            else:
+                marketing = {'total': lists['marketing.total'][i]}
+
+            hack_revenue = _dict_type(lists['hackathon.revenue'][i], hack_volume, hack_price)
+            revenue_total = _dict_type(lists['revenue.total'][i], hack_revenue, factory['revenue'],
+                                       hub['mrr'], lists['services.revenue'][i])
+            admin = lists['admin'][i]
+            costs_total = _dict_type(lists['costs.total'][i], personnel['total'], infrastructure['total'],
+                                     marketing['total'], admin)
+            ebitda = _dict_type(lists['ebitda'][i], revenue_total, costs_total)
+            funding = plan.funding[i]
+            cash = _dict_type(lists['cash'][i], cash, revenue_total, costs_total, funding)
+
+            months_data.append({
+                'month': month,
+                'date': dates[i],
+                'year': lists['year'][i],
+                'revenue': {
+                    'hackathon': {
+                        'volume': hack_volume,
+                        'price_unit': hack_price,
+                        'revenue': hack_revenue
+                    },
+                    'factory': factory,
+                    'enterprise_hub': hub,
+                    'services': {
+                        'volume': lists['services.volume'][i],
+                        'price_unit': plan.services_price[i],
+                        'revenue': lists['services.revenue'][i]
+                    },
+                    'total': revenue_total
+                },
+                'costs': {
+                    'personnel': personnel,
+                    'infrastructure': infrastructure,
+                    'marketing': marketing,
+                    'admin': admin,
+                    'total': costs_total
+                },
+                'metrics': {
+                    'ebitda': ebitda,
+                    'burn_rate': -ebitda if ebitda < 0 else 0,
+                    'arr': hub['arr'],
+                    'mrr': hub['mrr'],
+                    'cash': cash,
+                    'funding': funding,
+                    'team_size': lists['personnel.team_size'][i]
+                }
+            })
+
+        return months_data
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Lecture / écriture streaming des projections
+
+Format JSON Lines (.jsonl) : une ligne JSON compacte par mois, écrite au fil
+du calcul. Les consommateurs lisent ligne à ligne et peuvent ne garder que
+certains mois ou certaines métriques, sans charger tout le fichier.
+
+Les runs batch ajoutent leurs mois au même fichier (mode append), chaque
+ligne portant un tag `scenario`.
+
+L'ancien format (liste JSON indentée, projections_50m.json) reste lisible :
+load_projections() accepte les deux, et peut retourner un ProjectionStore
+columnaire (columnar=True).
+
+Usage:
+    with JsonlProjectionWriter(path) as writer:
+        for month_data in calculator.iter_months():
+            writer.write(month_data)
+
+    for row in iter_projections(path, months=[14, 50], fields=['metrics.arr']):
+        ...
+"""
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Any, List, Iterable, Iterator, Optional
+
+import pipeline_context
+
+
+class JsonlProjectionWriter:
+    """Écriture d'un mois par ligne (fichier ouvert en continu)"""
+
+    def __init__(self, path: Path, append: bool = False):
+        self.path = Path(path)
+        self.append = append
+        self.count = 0
+        self._file = None
+
+    def __enter__(self) -> 'JsonlProjectionWriter':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a' if self.append else 'w', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        self._file = None
+
+    def write(self, month_data: Dict[str, Any], scenario: Optional[Any] = None):
+        """Écrire un mois (tagué par scénario pour les runs batch)"""
+        if not isinstance(month_data, dict):
+            month_data = month_data.to_dict()  # Vue MonthView (ProjectionStore)
+        if scenario is not None:
+            month_data = {'scenario': scenario, **month_data}
+        self._file.write(json.dumps(month_data, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+        self.count += 1
+
+    def write_all(self, months: Iterable[Dict[str, Any]], scenario: Optional[Any] = None):
+        """Écrire une suite de mois (générateur accepté)"""
+        for month_data in months:
+            self.write(month_data, scenario)
+
+
+def get_field(data: Dict[str, Any], path: str) -> Any:
+    """Lire un chemin pointé ('metrics.arr', 'revenue.hackathon.volume')"""
+    for key in path.split('.'):
+        if not isinstance(data, Mapping) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def iter_projections(path: Path, months: Optional[Iterable[int]] = None,
+                     fields: Optional[List[str]] = None,
+                     scenario: Optional[Any] = None) -> Iterator[Dict[str, Any]]:
+    """Itérer les mois d'un fichier .jsonl (filtrage mois / métriques / scénario)
+
+    fields : chemins pointés à extraire; chaque ligne devient alors un dict
+    plat {'month': n, 'metrics.arr': ...} au lieu du mois complet.
+    """
+    wanted = set(months) if months is not None else None
+    last_wanted = max(wanted) if wanted else None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            month_data = json.loads(line)
+            tagged = 'scenario' in month_data
+
+            if scenario is not None and month_data.get('scenario') != scenario:
+                continue
+
+            month = month_data['month']
+            if wanted is not None and month not in wanted:
+                # Fichier mono-scénario trié par mois: inutile de lire la suite
+                if not tagged and month > last_wanted:
+                    break
+                continue
+
+            if fields is not None:
+                row = {'month': month}
+                if tagged:
+                    row['scenario'] = month_data['scenario']
+                for field in fields:
+                    row[field] = get_field(month_data, field)
+                yield row
+            else:
+                yield month_data
+
+
+def load_projections(path: Path, columnar: bool = False):
+    """Charger toutes les projections (.jsonl ou ancien .json indenté)
+
+    columnar=True : ProjectionStore (une colonne par métrique, vues mois à
+    __slots__) au lieu d'une liste de dicts; même accès p['metrics']['arr'].
+    """
+    path = Path(path)
+    context = pipeline_context.current()
+    if context is not None and not columnar:
+        # Mode en process: projections publiées par l'étape 3 ou déjà lues
+        return context.get(path, 'projections', _read_projections)
+    if columnar:
+        from projection_store import ProjectionStore
+        if path.suffix == '.jsonl':
+            return ProjectionStore.from_months(iter_projections(path))
+        return ProjectionStore.from_months(_read_projections(path))
+    return _read_projections(path)
+
+
+def _read_projections(path: Path) -> List[Dict[str, Any]]:
+    if path.suffix == '.jsonl':
+        return list(iter_projections(path))
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def find_projections(structured_dir: Path, name: str = 'projections_50m') -> Path:
+    """Fichier de projections le plus récent entre {name}.jsonl et {name}.json
+
+    Retourne le chemin .jsonl si aucun des deux n'existe (message d'erreur
+    des scripts appelants).
+    """
+    candidates = [Path(structured_dir) / f"{name}{suffix}" for suffix in ('.jsonl', '.json')]
+    existing = [path for path in candidates if path.exists()]
+    if not existing:
+        return candidates[0]
+    return max(existing, key=lambda path: path.stat().st_mtime)
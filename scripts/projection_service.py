@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Service HTTP local de projections
+
+Petit serveur HTTP (bibliothèque standard uniquement, hors ligne) autour de
+ProjectionCalculator et des checks du Validator, pour les outils qui
+lançaient les scripts en sous-process :
+
+    POST /projections?months=50&engine=array&fields=metrics.arr,metrics.cash
+        corps : assumptions en JSON (Content-Type application/json) ou YAML
+        réponse : {hash, months, engine, cached, projections, validation}
+    GET  /health
+        réponse : {status, cache: {size, hits, misses}, workers}
+
+Les calculs (CPU) tournent dans un pool de process; la boucle asyncio
+accepte les requêtes en parallèle. Les résultats sont mémorisés dans un
+cache LRU indexé par le hash SHA-256 des assumptions (+ horizon, moteur);
+deux requêtes identiques simultanées partagent le même calcul. Les
+projections en cache sont gardées en colonnes (ProjectionStore, ~3x moins
+de mémoire que les dicts par mois) et reconverties en JSON à l'envoi.
+
+fields : chemins pointés (cf. projection_io.get_field) pour ne renvoyer
+que quelques courbes; chaque mois devient {'month': n, 'metrics.arr': ...}.
+
+Les checks retournés sont ceux qui ne lisent que projections et
+assumptions (ARR, cash, burn, équipe, conversions); les checks Excel /
+Word restent dans 6_validate.py.
+
+Usage:
+    python scripts/projection_service.py --port 8765
+    python scripts/projection_service.py --unix /tmp/bp.sock
+    curl --data-binary @data/structured/assumptions.yaml \\
+        'http://127.0.0.1:8765/projections?fields=metrics.arr,metrics.cash'
+"""
+
+import io
+import os
+import json
+import asyncio
+import hashlib
+import logging
+import argparse
+import importlib
+import contextlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+
+import yaml
+
+from projection_io import get_field
+from projection_store import ProjectionStore, MonthView
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_MONTHS = 600
+
+# Checks du Validator sans fichier Excel / Word
+VALIDATION_CHECKS = [
+    'check_arr_targets',
+    'check_cash_position',
+    'check_burn_rate',
+    'check_team_size',
+    'check_conversion_rates',
+]
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 422: 'Unprocessable Entity', 500: 'Internal Server Error'}
+
+
+class ServiceError(Exception):
+    """Erreur renvoyée au client avec un code HTTP"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def assumptions_hash(assumptions: Dict[str, Any], months_count: int, engine: str) -> str:
+    """Clé du cache: contenu canonique des assumptions + horizon + moteur"""
+    canonical = json.dumps([assumptions, months_count, engine], sort_keys=True,
+                           separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class LRUCache:
+    """Cache LRU des résultats de calcul"""
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key: str, value: Dict[str, Any]):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self.entries), 'max_size': self.max_size,
+                'hits': self.hits, 'misses': self.misses}
+
+
+# Modules de calcul (importés une fois par worker)
+_worker_modules: Dict[str, Any] = {}
+
+
+def _init_worker():
+    """Initialiser un worker: modules importés, logs des étapes masqués"""
+    logging.disable(logging.INFO)
+    _worker_modules['calculation'] = importlib.import_module('3_calculate_projections')
+    _worker_modules['validate'] = importlib.import_module('6_validate')
+
+
+def compute(assumptions: Dict[str, Any], months_count: int, engine: str) -> Dict[str, Any]:
+    """Projections + checks pour un jeu d'assumptions (exécuté dans un worker)"""
+    if not _worker_modules:
+        _init_worker()
+    calculation = _worker_modules['calculation']
+    validate = _worker_modules['validate']
+
+    try:
+        calculator = calculation.ProjectionCalculator(
+            assumptions, months_count=months_count, engine=engine
+        )
+        projections = calculator.calculate_all_months()
+    except (KeyError, TypeError, ValueError, IndexError, AttributeError) as e:
+        return {'error': f"Calcul impossible - {type(e).__name__}: {e}"}
+
+    validator = validate.Validator(projections, assumptions)
+    skipped = []
+    with contextlib.redirect_stdout(io.StringIO()):  # Affichage rich des checks
+        for check in VALIDATION_CHECKS:
+            try:
+                getattr(validator, check)()
+            except (KeyError, TypeError, IndexError, ValueError) as e:
+                skipped.append(f"{check}: {type(e).__name__}: {e}")
+
+    return {
+        'projections': projections,
+        'validation': {
+            'passed': validator.checks_passed,
+            'warnings': validator.warnings,
+            'errors': validator.errors,
+            'skipped': skipped,
+        },
+    }
+
+
+def parse_assumptions(body: bytes, content_type: str) -> Dict[str, Any]:
+    """Assumptions du corps de requête (JSON ou YAML)"""
+    try:
+        text = body.decode('utf-8')
+        if 'json' in content_type:
+            assumptions = json.loads(text)
+        else:
+            assumptions = yaml.safe_load(text)  # YAML (JSON inclus)
+    except (UnicodeDecodeError, json.JSONDecodeError, yaml.YAMLError) as e:
+        raise ServiceError(400, f"Assumptions illisibles: {e}")
+    if not isinstance(assumptions, dict):
+        raise ServiceError(400, "Les assumptions doivent être un objet (mapping)")
+    return assumptions
+
+
+def select_fields(projections: Iterable[Mapping], fields: List[str]) -> List[Dict[str, Any]]:
+    """Ne garder que certaines métriques (courbes) par mois (dicts ou vues du store)"""
+    rows = []
+    for month_data in projections:
+        row = {'month': month_data['month']}
+        for field in fields:
+            value = get_field(month_data, field)
+            row[field] = value.to_dict() if isinstance(value, MonthView) else value
+        rows.append(row)
+    return rows
+
+
+class ProjectionService:
+    """Service de projections: cache LRU + pool de process"""
+
+    def __init__(self, workers: int = None, cache_size: int = 128):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = LRUCache(cache_size)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        self.in_flight: Dict[str, asyncio.Future] = {}
+
+    async def projections(self, assumptions: Dict[str, Any], months_count: int,
+                          engine: str) -> Tuple[str, Dict[str, Any], bool]:
+        """Résultat (hash, résultat, servi par le cache)"""
+        key = assumptions_hash(assumptions, months_count, engine)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return key, cached, True
+
+        future = self.in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.pool, compute, assumptions, months_count, engine)
+            self.in_flight[key] = future
+            try:
+                result = await future
+            finally:
+                del self.in_flight[key]
+            if 'error' not in result:
+                self.cache.put(key, {**result, 'projections': ProjectionStore.from_months(result['projections'])})
+        else:
+            result = await asyncio.shield(future)  # Même calcul déjà en cours
+        return key, result, False
+
+    async def handle(self, method: str, target: str, headers: Dict[str, str],
+                     body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Router une requête -> (statut HTTP, réponse JSON)"""
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+
+        if url.path == '/health':
+            if method != 'GET':
+                raise ServiceError(405, "GET attendu")
+            return 200, {'status': 'ok', 'cache': self.cache.stats(), 'workers': self.workers}
+
+        if url.path != '/projections':
+            raise ServiceError(404, f"Route inconnue: {url.path}")
+        if method != 'POST':
+            raise ServiceError(405, "POST attendu (assumptions dans le corps)")
+
+        calculation = importlib.import_module('3_calculate_projections')
+        engine = query.get('engine', ['dict'])[0]
+        if engine not in calculation.ENGINES:
+            raise ServiceError(400, f"Moteur inconnu: {engine} (attendu: {', '.join(calculation.ENGINES)})")
+        try:
+            months_count = int(query.get('months', ['50'])[0])
+        except ValueError:
+            raise ServiceError(400, "months doit être un entier")
+        if not 14 <= months_count <= MAX_MONTHS:
+            raise ServiceError(400, f"months hors bornes (14-{MAX_MONTHS})")
+
+        assumptions = parse_assumptions(body, headers.get('content-type', ''))
+        key, result, cached = await self.projections(assumptions, months_count, engine)
+        if 'error' in result:
+            raise ServiceError(422, result['error'])
+
+        projections = result['projections']
+        if 'fields' in query:
+            fields = [field for value in query['fields'] for field in value.split(',') if field]
+            projections = select_fields(projections, fields)
+        elif isinstance(projections, ProjectionStore):
+            projections = projections.to_months()
+        return 200, {
+            'hash': key,
+            'months': months_count,
+            'engine': engine,
+            'cached': cached,
+            'projections': projections,
+            'validation': result['validation'],
+        }
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Traiter une connexion HTTP/1.1 (une requête, puis fermeture)"""
+        try:
+            try:
+                request_line = (await reader.readline()).decode('latin-1').strip()
+                method, target, _ = request_line.split(' ', 2)
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode('latin-1').strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY_BYTES:
+                    raise ServiceError(413, f"Corps limité à {MAX_BODY_BYTES // (1024 * 1024)} Mo")
+                body = await reader.readexactly(length) if length else b''
+                status, payload = await self.handle(method.upper(), target, headers, body)
+            except ServiceError as e:
+                status, payload = e.status, {'error': str(e)}
+            except (ValueError, asyncio.IncompleteReadError):
+                status, payload = 400, {'error': "Requête HTTP invalide"}
+            except Exception as e:
+                logger.exception("❌ Erreur interne")
+                status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+            content = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(content)}\r\n"
+                f"Connection: close\r\n\r\n".encode('latin-1') + content
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass  # Client parti
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(service: ProjectionService, host: str, port: int, unix_path: str = None):
+    """Démarrer le serveur (TCP local ou socket Unix)"""
+    if unix_path:
+        server = await asyncio.start_unix_server(service.serve_connection, path=unix_path)
+        logger.info(f"🌐 Service projections sur unix:{unix_path}")
+    else:
+        server = await asyncio.start_server(service.serve_connection, host, port)
+        logger.info(f"🌐 Service projections sur http://{host}:{port}")
+    logger.info(f"  • {service.workers} worker(s), cache LRU {service.cache.max_size} entrées")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Service HTTP local de projections")
+    parser.add_argument('--host', default='127.0.0.1', help="Adresse d'écoute (défaut: locale)")
+    parser.add_argument('--port', type=int, default=8765, help="Port TCP")
+    parser.add_argument('--unix', default=None, help="Socket Unix (au lieu de TCP)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Process de calcul (défaut: nombre de coeurs)")
+    parser.add_argument('--cache-size', type=int, default=128,
+                        help="Résultats gardés en cache (LRU)")
+    args = parser.parse_args()
+
+    service = ProjectionService(args.workers, args.cache_size)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        logger.info("👋 Service arrêté")
+    finally:
+        service.close()
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Stockage columnaire des projections
+
+Chaque mois de projections_50m.json est un dict imbriqué qui répète les
+mêmes clés (revenue.hackathon.volume, costs.personnel.roles.<rôle>.fte...)
+à chaque mois. ProjectionStore garde à la place un tableau contigu par
+métrique (chemin pointé), indexé par mois :
+
+    store = ProjectionStore.from_months(projections)
+    store.column('metrics.arr')          # np.ndarray (M1..Mn)
+    store[13]['metrics']['arr']          # vue ligne, même accès qu'un dict
+    store.to_months() == projections     # conversion sans perte
+
+Les vues (MonthView) sont des Mapping légers à __slots__ : le code existant
+(injecteur, validateurs, générateurs Excel) les lit comme les dicts JSON.
+
+Conversion sans perte : l'ordre des clés, les entiers vs flottants et les
+clés absentes certains mois (ex: new_customers avant le lancement du Hub,
+rôles à 0 FTE) sont conservés, donc json.dumps(store.to_months()) est
+identique à l'original.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+# Marqueurs internes: dict vide (feuille sans valeur scalaire) et clé absente
+_EMPTY = object()
+_MISSING = object()
+
+
+class Column:
+    """Valeurs d'une métrique sur tous les mois
+
+    numeric : float64 contigu (+ masque des entiers d'origine si mélange)
+    sinon   : liste Python (dates, valeurs non numériques)
+    present : masque des mois où la clé existe (None = tous)
+    """
+
+    __slots__ = ('values', 'is_int', 'present', 'numeric')
+
+    def __init__(self, values: Union[np.ndarray, List[Any]], numeric: bool,
+                 is_int: Optional[np.ndarray] = None, present: Optional[np.ndarray] = None):
+        self.values = values
+        self.numeric = numeric
+        self.is_int = is_int
+        self.present = present
+
+    @classmethod
+    def build(cls, cells: List[Any], months_count: int) -> 'Column':
+        """Construire une colonne depuis les valeurs par mois (_MISSING = absente)"""
+        present = np.array([cell is not _MISSING for cell in cells], dtype=bool)
+        values = [cell for cell in cells if cell is not _MISSING]
+
+        numeric = all(
+            type(value) in (int, float) and (type(value) is float or float(value) == value)
+            for value in values
+        )
+        if not numeric:
+            return cls(list(cells), False, present=None if present.all() else present)
+
+        dense = np.zeros(months_count)
+        dense[present] = values
+        flags = np.zeros(months_count, dtype=bool)
+        flags[present] = [type(value) is int for value in values]
+
+        is_int: Optional[np.ndarray] = flags
+        if not flags[present].any():
+            is_int = None  # Que des flottants
+        return cls(dense, True, is_int=is_int, present=None if present.all() else present)
+
+    def has(self, index: int) -> bool:
+        return self.present is None or bool(self.present[index])
+
+    def get(self, index: int) -> Any:
+        """Valeur au mois `index` (0 = M1), avec son type d'origine"""
+        if not self.numeric:
+            value = self.values[index]
+            return {} if value is _EMPTY else value
+        value = self.values[index]
+        if self.is_int is not None and self.is_int[index]:
+            return int(value)
+        return float(value)
+
+    @property
+    def nbytes(self) -> int:
+        size = self.values.nbytes if self.numeric else 8 * len(self.values)
+        for mask in (self.is_int, self.present):
+            if mask is not None:
+                size += mask.nbytes
+        return size
+
+
+def _flatten(data: Dict[str, Any], prefix: str, out: List[tuple]):
+    """Aplatir un mois en [(chemin, valeur)] dans l'ordre des clés"""
+    for key, value in data.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            _flatten(value, f'{path}.', out)
+        else:
+            out.append((path, _EMPTY if isinstance(value, dict) else value))
+
+
+class ProjectionStore:
+    """Projections en colonnes contiguës, une par chemin de métrique"""
+
+    def __init__(self, columns: Dict[str, Column], order: List[str], months_count: int):
+        self.columns = columns
+        self.order = order
+        self.months_count = months_count
+        self._build_tree()
+
+    @classmethod
+    def from_months(cls, months: Iterable[Dict[str, Any]]) -> 'ProjectionStore':
+        """Construire depuis des mois au format JSON (liste ou générateur)"""
+        # Ordre des clés en liste chaînée (clé -> suivante): insertion en O(1)
+        following: Dict[Optional[str], Optional[str]] = {None: None}
+        cells: Dict[str, List[Any]] = {}
+        months_count = 0
+
+        for month_data in months:
+            flat: List[tuple] = []
+            _flatten(month_data, '', flat)
+
+            previous = None
+            for path, value in flat:
+                if path not in cells:
+                    # Nouvelle clé: insérée après la clé qui la précède ce mois-ci
+                    following[path] = following[previous]
+                    following[previous] = path
+                    cells[path] = [_MISSING] * months_count
+                cells[path].append(value)
+                previous = path
+
+            months_count += 1
+            for column_cells in cells.values():
+                if len(column_cells) < months_count:
+                    column_cells.append(_MISSING)
+
+        order: List[str] = []
+        path = following[None]
+        while path is not None:
+            order.append(path)
+            path = following[path]
+
+        columns = {path: Column.build(cells[path], months_count) for path in order}
+        return cls(columns, order, months_count)
+
+    def _build_tree(self):
+        """Index des enfants et présence par nœud (pour les vues)"""
+        self._children: Dict[str, List[str]] = {'': []}
+        self._node_present: Dict[str, Optional[np.ndarray]] = {}
+
+        for path in self.order:
+            parts = path.split('.')
+            for depth in range(len(parts)):
+                parent = '.'.join(parts[:depth])
+                node = '.'.join(parts[:depth + 1])
+                present = self.columns[path].present
+                if node not in self._node_present:
+                    # Nœud vu pour la première fois: ajouté aux enfants de son parent
+                    self._children.setdefault(parent, []).append(parts[depth])
+                    self._node_present[node] = None if present is None else present.copy()
+                elif self._node_present[node] is not None:
+                    if present is None:
+                        self._node_present[node] = None
+                    else:
+                        self._node_present[node] |= present
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.months_count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union['MonthView', List['MonthView']]:
+        if isinstance(index, slice):
+            return [MonthView(self, i, '') for i in range(*index.indices(self.months_count))]
+        if index < 0:
+            index += self.months_count
+        if not 0 <= index < self.months_count:
+            raise IndexError(index)
+        return MonthView(self, index, '')
+
+    def __iter__(self) -> Iterator['MonthView']:
+        for index in range(self.months_count):
+            yield MonthView(self, index, '')
+
+    def column(self, path: str) -> np.ndarray:
+        """Tableau d'une métrique numérique (NaN les mois où elle est absente)"""
+        column = self.columns[path]
+        if not column.numeric:
+            raise TypeError(f"Colonne non numérique: {path}")
+        if column.present is None:
+            return column.values
+        return np.where(column.present, column.values, np.nan)
+
+    @property
+    def nbytes(self) -> int:
+        """Taille des données (hors index de structure)"""
+        return sum(column.nbytes for column in self.columns.values())
+
+    # ------------------------------------------------------------------
+    # Conversion format JSON
+    # ------------------------------------------------------------------
+
+    def month_dict(self, index: int) -> Dict[str, Any]:
+        """Reconstruire le dict JSON d'un mois (0 = M1)"""
+        return self._node_dict('', index)
+
+    def _node_dict(self, node: str, index: int) -> Dict[str, Any]:
+        result = {}
+        for key in self._children.get(node, []):
+            path = f'{node}.{key}' if node else key
+            column = self.columns.get(path)
+            if column is not None and column.has(index):
+                result[key] = column.get(index)
+            elif path in self._children and self._has_node(path, index):
+                result[key] = self._node_dict(path, index)
+        return result
+
+    def _has_node(self, node: str, index: int) -> bool:
+        present = self._node_present.get(node)
+        return present is None or bool(present[index])
+
+    def to_months(self) -> List[Dict[str, Any]]:
+        """Liste de dicts identique à projections_50m.json"""
+        return [self.month_dict(index) for index in range(self.months_count)]
+
+
+class MonthView(Mapping):
+    """Vue d'un mois (ou d'un sous-nœud) sur le store, sans copie"""
+
+    __slots__ = ('_store', '_index', '_node')
+
+    def __init__(self, store: ProjectionStore, index: int, node: str):
+        self._store = store
+        self._index = index
+        self._node = node
+
+    def _path(self, key: str) -> str:
+        return f'{self._node}.{key}' if self._node else key
+
+    def __getitem__(self, key: str) -> Any:
+        store = self._store
+        path = self._path(key)
+        column = store.columns.get(path)
+        if column is not None and column.has(self._index):
+            return column.get(self._index)
+        if path in store._children and store._has_node(path, self._index):
+            return MonthView(store, self._index, path)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        store = self._store
+        for key in store._children.get(self._node, []):
+            path = self._path(key)
+            column = store.columns.get(path)
+            if column is not None and column.has(self._index):
+                yield key
+            elif path in store._children and store._has_node(path, self._index):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copie en dict JSON classique"""
+        return self._store._node_dict(self._node, self._index)
+
+    def __repr__(self) -> str:
+        return f"MonthView(M{self._index + 1}, {self._node or 'root'})"
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Batch de scénarios (what-if)
+
+Évalue en un seul process des milliers de variantes d'hypothèses à partir
+d'un assumptions.yaml de base et d'une liste (ou grille) de surcharges.
+Chaque variante passe par le moteur vectorisé (ArrayProjectionEngine) sans
+logging par mois ni dump JSON, et produit une ligne de KPIs :
+ARR M14 / M50, cash minimum, mois de break-even, burn max.
+
+Les surcharges sont des chemins pointés dans assumptions.yaml
+(ex: 'pricing.enterprise_hub.tiers.starter.monthly_eur', index de liste
+autorisés: 'pricing.hackathon.periods.1.price_eur') ou des alias courts
+(voir OVERRIDE_ALIASES). Un chemin absent des hypothèses (clé mal
+orthographiée) lève KeyError : la variante n'est pas évaluée à l'identique
+de la base sans le signaler.
+
+Usage:
+    python scripts/scenario_batch.py --grid conversion_rate=0.25,0.30,0.35 \\
+                                     --grid churn_monthly=0.005,0.008,0.015
+    python scripts/scenario_batch.py --scenarios scenarios.yaml --output kpis.csv
+    python scripts/scenario_batch.py --grid churn_monthly=0.005,0.01 \\
+                                     --projections data/outputs/scenario_months.jsonl
+"""
+
+import csv
+import time
+import yaml
+import logging
+import argparse
+import itertools
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from assumptions_plan import AssumptionsPlan
+from projection_io import JsonlProjectionWriter
+
+logger = logging.getLogger(__name__)
+
+# Alias courts -> chemins dans assumptions.yaml
+# (un alias peut cibler plusieurs chemins; seuls les chemins existants sont modifiés)
+OVERRIDE_ALIASES = {
+    'conversion_rate': [
+        'sales_assumptions.factory.conversion_rate',
+        'sales_assumptions.long_term_sales.factory.conversion_rate',
+    ],
+    'factory_delay': ['sales_assumptions.factory.delay_months'],
+    'churn_monthly': ['sales_assumptions.enterprise_hub.churn_monthly'],
+    'upgrade_rate': ['sales_assumptions.enterprise_hub.upgrade_patterns.starter_to_business_rate'],
+    'launch_month': ['pricing.enterprise_hub.launch_month'],
+    'starter_price': ['pricing.enterprise_hub.tiers.starter.monthly_eur'],
+    'business_price': ['pricing.enterprise_hub.tiers.business.monthly_eur'],
+    'enterprise_price': ['pricing.enterprise_hub.tiers.enterprise.monthly_eur'],
+    'charges_sociales_rate': ['personnel_details.charges_sociales_rate'],
+    'freelance_monthly': ['costs.personnel.freelance_monthly_budget'],
+    'admin_monthly': ['costs.office_admin.monthly'],
+}
+
+
+def _dict_key(data: Dict[Any, Any], key: str) -> Any:
+    """Clé du dict désignée par un segment de chemin (clés YAML non textuelles: 2027)"""
+    if key in data:
+        return key
+    return next((existing for existing in data if str(existing) == key), key)
+
+
+def _path_exists(data: Any, keys: List[str]) -> bool:
+    """Vérifier qu'un chemin pointé existe dans les hypothèses"""
+    for key in keys:
+        if isinstance(data, list):
+            if not key.isdigit() or int(key) >= len(data):
+                return False
+            data = data[int(key)]
+        elif isinstance(data, dict) and _dict_key(data, key) in data:
+            data = data[_dict_key(data, key)]
+        else:
+            return False
+    return True
+
+
+def set_path(data: Any, keys: List[str], value: Any, create: bool = False) -> Any:
+    """Retourner une copie de `data` avec `keys` = value.
+
+    Seuls les conteneurs le long du chemin sont copiés (partage structurel
+    du reste), ce qui évite un deepcopy complet par scénario. Le chemin
+    doit exister (KeyError sinon), sauf avec create=True.
+    """
+    if not create and not _path_exists(data, keys):
+        raise KeyError(f"Chemin absent de assumptions.yaml: {'.'.join(keys)}")
+    return _set_path(data, keys, value)
+
+
+def _set_path(data: Any, keys: List[str], value: Any) -> Any:
+    if not keys:
+        return value
+
+    key, rest = keys[0], keys[1:]
+    if isinstance(data, list):
+        index = int(key)
+        copied = list(data)
+        copied[index] = _set_path(data[index], rest, value)
+        return copied
+
+    copied = dict(data) if data is not None else {}
+    key = _dict_key(copied, key)
+    copied[key] = _set_path(copied.get(key), rest, value)
+    return copied
+
+
+def apply_overrides(assumptions: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Appliquer des surcharges (alias ou chemins pointés) sans modifier la base
+
+    Un chemin pointé doit exister (KeyError sinon); un alias dont aucun
+    chemin n'existe crée le premier (valeur par défaut du moteur surchargée).
+    """
+    result = assumptions
+    for name, value in overrides.items():
+        if name in OVERRIDE_ALIASES:
+            paths = [p.split('.') for p in OVERRIDE_ALIASES[name]]
+            existing = [p for p in paths if _path_exists(result, p)]
+            for keys in existing or paths[:1]:
+                result = set_path(result, keys, value, create=not existing)
+        else:
+            result = set_path(result, name.split('.'), value)
+    return result
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Produit cartésien d'une grille {paramètre: [valeurs]}"""
+    if not grid:
+        return [{}]
+    names = list(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def compute_kpis(cols: Dict[str, Any]) -> Dict[str, Any]:
+    """KPIs compacts d'une projection en colonnes"""
+    months_count = len(cols['month'])
+    arr = cols['hub.arr']
+    cash = cols['cash']
+    ebitda = cols['ebitda']
+
+    min_cash_index = int(cash.argmin())
+
+    # Break-even: premier mois à partir duquel l'EBITDA reste >= 0
+    break_even_month = None
+    negative = (ebitda < 0).nonzero()[0]
+    last_negative = int(negative[-1]) + 1 if len(negative) else 0
+    if last_negative < months_count:
+        break_even_month = last_negative + 1
+
+    return {
+        'arr_m14': float(arr[13]) if months_count >= 14 else None,
+        'arr_m50': float(arr[49]) if months_count >= 50 else None,
+        'min_cash': float(cash[min_cash_index]),
+        'min_cash_month': min_cash_index + 1,
+        'break_even_month': break_even_month,
+        'max_burn': float(cols['burn_rate'].max()),
+    }
+
+
+def evaluate_scenario(assumptions: Dict[str, Any], overrides: Dict[str, Any],
+                      months_count: int = 50,
+                      writer: Optional[JsonlProjectionWriter] = None,
+                      scenario: Optional[int] = None) -> Dict[str, Any]:
+    """Évaluer une variante et retourner ses KPIs
+
+    Si `writer` est fourni, les mois de la variante y sont ajoutés (tag
+    `scenario`) puis libérés aussitôt.
+    """
+    from projection_engine import ArrayProjectionEngine  # NumPy: pas à l'import (goal_seek --help)
+
+    variant = apply_overrides(assumptions, overrides)
+    plan = AssumptionsPlan(variant, months_count)
+    engine = ArrayProjectionEngine(variant, months_count, plan=plan)
+    cols = engine.compute()
+    if writer is not None:
+        writer.write_all(engine.to_months(cols), scenario=scenario)
+    return compute_kpis(cols)
+
+
+def run_batch(assumptions: Dict[str, Any], scenarios: List[Dict[str, Any]],
+              months_count: int = 50,
+              writer: Optional[JsonlProjectionWriter] = None) -> List[Dict[str, Any]]:
+    """Évaluer toutes les variantes; une ligne (overrides + KPIs) par scénario"""
+    rows = []
+    for index, overrides in enumerate(scenarios):
+        kpis = evaluate_scenario(assumptions, overrides, months_count, writer, index)
+        rows.append({'scenario': index, **overrides, **kpis})
+    return rows
+
+
+def write_csv(rows: List[Dict[str, Any]], output_path: Path):
+    """Écrire la table de KPIs en CSV"""
+    fieldnames = []
+    for row in rows:
+        for key in row:
+            if key not in fieldnames:
+                fieldnames.append(key)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_grid_arg(value: str) -> Dict[str, List[Any]]:
+    """Parser 'param=v1,v2,v3' (valeurs typées via YAML)"""
+    if '=' not in value:
+        raise argparse.ArgumentTypeError(f"Format attendu param=v1,v2 : {value}")
+    name, raw_values = value.split('=', 1)
+    return {name.strip(): [yaml.safe_load(v) for v in raw_values.split(',')]}
+
+
+def load_scenarios(path: Path) -> List[Dict[str, Any]]:
+    """Charger une liste de scénarios (YAML/JSON) ou une grille {param: [valeurs]}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    if isinstance(data, dict):
+        return expand_grid(data)
+    return list(data or [])
+
+
+def main():
+    """Fonction principale"""
+    # Configuration logging (ici et pas à l'import: module aussi importé par d'autres scripts)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    base_path = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(
+        description="Évaluation batch de variantes d'hypothèses (KPIs par scénario)"
+    )
+    parser.add_argument(
+        '--base',
+        type=Path,
+        default=base_path / "data" / "structured" / "assumptions.yaml",
+        help="Fichier assumptions.yaml de base"
+    )
+    parser.add_argument(
+        '--grid',
+        type=parse_grid_arg,
+        action='append',
+        default=[],
+        help="Grille param=v1,v2,... (répétable, produit cartésien)"
+    )
+    parser.add_argument(
+        '--scenarios',
+        type=Path,
+        help="Fichier YAML/JSON: liste de surcharges ou grille {param: [valeurs]}"
+    )
+    parser.add_argument(
+        '--months',
+        type=int,
+        default=50,
+        help="Horizon en mois (défaut 50)"
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=base_path / "data" / "outputs" / "scenario_batch.csv",
+        help="Fichier CSV de sortie"
+    )
+    parser.add_argument(
+        '--projections',
+        type=Path,
+        help="Fichier JSONL où ajouter les mois de chaque scénario (optionnel)"
+    )
+    parser.add_argument(
+        '--append',
+        action='store_true',
+        help="Ajouter au fichier --projections existant au lieu de l'écraser"
+    )
+    args = parser.parse_args()
+
+    with open(args.base, 'r', encoding='utf-8') as f:
+        assumptions = yaml.safe_load(f)
+
+    scenarios: List[Dict[str, Any]] = []
+    if args.scenarios:
+        scenarios.extend(load_scenarios(args.scenarios))
+    if args.grid:
+        grid: Dict[str, List[Any]] = {}
+        for item in args.grid:
+            grid.update(item)
+        scenarios.extend(expand_grid(grid))
+    if not scenarios:
+        scenarios = [{}]  # Scénario de base seul
+
+    # Chemins vérifiés avant tout calcul: pas de ligne "base" pour une surcharge mal orthographiée
+    try:
+        for overrides in scenarios:
+            apply_overrides(assumptions, overrides)
+    except KeyError as e:
+        logger.error(f"❌ {e.args[0]}")
+        return 1
+
+    logger.info(f"🔢 {len(scenarios)} scénario(s) sur {args.months} mois")
+    start = time.perf_counter()
+    if args.projections:
+        with JsonlProjectionWriter(args.projections, append=args.append) as writer:
+            rows = run_batch(assumptions, scenarios, args.months, writer)
+        logger.info(f"📁 Projections: {args.projections} ({writer.count} lignes)")
+    else:
+        rows = run_batch(assumptions, scenarios, args.months)
+    elapsed = time.perf_counter() - start
+    logger.info(f"✓ Évalués en {elapsed:.2f}s ({elapsed / len(rows) * 1000:.2f} ms/scénario)")
+
+    write_csv(rows, args.output)
+    logger.info(f"📁 KPIs: {args.output}")
+
+    if rows[0]['arr_m14'] is not None:
+        best = max(rows, key=lambda r: r['arr_m14'])
+        logger.info(
+            f"  Meilleur ARR M14: scénario {best['scenario']} → {best['arr_m14']:,.0f}€ "
+            f"(cash min {best['min_cash']:,.0f}€)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
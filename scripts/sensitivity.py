@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Analyse de sensibilité (tornado)
+
+Perturbe chaque feuille numérique d'assumptions.yaml de ±x% (différences
+finies) et classe les hypothèses par impact sur :
+  - ARR fin de 1ère période (M14)
+  - creux de trésorerie (cash minimum sur l'horizon)
+  - CA cumulé sur l'horizon
+
+Toutes les perturbations sont évaluées en un batch, réparti par blocs sur
+un pool de process (comme monte_carlo.py). Chaque worker compile une seule
+fois le plan de base et son calendrier; une variante ne recompile que son
+plan (surcharge à partage structurel, cf. scenario_batch.set_path).
+
+Exclus : paramètres de calendrier (clés *month / *_months : indices de mois,
+pas des grandeurs), sections sans effet sur les projections (scenarios,
+validation_rules, monte_carlo) et valeurs nulles.
+
+Le tableau tornado (data/structured/sensitivity.json) est repris par
+6a_create_template.py dans le sheet "Sensibilité".
+
+Usage:
+    python scripts/sensitivity.py --delta 0.10
+"""
+
+import os
+import json
+import time
+import yaml
+import logging
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+from assumptions_plan import AssumptionsPlan
+from projection_engine import ArrayProjectionEngine
+from scenario_batch import set_path
+
+logger = logging.getLogger(__name__)
+
+# Sections sans effet sur le calcul des projections
+EXCLUDED_SECTIONS = {'scenarios', 'validation_rules', 'monte_carlo', 'critical_assumptions'}
+
+# Libellés des métriques (ordre d'affichage)
+METRICS = {
+    'arr_first_period': 'ARR fin 1ère période',
+    'min_cash': 'Creux de trésorerie',
+    'ca_total': 'CA cumulé',
+}
+
+
+def is_timing_key(key: str) -> bool:
+    """Clé de calendrier (indice de mois ou durée en mois)"""
+    return key == 'month' or key.endswith('_month') or key.endswith('_months')
+
+
+def numeric_leaves(data: Any, prefix: Tuple[str, ...] = ()) -> List[Tuple[str, float]]:
+    """Feuilles numériques perturbables [(chemin pointé, valeur)]"""
+    leaves = []
+    if isinstance(data, dict):
+        items = [(str(key), value) for key, value in data.items()]
+    elif isinstance(data, list):
+        items = [(str(index), value) for index, value in enumerate(data)]
+    else:
+        items = []
+
+    for key, value in items:
+        path = prefix + (key,)
+        if not prefix and key in EXCLUDED_SECTIONS:
+            continue
+        if isinstance(value, (dict, list)):
+            leaves.extend(numeric_leaves(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if value != 0 and not is_timing_key(key):
+                leaves.append(('.'.join(path), value))
+    return leaves
+
+
+def measure(cols: Dict[str, Any], first_period_end: int) -> Dict[str, float]:
+    """Métriques du tornado sur une projection en colonnes"""
+    return {
+        'arr_first_period': float(cols['hub.arr'][first_period_end - 1]),
+        'min_cash': float(cols['cash'].min()),
+        'ca_total': float(cols['revenue.total'].sum()),
+    }
+
+
+# État par worker (initialisé une fois par process)
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(assumptions: Dict[str, Any], months_count: int):
+    """Initialiser un worker: plan de base et calendrier compilés une fois"""
+    plan = AssumptionsPlan(assumptions, months_count)
+    _worker_state['assumptions'] = assumptions
+    _worker_state['months_count'] = months_count
+    _worker_state['calendar'] = plan.calendar
+    _worker_state['first_period_end'] = plan.calendar.periods[0].last
+
+
+def evaluate_chunk(perturbations: List[Tuple[str, float]]) -> List[Tuple[str, float, Any]]:
+    """Évaluer un bloc de (chemin, valeur perturbée) -> métriques ou erreur"""
+    assumptions = _worker_state['assumptions']
+    months_count = _worker_state['months_count']
+    calendar = _worker_state['calendar']
+    first_period_end = _worker_state['first_period_end']
+
+    results = []
+    for path, value in perturbations:
+        variant = set_path(assumptions, path.split('.'), value)
+        try:
+            plan = AssumptionsPlan(variant, months_count, calendar=calendar)
+            cols = ArrayProjectionEngine(variant, months_count, plan=plan).compute()
+            results.append((path, value, measure(cols, first_period_end)))
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            results.append((path, value, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def run_sensitivity(assumptions: Dict[str, Any], delta: float = 0.10,
+                    months_count: int = 50, workers: int = None,
+                    chunk_size: int = 50) -> Dict[str, Any]:
+    """Perturber toutes les feuilles de ±delta et classer par impact"""
+    _init_worker(assumptions, months_count)
+    first_period_end = _worker_state['first_period_end']
+    base_cols = ArrayProjectionEngine(assumptions, months_count).compute()
+    base = measure(base_cols, first_period_end)
+
+    leaves = numeric_leaves(assumptions)
+    perturbations = []
+    for path, value in leaves:
+        perturbations.append((path, value * (1 - delta)))
+        perturbations.append((path, value * (1 + delta)))
+    chunks = [perturbations[i:i + chunk_size] for i in range(0, len(perturbations), chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [evaluate_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(assumptions, months_count)) as pool:
+            results = list(pool.map(evaluate_chunk, chunks))
+
+    # Résultats dans l'ordre des perturbations: (bas, haut) par feuille
+    flat = [item for chunk in results for item in chunk]
+    rows, skipped = [], []
+    for index, (path, value) in enumerate(leaves):
+        low, high = flat[2 * index][2], flat[2 * index + 1][2]
+        if isinstance(low, str) or isinstance(high, str):
+            skipped.append({'path': path, 'error': low if isinstance(low, str) else high})
+            continue
+        swing = {metric: abs(high[metric] - low[metric]) for metric in METRICS}
+        if not any(swing.values()):
+            continue  # Hypothèse sans effet sur les projections
+        rows.append({'path': path, 'value': value, 'low': low, 'high': high, 'swing': swing})
+
+    return {
+        'delta': delta,
+        'months_count': months_count,
+        'first_period_end': first_period_end,
+        'base': base,
+        'leaves': len(leaves),
+        'evaluations': len(perturbations),
+        'rows': rows,
+        'skipped': skipped,
+    }
+
+
+def tornado_table(result: Dict[str, Any], metric: str, top: int = 15) -> List[Dict[str, Any]]:
+    """Lignes du tornado pour une métrique, triées par écart décroissant"""
+    base_value = result['base'][metric]
+    rows = sorted(result['rows'], key=lambda row: row['swing'][metric], reverse=True)
+    table = []
+    for row in rows[:top]:
+        if not row['swing'][metric]:
+            break
+        table.append({
+            'path': row['path'],
+            'value': row['value'],
+            'low': row['low'][metric],
+            'high': row['high'][metric],
+            'swing': row['swing'][metric],
+            'swing_pct': row['swing'][metric] / abs(base_value) if base_value else None,
+        })
+    return table
+
+
+def main():
+    """Fonction principale"""
+    # Configuration logging (ici et pas à l'import: module aussi importé par d'autres scripts)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    base_path = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(description="Analyse de sensibilité (tornado) des hypothèses")
+    parser.add_argument('--base', type=Path,
+                        default=base_path / "data" / "structured" / "assumptions.yaml",
+                        help="Fichier assumptions.yaml")
+    parser.add_argument('--delta', type=float, default=0.10, help="Perturbation relative (±)")
+    parser.add_argument('--months', type=int, default=50, help="Horizon en mois")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Nombre de process (défaut: nombre de coeurs)")
+    parser.add_argument('--top', type=int, default=10, help="Hypothèses affichées par métrique")
+    parser.add_argument('--output', type=Path,
+                        default=base_path / "data" / "structured" / "sensitivity.json",
+                        help="Fichier JSON de sortie")
+    args = parser.parse_args()
+
+    with open(args.base, 'r', encoding='utf-8') as f:
+        assumptions = yaml.safe_load(f)
+
+    logger.info(f"🌪️ Sensibilité ±{args.delta:.0%} sur {args.months} mois")
+    start = time.perf_counter()
+    result = run_sensitivity(assumptions, args.delta, args.months, args.workers)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"✓ {result['leaves']} hypothèses, {result['evaluations']} évaluations "
+        f"en {elapsed:.2f}s ({len(result['rows'])} avec impact)"
+    )
+    for skipped in result['skipped']:
+        logger.warning(f"  ⚠️ Ignorée: {skipped['path']} ({skipped['error']})")
+
+    for metric, label in METRICS.items():
+        if metric == 'arr_first_period':
+            label = f"ARR M{result['first_period_end']}"
+        logger.info(f"\n📊 {label} (base {result['base'][metric]:,.0f}€):")
+        for row in tornado_table(result, metric, args.top):
+            logger.info(
+                f"  • {row['path']}: {row['low']:,.0f}€ → {row['high']:,.0f}€ "
+                f"(écart {row['swing']:,.0f}€)"
+            )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    logger.info(f"\n📁 Tornado: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Budget de démarrage des points d'entrée (temps d'import)
+
+Vérifie que les commandes légères restent légères :
+  - temps de démarrage (meilleur de --repeat lancements) sous le budget
+  - modules lourds jamais importés (relevé `python -X importtime`)
+
+Budgets (BUDGETS ci-dessous) :
+  - run.py --help          : < 150 ms, sans rich / yaml / openpyxl / pandas...
+  - 3_calculate_projections.py --help : sans NumPy (moteur dict par défaut)
+  - 4b_generate_bp_excel_50m.py / generate_charts.py --help : sans openpyxl /
+    matplotlib (importés à la génération)
+  - 6_validate.py --help   : sans openpyxl / python-docx (importés par les checks)
+  - goal_seek.py --help    : sans NumPy (importé au premier calcul)
+  - run.py --validate-only : orchestrateur + 6_validate sans matplotlib / pandas
+
+Sort en erreur (code 1) si un budget est dépassé : à lancer avec le
+benchmark (scripts/benchmark.py) pour détecter les régressions d'import.
+--scale multiplie les budgets de temps (machine CI plus lente).
+
+Usage:
+    python scripts/startup_budget.py
+    python scripts/startup_budget.py --scale 2 --repeat 10
+"""
+
+import sys
+import time
+import logging
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List, Set
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+BASE_PATH = Path(__file__).parent.parent
+
+HEAVY_MODULES = ['rich', 'yaml', 'openpyxl', 'docx', 'pandas', 'numpy', 'matplotlib']
+
+# Chemin --validate-only en process: orchestrateur puis module de validation
+VALIDATE_ONLY_IMPORTS = (
+    "import sys, importlib; sys.path[:0] = ['.', 'scripts']; "
+    "import run; importlib.import_module('6_validate')"
+)
+
+BUDGETS: List[Dict[str, Any]] = [
+    {
+        'name': 'run.py --help',
+        'args': ['run.py', '--help'],
+        'max_ms': 150,
+        'forbidden': HEAVY_MODULES,
+    },
+    {
+        'name': '3_calculate_projections.py --help',
+        'args': ['scripts/3_calculate_projections.py', '--help'],
+        'max_ms': 150,
+        'forbidden': HEAVY_MODULES,
+    },
+    {
+        'name': '4b_generate_bp_excel_50m.py --help',
+        'args': ['scripts/4b_generate_bp_excel_50m.py', '--help'],
+        'max_ms': 150,
+        'forbidden': HEAVY_MODULES,
+    },
+    {
+        'name': 'generate_charts.py --help',
+        'args': ['scripts/generate_charts.py', '--help'],
+        'max_ms': 150,
+        'forbidden': HEAVY_MODULES,
+    },
+    {
+        'name': '6_validate.py --help',
+        'args': ['scripts/6_validate.py', '--help'],
+        'max_ms': 250,
+        'forbidden': ['openpyxl', 'docx', 'pandas', 'numpy', 'matplotlib'],  # rich: console du rapport
+    },
+    {
+        'name': 'goal_seek.py --help',
+        'args': ['scripts/goal_seek.py', '--help'],
+        'max_ms': 200,
+        'forbidden': ['rich', 'openpyxl', 'docx', 'pandas', 'numpy', 'matplotlib'],  # yaml: chargé au démarrage
+    },
+    {
+        'name': 'run.py --validate-only (imports)',
+        'args': ['-c', VALIDATE_ONLY_IMPORTS],
+        'max_ms': None,
+        'forbidden': ['matplotlib', 'pandas'],  # numpy: importé par openpyxl s'il est installé
+    },
+]
+
+
+def startup_ms(args: List[str], repeat: int) -> float:
+    """Meilleur temps de lancement (ms) sur `repeat` exécutions"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=BASE_PATH, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def imported_modules(args: List[str]) -> Set[str]:
+    """Modules importés par la commande (sortie de -X importtime)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=BASE_PATH,
+                            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True)
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and line.count('|') == 2:
+            name = line.rsplit('|', 1)[1].strip()
+            if name != 'package':  # Ligne d'en-tête
+                modules.add(name)
+    return modules
+
+
+def check_budget(budget: Dict[str, Any], repeat: int, scale: float) -> List[str]:
+    """Violations du budget (liste vide si respecté)"""
+    violations = []
+    modules = imported_modules(budget['args'])
+    for forbidden in budget['forbidden']:
+        if any(name == forbidden or name.startswith(forbidden + '.') for name in modules):
+            violations.append(f"importe {forbidden}")
+
+    if budget['max_ms'] is not None:
+        elapsed = startup_ms(budget['args'], repeat)
+        limit = budget['max_ms'] * scale
+        status = "✓" if elapsed <= limit else "✗"
+        logger.info(f"  {status} {budget['name']}: {elapsed:.0f} ms (budget {limit:.0f} ms)")
+        if elapsed > limit:
+            violations.append(f"{elapsed:.0f} ms > {limit:.0f} ms")
+    else:
+        logger.info(f"  • {budget['name']}: {len(modules)} modules importés")
+    return violations
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Budget de démarrage des points d'entrée")
+    parser.add_argument('--repeat', type=int, default=5, help="Lancements par commande (meilleur temps)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiplicateur des budgets de temps (machine lente)")
+    args = parser.parse_args()
+
+    logger.info("⏱️  Budget de démarrage")
+    failures = {}
+    for budget in BUDGETS:
+        violations = check_budget(budget, args.repeat, args.scale)
+        if violations:
+            failures[budget['name']] = violations
+
+    if failures:
+        logger.error(f"\n❌ {len(failures)} budget(s) dépassé(s):")
+        for name, violations in failures.items():
+            logger.error(f"  • {name}: {', '.join(violations)}")
+        return 1
+
+    logger.info("\n✅ Budgets de démarrage respectés")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Télémétrie des étapes (temps, CPU, mémoire, cellules)
+
+Chaque sous-étape instrumentée (create_pl_sheet, inject_cash_flow_data,
+chargement / sauvegarde de workbook...) produit un enregistrement :
+  - wall_s       : temps écoulé
+  - cpu_s        : temps CPU du process
+  - peak_rss_mb  : pic de mémoire résidente du process (à la fin de la sous-étape)
+  - cells        : cellules Excel écrites (affectations de valeur openpyxl)
+
+Activée par la variable d'environnement BP_TELEMETRY (chemin d'un fichier
+JSON Lines, positionnée par run.py) : sans elle, les décorateurs ne
+mesurent rien. Les enregistrements sont ajoutés au fichier au fil de l'eau
+(plusieurs étapes en parallèle peuvent y écrire).
+
+Usage:
+    @instrument()
+    def create_pl_sheet(self): ...
+
+    with span('load_workbook'):
+        wb = openpyxl.load_workbook(path)
+"""
+
+import os
+import sys
+import json
+import time
+import functools
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: pas de getrusage
+    resource = None
+
+ENV_VAR = 'BP_TELEMETRY'
+
+_cell_writes = 0
+_cell_counter_installed = False
+
+
+def enabled() -> bool:
+    return bool(os.environ.get(ENV_VAR))
+
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Pic de mémoire résidente (Mo) du process ou de ses enfants terminés"""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    rss = resource.getrusage(who).ru_maxrss
+    # Linux: Ko, macOS: octets
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def _install_cell_counter():
+    """Compter les affectations de valeur de cellule (openpyxl.Cell.value = ...)"""
+    global _cell_counter_installed
+    if _cell_counter_installed:
+        return
+    _cell_counter_installed = True
+    try:
+        from openpyxl.cell.cell import Cell
+    except ImportError:
+        return
+
+    bind_value = Cell._bind_value
+
+    def counting_bind_value(cell, value):
+        global _cell_writes
+        _cell_writes += 1
+        bind_value(cell, value)
+
+    Cell._bind_value = counting_bind_value
+
+
+def stage_name() -> str:
+    """Nom de l'étape courante (script lancé)"""
+    return Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else 'python'
+
+
+def emit(record: Dict[str, Any]):
+    """Ajouter un enregistrement au fichier de télémétrie"""
+    path = os.environ.get(ENV_VAR)
+    if not path:
+        return
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+class span:
+    """Mesurer un bloc (context manager); sans effet si la télémétrie est inactive"""
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self.active = enabled()
+
+    def __enter__(self) -> 'span':
+        if self.active:
+            _install_cell_counter()
+            self._cells = _cell_writes
+            self._wall = time.perf_counter()
+            self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.active:
+            return False
+        emit({
+            'stage': stage_name(),
+            'step': self.name,
+            'wall_s': round(time.perf_counter() - self._wall, 6),
+            'cpu_s': round(time.process_time() - self._cpu, 6),
+            'peak_rss_mb': peak_rss_mb(),
+            'cells': _cell_writes - self._cells,
+            'ok': exc_type is None,
+            **self.attributes,
+        })
+        return False
+
+
+def instrument(name: Optional[str] = None):
+    """Décorateur: mesurer chaque appel de la fonction / méthode"""
+    def decorator(func):
+        step = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return func(*args, **kwargs)
+            with span(step):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
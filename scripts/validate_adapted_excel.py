@@ -5,11 +5,12 @@ Valider le fichier Excel adapté
 
 import openpyxl
 from pathlib import Path
-import json
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
+from projection_io import find_projections, load_projections
+
 console = Console()
 
 
@@ -192,14 +193,13 @@ def main():
     # Charger les fichiers
     source_file = base_path / "data" / "raw" / "BP FABRIQ_PRODUCT-OCT2025.xlsx"
     adapted_file = base_path / "data" / "outputs" / "BP_50M_Adapted_Nov2025-Dec2029.xlsx"
-    projections_file = base_path / "data" / "structured" / "projections_50m.json"
+    projections_file = find_projections(base_path / "data" / "structured", "projections_50m")
 
     console.print(f"\n[yellow]📂 Chargement fichiers...[/yellow]")
     wb_source = openpyxl.load_workbook(source_file, data_only=False)
     wb_adapted = openpyxl.load_workbook(adapted_file, data_only=False)
 
-    with open(projections_file) as f:
-        projections = json.load(f)
+    projections = load_projections(projections_file)
 
     console.print(f"[green]✓ Source: {len(wb_source.sheetnames)} sheets[/green]")
     console.print(f"[green]✓ Adapté: {len(wb_adapted.sheetnames)} sheets[/green]")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Rechargement du code en mode --watch / --in-process
+
+Vérifie qu'un module de scripts/ modifié pendant un `run.py --watch` est
+bien rechargé : sans cela l'étape est relancée avec l'ancien code, ses
+sorties périmées sont marquées à jour et publiées dans le cache d'artefacts.
+
+Sur une copie temporaire du dépôt (run.py, scripts/, hypothèses), l'étape
+3 (Projections, moteur array) est enchaînée en process comme dans la
+boucle de --watch (cache d'étapes et contexte partagés, ChangeWatcher) :
+  1. build initial
+  2. projection_engine.py modifié (mois marqués) : modification détectée,
+     étape relancée, sortie marquée
+  3. telemetry.py modifié (importé par run.py, non rechargeable) : étape
+     relancée en sous-process, sortie toujours marquée
+  4. aucune modification : étape à jour
+
+Sort en erreur (code 1) si une sortie est périmée.
+
+Usage:
+    python scripts/watch_check.py
+    python scripts/watch_check.py --assumptions chemin/assumptions.yaml
+"""
+
+import sys
+import json
+import shutil
+import logging
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+# Configuration logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+BASE_PATH = Path(__file__).parent.parent
+
+STAGE = 'scripts/3_calculate_projections.py'
+OUTPUT = 'data/structured/projections_50m.jsonl'
+
+# Modification de projection_engine.py: chaque mois porte le marqueur
+ENGINE_PATCH = """
+
+_to_months = ArrayProjectionEngine.to_months
+
+
+def _marked_months(self, cols):
+    return [dict(month_data, reload_check=True) for month_data in _to_months(self, cols)]
+
+
+ArrayProjectionEngine.to_months = _marked_months
+"""
+
+# Builds enchaînés dans un process lancé dans la copie (run.py de la copie)
+CHILD = "import sys; sys.path[:0] = ['.', 'scripts']; import watch_check; sys.exit(watch_check.check_builds())"
+
+
+def copy_tree(target: Path, assumptions: Path):
+    """Copie minimale du dépôt pour l'étape 3 (moteur array par défaut)"""
+    shutil.copy2(BASE_PATH / "run.py", target / "run.py")
+    shutil.copytree(BASE_PATH / "scripts", target / "scripts",
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    structured = target / "data" / "structured"
+    structured.mkdir(parents=True)
+    shutil.copy2(assumptions, structured / "assumptions.yaml")
+
+    calculation = target / STAGE
+    source = calculation.read_text(encoding='utf-8')
+    if source.count("default='dict'") != 1:
+        raise ValueError(f"Moteur par défaut introuvable dans {STAGE}")
+    calculation.write_text(source.replace("default='dict'", "default='array'"), encoding='utf-8')
+
+
+def append(path: Path, text: str):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+def check_builds() -> int:
+    """Builds successifs dans la copie courante (process enfant)"""
+    import run
+    from pipeline_context import PipelineContext, activate
+
+    root = Path.cwd()
+    stage = next(stage for stage in run.SCRIPTS if stage['script'] == STAGE)
+    args = argparse.Namespace(force=False, profile=False, verbose=False)
+    cache = run.StageCache(root / ".cache" / "run_state.json", root)
+    activate(PipelineContext())
+    watcher = run.ChangeWatcher(run.watched_files([stage]))
+
+    def build(label: str):
+        log_dir = root / "logs" / label
+        status = run.run_stages([stage], args, cache, log_dir, 1, in_process=True)[STAGE]
+        with open(root / OUTPUT, 'r', encoding='utf-8') as f:
+            marked = 'reload_check' in json.loads(f.readline())
+        return status, marked
+
+    failures = []
+
+    def expect(label: str, result, expected):
+        status = "✓" if result == expected else "✗"
+        logger.info(f"  {status} {label}: (étape, sortie marquée) = {result}, attendu {expected}")
+        if result != expected:
+            failures.append(label)
+
+    try:
+        expect("build initial", build("1_initial"), ('ok', False))
+
+        append(root / "scripts" / "projection_engine.py", ENGINE_PATCH)
+        changed = watcher.wait()
+        if "scripts/projection_engine.py" not in changed:
+            failures.append("projection_engine.py non surveillé")
+        expect("projection_engine.py modifié", build("2_engine"), ('ok', True))
+
+        append(root / "scripts" / "telemetry.py", "\n# Modifié par watch_check\n")
+        watcher.wait()
+        expect("telemetry.py modifié (sous-process)", build("3_telemetry"), ('ok', True))
+
+        expect("aucune modification", build("4_unchanged"), ('cached', True))
+    finally:
+        watcher.stop()
+
+    if failures:
+        logger.error(f"❌ Code périmé après modification: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+def main():
+    """Fonction principale"""
+    parser = argparse.ArgumentParser(description="Rechargement du code en mode --watch / --in-process")
+    parser.add_argument('--assumptions', type=Path,
+                        default=BASE_PATH / "data" / "structured" / "assumptions.yaml",
+                        help="Fichier assumptions.yaml de la copie")
+    args = parser.parse_args()
+
+    logger.info("👀 Rechargement du code (builds en process, étape 3)")
+    with tempfile.TemporaryDirectory(prefix='bp-watch-') as temp_dir:
+        target = Path(temp_dir)
+        copy_tree(target, args.assumptions.resolve())
+        result = subprocess.run([sys.executable, '-c', CHILD], cwd=target)
+
+    if result.returncode != 0:
+        return 1
+    logger.info("\n✅ Modules modifiés rechargés, sorties à jour")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+GenieFactory BP - Snapshots des workbooks parsés (cache par contenu)
+
+Le RAW (BP FABRIQ_PRODUCT-OCT2025.xlsx, ~355 000 cellules stylées) est
+parsé par 6a, puis le template par 6b, puis RAW / template / FINAL par
+chaque script de validation (6c, 9, 11, 16...) : quelques secondes de
+parsing XML à chaque fois pour les mêmes fichiers.
+
+load_workbook() parse un fichier au plus une fois par contenu : le
+workbook est ensuite conservé en snapshot binaire dans .cache/workbooks/,
+nommé par le SHA-256 du fichier (+ data_only, version openpyxl et format
+du snapshot). Tout script qui relit le même contenu restaure le snapshot
+au lieu de parser le XML. save_workbook() enregistre aussi le snapshot du
+workbook qu'il vient d'écrire : l'étape suivante (6b après 6a) n'a rien à
+parser.
+
+Format : le workbook est picklé sans ses cellules, stockées à part en
+tableaux compacts (lignes, colonnes, valeurs, types, index de style dans
+une table des styles distincts) et recréées directement à la restauration.
+Un pickle brut du Workbook est ~10x plus gros et pas plus rapide à relire
+que le XML.
+
+Chaque appel retourne un workbook neuf : les scripts peuvent le modifier
+sans affecter les suivants. Snapshot illisible ou périmé : fichier reparsé
+et snapshot réécrit. Les MAX_SNAPSHOTS snapshots les plus récemment
+utilisés sont conservés.
+
+Les snapshots sont relus avec pickle : quiconque peut écrire dans le
+dossier peut exécuter du code dans le pipeline. Le cache est donc un
+dossier local privé (.cache/workbooks ou BP_WORKBOOK_CACHE), créé en 0700 ;
+s'il appartient à un autre utilisateur ou est accessible en écriture au
+groupe / aux autres (ex. partage réseau), il est ignoré et les workbooks
+sont parsés normalement. Pour partager des sorties entre postes, utiliser
+le cache d'artefacts (artifact_store.py), qui ne stocke que des fichiers.
+
+Usage:
+    from workbook_snapshot import load_workbook, save_workbook
+    wb = load_workbook(raw_path)                 # Parsé une fois par contenu
+    save_workbook(wb, output_path)               # Écrit + snapshot pour l'étape suivante
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+from copy import copy
+from array import array
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import openpyxl
+from openpyxl.cell.cell import Cell, MergedCell
+from openpyxl.styles.cell_style import StyleArray
+
+from telemetry import span
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+MAX_SNAPSHOTS = 24
+CACHE_PATH = Path(os.environ.get('BP_WORKBOOK_CACHE',
+                                 Path(__file__).parent.parent / ".cache" / "workbooks"))
+
+stats = {'parsed': 0, 'restored': 0, 'stored': 0}
+
+_private_roots: Dict[Path, bool] = {}
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def snapshot_path(sha256: str, data_only: bool, root: Path = CACHE_PATH) -> Path:
+    mode = 'values' if data_only else 'formulas'
+    return root / f"{sha256}-{mode}-openpyxl{openpyxl.__version__}-v{SNAPSHOT_FORMAT}.pickle"
+
+
+def is_private(root: Path = CACHE_PATH) -> bool:
+    """Dossier de snapshots créé si besoin, utilisable seulement s'il est privé
+
+    Vérifié une fois par dossier : propriétaire = utilisateur courant et pas
+    d'écriture pour le groupe / les autres (POSIX).
+    """
+    root = Path(root)
+    if root not in _private_roots:
+        try:
+            root.mkdir(mode=0o700, parents=True, exist_ok=True)
+            info = root.stat()
+        except OSError as e:
+            logger.warning(f"⚠️ Cache de snapshots indisponible ({root}): {e}")
+            _private_roots[root] = False
+            return False
+        private = not hasattr(os, 'getuid') or (info.st_uid == os.getuid() and not info.st_mode & 0o022)
+        if not private:
+            logger.warning(f"⚠️ Cache de snapshots ignoré ({root}): dossier non privé "
+                           f"(propriétaire ou droits d'écriture), workbooks parsés sans snapshot")
+        _private_roots[root] = private
+    return _private_roots[root]
+
+
+def _style_key(cell) -> Optional[tuple]:
+    """Style de la cellule (None: jamais stylée, style par défaut)"""
+    return None if cell._style is None else tuple(cell._style)
+
+
+def _pack_cells(ws) -> Dict[str, Any]:
+    """Cellules d'une feuille -> tableaux compacts (styles dédupliqués)"""
+    styles: Dict[Optional[tuple], int] = {}
+    # Cellules vides sans style ni commentaire: ni écrites par wb.save ni relues par le parser
+    cells = [cell for cell in ws._cells.values() if type(cell) is Cell
+             and (cell._value is not None or cell.has_style or cell._comment is not None)]
+    merged = [cell for cell in ws._cells.values() if type(cell) is MergedCell]
+    return {
+        'rows': array('i', [cell.row for cell in cells]),
+        'columns': array('i', [cell.column for cell in cells]),
+        'values': [cell._value for cell in cells],
+        'types': ''.join(cell.data_type for cell in cells),
+        'styles': array('i', [styles.setdefault(_style_key(cell), len(styles)) for cell in cells]),
+        'extras': {(cell.row, cell.column): (cell._hyperlink, cell._comment) for cell in cells
+                   if cell._hyperlink is not None or cell._comment is not None},
+        'merged': [(cell.row, cell.column, styles.setdefault(_style_key(cell), len(styles)))
+                   for cell in merged],
+        'style_table': list(styles),
+    }
+
+
+def _unpack_cells(ws, packed: Dict[str, Any]):
+    """Recréer les cellules sans passer par Cell.__init__ (valeurs déjà typées)"""
+    table = [None if style is None else StyleArray(style) for style in packed['style_table']]
+    new_cell = Cell.__new__
+    cells = {}
+    for row, column, value, data_type, style in zip(packed['rows'], packed['columns'], packed['values'],
+                                                    packed['types'], packed['styles']):
+        cell = new_cell(Cell)
+        cell.parent = ws
+        cell.row = row
+        cell.column = column
+        cell._value = value
+        cell.data_type = data_type
+        cell._style = copy(table[style])
+        cell._hyperlink = None
+        cell._comment = None
+        cells[(row, column)] = cell
+    for (row, column), (hyperlink, comment) in packed['extras'].items():
+        cells[(row, column)]._hyperlink = hyperlink
+        cells[(row, column)]._comment = comment
+    for row, column, style in packed['merged']:
+        cell = MergedCell(ws, row, column)
+        cell._style = copy(table[style])
+        cells[(row, column)] = cell
+    ws._cells = cells
+
+
+def dumps(wb) -> bytes:
+    """Workbook -> snapshot (le workbook est laissé intact)"""
+    originals = {}
+    try:
+        for ws in wb.worksheets:
+            originals[ws] = ws._cells
+            ws._cells = _pack_cells(ws)
+        return pickle.dumps(wb, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for ws, cells in originals.items():
+            ws._cells = cells
+
+
+def loads(data: bytes):
+    """Snapshot -> Workbook openpyxl complet"""
+    wb = pickle.loads(data)
+    for ws in wb.worksheets:
+        _unpack_cells(ws, ws._cells)
+        # DimensionHolder (defaultdict) perd sa fabrique au pickling
+        ws.row_dimensions.worksheet = ws.column_dimensions.worksheet = ws
+        ws.row_dimensions.default_factory = ws._add_row
+        ws.column_dimensions.default_factory = ws._add_column
+    return wb
+
+
+def _write_atomic(target: Path, data: bytes):
+    """Fichier temporaire renommé: plusieurs process peuvent écrire le même snapshot"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def _restore(path: Path) -> Optional[Any]:
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        wb = loads(data)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # Snapshot tronqué ou incompatible: reparser
+        logger.warning(f"⚠️ Snapshot illisible ({path.name}): {e}")
+        return None
+    os.utime(path)  # Dernier usage (éviction)
+    return wb
+
+
+def store(wb, sha256: str, data_only: bool = False, root: Path = CACHE_PATH):
+    """Enregistrer le snapshot d'un workbook correspondant au contenu `sha256`"""
+    with span('store_workbook_snapshot'):
+        _write_atomic(snapshot_path(sha256, data_only, root), dumps(wb))
+    stats['stored'] += 1
+    prune(root)
+
+
+def prune(root: Path = CACHE_PATH, keep: int = MAX_SNAPSHOTS) -> int:
+    """Ne garder que les `keep` snapshots les plus récemment utilisés"""
+    snapshots = sorted(root.glob('*.pickle'), key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in snapshots[keep:]:
+        path.unlink(missing_ok=True)
+    return max(0, len(snapshots) - keep)
+
+
+def load_workbook(path: Path, data_only: bool = False, root: Path = CACHE_PATH):
+    """Comme openpyxl.load_workbook, mais parsé au plus une fois par contenu de fichier"""
+    path = Path(path)
+    if not is_private(root):
+        with span('load_workbook'):
+            wb = openpyxl.load_workbook(path, data_only=data_only)
+        stats['parsed'] += 1
+        return wb
+
+    sha256 = file_sha256(path)
+    snapshot = snapshot_path(sha256, data_only, root)
+
+    with span('restore_workbook_snapshot'):
+        wb = _restore(snapshot)
+    if wb is not None:
+        stats['restored'] += 1
+        logger.debug(f"📦 Snapshot restauré: {path.name}")
+        return wb
+
+    with span('load_workbook'):
+        wb = openpyxl.load_workbook(path, data_only=data_only)
+    stats['parsed'] += 1
+    try:
+        store(wb, sha256, data_only, root)
+    except OSError as e:  # Cache en lecture seule / disque plein: le workbook reste utilisable
+        logger.warning(f"⚠️ Snapshot non enregistré ({path.name}): {e}")
+    return wb
+
+
+def save_workbook(wb, path: Path, root: Path = CACHE_PATH):
+    """Sauvegarder un workbook et enregistrer son snapshot (relu sans parsing ensuite)"""
+    path = Path(path)
+    with span('save_workbook'):
+        wb.save(path)
+    if not is_private(root):
+        return
+    try:
+        store(wb, file_sha256(path), root=root)
+    except OSError as e:
+        logger.warning(f"⚠️ Snapshot non enregistré ({path.name}): {e}")